@@ -17,17 +17,29 @@
 """
 Defines a |PumpRoom| class, which coordinates the process of passing a
 |ReservoirQuery| to selected APIs and aggregating the results.
+
+Reservoirs are searched concurrently by a bounded pool of threads, so
+a search over several Reservoirs takes about as long as the slowest
+one. The size of the pool and the time allowed for the whole search are
+set in the `PUMPROOM` settings.
+
 """
 
 # standard library
+from concurrent.futures import ThreadPoolExecutor, wait
 import logging
-import threading
+
+# third party
+from django.conf import settings
 
 # local
 from aggregator.pumproom.pump import Pump
+from cyphon.transaction import close_connection
 
 LOGGER = logging.getLogger(__name__)
 
+_PUMPROOM_SETTINGS = getattr(settings, 'PUMPROOM', {})
+
 
 class PumpRoom(object):
     """
@@ -46,12 +58,28 @@ class PumpRoom(object):
     user : AppUser
         The |AppUser| making the request.
 
+    max_workers : int
+        The maximum number of |Reservoirs| searched at once. Defaults
+        to `PUMPROOM['MAX_WORKERS']`.
+
+    timeout : float or |None|
+        The number of seconds the |Reservoirs| may take to return
+        results, including time spent waiting for a free worker.
+        Searches that haven't started by then are cancelled, and results
+        that arrive later are discarded. If |None|, searches are not
+        timed out. Defaults to `PUMPROOM['TIMEOUT']`.
+
     """
 
-    def __init__(self, reservoirs, task, user=None):
+    def __init__(self, reservoirs, task, user=None, max_workers=None,
+                 timeout=None):
         self.reservoirs = reservoirs
         self.task = task
         self.user = user
+        self.max_workers = max_workers or \
+            _PUMPROOM_SETTINGS.get('MAX_WORKERS', 4)
+        self.timeout = timeout if timeout is not None else \
+            _PUMPROOM_SETTINGS.get('TIMEOUT', 60)
         self.records = []  # Invoices for the API calls made
 
     def _create_pump(self, reservoir):
@@ -65,20 +93,34 @@ class PumpRoom(object):
             user=self.user,
         )
 
-    def _start_pump(self, pump, query):
+    def _add_records(self, records):
         """
-        Takes a Pump and a ReservoirQuery and starts the Pump with that
-        query. Adds the result to the PumpRoom's records.
+        Takes the result of a Pump and adds it to the PumpRoom's
+        records.
         """
-        records = pump.start(query)
         if isinstance(records, list):
             self.records.extend(records)
         else:
             self.records.append(records)
 
+    @staticmethod
+    @close_connection
+    def _run_pump(pump, query):
+        """
+        Takes a Pump and a ReservoirQuery and returns the Pump's result.
+        Runs in a worker thread, so the thread's database connection is
+        closed when the Pump is done.
+        """
+        return pump.start(query)
+
     def get_results(self, query):
         """Get query results from the PumpRoom's Reservoirs.
 
+        The |Reservoirs| are searched concurrently, with up to
+        `max_workers` searches at a time. Results from a |Reservoir|
+        that fails or does not respond within `timeout` seconds of the
+        call are left out.
+
         Parameters
         ----------
         query : |ReservoirQuery|
@@ -90,18 +132,50 @@ class PumpRoom(object):
             |Invoices| recording the responses of the API calls made.
 
         """
-        threads = []
+        pumps = []
+        subqueries = []
+
         for reservoir in self.reservoirs:
-            pump = self._create_pump(reservoir)
-            subquery = query.filter_accounts(reservoir)
-            thread = threading.Thread(
-                target=self._start_pump,
-                kwargs={'pump': pump, 'query': subquery}
-            )
-            threads.append(thread)
-            thread.start()
-
-        for thread in threads:
-            thread.join()
+            pumps.append(self._create_pump(reservoir))
+            subqueries.append(query.filter_accounts(reservoir))
+
+        if not pumps:
+            return self.records
+
+        futures = {}
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(pumps)))
+
+        try:
+            for (index, (pump, subquery)) in enumerate(zip(pumps, subqueries)):
+                future = executor.submit(self._run_pump, pump, subquery)
+                futures[future] = index
+
+            (done, not_done) = wait(list(futures),
+                                    timeout=self.timeout or None)
+
+        finally:
+            # cancel Pumps that haven't started, and don't wait for
+            # Pumps that are still running
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+        for index in sorted(futures[future] for future in not_done):
+            LOGGER.warning('%s did not return results within %s sec',
+                           pumps[index], self.timeout)
+
+        results = {}
+
+        for future in sorted(done, key=futures.get):
+            index = futures[future]
+            try:
+                results[index] = future.result()
+            except Exception as error:
+                LOGGER.error('An error occurred while searching %s: %s',
+                             pumps[index], error)
+
+        for index in sorted(results):
+            self._add_records(results[index])
 
         return self.records
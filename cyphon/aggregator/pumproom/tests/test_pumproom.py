@@ -19,10 +19,15 @@ Tests the PumpRoom class.
 """
 
 # standard library
+import time
+from unittest import TestCase
 try:
-    from unittest.mock import patch
+    from unittest.mock import Mock, patch
 except ImportError:
-    from mock import patch
+    from mock import Mock, patch
+
+# third party
+from testfixtures import LogCapture
 
 # local
 from aggregator.pumproom.tests.test_pump import PumpBaseTestCase
@@ -64,3 +69,131 @@ class PumpRoomMultiTestCase(PumpBaseTestCase):
             results = pumproom.get_results(self.query)
             self.assertEqual(results, mock_results)
 
+
+class FakePump(object):
+    """
+    A Pump that sleeps before returning its results.
+    """
+
+    def __init__(self, name, delay, records=None, error=None):
+        self.name = name
+        self.delay = delay
+        self.records = records
+        self.error = error
+        self.started = False
+
+    def __str__(self):
+        return self.name
+
+    def start(self, query):
+        """Sleeps and returns the Pump's records."""
+        self.started = True
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return self.records
+
+
+class PumpRoomConcurrencyTestCase(TestCase):
+    """
+    Tests the concurrent execution of Pumps by the get_results method.
+    """
+
+    DELAY = 0.2
+
+    def setUp(self):
+        self.query = Mock()
+
+    def _get_results(self, pumps, **kwargs):
+        """
+        Runs a PumpRoom with fake Pumps and returns the results and the
+        elapsed time.
+        """
+        pumproom = PumpRoom(reservoirs=list(range(len(pumps))),
+                            task='BKGD_SRCH', **kwargs)
+        start_time = time.time()
+        with patch.object(PumpRoom, '_create_pump',
+                          side_effect=pumps):
+            results = pumproom.get_results(self.query)
+        return (results, time.time() - start_time)
+
+    def test_concurrent(self):
+        """
+        Tests that Reservoirs are searched concurrently, so a search
+        takes about as long as the slowest Reservoir.
+        """
+        pumps = [FakePump('pump_%s' % i, self.DELAY, records=[i])
+                 for i in range(4)]
+        results, elapsed = self._get_results(pumps, max_workers=4)
+        self.assertEqual(results, [0, 1, 2, 3])
+        self.assertLess(elapsed, self.DELAY * 2)
+
+    def test_bounded_pool(self):
+        """
+        Tests that no more than max_workers Reservoirs are searched at
+        once.
+        """
+        pumps = [FakePump('pump_%s' % i, self.DELAY, records=i)
+                 for i in range(4)]
+        results, elapsed = self._get_results(pumps, max_workers=2)
+        self.assertEqual(results, [0, 1, 2, 3])
+        self.assertGreaterEqual(elapsed, self.DELAY * 2)
+        self.assertLess(elapsed, self.DELAY * 3)
+
+    def test_timeout(self):
+        """
+        Tests that results from a Reservoir that times out are left out.
+        """
+        pumps = [
+            FakePump('fast', 0, records=[1]),
+            FakePump('slow', self.DELAY * 5, records=[2]),
+        ]
+        with LogCapture() as log_capture:
+            results, elapsed = self._get_results(pumps, timeout=self.DELAY)
+            log_capture.check(
+                ('aggregator.pumproom.pumproom', 'WARNING',
+                 'slow did not return results within %s sec' % self.DELAY),
+            )
+        self.assertEqual(results, [1])
+        self.assertLess(elapsed, self.DELAY * 3)
+
+    def test_timeout_queued(self):
+        """
+        Tests that Reservoirs still waiting for a worker when the
+        timeout passes are never searched.
+        """
+        pumps = [
+            FakePump('hung', self.DELAY * 5, records=[1]),
+            FakePump('queued', 0, records=[2]),
+        ]
+        with LogCapture() as log_capture:
+            results, elapsed = self._get_results(pumps, max_workers=1,
+                                                 timeout=self.DELAY)
+            log_capture.check(
+                ('aggregator.pumproom.pumproom', 'WARNING',
+                 'hung did not return results within %s sec' % self.DELAY),
+                ('aggregator.pumproom.pumproom', 'WARNING',
+                 'queued did not return results within %s sec'
+                 % self.DELAY),
+            )
+        self.assertEqual(results, [])
+        self.assertLess(elapsed, self.DELAY * 3)
+        time.sleep(self.DELAY)
+        self.assertFalse(pumps[1].started)
+
+    def test_error(self):
+        """
+        Tests that an error in one Reservoir doesn't affect the results
+        of the others.
+        """
+        pumps = [
+            FakePump('broken', 0, error=ValueError('foo')),
+            FakePump('working', 0, records=[2]),
+        ]
+        with LogCapture() as log_capture:
+            results, _ = self._get_results(pumps)
+            log_capture.check(
+                ('aggregator.pumproom.pumproom', 'ERROR',
+                 'An error occurred while searching broken: foo'),
+            )
+        self.assertEqual(results, [2])
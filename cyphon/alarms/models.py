@@ -71,6 +71,22 @@ class AlarmManager(GetByNameManager, FindEnabledMixin, BaseClass):
         for alarm in alarms:
             alarm.process(doc_obj)
 
+    def process_many(self, doc_objs):
+        """Inspect multiple documents with Alarms.
+
+        Parameters
+        ----------
+        doc_objs : |list| of |DocumentObj|
+            The documents that Alarms should inspect.
+
+        Returns
+        -------
+        None
+
+        """
+        for doc_obj in doc_objs:
+            self.process(doc_obj)
+
 
 class Alarm(models.Model, BaseClass):
     """
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2018 Dunbar Security Solutions, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+"""
+Registers functions that act on new |Alerts|.
+
+Work that follows the creation of an |Alert|, such as tagging it or
+notifying users, is done by alert handlers rather than by
+:data:`~django.db.models.signals.post_save` receivers. Handlers run in
+the order they were registered. When `ALERTS['ASYNC_HANDLERS']` is
+enabled they run in a Celery task, so the code that saves an Alert
+doesn't wait for them.
+
+========================  ============================================
+Function                  Description
+========================  ============================================
+:func:`~alert_handler`    Register a function to run for new Alerts.
+:func:`~get_handlers`     Get the registered handlers, in order.
+:func:`~run_handlers`     Run registered handlers for an Alert.
+========================  ============================================
+
+"""
+
+# standard library
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+_HANDLERS = []
+
+
+def alert_handler(func):
+    """Register a function to run when an |Alert| is created.
+
+    Parameters
+    ----------
+    func : function
+        A function that takes a new |Alert| as its only argument.
+
+    Returns
+    -------
+    function
+        The function, unchanged, so this can be used as a decorator.
+
+    """
+    if func not in _HANDLERS:
+        _HANDLERS.append(func)
+    return func
+
+
+def get_handlers():
+    """Get the registered alert handlers.
+
+    Returns
+    -------
+    |list| of function
+        The functions registered with :func:`~alert_handler`, in the
+        order they were registered.
+
+    """
+    return list(_HANDLERS)
+
+
+def get_handler_name(func):
+    """Get the dotted path of an alert handler for logging."""
+    return '%s.%s' % (func.__module__, func.__name__)
+
+
+def run_handlers(alert, start=0):
+    """Run the registered alert handlers for an |Alert|.
+
+    Handlers are run in order. An error in one handler is logged and
+    doesn't prevent the rest from running.
+
+    Parameters
+    ----------
+    alert : |Alert|
+        A new Alert.
+
+    start : int
+        The index of the first handler to run.
+
+    Returns
+    -------
+    None
+
+    """
+    for handler in get_handlers()[start:]:
+        try:
+            handler(alert)
+        except Exception as error:
+            _LOGGER.error('Alert handler %s failed for Alert %s: %s',
+                          get_handler_name(handler), alert.pk, error)
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2018 Dunbar Security Solutions, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+"""
+Defines a command for rebuilding the Alert search index.
+"""
+
+# third party
+from django.core.management.base import BaseCommand
+
+# local
+from alerts.models import Alert
+
+
+class Command(BaseCommand):
+    """
+    Rebuilds the `search_text` and `search_vector` of every Alert.
+
+    Run this after upgrading to populate the index for existing Alerts,
+    or after changing the text fields of a |Container|. Until then,
+    keyword searches look through the fields of unindexed Alerts
+    directly, which is slower.
+    """
+    help = 'Rebuilds the keyword search index for Alerts.'
+
+    BATCH_SIZE = 1000
+
+    def add_arguments(self, parser):
+        """Add an option for indexing only unindexed Alerts."""
+        parser.add_argument(
+            '--missing',
+            action='store_true',
+            help='Only index Alerts that have not been indexed.'
+        )
+
+    def handle(self, *args, **options):
+        """Index each Alert and report the number indexed."""
+        alerts = Alert.objects.select_related('analysis', 'distillery')\
+                              .prefetch_related('comments')\
+                              .order_by('pk')
+        if options['missing']:
+            alerts = alerts.filter(search_vector__isnull=True)
+        last_pk = 0
+        total = 0
+
+        # share Distillery instances so their Containers' fields are
+        # only looked up once
+        distilleries = {}
+
+        while True:
+            batch = list(alerts.filter(pk__gt=last_pk)[:self.BATCH_SIZE])
+            if not batch:
+                break
+            for alert in batch:
+                if alert.distillery_id:
+                    alert.distillery = distilleries.setdefault(
+                        alert.distillery_id, alert.distillery)
+                alert.update_search_index()
+            last_pk = batch[-1].pk
+            total += len(batch)
+
+        self.stdout.write('Indexed %s alerts.' % total)
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2018 Dunbar Security Solutions, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+"""
+Defines a command for recounting |AlertStats|.
+"""
+
+# third party
+from django.core.management.base import BaseCommand
+
+# local
+from alerts.models import AlertStats
+
+
+class Command(BaseCommand):
+    """
+    Rebuilds the |AlertStats| rollup from the Alert table.
+
+    Run this after changing the ``TIME_ZONE`` setting, since
+    |AlertStats| are grouped by local date.
+    """
+    help = 'Recounts Alerts into the AlertStats rollup table.'
+
+    def handle(self, *args, **options):
+        """Rebuild the |AlertStats| and report the number of groups."""
+        total = AlertStats.objects.rebuild()
+        self.stdout.write('Rebuilt %s alert stats groups.' % total)
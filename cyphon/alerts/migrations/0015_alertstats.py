@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.2 on 2026-10-18 12:00
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+from django.db.models.functions import TruncDate
+import django.db.models.deletion
+
+_KEY_FORMAT = '{day}|{level}|{status}|{distillery_id}|{alarm_type_id}|{alarm_id}'
+
+
+def backfill_stats(apps, schema_editor):
+    """Count existing Alerts into AlertStats."""
+    Alert = apps.get_model('alerts', 'Alert')
+    AlertStats = apps.get_model('alerts', 'AlertStats')
+    groups = Alert.objects.annotate(day=TruncDate('created_date'))\
+                          .values('day', 'level', 'status', 'distillery_id',
+                                  'alarm_type_id', 'alarm_id')\
+                          .annotate(count=models.Count('id'))\
+                          .order_by()
+    stats = [AlertStats(key=_KEY_FORMAT.format(**group), **group)
+             for group in groups]
+    AlertStats.objects.bulk_create(stats, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('distilleries', '0004_remove_name_null'),
+        ('alerts', '0014_remove_alert_notes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AlertStats',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=255, unique=True)),
+                ('day', models.DateField(db_index=True)),
+                ('level', models.CharField(choices=[('CRITICAL', 'Critical'), ('HIGH', 'High'), ('MEDIUM', 'Medium'), ('LOW', 'Low'), ('INFO', 'Info')], max_length=20)),
+                ('status', models.CharField(choices=[('NEW', 'New'), ('BUSY', 'Busy'), ('DONE', 'Done')], max_length=20)),
+                ('alarm_id', models.PositiveIntegerField(blank=True, null=True)),
+                ('count', models.IntegerField(default=0)),
+                ('alarm_type', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='contenttypes.ContentType')),
+                ('distillery', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='alert_stats', related_query_name='alert_stats', to='distilleries.Distillery')),
+            ],
+            options={
+                'verbose_name_plural': 'alert stats',
+            },
+        ),
+        migrations.RunPython(
+            backfill_stats,
+            reverse_code=migrations.RunPython.noop
+        ),
+    ]
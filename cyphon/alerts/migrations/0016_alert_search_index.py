@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2018 Dunbar Security Solutions, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+#
+# Generated by Django 1.11.2 on 2026-10-18 12:00
+from __future__ import unicode_literals
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.operations
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('alerts', '0015_alertstats'),
+    ]
+
+    operations = [
+        django.contrib.postgres.operations.TrigramExtension(),
+        migrations.AddField(
+            model_name='alert',
+            name='search_text',
+            field=models.TextField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='alert',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='alert',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='alerts_search_vector_gin'),
+        ),
+        migrations.RunSQL(
+            'CREATE INDEX alerts_search_text_trgm ON alerts_alert '
+            'USING gin (search_text gin_trgm_ops);',
+            reverse_sql='DROP INDEX alerts_search_text_trgm;'
+        ),
+        # lets searches find Alerts that haven't been indexed yet, which
+        # are searched field by field until rebuild_alert_search is run
+        migrations.RunSQL(
+            'CREATE INDEX alerts_unindexed ON alerts_alert (id) '
+            'WHERE search_vector IS NULL;',
+            reverse_sql='DROP INDEX alerts_unindexed;'
+        ),
+    ]
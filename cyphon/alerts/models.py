@@ -19,9 +19,11 @@ Defines Alert class.
 """
 
 # standard library
+import functools
 import hashlib
 import json
 import logging
+import operator
 import urllib
 import uuid
 import time
@@ -35,7 +37,10 @@ from django.contrib.contenttypes.models import ContentType
 from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelation
 from django.contrib.gis.db.models import PointField
 from django.contrib.postgres.fields import JSONField
-from django.db import models
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
+from django.db import IntegrityError, models, transaction
+from django.db.models.functions import TruncDate
 from django.forms import fields
 from django.utils.functional import cached_property
 from django.utils.translation import ugettext_lazy as _
@@ -69,11 +74,92 @@ fields.DateTimeField.strptime = lambda o, v, f: \
                                 dateutil.parser.parse(v)  # pragma: no cover
 
 
+def _get_alarms_for_user(user):
+    """Get subqueries of the |Watchdogs| and |Monitors| visible to a user.
+
+    Parameters
+    ----------
+    user : |AppUser|
+        The user whose |Groups| determine which alarms are visible.
+
+    Returns
+    -------
+    tuple
+        A 2-tuple of |Subqueries| for the ids of |Watchdogs| and
+        |Monitors| that either have no |Groups| or share a |Group|
+        with the user.
+
+    """
+    user_groups = user.groups.all()
+    Monitor = apps.get_model('monitors', 'Monitor')
+    Watchdog = apps.get_model('watchdogs', 'Watchdog')
+    monitors = models.Subquery(Monitor.objects
+        .annotate(models.Count('groups'))
+        .filter(models.Q(groups__count=0) |
+                models.Q(groups__in=user_groups))
+        .values('id'))
+    watchdogs = models.Subquery(Watchdog.objects
+        .annotate(models.Count('groups'))
+        .filter(models.Q(groups__count=0) |
+                models.Q(groups__in=user_groups))
+        .values('id'))
+    return (watchdogs, monitors)
+
+
+def _get_company_query(user):
+    """Get a Q object restricting records to a user's |Company|.
+
+    Returns None for staff users, who can see all records.
+    """
+    if not user.is_staff:
+        return models.Q(distillery__company=user.company) | \
+               models.Q(distillery__company__isnull=True)
+
+
+def _get_local_date(value):
+    """Return the date of a datetime in the current time zone."""
+    value = models.DateTimeField().to_python(value)
+    if timezone.is_aware(value):
+        value = timezone.localtime(value)
+    return value.date()
+
+
+class AlertQuerySet(models.QuerySet):
+    """
+    Keeps |AlertStats| in sync with bulk updates to Alerts.
+    """
+
+    def update(self, **kwargs):
+        """
+        Overrides the default update method to adjust |AlertStats|
+        when fields tracked by the rollup are changed.
+        """
+        if not AlertStats.TRACKED_FIELDS.intersection(kwargs):
+            return super(AlertQuerySet, self).update(**kwargs)
+
+        with transaction.atomic(using=self.db):
+            alert_ids = list(self.values_list('pk', flat=True))
+            alerts = self.model.objects.filter(pk__in=alert_ids)
+            AlertStats.objects.add_alerts(alerts, delta=-1)
+            rows = super(AlertQuerySet, self).update(**kwargs)
+            AlertStats.objects.add_alerts(alerts, delta=1)
+        return rows
+
+    update.alters_data = True
+
+
 class AlertManager(models.Manager):
     """
     Adds methods to the default model manager.
     """
 
+    def get_queryset(self):
+        """
+        Overrides the default get_queryset method to return an
+        |AlertQuerySet|.
+        """
+        return AlertQuerySet(self.model, using=self._db)
+
     def with_codebooks(self):
         """
         Overrides the default get_queryset method to select the related
@@ -88,19 +174,7 @@ class AlertManager(models.Manager):
         """
 
         """
-        user_groups = user.groups.all()
-        Monitor = apps.get_model('monitors', 'Monitor')
-        Watchdog = apps.get_model('watchdogs', 'Watchdog')
-        monitors = models.Subquery(Monitor.objects
-            .annotate(models.Count('groups'))
-            .filter(models.Q(groups__count=0) |
-                    models.Q(groups__in=user_groups))
-            .values('id'))
-        watchdogs = models.Subquery(Watchdog.objects
-            .annotate(models.Count('groups'))
-            .filter(models.Q(groups__count=0) |
-                    models.Q(groups__in=user_groups))
-            .values('id'))
+        (watchdogs, monitors) = _get_alarms_for_user(user)
         return queryset.filter(
             models.Q(watchdog__isnull=True, monitor__isnull=True) |
             models.Q(watchdog__in=watchdogs) |
@@ -111,9 +185,8 @@ class AlertManager(models.Manager):
         """
 
         """
-        if not user.is_staff:
-            query = models.Q(distillery__company=user.company) | \
-                    models.Q(distillery__company__isnull=True)
+        query = _get_company_query(user)
+        if query is not None:
             return queryset.filter(query).distinct()
         else:
             return queryset
@@ -204,6 +277,15 @@ class Alert(models.Model):
         of the |Muzzle| and the Alert. Otherwise, consists of a UUID.
         Used to identify duplicate Alerts.
 
+    search_text : str
+        Lowercased text from the Alert's title, |Analysis| notes,
+        |Comments|, and the text fields of its data. Used for substring
+        keyword searches.
+
+    search_vector : str
+        A weighted full-text search vector built from the same text as
+        `search_text`. Used for keyword searches and ranking.
+
     """
     _WATCHDOG = models.Q(app_label='watchdogs', model='watchdog')
     _MONITOR = models.Q(app_label='monitors', model='monitor')
@@ -213,6 +295,17 @@ class Alert(models.Model):
     _HASH_FORMAT = ('{level}|{distillery}|{alarm_type}'
                     '|{alarm_id}|{field_values}|{bucket:.0f}')
 
+    #: Fields whose changes require the search index to be updated.
+    SEARCH_FIELDS = frozenset(['title', 'data', 'distillery'])
+
+    # weights of each part of the search vector, in order
+    _SEARCH_WEIGHTS = (
+        ('title', 'A'),
+        ('notes', 'B'),
+        ('comments', 'C'),
+        ('data', 'D'),
+    )
+
     level = models.CharField(
         max_length=20,
         choices=ALERT_LEVEL_CHOICES,
@@ -276,6 +369,8 @@ class Alert(models.Model):
         db_index=True,
         unique=True
     )
+    search_text = models.TextField(blank=True, null=True, editable=False)
+    search_vector = SearchVectorField(blank=True, null=True, editable=False)
 
     objects = AlertManager()
 
@@ -286,6 +381,10 @@ class Alert(models.Model):
             ('view_alert', 'Can see existing alerts'),
         )
         ordering = ['-id']
+        indexes = [
+            GinIndex(fields=['search_vector'],
+                     name='alerts_search_vector_gin'),
+        ]
 
     def __str__(self):
         if self.title:
@@ -320,6 +419,102 @@ class Alert(models.Model):
 
         return super(Alert, self).save(*args, **kwargs)
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Overrides the default from_db method to remember the
+        |AlertStats| group the Alert was loaded in.
+        """
+        instance = super(Alert, cls).from_db(db, field_names, values)
+        deferred_fields = instance.get_deferred_fields()
+        if deferred_fields.isdisjoint(AlertStats.ALERT_FIELDS):
+            instance._stats_values = instance.get_stats_values()
+        return instance
+
+    def _get_data_text(self):
+        """
+        Returns a string of values from the Alert's data for the text
+        fields of its Distillery's Container.
+        """
+        if not self.data or not self.distillery:
+            return ''
+
+        values = []
+
+        for field in self.distillery.get_text_fields():
+            value = get_dict_value(field.field_name, self.data)
+            if value in (None, ''):
+                continue
+            if not isinstance(value, str):
+                value = json.dumps(value)
+            values.append(value)
+
+        return '\n'.join(values)
+
+    def _get_search_parts(self):
+        """
+        Returns a dictionary of the text to index for the Alert's
+        title, notes, comments, and data.
+        """
+        try:
+            notes = self.analysis.notes
+        except Analysis.DoesNotExist:
+            notes = ''
+
+        comments = [comment.content for comment in self.comments.all()]
+
+        return {
+            'title': self.title or '',
+            'notes': notes or '',
+            'comments': '\n'.join(comments),
+            'data': self._get_data_text(),
+        }
+
+    def update_search_index(self):
+        """Update the Alert's `search_text` and `search_vector`.
+
+        The fields are written with a queryset update, so no signals
+        are sent and other fields are left untouched.
+
+        Returns
+        -------
+        None
+
+        """
+        parts = self._get_search_parts()
+        vectors = [
+            SearchVector(models.Value(parts[name],
+                                      output_field=models.TextField()),
+                         weight=weight)
+            for (name, weight) in self._SEARCH_WEIGHTS
+        ]
+        self.search_text = '\n'.join(
+            parts[name] for (name, dummy_weight) in self._SEARCH_WEIGHTS
+        ).lower()
+        Alert.objects.filter(pk=self.pk).update(
+            search_text=self.search_text,
+            search_vector=functools.reduce(operator.add, vectors)
+        )
+
+    def get_stats_values(self):
+        """Get the |AlertStats| group the Alert is counted in.
+
+        Returns
+        -------
+        dict
+            A dictionary of |AlertStats| field values for the Alert's
+            day, level, status, distillery, and alarm.
+
+        """
+        return {
+            'day': _get_local_date(self.created_date),
+            'level': self.level,
+            'status': self.status,
+            'distillery_id': self.distillery_id,
+            'alarm_type_id': self.alarm_type_id,
+            'alarm_id': self.alarm_id,
+        }
+
     @property
     def link(self):
         """
@@ -610,6 +805,237 @@ class Alert(models.Model):
             return self._summarize(include_empty=include_empty)
 
 
+class AlertStatsManager(models.Manager):
+    """
+    Adds methods to the default model manager.
+    """
+
+    def adjust(self, values, delta):
+        """Add to the count of an |AlertStats| group.
+
+        Parameters
+        ----------
+        values : dict
+            |AlertStats| field values identifying the group, as
+            returned by :meth:`Alert.get_stats_values`.
+
+        delta : int
+            The number to add to the group's count.
+
+        Returns
+        -------
+        None
+
+        """
+        key = self.model.get_key(values)
+        count = models.F('count') + delta
+
+        if self.filter(key=key).update(count=count):
+            return
+
+        try:
+            with transaction.atomic(using=self.db):
+                self.create(key=key, count=delta, **values)
+        except IntegrityError:
+            # another process created the group in the meantime
+            self.filter(key=key).update(count=count)
+
+    def add_alerts(self, alerts, delta=1):
+        """Add |Alerts| to the counts of their |AlertStats| groups.
+
+        Parameters
+        ----------
+        alerts : |QuerySet| of |Alerts|
+            The |Alerts| to count.
+
+        delta : int
+            The amount to add for each |Alert|. Use -1 to remove the
+            |Alerts| from the counts.
+
+        Returns
+        -------
+        None
+
+        """
+        for group in self.model.get_groups(alerts):
+            count = group.pop('count')
+            self.adjust(group, count * delta)
+
+    def rebuild(self):
+        """Recount all |Alerts| into a fresh set of |AlertStats|.
+
+        Returns
+        -------
+        int
+            The number of |AlertStats| groups created.
+
+        """
+        Alert = apps.get_model('alerts', 'Alert')
+        stats = [self.model(key=self.model.get_key(group), **group)
+                 for group in self.model.get_groups(Alert.objects.all())]
+
+        with transaction.atomic(using=self.db):
+            self.all().delete()
+            self.bulk_create(stats, batch_size=1000)
+
+        return len(stats)
+
+    def filter_by_user(self, user, queryset=None):
+        """Filter |AlertStats| to those for |Alerts| a user can see.
+
+        Mirrors :meth:`AlertManager.filter_by_user`.
+
+        Parameters
+        ----------
+        user : |AppUser|
+            The user viewing the stats.
+
+        queryset : |QuerySet| of |AlertStats|, optional
+            The |AlertStats| to filter. Defaults to all |AlertStats|.
+
+        Returns
+        -------
+        |QuerySet| of |AlertStats|
+
+        """
+        if queryset is None:
+            queryset = self.get_queryset()
+
+        if not user:
+            return queryset.none()
+
+        company_query = _get_company_query(user)
+        if company_query is not None:
+            queryset = queryset.filter(company_query)
+
+        (watchdogs, monitors) = _get_alarms_for_user(user)
+        Monitor = apps.get_model('monitors', 'Monitor')
+        Watchdog = apps.get_model('watchdogs', 'Watchdog')
+        watchdog_type = ContentType.objects.get_for_model(Watchdog)
+        monitor_type = ContentType.objects.get_for_model(Monitor)
+
+        # Alerts whose alarm no longer exists are visible to everyone,
+        # as they are in AlertManager.filter_by_user
+        existing_alarm = (
+            models.Q(alarm_type=watchdog_type,
+                     alarm_id__in=Watchdog.objects.values('id')) |
+            models.Q(alarm_type=monitor_type,
+                     alarm_id__in=Monitor.objects.values('id'))
+        )
+        return queryset.filter(
+            ~existing_alarm |
+            models.Q(alarm_type=watchdog_type, alarm_id__in=watchdogs) |
+            models.Q(alarm_type=monitor_type, alarm_id__in=monitors))
+
+
+class AlertStats(models.Model):
+    """
+    A daily count of |Alerts| with the same level, status,
+    |Distillery|, and |Alarm|.
+
+    AlertStats are kept up to date as |Alerts| are saved, updated, and
+    deleted, so dashboard counts can be read without scanning the
+    Alert table. Use the ``rebuild_alert_stats`` management command to
+    recount them from scratch.
+
+    Attributes
+    ----------
+    key : str
+        A unique string identifying the group.
+
+    day : date
+        The local date on which the |Alerts| were created.
+
+    level : str
+        The level of the |Alerts|.
+
+    status : str
+        The status of the |Alerts|.
+
+    distillery : Distillery
+        The |Distillery| associated with the |Alerts|.
+
+    alarm_type : ContentType
+        The type of |Alarm| that triggered the |Alerts|.
+
+    alarm_id : int
+        The id of the |Alarm| that triggered the |Alerts|.
+
+    count : int
+        The number of |Alerts| in the group.
+
+    """
+    ALERT_FIELDS = frozenset([
+        'created_date',
+        'level',
+        'status',
+        'distillery_id',
+        'alarm_type_id',
+        'alarm_id',
+    ])
+    TRACKED_FIELDS = ALERT_FIELDS | frozenset(['distillery', 'alarm_type'])
+
+    _KEY_FORMAT = '{day}|{level}|{status}|{distillery_id}|{alarm_type_id}|{alarm_id}'
+
+    key = models.CharField(max_length=255, unique=True)
+    day = models.DateField(db_index=True)
+    level = models.CharField(max_length=20, choices=ALERT_LEVEL_CHOICES)
+    status = models.CharField(max_length=20, choices=ALERT_STATUS_CHOICES)
+    distillery = models.ForeignKey(
+        Distillery,
+        blank=True,
+        null=True,
+        related_name='alert_stats',
+        related_query_name='alert_stats',
+        on_delete=models.CASCADE
+    )
+    alarm_type = models.ForeignKey(
+        ContentType,
+        blank=True,
+        null=True,
+        on_delete=models.CASCADE
+    )
+    alarm_id = models.PositiveIntegerField(blank=True, null=True)
+    count = models.IntegerField(default=0)
+
+    objects = AlertStatsManager()
+
+    class Meta(object):
+        """Metadata options."""
+
+        verbose_name_plural = _('alert stats')
+
+    def __str__(self):
+        return '%s: %s' % (self.key, self.count)
+
+    @classmethod
+    def get_key(cls, values):
+        """Return the unique key for a dictionary of group values."""
+        return cls._KEY_FORMAT.format(**values)
+
+    @staticmethod
+    def get_groups(alerts):
+        """Count |Alerts| by |AlertStats| group.
+
+        Parameters
+        ----------
+        alerts : |QuerySet| of |Alerts|
+            The |Alerts| to count.
+
+        Returns
+        -------
+        |QuerySet|
+            Dictionaries of |AlertStats| field values, each with a
+            `count` of the matching |Alerts|.
+
+        """
+        return alerts.annotate(day=TruncDate('created_date'))\
+                     .values('day', 'level', 'status', 'distillery_id',
+                             'alarm_type_id', 'alarm_id')\
+                     .annotate(count=models.Count('id'))\
+                     .order_by()
+
+
 class AnalysisManager(models.Manager):
     """
     Adds methods to the default model manager.
@@ -19,7 +19,9 @@
 """
 
 # standard library
+import logging
 import os
+import smtplib
 
 # third party
 from django.conf import settings
@@ -29,6 +31,7 @@ from django.template import loader
 # local
 from utils.emailutils import emailutils
 
+_LOGGER = logging.getLogger(__name__)
 
 _SUBJECT_TEMPLATE = 'alerts/comment_notification_subject.txt',
 _TEXT_TEMPLATE = 'alerts/comment_notification_text_email.txt',
@@ -83,3 +86,25 @@ def compose_comment_email(comment, user):
         file_name=_LOGO_FILE
     )
     return email_message
+
+
+def send_comment_emails(comment):
+    """Email the other contributors to an |Alert| about a new |Comment|.
+
+    Parameters
+    ----------
+    comment : |Comment|
+        The new |Comment|.
+
+    Returns
+    -------
+    None
+
+    """
+    for user in comment.get_other_contributors():
+        email_message = compose_comment_email(comment, user)
+        try:
+            email_message.send()
+        except smtplib.SMTPAuthenticationError as error:
+            _LOGGER.error('An error occurred when sending an '
+                          'email notification: %s', error)
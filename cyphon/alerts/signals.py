@@ -20,19 +20,29 @@
 
 # standard library
 import logging
-import smtplib
 
 # third party
-from django.db.models.signals import post_save
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 
 # local
 from utils.emailutils.emailutils import emails_enabled
-from .models import Comment
-from .services import compose_comment_email
+from . import tasks
+from .handlers import alert_handler, run_handlers
+from .models import Alert, AlertStats, Analysis, Comment
+from .services import send_comment_emails
 
 _LOGGER = logging.getLogger(__name__)
 
+_ALERT_SETTINGS = getattr(settings, 'ALERTS', {})
+
+
+def _run_async():
+    """Whether work that follows a save should be queued in Celery."""
+    return _ALERT_SETTINGS.get('ASYNC_HANDLERS', False) and not settings.TEST
+
 
 @receiver(post_save, sender=Comment)
 def send_comment_notification(sender, instance, created, **kwargs):
@@ -40,10 +50,98 @@ def send_comment_notification(sender, instance, created, **kwargs):
 
     # email relevant users if a comment is created
     if created and emails_enabled():
-        for user in instance.get_other_contributors():
-            email_message = compose_comment_email(instance, user)
-            try:
-                email_message.send()
-            except smtplib.SMTPAuthenticationError as error:
-                _LOGGER.error('An error occurred when sending an '
-                              'email notification: %s', error)
+        if _run_async():
+            comment_id = instance.pk
+            transaction.on_commit(
+                lambda: tasks.send_comment_notification.delay(comment_id))
+        else:
+            send_comment_emails(instance)
+
+
+@receiver(post_save, sender=Alert, dispatch_uid='alerts.handle_new_alert')
+def handle_new_alert(sender, instance, created, **kwargs):
+    """Run the registered alert handlers when an |Alert| is created.
+
+    Handlers are queued in a Celery task once the transaction commits
+    if `ALERTS['ASYNC_HANDLERS']` is enabled. Otherwise they run now.
+    """
+    if not created:
+        return
+
+    if _run_async():
+        alert_id = instance.pk
+        transaction.on_commit(
+            lambda: tasks.handle_new_alert.delay(alert_id))
+    else:
+        run_handlers(instance)
+
+
+@receiver(pre_save, sender=Alert, dispatch_uid='alerts.get_old_alert_stats')
+def get_old_alert_stats(sender, instance, **kwargs):
+    """Look up the |AlertStats| group of an existing |Alert| that
+    wasn't loaded from the database before it's overwritten."""
+    if instance.pk is None or hasattr(instance, '_stats_values'):
+        return
+
+    old_alert = sender.objects.filter(pk=instance.pk).only(
+        'created_date', 'level', 'status', 'distillery',
+        'alarm_type', 'alarm_id').first()
+
+    if old_alert is not None:
+        instance._stats_values = old_alert.get_stats_values()
+
+
+@receiver(post_save, sender=Alert, dispatch_uid='alerts.update_alert_stats')
+def update_alert_stats(sender, instance, created, **kwargs):
+    """Move a saved |Alert| into its current |AlertStats| group."""
+    old_values = getattr(instance, '_stats_values', None)
+    new_values = instance.get_stats_values()
+
+    if created:
+        AlertStats.objects.adjust(new_values, 1)
+    elif old_values is not None and old_values != new_values:
+        AlertStats.objects.adjust(old_values, -1)
+        AlertStats.objects.adjust(new_values, 1)
+
+    instance._stats_values = new_values
+
+
+@receiver(post_delete, sender=Alert, dispatch_uid='alerts.remove_alert_stats')
+def remove_alert_stats(sender, instance, **kwargs):
+    """Remove a deleted |Alert| from its |AlertStats| group."""
+    values = getattr(instance, '_stats_values', None)
+    if values is None:
+        values = instance.get_stats_values()
+    AlertStats.objects.adjust(values, -1)
+
+
+@receiver(post_save, sender=Alert, dispatch_uid='alerts.index_alert')
+def index_alert(sender, instance, created, update_fields, **kwargs):
+    """Update the search index of an updated |Alert|.
+
+    New Alerts are indexed by :func:`~index_new_alert`.
+    """
+    if created:
+        return
+
+    if update_fields is None or \
+            not Alert.SEARCH_FIELDS.isdisjoint(update_fields):
+        instance.update_search_index()
+
+
+@alert_handler
+def index_new_alert(alert):
+    """Add a new |Alert| to the search index."""
+    alert.update_search_index()
+
+
+@receiver([post_save, post_delete], sender=Analysis,
+          dispatch_uid='alerts.index_analysis_alert')
+@receiver([post_save, post_delete], sender=Comment,
+          dispatch_uid='alerts.index_comment_alert')
+def index_related_alert(sender, instance, **kwargs):
+    """Update the search index of an |Alert| when its |Analysis| or
+    |Comments| change."""
+    alert = Alert.objects.filter(pk=instance.alert_id).first()
+    if alert is not None:
+        alert.update_search_index()
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2018 Dunbar Security Solutions, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+"""
+Celery tasks for work that follows changes to |Alerts|.
+
+"""
+
+# standard library
+import logging
+
+# third party
+from django.conf import settings
+from django.db import close_old_connections
+
+# local
+from cyphon.celeryapp import app
+from .handlers import get_handler_name, get_handlers
+from .models import Alert, Comment
+from .services import send_comment_emails
+
+_LOGGER = logging.getLogger(__name__)
+
+_ALERT_SETTINGS = getattr(settings, 'ALERTS', {})
+
+
+@app.task(bind=True, name='alerts.handle_new_alert',
+          max_retries=_ALERT_SETTINGS.get('HANDLER_RETRIES', 3),
+          default_retry_delay=_ALERT_SETTINGS.get('HANDLER_RETRY_DELAY', 30))
+def handle_new_alert(self, alert_id, start=0):
+    """Run the registered alert handlers for a new |Alert|.
+
+    Handlers run in order. If a handler fails, the task is retried
+    from that handler, so earlier handlers aren't repeated and later
+    ones don't run ahead of it. Once the retries are used up, the error
+    is logged and the remaining handlers are run. Retries are shared
+    by all the handlers for the Alert.
+
+    Parameters
+    ----------
+    alert_id : int
+        The primary key of the Alert.
+
+    start : int
+        The index of the first handler to run.
+
+    Returns
+    -------
+    None
+
+    """
+    try:
+        alert = Alert.objects.filter(pk=alert_id).first()
+
+        if alert is None:
+            _LOGGER.warning('Alert %s no longer exists', alert_id)
+            return
+
+        handlers = get_handlers()
+
+        for index in range(start, len(handlers)):
+            try:
+                handlers[index](alert)
+            except Exception as error:
+                if self.request.retries < self.max_retries:
+                    raise self.retry(args=(alert_id, index), exc=error)
+                _LOGGER.error('Alert handler %s failed for Alert %s: %s',
+                              get_handler_name(handlers[index]),
+                              alert_id, error)
+    finally:
+        close_old_connections()
+
+
+@app.task(name='alerts.send_comment_notification')
+def send_comment_notification(comment_id):
+    """Email users about a new |Comment|.
+
+    Parameters
+    ----------
+    comment_id : int
+        The primary key of the Comment.
+
+    Returns
+    -------
+    None
+
+    """
+    try:
+        comment = Comment.objects.filter(pk=comment_id).first()
+
+        if comment is not None:
+            send_comment_emails(comment)
+    finally:
+        close_old_connections()
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2018 Dunbar Security Solutions, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+"""
+Benchmarks the Alert stats endpoints with and without |AlertStats|.
+
+Run with::
+
+    python manage.py test alerts.tests -p "benchmark_*.py"
+
+"""
+
+# standard library
+import datetime
+import random
+try:
+    from unittest.mock import patch
+except ImportError:
+    from mock import patch
+
+# third party
+from django.utils import timezone
+
+# local
+from alerts.models import Alert, AlertStats
+from alerts.views import AlertViewSet
+from cyphon.choices import ALERT_LEVEL_CHOICES, ALERT_STATUS_CHOICES
+from distilleries.models import Distillery
+from tests.api_tests import CyphonAPITestCase
+from tests.fixture_manager import get_fixtures
+from utils.performance.benchmark import get_rate, report
+
+
+class AlertStatsBenchmark(CyphonAPITestCase):
+    """
+    Compares response rates of the Alert stats endpoints when they
+    are answered from AlertStats and from the Alert table.
+    """
+    fixtures = get_fixtures(['alerts'])
+
+    model_url = 'alerts/'
+
+    ALERTS = 50000
+    DAYS = 90
+    REQUESTS = 10
+
+    ENDPOINTS = [
+        'levels/',
+        'statuses/',
+        'level-timeseries/',
+    ]
+
+    def setUp(self):
+        super(AlertStatsBenchmark, self).setUp()
+        self.authenticate(is_staff=False)
+        now = timezone.now()
+        distilleries = list(Distillery.objects.all())
+        levels = [level for (level, dummy_text) in ALERT_LEVEL_CHOICES]
+        statuses = [status for (status, dummy_text) in ALERT_STATUS_CHOICES]
+        alerts = [
+            Alert(
+                level=random.choice(levels),
+                status=random.choice(statuses),
+                distillery=random.choice(distilleries),
+                created_date=now - datetime.timedelta(
+                    minutes=random.randint(0, self.DAYS * 24 * 60)),
+                muzzle_hash='benchmark-%s' % num,
+                data={}
+            )
+            for num in range(self.ALERTS)
+        ]
+        Alert.objects.bulk_create(alerts, batch_size=1000)
+        AlertStats.objects.rebuild()
+
+    def _get_urls(self, endpoint):
+        """
+        Returns a list of request URLs for an endpoint.
+        """
+        return [self.url + endpoint + '?days=%s' % self.DAYS] * self.REQUESTS
+
+    def test_requests_per_second(self):
+        """
+        Reports requests/sec for each stats endpoint.
+        """
+        results = []
+
+        with patch.object(AlertViewSet, 'MAX_DAYS', self.DAYS):
+            for endpoint in self.ENDPOINTS:
+                urls = self._get_urls(endpoint)
+                stats_rate = get_rate(self.client.get, urls, repeat=1)
+                with patch('alerts.views.AlertViewSet._get_alert_stats',
+                           return_value=None):
+                    alerts_rate = get_rate(self.client.get, urls, repeat=1)
+                results.append(('%s (AlertStats)' % endpoint, stats_rate))
+                results.append(('%s (Alerts)' % endpoint, alerts_rate))
+
+            # counts by collection are always answered from AlertStats
+            urls = self._get_urls('collections/')
+            results.append(('collections/ (AlertStats)',
+                            get_rate(self.client.get, urls, repeat=1)))
+
+        report('Alert stats endpoints', results, unit='requests/sec')
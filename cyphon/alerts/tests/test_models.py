@@ -20,6 +20,7 @@ Tests Alert model methods.
 
 # standard library
 import datetime
+import io
 import logging
 try:
     from unittest.mock import patch
@@ -28,12 +29,15 @@ except ImportError:
 
 # third party
 from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.core.management import call_command
 from django.db import IntegrityError
 from django.test import TestCase
 from django.utils import timezone
 
 # local
-from alerts.models import Alert, Comment
+from alerts.models import Alert, AlertStats, Comment
+from appusers.models import AppUser
 from companies.models import Company
 from distilleries.models import Distillery
 from tests.fixture_manager import get_fixtures
@@ -750,6 +754,134 @@ I have something to say about what you have to say"""
         self.assertEqual(actual, expected)
 
 
+class AlertStatsTestCase(TestCase):
+    """
+    Tests the AlertStats class.
+    """
+    fixtures = get_fixtures(['alerts', 'comments'])
+
+    def assertStatsInSync(self):
+        """
+        Asserts that AlertStats counts match a fresh count of Alerts.
+        """
+        expected = {
+            AlertStats.get_key(group): group['count']
+            for group in AlertStats.get_groups(Alert.objects.all())
+        }
+        actual = {
+            stats.key: stats.count
+            for stats in AlertStats.objects.exclude(count=0)
+        }
+        self.assertEqual(actual, expected)
+
+    def test_fixtures(self):
+        """
+        Tests that Alerts loaded from fixtures are counted.
+        """
+        self.assertStatsInSync()
+        total = sum(AlertStats.objects.values_list('count', flat=True))
+        self.assertEqual(total, Alert.objects.count())
+
+    def test_adjust_new_group(self):
+        """
+        Tests the adjust method when the group doesn't exist yet.
+        """
+        values = Alert.objects.get(pk=1).get_stats_values()
+        values['level'] = 'INFO'
+        AlertStats.objects.adjust(values, 3)
+        stats = AlertStats.objects.get(key=AlertStats.get_key(values))
+        self.assertEqual(stats.count, 3)
+        self.assertEqual(stats.level, 'INFO')
+
+    def test_adjust_existing_group(self):
+        """
+        Tests the adjust method when the group already exists.
+        """
+        values = Alert.objects.get(pk=1).get_stats_values()
+        key = AlertStats.get_key(values)
+        count = AlertStats.objects.get(key=key).count
+        AlertStats.objects.adjust(values, -1)
+        self.assertEqual(AlertStats.objects.get(key=key).count, count - 1)
+
+    def test_add_alerts(self):
+        """
+        Tests the add_alerts method.
+        """
+        alerts = Alert.objects.filter(level='HIGH')
+        AlertStats.objects.add_alerts(alerts, delta=-1)
+        self.assertFalse(AlertStats.objects.filter(level='HIGH')
+                                           .exclude(count=0).exists())
+        AlertStats.objects.add_alerts(alerts)
+        self.assertStatsInSync()
+
+    def test_rebuild(self):
+        """
+        Tests the rebuild method.
+        """
+        AlertStats.objects.update(count=100)
+        AlertStats.objects.adjust(
+            Alert.objects.get(pk=1).get_stats_values(), 5)
+        total = AlertStats.objects.rebuild()
+        self.assertEqual(total, AlertStats.objects.count())
+        self.assertStatsInSync()
+
+    def test_rebuild_command(self):
+        """
+        Tests the rebuild_alert_stats management command.
+        """
+        AlertStats.objects.all().delete()
+        output = io.StringIO()
+        call_command('rebuild_alert_stats', stdout=output)
+        self.assertStatsInSync()
+        self.assertIn('Rebuilt', output.getvalue())
+
+    def test_queryset_update(self):
+        """
+        Tests that bulk updates of tracked fields adjust AlertStats.
+        """
+        Alert.objects.filter(status='NEW').update(status='DONE')
+        self.assertStatsInSync()
+        Alert.objects.filter(pk__in=[1, 2]).update(level='CRITICAL')
+        self.assertStatsInSync()
+
+    def test_queryset_update_untracked(self):
+        """
+        Tests that bulk updates of other fields leave AlertStats alone.
+        """
+        with patch.object(AlertStats.objects, 'add_alerts') as mock_add:
+            Alert.objects.all().update(title='foo')
+            mock_add.assert_not_called()
+
+    def test_filter_by_user(self):
+        """
+        Tests that filter_by_user matches the Alerts a user can see.
+        """
+        user = AppUser.objects.get(pk=2)
+
+        for is_staff in (True, False):
+            user.is_staff = is_staff
+            for group in Group.objects.filter(pk__in=[1, 2]):
+                user.groups.set([group])
+                alerts = Alert.objects.filter_by_user(user)
+                visible = Alert.objects.filter(pk__in=alerts.values('pk'))
+                expected = {
+                    AlertStats.get_key(values): values['count']
+                    for values in AlertStats.get_groups(visible)
+                }
+                actual = {
+                    stats.key: stats.count
+                    for stats in AlertStats.objects.filter_by_user(user)
+                                                   .exclude(count=0)
+                }
+                self.assertEqual(actual, expected)
+
+    def test_filter_by_no_user(self):
+        """
+        Tests that filter_by_user returns nothing without a user.
+        """
+        self.assertFalse(AlertStats.objects.filter_by_user(None).exists())
+
+
 class CommentTestCase(TestCase):
     """
     Tests the Comment model methods.
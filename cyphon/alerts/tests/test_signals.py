@@ -31,7 +31,7 @@ from testfixtures import LogCapture
 
 # local
 from appusers.models import AppUser
-from alerts.models import Comment
+from alerts.models import Alert, AlertStats, Analysis, Comment
 from tests.fixture_manager import get_fixtures
 
 
@@ -50,7 +50,7 @@ class SendCommentNotificationTestCase(TestCase):
         send an email when an existing alert is updated.
         """
         with patch('alerts.signals.emails_enabled', return_value=True):
-            with patch('alerts.signals.compose_comment_email') as mock_compose:
+            with patch('alerts.services.compose_comment_email') as mock_compose:
                 comment = Comment.objects.get(pk=1)
                 comment.save()
                 mock_compose.assert_not_called()
@@ -63,7 +63,7 @@ class SendCommentNotificationTestCase(TestCase):
         """
         mock_email = Mock()
         with patch('alerts.signals.emails_enabled', return_value=True):
-            with patch('alerts.signals.compose_comment_email',
+            with patch('alerts.services.compose_comment_email',
                        return_value=mock_email) as mock_compose:
                 comment = Comment.objects.get(pk=1)
                 user = AppUser.objects.get(pk=2)
@@ -81,7 +81,7 @@ class SendCommentNotificationTestCase(TestCase):
         """
         mock_email = Mock()
         with patch('alerts.signals.emails_enabled', return_value=False):
-            with patch('alerts.signals.compose_comment_email',
+            with patch('alerts.services.compose_comment_email',
                        return_value=mock_email) as mock_compose:
                 comment = Comment.objects.get(pk=1)
                 comment.pk = None
@@ -97,15 +97,216 @@ class SendCommentNotificationTestCase(TestCase):
         mock_email.send = Mock(
             side_effect=SMTPAuthenticationError(535, 'foobar'))
         with patch('alerts.signals.emails_enabled', return_value=True):
-            with patch('alerts.signals.compose_comment_email',
+            with patch('alerts.services.compose_comment_email',
                        return_value=mock_email):
                 with LogCapture() as log_capture:
                     comment = Comment.objects.get(pk=1)
                     comment.pk = None
                     comment.save()
                     log_capture.check(
-                        ('alerts.signals',
+                        ('alerts.services',
                          'ERROR',
                          'An error occurred when sending an email '
                          'notification: (535, \'foobar\')'),
                     )
+
+
+class HandleNewAlertTestCase(TestCase):
+    """
+    Tests the handle_new_alert receiver.
+    """
+    fixtures = get_fixtures(['alerts'])
+
+    def _create_alert(self):
+        """
+        Saves and returns a new Alert.
+        """
+        old_alert = Alert.objects.get(pk=1)
+        alert = Alert(
+            level='HIGH',
+            distillery=old_alert.distillery,
+            doc_id='foo',
+            data={'subject': 'foo'}
+        )
+        alert.save()
+        return alert
+
+    def test_run_now(self):
+        """
+        Tests that alert handlers are run when the Alert is saved if
+        they aren't run asynchronously.
+        """
+        with patch('alerts.signals._run_async', return_value=False):
+            with patch('alerts.signals.run_handlers') as mock_run:
+                alert = self._create_alert()
+        mock_run.assert_called_once_with(alert)
+
+    def test_run_async(self):
+        """
+        Tests that alert handlers are queued in a task once the
+        transaction is committed if they are run asynchronously.
+        """
+        with patch('alerts.signals._run_async', return_value=True):
+            with patch('alerts.signals.transaction.on_commit',
+                       side_effect=lambda func: func()) as mock_commit:
+                with patch('alerts.tasks.handle_new_alert.delay') \
+                        as mock_delay:
+                    with patch('alerts.signals.run_handlers') as mock_run:
+                        alert = self._create_alert()
+        self.assertEqual(mock_commit.call_count, 1)
+        mock_delay.assert_called_once_with(alert.pk)
+        mock_run.assert_not_called()
+
+    def test_updated_alert(self):
+        """
+        Tests that alert handlers aren't run when an Alert is updated.
+        """
+        alert = Alert.objects.get(pk=1)
+        with patch('alerts.signals.run_handlers') as mock_run:
+            alert.save()
+        mock_run.assert_not_called()
+
+
+class AlertStatsReceiversTestCase(TestCase):
+    """
+    Tests the receivers that keep AlertStats up to date.
+    """
+    fixtures = get_fixtures(['alerts'])
+
+    @staticmethod
+    def _get_count(values):
+        """
+        Returns the AlertStats count for a dictionary of group values.
+        """
+        stats = AlertStats.objects.filter(key=AlertStats.get_key(values))
+        return stats.values_list('count', flat=True).first() or 0
+
+    def test_new_alert(self):
+        """
+        Tests that a new Alert is added to its group.
+        """
+        old_alert = Alert.objects.get(pk=1)
+        alert = Alert(
+            level='HIGH',
+            distillery=old_alert.distillery,
+            created_date=old_alert.created_date,
+            doc_id='foo',
+            data={'subject': 'foo'}
+        )
+        values = alert.get_stats_values()
+        count = self._get_count(values)
+        alert.save()
+        self.assertEqual(self._get_count(values), count + 1)
+
+    def test_status_change(self):
+        """
+        Tests that an Alert is moved to a new group when its status
+        changes.
+        """
+        alert = Alert.objects.get(pk=1)
+        old_values = alert.get_stats_values()
+        old_count = self._get_count(old_values)
+        alert.status = 'DONE' if alert.status != 'DONE' else 'NEW'
+        new_values = alert.get_stats_values()
+        new_count = self._get_count(new_values)
+        alert.save()
+        self.assertEqual(self._get_count(old_values), old_count - 1)
+        self.assertEqual(self._get_count(new_values), new_count + 1)
+
+        # saving again leaves the counts alone
+        alert.save()
+        self.assertEqual(self._get_count(new_values), new_count + 1)
+
+    def test_deferred_alert(self):
+        """
+        Tests that an Alert loaded without its tracked fields is
+        looked up before it's moved to a new group.
+        """
+        alert = Alert.objects.defer('level').get(pk=1)
+        old_values = Alert.objects.get(pk=1).get_stats_values()
+        old_count = self._get_count(old_values)
+        new_values = dict(old_values, level='INFO')
+        new_count = self._get_count(new_values)
+        alert.level = 'INFO'
+        alert.save()
+        self.assertEqual(self._get_count(old_values), old_count - 1)
+        self.assertEqual(self._get_count(new_values), new_count + 1)
+
+    def test_unchanged_alert(self):
+        """
+        Tests that saving an Alert without changing tracked fields
+        doesn't touch AlertStats.
+        """
+        alert = Alert.objects.get(pk=1)
+        alert.title = 'foo'
+        with patch.object(AlertStats.objects, 'adjust') as mock_adjust:
+            alert.save()
+            mock_adjust.assert_not_called()
+
+    def test_delete(self):
+        """
+        Tests that a deleted Alert is removed from its group.
+        """
+        alert = Alert.objects.get(pk=1)
+        values = alert.get_stats_values()
+        count = self._get_count(values)
+        alert.delete()
+        self.assertEqual(self._get_count(values), count - 1)
+
+
+class AlertSearchIndexReceiversTestCase(TestCase):
+    """
+    Tests the receivers that keep the Alert search index up to date.
+    """
+    fixtures = get_fixtures(['alerts', 'comments'])
+
+    def test_fixtures(self):
+        """
+        Tests that Alerts loaded from fixtures are indexed.
+        """
+        alert = Alert.objects.get(pk=3)
+        self.assertIn('acme supply co', alert.search_text)
+        self.assertIn('some example notes', alert.search_text)
+        self.assertIn('i have something to say', alert.search_text)
+
+    def test_alert_title(self):
+        """
+        Tests that an Alert is reindexed when its title changes.
+        """
+        alert = Alert.objects.get(pk=1)
+        alert.title = 'Wombat Alert'
+        alert.save()
+        search_text = Alert.objects.get(pk=1).search_text
+        self.assertIn('wombat alert', search_text)
+        self.assertNotIn('acme', search_text)
+
+    def test_update_fields(self):
+        """
+        Tests that an Alert isn't reindexed when fields that aren't
+        indexed are saved.
+        """
+        alert = Alert.objects.get(pk=1)
+        with patch.object(Alert, 'update_search_index') as mock_update:
+            alert.save(update_fields=['status'])
+            mock_update.assert_not_called()
+
+    def test_analysis(self):
+        """
+        Tests that an Alert is reindexed when its Analysis changes.
+        """
+        Analysis.objects.save_notes(Alert.objects.get(pk=2), 'Wombat notes')
+        self.assertIn('wombat notes', Alert.objects.get(pk=2).search_text)
+
+    def test_comment(self):
+        """
+        Tests that an Alert is reindexed when a Comment is added or
+        deleted.
+        """
+        alert = Alert.objects.get(pk=1)
+        user = AppUser.objects.get(pk=1)
+        with patch('alerts.signals.emails_enabled', return_value=False):
+            comment = Comment.objects.create(alert=alert, user=user,
+                                             content='Wombat comment')
+        self.assertIn('wombat comment', Alert.objects.get(pk=1).search_text)
+        comment.delete()
+        self.assertNotIn('wombat', Alert.objects.get(pk=1).search_text)
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2018 Dunbar Security Solutions, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+"""
+Tests Alert tasks.
+"""
+
+# third party
+from django.test import TestCase
+from testfixtures import LogCapture
+
+try:
+    from unittest.mock import Mock, patch
+except ImportError:
+    from mock import Mock, patch
+
+# local
+from alerts.tasks import handle_new_alert, send_comment_notification
+from tests.fixture_manager import get_fixtures
+
+
+class HandleNewAlertTestCase(TestCase):
+    """
+    Tests the handle_new_alert task.
+    """
+    fixtures = get_fixtures(['alerts'])
+
+    def setUp(self):
+        self.calls = []
+        self.failures = {}
+
+    def _get_handler(self, name, failures=0):
+        """
+        Returns an alert handler that records its calls and fails the
+        given number of times.
+        """
+        self.failures[name] = failures
+
+        def handler(alert):
+            self.calls.append((name, alert.pk))
+            if self.failures[name] > 0:
+                self.failures[name] -= 1
+                raise ValueError('%s failed' % name)
+
+        handler.__name__ = name
+        return handler
+
+    def test_handlers_in_order(self):
+        """
+        Tests that handlers are run in order.
+        """
+        handlers = [self._get_handler('foo'), self._get_handler('bar')]
+        with patch('alerts.tasks.get_handlers', return_value=handlers):
+            handle_new_alert.apply(args=(1, ))
+        self.assertEqual(self.calls, [('foo', 1), ('bar', 1)])
+
+    def test_retry_failed_handler(self):
+        """
+        Tests that a task is retried from the handler that failed.
+        """
+        handlers = [
+            self._get_handler('foo'),
+            self._get_handler('bar', failures=1),
+            self._get_handler('baz'),
+        ]
+        with patch('alerts.tasks.get_handlers', return_value=handlers):
+            handle_new_alert.apply(args=(1, ))
+        self.assertEqual(self.calls, [
+            ('foo', 1), ('bar', 1), ('bar', 1), ('baz', 1)
+        ])
+
+    def test_retries_exhausted(self):
+        """
+        Tests that an error is logged and the remaining handlers run
+        when a handler fails on every retry.
+        """
+        handlers = [
+            self._get_handler('foo', failures=100),
+            self._get_handler('bar'),
+        ]
+        with patch('alerts.tasks.get_handlers', return_value=handlers):
+            with LogCapture('alerts.tasks') as log_capture:
+                handle_new_alert.apply(args=(1, ))
+        retries = handle_new_alert.max_retries
+        self.assertEqual(self.calls,
+                         [('foo', 1)] * (retries + 1) + [('bar', 1)])
+        log_capture.check(
+            ('alerts.tasks', 'ERROR',
+             'Alert handler alerts.tests.test_tasks.foo failed for '
+             'Alert 1: foo failed'),
+        )
+
+    def test_missing_alert(self):
+        """
+        Tests that nothing is run for an Alert that doesn't exist.
+        """
+        handlers = [self._get_handler('foo')]
+        with patch('alerts.tasks.get_handlers', return_value=handlers):
+            with LogCapture('alerts.tasks') as log_capture:
+                handle_new_alert.apply(args=(999, ))
+        self.assertEqual(self.calls, [])
+        log_capture.check(
+            ('alerts.tasks', 'WARNING', 'Alert 999 no longer exists'),
+        )
+
+
+class SendCommentNotificationTestCase(TestCase):
+    """
+    Tests the send_comment_notification task.
+    """
+    fixtures = get_fixtures(['comments'])
+
+    def test_send_emails(self):
+        """
+        Tests that emails are sent for a Comment.
+        """
+        mock_email = Mock()
+        with patch('alerts.services.compose_comment_email',
+                   return_value=mock_email) as mock_compose:
+            send_comment_notification.apply(args=(1, ))
+        self.assertEqual(mock_compose.call_count, 1)
+        self.assertEqual(mock_email.send.call_count, 1)
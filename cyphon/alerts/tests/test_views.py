@@ -314,6 +314,22 @@ class AlertLevelAPITests(AlertBaseAPITests):
             }
             self.assertEqual(response.json(), expected)
 
+    def test_get_alert_levels_fallback(self):
+        """
+        Tests that Alert counts by level match when AlertStats can't be
+        used to answer the request.
+        """
+        test_urls = ['?days=7', '?days=7&level=HIGH&status=NEW',
+                     '?days=7&collection=3']
+        for test_url in test_urls:
+            with patch('alerts.views.timezone.now', return_value=self.date):
+                response = self.get_api_response(test_url, is_staff=False)
+                with patch('alerts.views.AlertViewSet._get_alert_stats',
+                           return_value=None):
+                    fallback = self.get_api_response(test_url,
+                                                     is_staff=False)
+                self.assertEqual(response.json(), fallback.json())
+
     def test_get_alert_levels_no_days(self):
         """
         Tests the REST API endpoint for Alert counts by level when no
@@ -528,6 +544,20 @@ class AlertTimeseriesAPITests(AlertBaseAPITests):
                 ]}
             self.assertEqual(response.json(), expected)
 
+    def test_level_timeseries_fallback(self):
+        """
+        Tests that the Alert level timeseries matches when AlertStats
+        can't be used to answer the request.
+        """
+        test_url = '?days=7&status=NEW&status=DONE'
+        date = self.date + timedelta(days=3)
+        with patch('alerts.views.timezone.localtime', return_value=date):
+            response = self.get_api_response(test_url, is_staff=False)
+            with patch('alerts.views.AlertViewSet._get_alert_stats',
+                       return_value=None):
+                fallback = self.get_api_response(test_url, is_staff=False)
+            self.assertEqual(response.json(), fallback.json())
+
     def test_level_timeseries_no_days(self):
         """
         Tests the REST API endpoint for Alert level timeseries when no
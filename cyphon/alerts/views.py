@@ -23,7 +23,7 @@ import datetime
 import json
 
 # third party
-from django.db.models import OuterRef
+from django.db.models import Sum
 from django.shortcuts import get_object_or_404
 from django.core.exceptions import PermissionDenied
 from django.core.serializers import serialize
@@ -41,9 +41,9 @@ from cyphon.choices import ALERT_LEVEL_CHOICES, ALERT_STATUS_CHOICES
 from cyphon.views import CustomModelViewSet
 from distilleries.models import Distillery
 from distilleries.serializers import DistilleryListSerializer
-from utils.dbutils.dbutils import count_by_group, SQCount
+from utils.dbutils.dbutils import count_by_group
 from .filters import AlertFilter
-from .models import Alert, Analysis, Comment
+from .models import Alert, AlertStats, Analysis, Comment
 from .serializers import (
     AlertDetailSerializer,
     AlertListSerializer,
@@ -76,6 +76,16 @@ class AlertViewSet(CustomModelViewSet):
 
     MAX_DAYS = 30
 
+    #: Query parameters that can be answered from |AlertStats|.
+    STATS_PARAMS = frozenset([
+        'days',
+        'collection',
+        'warehouse',
+        'level',
+        'status',
+        'categories',
+    ])
+
     def get_queryset(self):
         """
         Overrides the default method for returning the ViewSet's
@@ -189,10 +199,77 @@ class AlertViewSet(CustomModelViewSet):
         )
         return counts[field_name]
 
+    def _get_alert_stats(self, start_date, end_date=None):
+        """
+        Returns a QuerySet of AlertStats for the request's filters, or
+        None if the request uses filters that AlertStats can't answer.
+        """
+        params = self.request.query_params
+
+        if not self.STATS_PARAMS.issuperset(params.keys()):
+            return None
+
+        filterset = AlertFilter(params, queryset=Alert.objects.none())
+        if not filterset.form.is_valid():
+            return None
+
+        data = filterset.form.cleaned_data
+        stats = AlertStats.objects.filter_by_user(self.request.user)
+        stats = stats.filter(day__gte=start_date.date())
+
+        if end_date is not None:
+            stats = stats.filter(day__lt=end_date.date())
+
+        if data.get('collection'):
+            stats = stats.filter(distillery__in=data['collection'])
+
+        if data.get('warehouse'):
+            stats = stats.filter(
+                distillery__collection__warehouse__in=data['warehouse'])
+
+        if data.get('level'):
+            stats = stats.filter(level__in=data['level'])
+
+        if data.get('status'):
+            stats = stats.filter(status__in=data['status'])
+
+        if data.get('categories'):
+            distilleries = Distillery.objects.filter(
+                categories__in=data['categories']).values('id')
+            stats = stats.filter(distillery__in=distilleries)
+
+        return stats
+
+    @staticmethod
+    def _sum_by_field(stats, field_name, choices):
+        """
+        Takes a QuerySet of AlertStats, a field name, and a tuple of
+        choices. Returns a dictionary of alert counts for each choice.
+        """
+        counts = {key: 0 for (key, dummy_text) in choices}
+        totals = stats.values(field_name).annotate(total=Sum('count'))\
+                      .order_by()
+        for total in totals:
+            counts[total[field_name]] = total['total']
+        return counts
+
     def _timeseries(self, days, field_name, choices):
         """
 
         """
+        start_date = self._get_date(days)
+        end_date = self._get_date(0)
+        stats = self._get_alert_stats(start_date, end_date)
+
+        if stats is not None:
+            return self._timeseries_from_stats(
+                stats=stats,
+                start_date=start_date,
+                days=days,
+                field_name=field_name,
+                choices=choices
+            )
+
         counts = {'date': []}
 
         for (value, dummy_text) in choices:
@@ -213,6 +290,31 @@ class AlertViewSet(CustomModelViewSet):
 
         return counts
 
+    @staticmethod
+    def _timeseries_from_stats(stats, start_date, days, field_name, choices):
+        """
+        Takes a QuerySet of AlertStats and returns a timeseries of
+        daily alert counts for each choice, using a single query.
+        """
+        first_day = start_date.date()
+        dates = [first_day + datetime.timedelta(days=day)
+                 for day in range(days)]
+        counts = {'date': dates}
+
+        for (value, dummy_text) in choices:
+            counts[value] = [0] * days
+
+        totals = stats.values('day', field_name)\
+                      .annotate(total=Sum('count'))\
+                      .order_by()
+
+        for total in totals:
+            index = (total['day'] - first_day).days
+            if 0 <= index < days and total[field_name] in counts:
+                counts[total[field_name]][index] = total['total']
+
+        return counts
+
     @staticmethod
     def _handle_missing_days_param():
         """
@@ -252,12 +354,18 @@ class AlertViewSet(CustomModelViewSet):
         if error:
             return error
         else:
-            queryset = self._filter_by_start_date(int(days))
-            counts = self._counts_by_field(
-                queryset=queryset,
-                field_name=field_name,
-                choices=choices
-            )
+            start_date = self._get_date(days)
+            stats = self._get_alert_stats(start_date)
+
+            if stats is not None:
+                counts = self._sum_by_field(stats, field_name, choices)
+            else:
+                queryset = self._filter_by_timeframe(start_date=start_date)
+                counts = self._counts_by_field(
+                    queryset=queryset,
+                    field_name=field_name,
+                    choices=choices
+                )
             return Response(counts)
 
     @list_route(methods=['get'], url_path='levels')
@@ -289,15 +397,18 @@ class AlertViewSet(CustomModelViewSet):
         if error:
             return error
         else:
-            alerts = Alert.objects.filter(
-                created_date__gte=date,
-                distillery_id=OuterRef('collection_id'))
-            alerts = Alert.objects.filter_by_user(request.user, alerts)
+            stats = AlertStats.objects.filter_by_user(
+                request.user,
+                AlertStats.objects.filter(day__gte=date.date(),
+                                          distillery__isnull=False)
+            )
+            totals = stats.values('distillery__name')\
+                          .annotate(total=Sum('count'))\
+                          .order_by()
             counts = {
-                d.name: d.alert_count
-                for d in Distillery.objects.annotate(
-                    alert_count=SQCount(alerts))
-                if d.alert_count
+                total['distillery__name']: total['total']
+                for total in totals
+                if total['total']
             }
             return Response(counts)
 
@@ -24,14 +24,11 @@ classes.
 
 """
 
-# standard library
-import datetime
-
 # third party
 from django.db import models
-from django.utils import timezone
 
 # local
+from ambassador import ratelimits
 from ambassador.passports.models import Passport
 from ambassador.visas.models import Visa
 from cyphon.models import SelectRelatedManager, GetByNameMixin
@@ -153,13 +150,6 @@ class Emissary(models.Model):
     def __str__(self):
         return self.name
 
-    def _get_call_count(self, start_time):
-        """
-        Takes a datetime and returns an int of the number of calls
-        recorded since that time.
-        """
-        return self.passport.get_call_count(start_time)
-
     def _get_allowed_calls(self):
         """
         Returns the number of calls allowed in a request interval.
@@ -172,15 +162,12 @@ class Emissary(models.Model):
         """
         return self.visa.get_request_interval_in_minutes()
 
-    def _get_interval_start_time(self):
+    def _get_time_until_reset_in_minutes(self):
         """
-        Returns a datetime for the start of the current rate limit
-        interval.
+        Returns the number of minutes until the oldest call in the
+        current rate limit interval leaves the interval.
         """
-        current_time = timezone.now()
-        minutes = self._get_time_interval_in_minutes()
-        time_delta = datetime.timedelta(minutes=minutes)
-        return current_time - time_delta
+        return ratelimits.get_seconds_until_reset(self) / 60.0
 
     def _has_endpoint(self, endpoint):
         """
@@ -219,9 +206,14 @@ class Emissary(models.Model):
             The number of calls made during the current rate limit
             interval.
 
+        Note
+        ----
+        Calls are counted by a rate limiter (see
+        :mod:`ambassador.ratelimits`) rather than by counting |Stamps|
+        in the database.
+
         """
-        start_time = self._get_interval_start_time()
-        return self._get_call_count(start_time)
+        return ratelimits.get_call_count(self)
 
     def remaining_calls(self):
         """Get the number of calls that can be made in the current
@@ -299,11 +291,11 @@ class Emissary(models.Model):
             based on the |Emissary|'s |Visa|.
 
         """
-        remaining_calls = self._get_remaining_calls()
+        remaining_calls = self.remaining_calls()
         balance = remaining_calls - query_cnt
 
         if balance < 0:
-            allowed_calls = self.get_allowed_calls()
+            allowed_calls = self._get_allowed_calls()
             needed_calls = abs(balance)
 
             # get the floor of the number of intervals needed to fulfill
@@ -312,8 +304,9 @@ class Emissary(models.Model):
             # interval starts, rather than spreading them out over the
             # interval - so we don't count time from the last interval
             num_intervals = needed_calls // allowed_calls
-            extra_time = num_intervals * self.get_time_interval_in_minutes()
-            time_left_in_current_intrvl = self.get_time_remaining_in_minutes()
+            extra_time = num_intervals * self._get_time_interval_in_minutes()
+            time_left_in_current_intrvl = \
+                self._get_time_until_reset_in_minutes()
             return time_left_in_current_intrvl + extra_time
         else:
             return 0
@@ -120,3 +120,22 @@ class Passport(models.Model):
 
         """
         return self.stamps.filter(job_start__gte=start_time).count()
+
+    def get_call_times(self, start_time):
+        """Get the times the |Passport| has been used since start_time.
+
+        Parameters
+        ----------
+        start_time : |datetime|
+            The start of the time frame in which calls should be found.
+
+        Returns
+        -------
+        |list| of |datetime|
+            The :attr:`~ambassador.stamps.models.Stamp.job_start` of
+            each |Stamp| associated with the |Passport| that is greater
+            or equal to `start_time`.
+
+        """
+        return list(self.stamps.filter(job_start__gte=start_time)
+                    .values_list('job_start', flat=True))
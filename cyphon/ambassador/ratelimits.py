@@ -0,0 +1,411 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2018 Dunbar Security Solutions, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+"""
+Tracks the API calls made by |Emissaries| to enforce their |Visas|.
+
+Each |Emissary| may make a number of calls to its API in a sliding
+interval defined by its |Visa|. Rather than counting |Stamps| in the
+database before each call, calls are counted by a rate limiter keyed
+by the |Emissary|'s |Passport| and |Visa|. |Stamps| remain the audit
+log of the calls, and are used to seed a limiter's counts.
+
+The rate limiter uses one of two stores, chosen by the
+`EMISSARIES['RATE_LIMIT_BACKEND']` setting:
+
+``'local'``
+    Keeps the time of each call in process memory. The times are
+    reloaded from |Stamps| every `EMISSARIES['RATE_LIMIT_SYNC']`
+    seconds, to include calls made by other processes.
+
+``'cache'``
+    Counts calls in Django's cache, divided into
+    `EMISSARIES['RATE_LIMIT_BUCKETS']` buckets per interval. If the
+    cache is shared (e.g., Memcached), the counts are shared by all
+    processes.
+
+===========================  ===========================================
+Class                        Description
+===========================  ===========================================
+:class:`~LocalStore`         Keeps call times in process memory.
+:class:`~CacheStore`         Counts calls in Django's cache.
+===========================  ===========================================
+
+================================  ======================================
+Function                          Description
+================================  ======================================
+:func:`~get_call_count`           Get the calls made in a Visa interval.
+:func:`~get_seconds_until_reset`  Get the time until a call expires.
+:func:`~record_call`              Count a call made by an Emissary.
+:func:`~get_store`                Get the configured store.
+================================  ======================================
+
+"""
+
+# standard library
+from collections import deque
+import datetime
+import math
+import threading
+import time
+
+# third party
+from django.conf import settings
+from django.core.cache import cache as default_cache
+from django.utils import timezone
+
+_EMISSARY_SETTINGS = getattr(settings, 'EMISSARIES', {})
+
+_BACKEND = _EMISSARY_SETTINGS.get('RATE_LIMIT_BACKEND', 'local')
+
+_BUCKETS = _EMISSARY_SETTINGS.get('RATE_LIMIT_BUCKETS', 10)
+
+_SYNC_INTERVAL = _EMISSARY_SETTINGS.get('RATE_LIMIT_SYNC', 60)
+
+_STATE = {
+    'store': None,
+}
+
+_LOCK = threading.Lock()
+
+
+class LocalStore(object):
+    """Keeps the times of recent API calls in process memory.
+
+    Calls are counted in an exact sliding window. The times for a key
+    expire after `sync_interval` seconds, so they are reloaded from
+    the database to include calls made by other processes.
+
+    Parameters
+    ----------
+    sync_interval : int
+        Seconds before the call times for a key must be reloaded.
+
+    """
+
+    def __init__(self, sync_interval=_SYNC_INTERVAL):
+        self.sync_interval = sync_interval
+        self._calls = {}
+        self._loaded = {}
+        self._lock = threading.Lock()
+
+    def is_loaded(self, key):
+        """
+        Takes a key and returns a |bool| indicating whether its call
+        times are loaded and current.
+        """
+        loaded = self._loaded.get(key)
+        return loaded is not None and \
+            time.time() - loaded < self.sync_interval
+
+    def load(self, key, interval, timestamps):
+        """
+        Takes a key, the length of its interval in seconds, and a list
+        of timestamps for calls made in the current interval, and
+        replaces the call times for the key.
+        """
+        with self._lock:
+            self._calls[key] = deque(sorted(timestamps))
+            self._loaded[key] = time.time()
+
+    def _prune(self, key, interval):
+        """
+        Takes a key and the length of its interval in seconds, and
+        removes call times that are outside the current interval.
+        Returns the remaining call times.
+        """
+        calls = self._calls.setdefault(key, deque())
+        start_time = time.time() - interval
+        while calls and calls[0] < start_time:
+            calls.popleft()
+        return calls
+
+    def count(self, key, interval):
+        """
+        Takes a key and the length of its interval in seconds, and
+        returns the number of calls made in the current interval.
+        """
+        with self._lock:
+            return len(self._prune(key, interval))
+
+    def add(self, key, interval, timestamp=None):
+        """
+        Takes a key, the length of its interval in seconds, and an
+        optional timestamp, and records a call for the key.
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        with self._lock:
+            calls = self._prune(key, interval)
+            calls.append(timestamp)
+
+    def get_oldest(self, key, interval):
+        """
+        Takes a key and the length of its interval in seconds, and
+        returns the timestamp of the oldest call in the current
+        interval, or None if there are no calls.
+        """
+        with self._lock:
+            calls = self._prune(key, interval)
+            return calls[0] if calls else None
+
+    def clear(self):
+        """Discard all call times."""
+        with self._lock:
+            self._calls.clear()
+            self._loaded.clear()
+
+
+class CacheStore(object):
+    """Counts API calls in Django's cache.
+
+    Each interval is divided into a number of buckets, which are
+    counted with the cache's atomic increment. A call is counted until
+    its bucket leaves the interval, so counts may include calls made up
+    to one bucket width before the start of the interval.
+
+    Parameters
+    ----------
+    buckets : int
+        The number of buckets in an interval.
+
+    cache : `BaseCache`, optional
+        The Django cache to use. Defaults to the default cache.
+
+    """
+
+    def __init__(self, buckets=_BUCKETS, cache=None):
+        self.buckets = buckets
+        self.cache = cache or default_cache
+
+    def _get_width(self, interval):
+        """
+        Takes the length of an interval in seconds and returns the
+        width of a bucket in seconds.
+        """
+        return max(float(interval) / self.buckets, 1)
+
+    def _get_bucket_keys(self, key, interval, now=None):
+        """
+        Takes a key and the length of its interval in seconds, and
+        returns a list of (bucket start time, cache key) tuples for the
+        buckets in the current interval, oldest first.
+        """
+        width = self._get_width(interval)
+        now = time.time() if now is None else now
+        last = int(now // width)
+        first = int((now - interval) // width)
+        return [(index * width, '%s:%s' % (key, index))
+                for index in range(first, last + 1)]
+
+    def is_loaded(self, key):
+        """
+        Takes a key and returns a |bool| indicating whether its counts
+        were loaded by this or another process.
+        """
+        return self.cache.get('%s:loaded' % key) is not None
+
+    def load(self, key, interval, timestamps):
+        """
+        Takes a key, the length of its interval in seconds, and a list
+        of timestamps for calls made in the current interval, and adds
+        them to the counts for the key, if no process has already done
+        so.
+        """
+        if self.cache.add('%s:loaded' % key, True, timeout=None):
+            for timestamp in timestamps:
+                self.add(key, interval, timestamp)
+
+    def count(self, key, interval):
+        """
+        Takes a key and the length of its interval in seconds, and
+        returns the number of calls made in the current interval.
+        """
+        bucket_keys = [bucket_key for (_, bucket_key)
+                       in self._get_bucket_keys(key, interval)]
+        return sum(self.cache.get_many(bucket_keys).values())
+
+    def add(self, key, interval, timestamp=None):
+        """
+        Takes a key, the length of its interval in seconds, and an
+        optional timestamp, and counts a call for the key.
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        width = self._get_width(interval)
+        bucket_key = '%s:%s' % (key, int(timestamp // width))
+        timeout = int(math.ceil(interval + width))
+
+        self.cache.add(bucket_key, 0, timeout=timeout)
+        try:
+            self.cache.incr(bucket_key)
+        except ValueError:  # the bucket expired or was evicted
+            self.cache.add(bucket_key, 1, timeout=timeout)
+
+    def get_oldest(self, key, interval):
+        """
+        Takes a key and the length of its interval in seconds, and
+        returns the start time of the oldest bucket with calls in the
+        current interval, or None if there are no calls.
+        """
+        bucket_keys = self._get_bucket_keys(key, interval)
+        counts = self.cache.get_many([bucket_key for (_, bucket_key)
+                                      in bucket_keys])
+        for (start_time, bucket_key) in bucket_keys:
+            if counts.get(bucket_key):
+                return start_time
+
+    def clear(self):
+        """
+        Does nothing, since entries in a shared cache may be in use by
+        other processes. They expire with their intervals.
+        """
+        pass
+
+
+def get_store():
+    """Get the store used to count API calls.
+
+    Returns
+    -------
+    |LocalStore| or |CacheStore|
+        The store for the `EMISSARIES['RATE_LIMIT_BACKEND']` setting.
+
+    """
+    if _STATE['store'] is None:
+        with _LOCK:
+            if _STATE['store'] is None:
+                if _BACKEND == 'cache':
+                    _STATE['store'] = CacheStore()
+                else:
+                    _STATE['store'] = LocalStore()
+    return _STATE['store']
+
+
+def _get_key(emissary):
+    """
+    Returns a key identifying the Passport and Visa of an Emissary.
+    """
+    return 'ratelimit:%s:%s' % (emissary.passport_id, emissary.visa_id)
+
+
+def _get_interval(emissary):
+    """
+    Returns the number of seconds in an Emissary's Visa interval.
+    """
+    return emissary.visa.get_request_interval_in_minutes() * 60
+
+
+def _load(store, key, emissary, interval):
+    """
+    Loads the times of the calls made with an Emissary's Passport in
+    the current interval from its Stamps.
+    """
+    start_time = timezone.now() - datetime.timedelta(seconds=interval)
+    timestamps = [job_start.timestamp() for job_start
+                  in emissary.passport.get_call_times(start_time)]
+    store.load(key, interval, timestamps)
+
+
+def _get_loaded_store(emissary):
+    """
+    Returns the store, the key, and the interval for an Emissary, with
+    the Emissary's calls loaded in the store.
+    """
+    store = get_store()
+    key = _get_key(emissary)
+    interval = _get_interval(emissary)
+
+    if not store.is_loaded(key):
+        _load(store, key, emissary, interval)
+
+    return (store, key, interval)
+
+
+def get_call_count(emissary):
+    """Get the number of calls an |Emissary| made in its |Visa| interval.
+
+    Parameters
+    ----------
+    emissary : |Emissary|
+        An |Emissary| with a |Visa|.
+
+    Returns
+    -------
+    int
+        The number of calls made in the current interval.
+
+    """
+    store, key, interval = _get_loaded_store(emissary)
+    return store.count(key, interval)
+
+
+def get_seconds_until_reset(emissary):
+    """Get the seconds until the oldest call leaves the |Visa| interval.
+
+    Parameters
+    ----------
+    emissary : |Emissary|
+        An |Emissary| with a |Visa|.
+
+    Returns
+    -------
+    float
+        The number of seconds until another call can be made, if the
+        |Emissary| has reached its limit, or 0 if no calls have been
+        made in the current interval.
+
+    """
+    store, key, interval = _get_loaded_store(emissary)
+    oldest = store.get_oldest(key, interval)
+
+    if oldest is None:
+        return 0
+
+    return max(0, oldest + interval - time.time())
+
+
+def record_call(emissary, timestamp=None):
+    """Count a call made by an |Emissary|.
+
+    Parameters
+    ----------
+    emissary : |Emissary|
+        The |Emissary| that made the call.
+
+    timestamp : float, optional
+        The time of the call. Defaults to the current time.
+
+    Returns
+    -------
+    None
+
+    Note
+    ----
+    The call's |Stamp| should be saved before the call is recorded. If
+    the store must first be loaded from |Stamps|, the call is counted
+    from its |Stamp|.
+
+    """
+    if emissary.visa_id is None:
+        return
+
+    store = get_store()
+    key = _get_key(emissary)
+    interval = _get_interval(emissary)
+
+    if store.is_loaded(key):
+        store.add(key, interval, timestamp)
+    else:
+        _load(store, key, emissary, interval)
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2018 Dunbar Security Solutions, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+"""
+Tests the ratelimits module.
+"""
+
+# standard library
+import datetime
+import time
+from unittest import TestCase
+try:
+    from unittest.mock import Mock, patch
+except ImportError:
+    from mock import Mock, patch
+
+# third party
+from django.core.cache.backends.locmem import LocMemCache
+from django.utils import timezone
+
+# local
+from ambassador import ratelimits
+from ambassador.ratelimits import CacheStore, LocalStore
+
+
+class LocalStoreTestCase(TestCase):
+    """
+    Tests the LocalStore class.
+    """
+
+    def setUp(self):
+        self.store = LocalStore(sync_interval=60)
+
+    def test_count(self):
+        """
+        Tests that calls outside the interval are not counted.
+        """
+        now = time.time()
+        self.store.load('key', 60, [now - 120, now - 30])
+        self.store.add('key', 60)
+        self.assertEqual(self.store.count('key', 60), 2)
+
+    def test_is_loaded(self):
+        """
+        Tests that call times must be reloaded after the sync interval.
+        """
+        self.assertFalse(self.store.is_loaded('key'))
+        self.store.load('key', 60, [])
+        self.assertTrue(self.store.is_loaded('key'))
+        self.store.sync_interval = 0
+        self.assertFalse(self.store.is_loaded('key'))
+
+    def test_get_oldest(self):
+        """
+        Tests the get_oldest method.
+        """
+        now = time.time()
+        self.assertIsNone(self.store.get_oldest('key', 60))
+        self.store.load('key', 60, [now - 10, now - 20])
+        self.assertEqual(self.store.get_oldest('key', 60), now - 20)
+
+
+class CacheStoreTestCase(TestCase):
+    """
+    Tests the CacheStore class.
+    """
+
+    def setUp(self):
+        cache = LocMemCache('ratelimits', {})
+        cache.clear()
+        self.store = CacheStore(buckets=10, cache=cache)
+
+    def test_count(self):
+        """
+        Tests that calls are counted in buckets within the interval.
+        """
+        now = time.time()
+        self.store.add('key', 60, now - 600)
+        self.store.add('key', 60, now - 30)
+        self.store.add('key', 60)
+        self.store.add('key', 60)
+        self.assertEqual(self.store.count('key', 60), 3)
+
+    def test_load_once(self):
+        """
+        Tests that calls are only loaded by the first process.
+        """
+        now = time.time()
+        self.assertFalse(self.store.is_loaded('key'))
+        self.store.load('key', 60, [now - 10])
+        self.store.load('key', 60, [now - 10])
+        self.assertTrue(self.store.is_loaded('key'))
+        self.assertEqual(self.store.count('key', 60), 1)
+
+    def test_get_oldest(self):
+        """
+        Tests that get_oldest returns the start of the oldest bucket
+        with calls.
+        """
+        now = time.time()
+        self.assertIsNone(self.store.get_oldest('key', 60))
+        self.store.add('key', 60, now - 30)
+        oldest = self.store.get_oldest('key', 60)
+        self.assertLessEqual(oldest, now - 30)
+        self.assertGreaterEqual(oldest, now - 36)
+
+
+class RateLimitTestCase(TestCase):
+    """
+    Tests the get_call_count, get_seconds_until_reset, and record_call
+    functions.
+    """
+
+    def setUp(self):
+        self.store = LocalStore(sync_interval=60)
+        self.emissary = Mock(passport_id=1, visa_id=2)
+        self.emissary.visa.get_request_interval_in_minutes.return_value = 1
+        self.job_start = timezone.now() - datetime.timedelta(seconds=30)
+        self.emissary.passport.get_call_times.return_value = [self.job_start]
+        self.patch = patch.dict(ratelimits._STATE, {'store': self.store})
+        self.patch.start()
+
+    def tearDown(self):
+        self.patch.stop()
+
+    def test_get_call_count(self):
+        """
+        Tests that calls are loaded from Stamps only once.
+        """
+        self.assertEqual(ratelimits.get_call_count(self.emissary), 1)
+        self.assertEqual(ratelimits.get_call_count(self.emissary), 1)
+        self.assertEqual(
+            self.emissary.passport.get_call_times.call_count, 1)
+
+    def test_record_call(self):
+        """
+        Tests that a recorded call is counted without querying Stamps.
+        """
+        ratelimits.get_call_count(self.emissary)
+        ratelimits.record_call(self.emissary)
+        self.assertEqual(ratelimits.get_call_count(self.emissary), 2)
+        self.assertEqual(
+            self.emissary.passport.get_call_times.call_count, 1)
+
+    def test_record_call_not_loaded(self):
+        """
+        Tests that a call isn't counted twice when the store is loaded
+        from Stamps that include the call.
+        """
+        ratelimits.record_call(self.emissary)
+        self.assertEqual(ratelimits.get_call_count(self.emissary), 1)
+
+    def test_record_call_no_visa(self):
+        """
+        Tests that calls are not counted for an Emissary without a Visa.
+        """
+        self.emissary.visa_id = None
+        ratelimits.record_call(self.emissary)
+        self.assertFalse(self.emissary.passport.get_call_times.called)
+
+    def test_get_seconds_until_reset(self):
+        """
+        Tests the get_seconds_until_reset function.
+        """
+        seconds = ratelimits.get_seconds_until_reset(self.emissary)
+        self.assertGreater(seconds, 25)
+        self.assertLessEqual(seconds, 30)
+
+    def test_get_seconds_until_reset_no_calls(self):
+        """
+        Tests the get_seconds_until_reset function when no calls have
+        been made.
+        """
+        self.emissary.passport.get_call_times.return_value = []
+        self.assertEqual(ratelimits.get_seconds_until_reset(self.emissary), 0)
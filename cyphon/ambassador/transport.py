@@ -31,6 +31,7 @@ import logging
 from django.utils.functional import cached_property
 
 # local
+from ambassador import ratelimits
 from ambassador.exceptions import EmissaryDoesNotExist
 from ambassador.stamps.models import Stamp
 from cyphon.baseclass import BaseClass
@@ -136,14 +137,17 @@ class Transport(BaseClass):
     def _stamp_passport(self):
         """
         Creates a Stamp associated with the Transport's Endpoint,
-        Passport, and AppUser. Saves it to the database and returns the
-        saved object.
+        Passport, and AppUser. Saves it to the database, counts the call
+        against the Emissary's rate limit, and returns the saved object.
         """
-        return Stamp.objects.create(
+        stamp = Stamp.objects.create(
             endpoint=self.endpoint,
             passport=self.passport,
             user=self.user
         )
+        ratelimits.record_call(self.emissary,
+                               timestamp=stamp.job_start.timestamp())
+        return stamp
 
     def get_key(self):
         """Get the consumer/client/developer key used to authenticate requests.
@@ -134,6 +134,16 @@ class Container(models.Model):
         else:
             return data
 
+    def add_labels(self, data_list):
+        """
+        Takes a list of dictionaries of data and returns a list of the
+        'labeled' data, as in add_label(). The data are analyzed together.
+        """
+        if self.label:
+            return self.label.add_many(data_list)
+        else:
+            return data_list
+
     def get_sample(self, data):
         """
         Takes a dictionary of bottled data and returns a dictionary of 'teaser'
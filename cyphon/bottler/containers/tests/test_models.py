@@ -171,6 +171,24 @@ class ContainerTestCase(TestCase):
         expected = self.data
         self.assertEqual(actual, expected)
 
+    def test_add_labels_when_defined(self):
+        """
+        Tests the add_labels method for a Container than has a Label.
+        """
+        mock_docs = [Mock()]
+        self.labeled_container.label.add_many = Mock(return_value=mock_docs)
+        actual = self.labeled_container.add_labels([self.data])
+        self.labeled_container.label.add_many.assert_called_once_with(
+            [self.data])
+        self.assertEqual(actual, mock_docs)
+
+    def test_add_labels_when_undefined(self):
+        """
+        Tests the add_labels method for a Container than has no Label.
+        """
+        actual = self.plain_container.add_labels([self.data])
+        self.assertEqual(actual, [self.data])
+
     def test_get_sample_with_taste(self):
         """
         Tests the get_sample method for a Container than has a Taste.
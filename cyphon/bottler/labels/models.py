@@ -104,6 +104,16 @@ class LabelField(DataField):
         value = self._get_result(data)
         return {key: value}
 
+    def create_many(self, data_list):
+        """
+        Takes a list of dictionaries of bottled data and returns a list
+        of dictionaries containing the results of the analysis, which
+        is performed on the whole list at once.
+        """
+        key = self.field_name
+        values = self.analyzer.get_results(data_list)
+        return [{key: value} for value in values]
+
 
 class LabelManager(GetByNameManager):
     """
@@ -156,6 +166,33 @@ class Label(models.Model):
         data_copy.update(label)
         return data_copy
 
+    def create_many(self, data_list):
+        """
+        Takes a list of dictionaries of bottled data and returns a list
+        of dictionaries of metadata, as in create(). Each of the Label's
+        LabelFields analyzes the whole list at once.
+        """
+        labels = [{} for _ in data_list]
+
+        for field in self.fields.all():
+            items = field.create_many(data_list)
+            for label, item in zip(labels, items):
+                label.update(item)
+
+        return [{_DISTILLERY_SETTINGS['LABEL_KEY']: label}
+                for label in labels]
+
+    def add_many(self, data_list):
+        """
+        Takes a list of dictionaries of bottled data and returns a list
+        of the dictionaries updated with metadata, as in add().
+        """
+        data_copies = [copy.deepcopy(data) for data in data_list]
+        labels = self.create_many(data_copies)
+        for data_copy, label in zip(data_copies, labels):
+            data_copy.update(label)
+        return data_copies
+
     def get_fields(self):
         """
         Returns a list of data dictionaries containing the field_name,
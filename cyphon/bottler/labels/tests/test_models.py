@@ -100,6 +100,14 @@ class LabelFieldTestCase(LabelBaseTestCase):
         actual = self.label_field.create(self.high_priority_msg)
         self.assertEqual(actual, {'priority': 'HIGH'})
 
+    def test_create_many(self):
+        """
+        Tests the create_many method of the LabelField class.
+        """
+        actual = self.label_field.create_many([self.low_priority_msg,
+                                               self.high_priority_msg])
+        self.assertEqual(actual, [{'priority': 'LOW'}, {'priority': 'HIGH'}])
+
 
 class LabelTestCase(LabelBaseTestCase):
     """
@@ -139,6 +147,32 @@ class LabelTestCase(LabelBaseTestCase):
         }
         self.assertEqual(actual, expected)
 
+    def test_label_add_many(self):
+        """
+        Tests the add_many method of the Label class.
+        """
+        actual = self.label.add_many([self.low_priority_msg,
+                                      self.med_priority_msg])
+        expected = [
+            {
+                'subject': '[INFO-333]',
+                _DISTILLERY_SETTINGS['LABEL_KEY']: {
+                    'priority': 'LOW',
+                    'source_ip_location': None
+                }
+            },
+            {
+                'subject': '[WARN-222]',
+                _DISTILLERY_SETTINGS['LABEL_KEY']: {
+                    'priority': 'MEDIUM',
+                    'source_ip_location': None
+                }
+            },
+        ]
+        self.assertEqual(actual, expected)
+        self.assertNotIn(_DISTILLERY_SETTINGS['LABEL_KEY'],
+                         self.low_priority_msg)
+
     def test_get_fields(self):
         """
         Tests the get_fields method.
@@ -34,6 +34,7 @@ from django.utils.translation import ugettext_lazy as _
 # local
 from companies.models import Company
 from utils.validators.validators import regex_validator
+from .redactors import get_redactor
 
 _CODEBOOK_SETTINGS = settings.CODEBOOKS
 
@@ -257,11 +258,18 @@ class CodeBook(models.Model):
         codes = self._get_codename_dict()
         return json.dumps(codes, indent=4)
 
+    def _get_redactor(self):
+        """
+        Returns a Redactor for the CodeBook's RealNames.
+        """
+        names = tuple((realname.regex, realname._formatted_codename)
+                      for realname in self.realnames)
+        return get_redactor(names)
+
     def redact(self, text):
         """
         Takes a text string and returns a redacted version of the text
-        using the CodeBook's CodeNames.
+        using the CodeBook's CodeNames. Only the RealNames that could
+        be present in the text are searched for.
         """
-        for realname in self.realnames:
-            text = realname.redact(text)
-        return text
+        return self._get_redactor().redact(text)
@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2018 Dunbar Security Solutions, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+"""
+Redacts text with the RealNames of a CodeBook, searching only for the
+RealNames that could be present.
+
+Each RealName's regex is searched for runs of plain characters that
+every match must contain. Before the text is redacted, RealNames whose
+runs don't all appear in it are set aside, so a CodeBook with hundreds of
+RealNames only searches for the few that could be present.
+
+The remaining RealNames are replaced in turn, in rank order, just as if
+every RealName had been replaced. Whenever a RealName is replaced, the
+candidates are found again, since the inserted CodeName may contain a
+later RealName. Regexes whose runs can't be found (e.g., ones with
+alternatives or global inline flags) are always searched for.
+
+Redactors are cached by the regexes and CodeNames they replace, so a
+change to a CodeBook's CodeNames or RealNames produces a new Redactor.
+
+=====================  ==============================================
+Class                  Description
+=====================  ==============================================
+:class:`~Redactor`     Replaces RealNames with CodeNames.
+=====================  ==============================================
+
+=====================  ==============================================
+Function               Description
+=====================  ==============================================
+:func:`~get_redactor`  Gets a cached Redactor.
+=====================  ==============================================
+
+"""
+
+# standard library
+from collections import Counter
+from functools import lru_cache
+import re
+
+# third party
+from django.conf import settings
+
+_CODEBOOK_SETTINGS = settings.CODEBOOKS
+
+_CACHE_SIZE = _CODEBOOK_SETTINGS.get('REDACTOR_CACHE_SIZE', 100)
+
+# regexes whose runs of plain characters can't be found reliably
+_UNSAFE_REGEX = re.compile(r'\\[1-9]|\(\?P=|^\(\?[aiLmsux]+\)')
+
+_QUANTIFIER_REGEX = re.compile(r'\{\d*,?\d*\}')
+
+# the number of characters that follow these escapes
+_ESCAPE_LENGTHS = {'x': 2, 'u': 4, 'U': 8}
+
+# characters that match ASCII letters when case is ignored, but don't
+# become them when lowercased
+_FOLD = str.maketrans({'\u0131': 'i', '\u017f': 's'})
+
+
+def _skip_escape(regex, index):
+    """
+    Takes a regex and the index of a letter or digit that follows a
+    backslash, and returns the index after the escape sequence.
+    """
+    escaped = regex[index]
+    index += 1
+
+    if escaped in _ESCAPE_LENGTHS:
+        return index + _ESCAPE_LENGTHS[escaped]
+
+    if escaped == 'N':
+        return regex.find('}', index) + 1 or len(regex)
+
+    if escaped.isdigit():
+        while index < len(regex) and regex[index].isdigit():
+            index += 1
+
+    return index
+
+
+def _skip_class(regex, index):
+    """
+    Takes a regex and the index of the opening bracket of a character
+    class, and returns the index after the closing bracket.
+    """
+    index += 1
+    if regex[index:index + 1] == '^':
+        index += 1
+    if regex[index:index + 1] == ']':
+        index += 1
+
+    while index < len(regex):
+        if regex[index] == '\\':
+            index += 2
+        elif regex[index] == ']':
+            return index + 1
+        else:
+            index += 1
+
+    return index
+
+
+def _get_literals(regex):
+    """
+    Takes a regex and returns a tuple of the runs of ASCII characters
+    that every match must contain, in lowercase.
+    Characters inside groups are ignored, since groups may be optional
+    or contain alternatives.
+    """
+    if '|' in regex or _UNSAFE_REGEX.search(regex):
+        return ()
+
+    runs = ['']
+    depth = 0
+    index = 0
+
+    while index < len(regex):
+        char = regex[index]
+        literal = None
+
+        if char == '\\':
+            escaped = regex[index + 1:index + 2]
+            if escaped.isalnum():
+                index = _skip_escape(regex, index + 1)
+            else:
+                literal = escaped
+                index += 2
+        elif char == '[':
+            index = _skip_class(regex, index)
+        elif char == '(':
+            depth += 1
+            index += 1
+        elif char == ')':
+            depth -= 1
+            index += 1
+        elif char == '{' and _QUANTIFIER_REGEX.match(regex, index):
+            index = _QUANTIFIER_REGEX.match(regex, index).end()
+        elif char in '.^$*+?{}':
+            index += 1
+        else:
+            literal = char
+            index += 1
+
+        optional = regex[index:index + 1] in ('?', '*', '{')
+
+        if literal and ord(literal) < 128 and depth == 0 and not optional:
+            runs[-1] += literal
+            if regex[index:index + 1] == '+':
+                runs.append('')
+        elif runs[-1]:
+            runs.append('')
+
+    literals = set(run.lower() for run in runs if run)
+    return tuple(sorted(literals))
+
+
+def _fold(text):
+    """
+    Takes text and returns a lowercase version that contains the
+    literals of any RealName that matches the text.
+    """
+    return text.lower().translate(_FOLD)
+
+
+class Redactor(object):
+    """Replaces RealNames with CodeNames.
+
+    Parameters
+    ----------
+    names : |tuple| of |tuple|
+        A (regex, codename) tuple for each RealName, in the order in
+        which they should be replaced.
+
+    Attributes
+    ----------
+    names : |tuple| of |tuple|
+        A (regex, codename) tuple for each RealName.
+
+    """
+
+    def __init__(self, names):
+        self.names = names
+        self._patterns = [re.compile(regex, re.IGNORECASE)
+                          for (regex, _) in names]
+        self._literals = [_get_literals(regex) for (regex, _) in names]
+        self._unfiltered = []
+        self._by_literal = {}
+        self._index_literals()
+
+    def _index_literals(self):
+        """
+        Groups the RealNames by the literal that the fewest other
+        RealNames share, so only a few RealNames need to be checked for
+        each literal found in the text.
+        """
+        counts = Counter(literal for literals in self._literals
+                         for literal in literals)
+
+        for index, literals in enumerate(self._literals):
+            if literals:
+                key = min(literals,
+                          key=lambda literal: (counts[literal], -len(literal)))
+                self._by_literal.setdefault(key, []).append(index)
+            else:
+                self._unfiltered.append(index)
+
+    def _get_candidates(self, text):
+        """
+        Takes text and returns a tuple of the indexes of the RealNames
+        that could match it.
+        """
+        folded_text = _fold(text)
+        indexes = list(self._unfiltered)
+
+        for literal, literal_indexes in self._by_literal.items():
+            if literal in folded_text:
+                indexes.extend(
+                    index for index in literal_indexes
+                    if all(other in folded_text
+                           for other in self._literals[index]))
+
+        return tuple(sorted(indexes))
+
+    def redact(self, text):
+        """Replace RealNames in text with their CodeNames.
+
+        Parameters
+        ----------
+        text : str
+            The text to redact.
+
+        Returns
+        -------
+        str
+            The redacted text.
+
+        """
+        indexes = self._get_candidates(text)
+        position = 0
+
+        while position < len(indexes):
+            index = indexes[position]
+            (dummy_regex, codename) = self.names[index]
+            (redacted, count) = self._patterns[index].subn(codename, text)
+            position += 1
+
+            # the CodeName may contain a later RealName
+            if count:
+                text = redacted
+                indexes = [later for later in self._get_candidates(text)
+                           if later > index]
+                position = 0
+
+        return text
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def get_redactor(names):
+    """Get a Redactor for a set of RealNames.
+
+    Parameters
+    ----------
+    names : |tuple| of |tuple|
+        A (regex, codename) tuple for each RealName, in the order in
+        which they should be replaced.
+
+    Returns
+    -------
+    |Redactor|
+
+    """
+    return Redactor(names)
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2018 Dunbar Security Solutions, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+"""
+Benchmarks redacting alert titles with a large CodeBook.
+
+Compares replacing each RealName in turn, as CodeBooks used to, with a
+Redactor that only searches for the RealNames that could be present.
+
+Run with::
+
+    python manage.py test codebooks.tests -p "benchmark_*.py"
+
+"""
+
+# standard library
+import random
+import re
+
+# third party
+from django.test import SimpleTestCase
+
+# local
+from codebooks.redactors import Redactor
+from utils.performance.benchmark import get_rate, report
+
+
+def _get_names(num):
+    """
+    Returns (regex, codename) tuples for RealNames, with longer names
+    before the names they contain.
+    """
+    names = []
+    for index in range(num // 2):
+        names.append(('Company.?%03d.?Holdings' % index, '**C%03d**' % index))
+    for index in range(num - num // 2):
+        names.append(('Company.?%03d' % index, '**C%03d**' % index))
+    return tuple(names)
+
+
+def _get_titles(num, names):
+    """
+    Returns alert titles, about half of which mention a RealName.
+    """
+    rand = random.Random(0)
+    words = ['alert', 'login', 'failed', 'from', 'host', 'user', 'error',
+             'detected', 'on', 'server', 'traffic', 'unusual']
+    titles = []
+    for _ in range(num):
+        title = ' '.join(rand.choice(words) for _ in range(8))
+        if rand.random() < 0.5:
+            regex = rand.choice(names)[0]
+            title += ' ' + regex.replace('.?', ' ')
+        titles.append(title)
+    return titles
+
+
+class RedactorBenchmark(SimpleTestCase):
+    """
+    Redacts 10,000 alert titles with 500 RealNames.
+    """
+
+    NAMES = 500
+    TITLES = 10000
+
+    def test_titles_per_second(self):
+        """
+        Reports titles/sec for each approach.
+        """
+        names = _get_names(self.NAMES)
+        titles = _get_titles(self.TITLES, names)
+        patterns = [(re.compile(regex, re.IGNORECASE), codename)
+                    for (regex, codename) in names]
+
+        def redact_in_turn(text):
+            """Replaces each RealName in turn."""
+            for pattern, codename in patterns:
+                text = pattern.sub(codename, text)
+            return text
+
+        redactor = Redactor(names)
+
+        for title in titles[:100]:
+            self.assertEqual(redactor.redact(title), redact_in_turn(title))
+
+        results = [
+            ('in turn', get_rate(redact_in_turn, titles, repeat=1)),
+            ('filtered', get_rate(redactor.redact, titles)),
+        ]
+        report('CodeBook redaction', results, unit='titles/sec')
@@ -195,3 +195,20 @@ class CodeBookTestCase(CodeBookBaseTestCase):
             actual = self.codebook.redact(text)
             expected = '**FORGE** is president of **PEAK**.'
             self.assertEqual(actual, expected)
+
+    def test_redact_changed_realname(self):
+        """
+        Tests that the redact method uses a RealName's new regex after
+        it is changed.
+        """
+        with patch.dict('codebooks.models.settings.CODEBOOKS',
+                        self.mock_settings):
+            text = 'Bob Smith'
+            self.assertEqual(self.codebook.redact(text), 'Bob **FORGE**')
+
+            realname = RealName.objects.get_by_natural_key('Smith')
+            realname.regex = 'Bob'
+            realname.save()
+
+            codebook = CodeBook.objects.get_by_natural_key('Acme')
+            self.assertEqual(codebook.redact(text), '**FORGE** Smith')
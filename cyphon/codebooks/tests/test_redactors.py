@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2018 Dunbar Security Solutions, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+"""
+Tests the Redactor class.
+"""
+
+# standard library
+import re
+
+# third party
+from django.test import SimpleTestCase
+
+# local
+from codebooks.redactors import Redactor, _get_literals, get_redactor
+
+NAMES = (
+    ('Acme.?Supply.?Co', '**PEAK**'),
+    ('John.?Smith', '**FORGE**'),
+    ('Acme.?Supply', '**PEAK**'),
+    ('Smith', '**FORGE**'),
+    ('Acme', '**PEAK**'),
+)
+
+
+class RedactorTestCase(SimpleTestCase):
+    """
+    Tests the Redactor class.
+    """
+
+    def test_redact(self):
+        """
+        Tests that RealNames are replaced in rank order.
+        """
+        redactor = Redactor(NAMES)
+        text = 'John Smith is president of Acme Supply Co. (not acme inc.)'
+        actual = redactor.redact(text)
+        expected = '**FORGE** is president of **PEAK**. (not **PEAK** inc.)'
+        self.assertEqual(actual, expected)
+
+    def test_redact_overlapping(self):
+        """
+        Tests that a higher-ranked RealName is replaced first when it
+        overlaps a lower-ranked one that starts earlier in the text.
+        """
+        redactor = Redactor((('Smith', 'A'), ('John Smith', 'B')))
+        self.assertEqual(redactor.redact('John Smith'), 'John A')
+
+        redactor = Redactor((('Smith Co', 'A'), ('John Smith', 'B')))
+        self.assertEqual(redactor.redact('John Smith Co'), 'John A')
+
+    def test_redact_in_rank_order(self):
+        """
+        Tests that the result is the same as replacing every RealName
+        in turn.
+        """
+        names = (('Smith', 'A'), ('John.?Smith', 'B'), ('Acme', 'C'),
+                 ('Acme.?Co', 'D'), ('a.?Co', 'E'))
+        texts = ['John Smith', 'Acme Co', 'john smith of acme co, Smith',
+                 'Acme', 'nothing here']
+        redactor = Redactor(names)
+
+        for text in texts:
+            expected = text
+            for (regex, codename) in names:
+                expected = re.sub(regex, codename, expected,
+                                  flags=re.IGNORECASE)
+            self.assertEqual(redactor.redact(text), expected)
+
+    def test_redact_groups(self):
+        """
+        Tests that the right CodeName is used for RealNames with groups.
+        """
+        redactor = Redactor((('(Acme)(.?Co)?', 'A'), ('(Smith)', 'B')))
+        self.assertEqual(redactor.redact('Acme Co, Smith, Acme'), 'A, B, A')
+
+    def test_codenames_redacted(self):
+        """
+        Tests that inserted CodeNames are redacted by later RealNames,
+        even if the later RealNames weren't in the original text.
+        """
+        redactor = Redactor((('Acme', 'PEAK'), ('peak', 'SUMMIT')))
+        self.assertEqual(redactor.redact('Acme peak'), 'SUMMIT SUMMIT')
+        self.assertEqual(redactor.redact('Acme'), 'SUMMIT')
+
+    def test_backreference(self):
+        """
+        Tests that RealNames with backreferences are replaced.
+        """
+        redactor = Redactor((('(a)\\1', 'X'), ('b', 'Y')))
+        self.assertEqual(redactor.redact('aab'), 'XY')
+
+    def test_no_names(self):
+        """
+        Tests a Redactor with no RealNames.
+        """
+        self.assertEqual(Redactor(()).redact('Acme'), 'Acme')
+
+    def test_get_redactor(self):
+        """
+        Tests that Redactors are cached by their RealNames.
+        """
+        self.assertIs(get_redactor(NAMES), get_redactor(NAMES))
+        self.assertIsNot(get_redactor(NAMES), get_redactor(NAMES[:2]))
+
+
+class GetLiteralsTestCase(SimpleTestCase):
+    """
+    Tests the _get_literals function.
+    """
+
+    def test_get_literals(self):
+        """
+        Tests that only text every match must contain is returned.
+        """
+        tests = [
+            ('Acme.?Supply.?Co', ('acme', 'co', 'supply')),
+            ('a{2,3}bc', ('bc',)),
+            ('foo(bar)?baz+', ('baz', 'foo')),
+            ('[abc]xyz\\.com', ('xyz.com',)),
+            ('\\x41bcd\\b', ('bcd',)),
+            ('fo*', ('f',)),
+            ('foo|bar', ()),
+            ('(?i)foo', ()),
+        ]
+        for regex, expected in tests:
+            self.assertEqual(_get_literals(regex), expected, regex)
+
+    def test_ignore_case(self):
+        """
+        Tests that text with characters that only match a RealName
+        when case is ignored is still redacted.
+        """
+        redactor = Redactor((('Smith', 'FORGE'),))
+        self.assertEqual(redactor.redact('\u017fmith'), 'FORGE')
@@ -25,7 +25,9 @@ import logging
 # third party
 from django.apps import apps
 from django.conf import settings
-from django.utils.functional import cached_property
+
+# local
+from cyphon.snapshot import get_active_snapshot
 
 _DISTILLERY_SETTINGS = settings.DISTILLERIES
 
@@ -52,11 +54,40 @@ class DocumentObj(object):
 
     """
 
+    __slots__ = ('data', 'doc_id', 'collection', 'platform', '_distillery')
+
+    _UNSET = object()
+
     def __init__(self, data=None, doc_id=None, collection=None, platform=None):
         self.data = data
         self.doc_id = doc_id
         self.collection = collection
         self.platform = platform
+        self._distillery = self._UNSET
+
+    def derive(self, data):
+        """Create a DocumentObj for data derived from this document.
+
+        The new DocumentObj shares this document's id, |Collection|,
+        platform, and |Distillery| instead of copying them, and holds
+        the given data in place of this document's data.
+
+        Parameters
+        ----------
+        data : `str`, `dict`, or `email.message.Message`
+            The derived data, such as the output of a |Condenser|.
+
+        Returns
+        -------
+        |DocumentObj|
+            A new document that refers to the same source.
+
+        """
+        doc_obj = DocumentObj(data=data, doc_id=self.doc_id,
+                              collection=self.collection,
+                              platform=self.platform)
+        doc_obj._distillery = self._distillery
+        return doc_obj
 
     def __str__(self):
         return "%s:%s" % (self.collection, self.doc_id)
@@ -91,7 +122,7 @@ class DocumentObj(object):
             _LOGGER.error('Info for raw data document %s could not be added',
                           self)
 
-    @cached_property
+    @property
     def distillery(self):
         """The |Distillery| associated with the DocumentObj.
 
@@ -101,6 +132,26 @@ class DocumentObj(object):
             The |Distillery| associated with the document, if it exists.
 
         """
+        if self._distillery is self._UNSET:
+            self._distillery = self._get_distillery()
+        return self._distillery
+
+    @distillery.setter
+    def distillery(self, distillery):
+        self._distillery = distillery
+
+    def _get_distillery(self):
+        """Look up the |Distillery| associated with the DocumentObj.
+
+        Returns the |Distillery| from the active config snapshot if
+        possible. Otherwise, gets it from the database.
+        """
+        snapshot = get_active_snapshot()
+        if snapshot is not None:
+            distillery = snapshot.get_distillery(self.collection)
+            if distillery is not None:
+                return distillery
+
         natural_key = self._get_distillery_natural_key()
         try:
             # use get_model to avoid circular dependency
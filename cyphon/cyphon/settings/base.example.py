@@ -64,6 +64,18 @@ TEST = 'test' in sys.argv
 #: The host/domain names that this Django site can serve.
 ALLOWED_HOSTS = HOST_SETTINGS['ALLOWED_HOSTS']
 
+#: Cache shared by all Cyphon processes (see CACHE). If CACHE is not
+#: configured, a table in the PostgreSQL database is used. Tests use a
+#: local memory cache.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    } if TEST else globals().get('CACHE', {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'cyphon_cache',
+    })
+}
+
 #: Settings for all databases to be used with Django.
 DATABASES = {
     'default': {
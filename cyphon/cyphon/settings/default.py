@@ -68,13 +68,36 @@ PROJ_DIR = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
 HOME_DIR = os.path.dirname(PROJ_DIR)
 KEYS_DIR = os.path.join(HOME_DIR, 'keys')
 
+ALERTS = {
+    # Work that follows a new Alert (tagging, notifications) runs in a
+    # Celery task, so saving an Alert doesn't wait for it.
+    'ASYNC_HANDLERS': True,
+    'HANDLER_RETRIES': 3,       # times a failed handler is retried
+    'HANDLER_RETRY_DELAY': 30,  # seconds between retries
+}
+
 APPUSERS = {
     'CUSTOM_FILTER_BACKENDS': []
 }
 
+CACHE = {
+    # Django's cache shares version counters and other state between the
+    # web server, queue consumers, and Celery workers, so every process
+    # must use the same cache. By default, the cache is a table in the
+    # PostgreSQL database. For heavy loads, Memcached may be used instead
+    # (e.g., 'django.core.cache.backends.memcached.MemcachedCache').
+    'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+    'LOCATION': 'cyphon_cache',
+}
+
 CODEBOOKS = {
     'CODENAME_PREFIX': '**',  # prefix for displayed CodeNames
     'CODENAME_SUFFIX': '**',  # suffix for displayed CodeNames
+    'REDACTOR_CACHE_SIZE': 100,  # number of compiled CodeBooks to keep
+}
+
+CONDENSERS = {
+    'CACHE_TIMEOUT': 60,  # seconds before condenser plans are rebuilt
 }
 
 CYCLOPS = {
@@ -141,7 +164,14 @@ ELASTICSEARCH = {
     'INDEX': {
         'index.mapping.ignore_malformed': True,
         'number_of_shards': 1,
+        # How often new documents are made searchable in Collections
+        # whose refresh policy is "wait_for" or "none".
+        'refresh_interval': '1s',
     },
+    # Number of seconds to reuse the results of cluster health checks
+    # and index existence checks.
+    'HEALTH_CACHE_TIMEOUT': 5,
+    'INDEX_CACHE_TIMEOUT': 60,
 }
 
 EMAIL = {
@@ -154,9 +184,22 @@ EMAIL = {
     'USE_TLS': True,
 }
 
+EMISSARIES = {
+    # Store used to count API calls against Visa rate limits: 'local'
+    # keeps call times in process memory; 'cache' counts calls in Django's
+    # cache, which is shared between processes (see CACHE).
+    'RATE_LIMIT_BACKEND': 'local',
+    'RATE_LIMIT_BUCKETS': 10,  # buckets per Visa interval for 'cache'
+    # Seconds before call times in the 'local' store are reloaded from
+    # Stamps. Tests roll back Stamps, so they are reloaded on each check.
+    'RATE_LIMIT_SYNC': 0,
+}
+
 GEOIP = {
     'GEOIP_PATH': os.getenv('GEOIP_PATH', '/usr/share/GeoIP/'),
     'CITY_DB': 'GeoLite2-City.mmdb',
+    'CACHE_SIZE': 10000,                # addresses
+    'RELOAD_CHECK_INTERVAL': 60,        # seconds
 }
 
 JIRA = {
@@ -208,6 +251,20 @@ MONGODB = {
     'TIMEOUT': 20,
 }
 
+MONITORS = {
+    # Health checks find the latest document for all monitored
+    # Distilleries at once, with one search per Warehouse.
+    'BATCH_HEALTH_CHECKS': True,
+
+    # Documents are tracked as they are saved, so health checks only
+    # search Distilleries when the tracker can't vouch for them (e.g.,
+    # after a restart). The tracker is shared between processes through
+    # Django's cache (see CACHE).
+    'TRACK_DOCUMENTS': True,
+    'TRACKER_FLUSH_INTERVAL': 5,  # seconds
+    'TRACKER_TIMEOUT': 86400,  # seconds
+}
+
 NOTIFICATIONS = {
     'PUSH_NOTIFICATION_KEY': '',
     'GCM_SENDER_ID': '',
@@ -228,6 +285,12 @@ PRIVATE_FIELDS = [
     DISTILLERIES['DATE_KEY'],
 ]
 
+PUMPROOM = {
+    # Reservoirs are searched concurrently by a bounded pool of threads.
+    'MAX_WORKERS': 4,  # maximum number of Reservoirs searched at once
+    'TIMEOUT': 60,     # seconds before unfinished searches are abandoned
+}
+
 RABBITMQ = {
     'HOST': os.getenv('RABBITMQ_DEFAULT_HOST', 'rabbit'),
     'VHOST': os.getenv('RABBITMQ_DEFAULT_VHOST', 'cyphon'),
@@ -237,11 +300,41 @@ RABBITMQ = {
     'DURABLE': True,
 }
 
+RECEIVER = {
+    # Queue consumers keep a snapshot of the configuration for processing
+    # messages. Changes are detected through a version counter in Django's
+    # cache (see CACHE).
+    'SNAPSHOT_CHECK_INTERVAL': 1,  # seconds between checks of the version
+    'SNAPSHOT_MAX_AGE': 300,       # seconds before a snapshot is rebuilt
+    # Default batch settings for queue consumers, which can be overridden
+    # on the command line. A BATCH_SIZE of 1 processes messages one at a time.
+    'BATCH_SIZE': 1,        # maximum number of messages per batch
+    'BATCH_TIMEOUT': 1000,  # milliseconds to wait for a batch to fill
+    # Batches are requeued if their data store can't be reached.
+    'RETRY_DELAY': 5,       # seconds before a batch is requeued
+}
+
 SAUCELABS = {
     'USERNAME': os.getenv('SAUCE_USERNAME', ''),
     'ACCESS_KEY': os.getenv('SAUCE_ACCESS_KEY', ''),
 }
 
+SEARCH = {
+    # Distilleries in a search are queried in parallel within one deadline.
+    'MAX_WORKERS': 8,   # searches run at once by each process
+    'TIMEOUT': 30,      # seconds before unfinished searches are reported
+    'BATCH_SIZE': 20,   # maximum searches combined in one batched request
+}
+
+SIEVES = {
+    'CACHE_TIMEOUT': 60,  # seconds before compiled sieves are rebuilt
+}
+
+TAGS = {
+    'INDEX_CHECK_INTERVAL': 1,  # seconds between checks for changed tags
+    'INDEX_MAX_AGE': 300,       # seconds before the tag index is rebuilt
+}
+
 TEASERS = {
     'CHAR_LIMIT': 1000  # Character limit for teaser fields
 }
@@ -255,7 +348,12 @@ TWITTER = {
 }
 
 WAREHOUSES = {
-    'DEFAULT_STORAGE_ENGINE': 'elasticsearch'
+    'DEFAULT_STORAGE_ENGINE': 'elasticsearch',
+    # Engines are shared within each process. Changes to their
+    # configuration are detected through a version counter in Django's
+    # cache (see CACHE).
+    'ENGINE_CHECK_INTERVAL': 1,  # seconds between checks of the version
+    'ENGINE_MAX_AGE': 300,       # seconds before an Engine is set up again
 }
 
 
@@ -284,6 +382,18 @@ TEST = 'test' in sys.argv
 #: The host/domain names that this Django site can serve.
 ALLOWED_HOSTS = HOST_SETTINGS['ALLOWED_HOSTS']
 
+#: Cache shared by all Cyphon processes (see CACHE). If CACHE is not
+#: configured, a table in the PostgreSQL database is used. Tests use a
+#: local memory cache.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    } if TEST else globals().get('CACHE', {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'cyphon_cache',
+    })
+}
+
 #: Settings for all databases to be used with Django.
 DATABASES = {
     'default': {
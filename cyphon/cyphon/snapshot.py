@@ -0,0 +1,472 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2018 Dunbar Security Solutions, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+"""
+Provides a per-process snapshot of the configuration used to process
+incoming documents.
+
+A |ConfigSnapshot| holds the enabled Chutes, Watchdogs, and Distilleries,
+together with the Sieves, Mungers, Condensers, Collections, and other
+objects they depend on. Once loaded, it allows queue consumers to sift,
+store, and inspect documents without querying the relational database
+for configuration.
+
+Snapshots are only used in processes that call :func:`~activate`, such
+as the :mod:`receiver`. A version counter, stored in Django's cache, is
+bumped whenever a transaction that saves or deletes a relevant model
+commits (see :mod:`cyphon.versions`). Active processes check the counter
+at most every `RECEIVER['SNAPSHOT_CHECK_INTERVAL']` seconds and rebuild
+their snapshot when it changes. The process that made the change drops
+its snapshot right away. As a safeguard against changes that don't send
+signals, snapshots are also rebuilt after `RECEIVER['SNAPSHOT_MAX_AGE']`
+seconds.
+
+============================  ==========================================
+Class                         Description
+============================  ==========================================
+:class:`~ConfigSnapshot`      In-memory copy of the processing config.
+============================  ==========================================
+
+============================  ==========================================
+Function                      Description
+============================  ==========================================
+:func:`~activate`             Use snapshots in the current process.
+:func:`~deactivate`           Stop using snapshots.
+:func:`~get_active_snapshot`  Get the current snapshot, if active.
+:func:`~get_snapshot`         Get the current snapshot.
+:func:`~get_version`          Get the current config version.
+:func:`~bump_version`         Invalidate snapshots in all processes.
+:func:`~get_stats`            Get metrics for snapshot rebuilds.
+============================  ==========================================
+
+"""
+
+# standard library
+import logging
+import threading
+import time
+
+# third party
+from django.apps import apps
+from django.conf import settings
+from django.db.models import Prefetch, prefetch_related_objects
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+# local
+from cyphon import versions
+from engines import registry
+
+_RECEIVER_SETTINGS = getattr(settings, 'RECEIVER', {})
+
+_CHECK_INTERVAL = _RECEIVER_SETTINGS.get('SNAPSHOT_CHECK_INTERVAL', 1)
+
+_MAX_AGE = _RECEIVER_SETTINGS.get('SNAPSHOT_MAX_AGE', 300)
+
+_VERSION_KEY = 'cyphon.snapshot.version'
+
+#: Apps whose models are part of the processing configuration.
+WATCHED_APPS = (
+    'bottles',
+    'categories',
+    'companies',
+    'containers',
+    'datachutes',
+    'datacondensers',
+    'datamungers',
+    'datasieves',
+    'distilleries',
+    'inspections',
+    'labels',
+    'logchutes',
+    'logcondensers',
+    'logmungers',
+    'logsieves',
+    'parsers',
+    'pipes',
+    'procedures',
+    'reservoirs',
+    'tastes',
+    'warehouses',
+    'watchdogs',
+)
+
+#: Chute models whose enabled Chutes are included in a snapshot.
+CHUTE_MODELS = (
+    ('datachutes', 'DataChute'),
+    ('logchutes', 'LogChute'),
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+_LOCK = threading.Lock()
+
+_STATE = {
+    'active': False,
+    'snapshot': None,
+    'last_check': 0,
+}
+
+_STATS = {
+    'rebuilds': 0,
+    'last_duration': None,
+    'total_duration': 0.0,
+    'version': None,
+}
+
+
+def _prefetch_condensers(condensers, seen=None):
+    """
+    Takes a list of Condensers and fetches their Fittings and Parsers,
+    including those of any Condensers nested within them.
+    """
+    seen = seen if seen is not None else set()
+    condensers = [condenser for condenser in condensers
+                  if condenser is not None and id(condenser) not in seen]
+
+    if not condensers:
+        return
+
+    seen.update(id(condenser) for condenser in condensers)
+    prefetch_related_objects(condensers,
+                             'fittings__content_type',
+                             'fittings__target_field',
+                             'fittings__field_parser')
+
+    nested = [fitting.field_parser for condenser in condensers
+              for fitting in condenser.fittings.all()
+              if fitting.is_condenser()]
+
+    _prefetch_condensers(nested, seen)
+
+
+class ConfigSnapshot(object):
+    """An in-memory copy of the configuration for processing documents.
+
+    Parameters
+    ----------
+    version : int
+        The config version the snapshot was built from.
+
+    Attributes
+    ----------
+    version : int
+        The config version the snapshot was built from.
+
+    created : float
+        The time when the snapshot was built.
+
+    """
+
+    def __init__(self, version):
+        self.version = version
+        self.created = time.time()
+        self._distilleries = {}
+        self._distilleries_by_pk = {}
+        self._distillery_categories = {}
+        self._chutes = {}
+        self._watchdogs = []
+        self._watchdog_categories = {}
+        self._load()
+
+    def _load(self):
+        """
+        Loads the configuration from the database.
+        """
+        self._load_distilleries()
+        for app_label, model_name in CHUTE_MODELS:
+            self._load_chutes(apps.get_model(app_label, model_name))
+        self._load_watchdogs()
+
+    def _load_distilleries(self):
+        """
+        Loads all Distilleries with their Collections and Containers.
+        """
+        distillery_model = apps.get_model('distilleries', 'Distillery')
+        queryset = distillery_model.objects.select_related(
+            'collection__warehouse',
+            'container__bottle',
+            'container__label',
+            'company',
+        ).prefetch_related('categories', 'container__label__fields')
+
+        for distillery in queryset:
+            self._distilleries[str(distillery.collection)] = distillery
+            self._distilleries_by_pk[distillery.pk] = distillery
+            self._distillery_categories[distillery.pk] = set(
+                category.pk for category in distillery.categories.all())
+
+    def _load_chutes(self, chute_model):
+        """
+        Loads the enabled Chutes for a Chute model, with their Sieves
+        compiled into a combined matcher and their Mungers and
+        Condensers fetched.
+        """
+        # imported here to avoid a circular import with the sifter models
+        from sifter.sieves.compiled import get_multi_sieve
+
+        queryset = chute_model.objects.find_enabled().select_related(
+            'sieve',
+            'munger__condenser__bottle',
+        )
+        chutes = list(queryset)
+
+        for chute in chutes:
+            munger = chute.munger
+            munger.distillery = self._distilleries_by_pk.get(
+                munger.distillery_id, munger.distillery)
+
+        get_multi_sieve(chutes)
+
+        condensers = [chute.munger.condenser for chute in chutes]
+        _prefetch_condensers(condensers)
+
+        for condenser in condensers:
+            condenser.get_plan()
+
+        self._chutes[chute_model] = chutes
+
+    def _load_watchdogs(self):
+        """
+        Loads the enabled Watchdogs with their Triggers and Muzzles,
+        with the Triggers' Sieves compiled.
+        """
+        watchdog_model = apps.get_model('watchdogs', 'Watchdog')
+        trigger_model = apps.get_model('watchdogs', 'Trigger')
+        triggers = trigger_model.objects.select_related('sieve')
+        queryset = watchdog_model.objects.find_enabled().select_related(
+            'muzzle'
+        ).prefetch_related(
+            'categories',
+            Prefetch('triggers', queryset=triggers),
+        )
+
+        for watchdog in queryset:
+            for trigger in watchdog.triggers.all():
+                trigger.sieve.get_compiled()
+            self._watchdogs.append(watchdog)
+            self._watchdog_categories[watchdog.pk] = set(
+                category.pk for category in watchdog.categories.all())
+
+    def get_enabled_chutes(self, chute_model):
+        """Get the enabled Chutes for a Chute model.
+
+        Parameters
+        ----------
+        chute_model : type
+            A subclass of |Chute|.
+
+        Returns
+        -------
+        |list| or |None|
+            The enabled Chutes, or |None| if the snapshot does not
+            include the model.
+
+        """
+        return self._chutes.get(chute_model)
+
+    def get_distillery(self, collection):
+        """Get a |Distillery| by the natural key of its |Collection|.
+
+        Parameters
+        ----------
+        collection : str
+            A string representation of a |Collection| (e.g.,
+            'elasticsearch.cyphon.syslog').
+
+        Returns
+        -------
+        |Distillery| or |None|
+            The |Distillery| for the |Collection|, if one exists in
+            the snapshot.
+
+        """
+        return self._distilleries.get(collection)
+
+    def find_relevant_watchdogs(self, distillery):
+        """Find enabled Watchdogs that should inspect a document.
+
+        Equivalent to :meth:`~watchdogs.models.WatchdogManager.find_relevant`.
+
+        Parameters
+        ----------
+        distillery : |Distillery| or |None|
+            The |Distillery| associated with the document.
+
+        Returns
+        -------
+        |list| of |Watchdogs|
+
+        """
+        categories = set()
+        if distillery is not None:
+            categories = self._distillery_categories.get(distillery.pk)
+            if categories is None:
+                categories = set(
+                    category.pk for category in distillery.categories.all())
+
+        return [
+            watchdog for watchdog in self._watchdogs
+            if not self._watchdog_categories[watchdog.pk]
+            or self._watchdog_categories[watchdog.pk] & categories
+        ]
+
+
+def get_version():
+    """Get the current config version.
+
+    Returns
+    -------
+    int
+
+    """
+    return versions.get_version(_VERSION_KEY)
+
+
+def bump_version():
+    """Increment the config version once the current transaction commits.
+
+    Active processes will rebuild their snapshots the next time they
+    check the version.
+
+    Returns
+    -------
+    None
+
+    """
+    versions.bump_version(_VERSION_KEY)
+
+
+def _is_current(snapshot, now):
+    """
+    Takes a ConfigSnapshot and the current time, and returns a Boolean
+    indicating whether the snapshot can still be used.
+    """
+    if now - snapshot.created >= _MAX_AGE:
+        return False
+
+    if now - _STATE['last_check'] < _CHECK_INTERVAL:
+        return True
+
+    _STATE['last_check'] = now
+    return get_version() == snapshot.version
+
+
+def _rebuild():
+    """
+    Builds a new ConfigSnapshot, records metrics for the rebuild, and
+    returns the snapshot.
+    """
+    # imported here to avoid a circular import with the sifter models
+    from sifter.condensers import plans
+    from sifter.sieves import compiled
+
+    version = get_version()
+    start_time = time.time()
+
+    compiled.clear_cache()
+    plans.clear_cache()
+
+    # changes made in other processes only reach this one through the
+    # version, so shared Engines must be set up again when it changes
+    if version != _STATS['version']:
+        registry.invalidate()
+
+    snapshot = ConfigSnapshot(version)
+
+    duration = time.time() - start_time
+    _STATS['rebuilds'] += 1
+    _STATS['last_duration'] = duration
+    _STATS['total_duration'] += duration
+    _STATS['version'] = version
+
+    _LOGGER.info('Built configuration snapshot (version %s) in %.3f sec',
+                 version, duration)
+
+    _STATE['snapshot'] = snapshot
+    _STATE['last_check'] = snapshot.created
+    return snapshot
+
+
+def get_snapshot():
+    """Get a current |ConfigSnapshot|.
+
+    Builds a new snapshot if none exists or if the existing snapshot
+    is out of date.
+
+    Returns
+    -------
+    |ConfigSnapshot|
+
+    """
+    snapshot = _STATE['snapshot']
+
+    if snapshot is not None and _is_current(snapshot, time.time()):
+        return snapshot
+
+    with _LOCK:
+        if _STATE['snapshot'] is not snapshot:
+            return _STATE['snapshot']
+        return _rebuild()
+
+
+def get_active_snapshot():
+    """Get a current |ConfigSnapshot| if snapshots are active.
+
+    Returns
+    -------
+    |ConfigSnapshot| or |None|
+        A current snapshot if :func:`~activate` has been called in
+        this process. Otherwise, |None|.
+
+    """
+    if _STATE['active']:
+        return get_snapshot()
+
+
+def activate():
+    """Use configuration snapshots in the current process."""
+    _STATE['active'] = True
+
+
+def deactivate():
+    """Stop using configuration snapshots in the current process."""
+    _STATE['active'] = False
+    _STATE['snapshot'] = None
+
+
+def get_stats():
+    """Get metrics for snapshot rebuilds in the current process.
+
+    Returns
+    -------
+    dict
+        A dictionary with the number of rebuilds, the duration of the
+        last rebuild, the total time spent rebuilding (in seconds), and
+        the version of the current snapshot.
+
+    """
+    return dict(_STATS)
+
+
+@receiver(post_save, dispatch_uid='snapshot.invalidate.save')
+@receiver(post_delete, dispatch_uid='snapshot.invalidate.delete')
+@receiver(m2m_changed, dispatch_uid='snapshot.invalidate.m2m')
+def invalidate(sender, **kwargs):
+    """Bump the config version when a relevant model changes."""
+    if sender._meta.app_label in WATCHED_APPS:
+        _STATE['snapshot'] = None
+        bump_version()
@@ -25,12 +25,15 @@ Cyphon Celery tasks.
 
 # third party
 from django.apps import apps
+from django.conf import settings
 from django.db import close_old_connections
 
 # local
 from cyphon.celeryapp import app
 from aggregator.filters.services import execute_filter_queries
 
+_MONITOR_SETTINGS = getattr(settings, 'MONITORS', {})
+
 
 @app.task(name='tasks.get_new_mail')
 def get_new_mail():
@@ -55,8 +58,12 @@ def run_health_check():
     monitor_model = apps.get_model(app_label='monitors', model_name='monitor')
     monitors = monitor_model.objects.find_enabled()
 
-    for monitor in monitors:
-        monitor.update_status()
+    if _MONITOR_SETTINGS.get('BATCH_HEALTH_CHECKS', False):
+        monitor_model.objects.update_statuses(
+            monitors.prefetch_related('distilleries'))
+    else:
+        for monitor in monitors:
+            monitor.update_status()
 
     close_old_connections()
 
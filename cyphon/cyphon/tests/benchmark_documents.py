@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2018 Dunbar Security Solutions, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+"""
+Benchmarks deriving condensed documents from a large message.
+
+Compares copying a DocumentObj for each matching Chute, as Mungers
+used to, with deriving a new DocumentObj that shares the source
+metadata.
+
+Run with::
+
+    python manage.py test cyphon.tests -p "benchmark_*.py"
+
+"""
+
+# standard library
+import copy
+
+# third party
+from django.test import SimpleTestCase
+
+# local
+from cyphon.documents import DocumentObj
+from utils.performance.benchmark import get_peak_memory, get_rate, report
+
+
+class DeriveDocumentBenchmark(SimpleTestCase):
+    """
+    Fans a 1 MB message out to 5 Chutes.
+    """
+
+    CHUTES = 5
+    MESSAGES = 20
+
+    @staticmethod
+    def _get_message(index):
+        """
+        Returns a DocumentObj holding about 1 MB of data.
+        """
+        data = {
+            'subject': 'message %s' % index,
+            'lines': ['%06d %s' % (i, 'x' * 1017) for i in range(1000)],
+        }
+        return DocumentObj(data=data, doc_id=str(index),
+                           collection='elasticsearch.cyphon.mail')
+
+    def test_fan_out(self):
+        """
+        Reports messages/sec and peak memory for copying and deriving
+        documents.
+        """
+        messages = [self._get_message(i) for i in range(self.MESSAGES)]
+        condensed = {'subject': 'condensed'}
+
+        def fan_out_copy(doc_obj):
+            """Copies the document for each Chute."""
+            results = []
+            for _ in range(self.CHUTES):
+                new_doc_obj = copy.deepcopy(doc_obj)
+                new_doc_obj.data = dict(condensed)
+                results.append(new_doc_obj)
+            return results
+
+        def fan_out_derive(doc_obj):
+            """Derives a document for each Chute."""
+            return [doc_obj.derive(dict(condensed))
+                    for _ in range(self.CHUTES)]
+
+        results = [
+            ('deepcopy', get_rate(fan_out_copy, messages, repeat=1)),
+            ('derive', get_rate(fan_out_derive, messages)),
+        ]
+        report('1 MB message to 5 Chutes', results, unit='messages/sec')
+
+        memory = [
+            ('deepcopy', get_peak_memory(fan_out_copy, messages[:1])),
+            ('derive', get_peak_memory(fan_out_derive, messages[:1])),
+        ]
+        for label, peak in memory:
+            print('%s: %.1f KB peak allocation per message'
+                  % (label, peak / 1024.0))
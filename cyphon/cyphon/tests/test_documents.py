@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2018 Dunbar Security Solutions, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+"""
+Tests the DocumentObj class.
+"""
+
+# standard library
+try:
+    from unittest.mock import Mock, patch
+except ImportError:
+    from mock import Mock, patch
+
+# third party
+from django.test import TestCase
+
+# local
+from cyphon.documents import DocumentObj
+
+
+class DocumentObjTestCase(TestCase):
+    """
+    Tests the DocumentObj class.
+    """
+
+    def setUp(self):
+        self.doc_obj = DocumentObj(
+            data={'message': 'foo'},
+            doc_id='1',
+            collection='elasticsearch.test_index.test_docs',
+            platform='twitter'
+        )
+
+    def test_slots(self):
+        """
+        Tests that a DocumentObj doesn't have an instance dictionary.
+        """
+        self.assertFalse(hasattr(self.doc_obj, '__dict__'))
+        with self.assertRaises(AttributeError):
+            self.doc_obj.foo = 'bar'
+
+    def test_derive(self):
+        """
+        Tests that the derive method creates a new DocumentObj that
+        shares the source document's metadata.
+        """
+        data = {'content': 'bar'}
+        derived = self.doc_obj.derive(data)
+        self.assertIsNot(derived, self.doc_obj)
+        self.assertIs(derived.data, data)
+        self.assertEqual(derived.doc_id, '1')
+        self.assertEqual(derived.collection,
+                         'elasticsearch.test_index.test_docs')
+        self.assertEqual(derived.platform, 'twitter')
+        self.assertEqual(self.doc_obj.data, {'message': 'foo'})
+
+    def test_derive_distillery(self):
+        """
+        Tests that a derived DocumentObj shares a Distillery that has
+        already been looked up.
+        """
+        distillery = Mock()
+        self.doc_obj.distillery = distillery
+        derived = self.doc_obj.derive({})
+        self.assertIs(derived.distillery, distillery)
+
+    def test_distillery_cached(self):
+        """
+        Tests that the Distillery is only looked up once.
+        """
+        distillery = Mock()
+        with patch.object(DocumentObj, '_get_distillery',
+                          return_value=distillery) as mock_get:
+            self.assertIs(self.doc_obj.distillery, distillery)
+            self.assertIs(self.doc_obj.distillery, distillery)
+            self.assertEqual(mock_get.call_count, 1)
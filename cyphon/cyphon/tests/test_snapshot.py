@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2018 Dunbar Security Solutions, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+"""
+Tests the snapshot module.
+"""
+
+# standard library
+try:
+    from unittest.mock import patch
+except ImportError:
+    from mock import patch
+
+# third party
+from django.test import TestCase
+
+# local
+from aggregator.pipes.models import Pipe
+from companies.models import Company
+from cyphon import snapshot
+from cyphon.documents import DocumentObj
+from distilleries.models import Distillery
+from sifter.datasifter.datachutes.models import DataChute
+from sifter.logsifter.logchutes.models import LogChute
+from watchdogs.models import Watchdog
+from tests.fixture_manager import get_fixtures
+
+
+class ConfigSnapshotTestCase(TestCase):
+    """
+    Tests the ConfigSnapshot class.
+    """
+    fixtures = get_fixtures(['datachutes', 'logchutes', 'watchdogs'])
+
+    def setUp(self):
+        self.snapshot = snapshot.ConfigSnapshot(version=0)
+
+    def test_get_enabled_chutes(self):
+        """
+        Tests the get_enabled_chutes method.
+        """
+        for model in [DataChute, LogChute]:
+            expected = list(model.objects.find_enabled())
+            self.assertEqual(self.snapshot.get_enabled_chutes(model), expected)
+
+    def test_chutes_no_queries(self):
+        """
+        Tests that enabled Chutes can examine data without querying
+        the database.
+        """
+        chutes = self.snapshot.get_enabled_chutes(DataChute)
+        with self.assertNumQueries(0):
+            for chute in chutes:
+                chute._is_match({'subject': 'this is a critical alert'})
+                str(chute.munger.distillery.collection)
+
+    def test_get_distillery(self):
+        """
+        Tests the get_distillery method.
+        """
+        distillery = Distillery.objects.get(pk=1)
+        collection = str(distillery.collection)
+        self.assertEqual(self.snapshot.get_distillery(collection), distillery)
+        self.assertIsNone(self.snapshot.get_distillery('foo.bar.baz'))
+
+    def test_find_relevant_watchdogs(self):
+        """
+        Tests the find_relevant_watchdogs method.
+        """
+        for distillery in list(Distillery.objects.all()) + [None]:
+            expected = set(Watchdog.objects.find_relevant(distillery))
+            actual = self.snapshot.find_relevant_watchdogs(distillery)
+            self.assertEqual(set(actual), expected)
+
+    def test_watchdogs_no_queries(self):
+        """
+        Tests that Watchdogs can inspect data without querying the
+        database.
+        """
+        distillery = self.snapshot.get_distillery(
+            str(Distillery.objects.get(pk=1).collection))
+        with self.assertNumQueries(0):
+            watchdogs = self.snapshot.find_relevant_watchdogs(distillery)
+            for watchdog in watchdogs:
+                watchdog.inspect({'subject': 'this is a critical alert'})
+                watchdog._is_muzzled()
+
+
+class GetSnapshotTestCase(TestCase):
+    """
+    Tests the get_snapshot and get_active_snapshot functions.
+    """
+    fixtures = get_fixtures(['datachutes'])
+
+    def tearDown(self):
+        snapshot.deactivate()
+
+    def test_inactive(self):
+        """
+        Tests that get_active_snapshot returns None unless snapshots
+        are active.
+        """
+        self.assertIsNone(snapshot.get_active_snapshot())
+        snapshot.activate()
+        self.assertIsInstance(snapshot.get_active_snapshot(),
+                              snapshot.ConfigSnapshot)
+
+    def test_cached(self):
+        """
+        Tests that a snapshot is reused while the version is unchanged.
+        """
+        snapshot.activate()
+        result_1 = snapshot.get_snapshot()
+        rebuilds = snapshot.get_stats()['rebuilds']
+        with self.assertNumQueries(0):
+            result_2 = snapshot.get_snapshot()
+        self.assertIs(result_1, result_2)
+        self.assertEqual(snapshot.get_stats()['rebuilds'], rebuilds)
+
+    @patch('cyphon.snapshot._CHECK_INTERVAL', 0)
+    def test_invalidated_on_save(self):
+        """
+        Tests that a snapshot is rebuilt after a relevant model is saved.
+        """
+        snapshot.activate()
+        result_1 = snapshot.get_snapshot()
+        version = snapshot.get_version()
+        rebuilds = snapshot.get_stats()['rebuilds']
+
+        chute = DataChute.objects.get(pk=1)
+        chute.enabled = False
+        chute.save()
+
+        result_2 = snapshot.get_snapshot()
+        self.assertIsNot(result_1, result_2)
+        self.assertNotIn(chute, result_2.get_enabled_chutes(DataChute))
+        self.assertEqual(snapshot.get_stats()['rebuilds'], rebuilds + 1)
+        self.assertIsNotNone(snapshot.get_stats()['last_duration'])
+
+        # the version is only bumped once the transaction commits
+        self.assertEqual(snapshot.get_version(), version)
+
+    def test_version_bumped_on_commit(self):
+        """
+        Tests that the version is bumped when a transaction that saves
+        a relevant model commits.
+        """
+        version = snapshot.get_version()
+        chute = DataChute.objects.get(pk=1)
+        with patch('cyphon.versions.transaction.on_commit',
+                   side_effect=lambda func: func()) as mock_commit:
+            chute.save()
+        self.assertTrue(mock_commit.called)
+        self.assertGreater(snapshot.get_version(), version)
+
+    def test_related_models_watched(self):
+        """
+        Tests that the version is bumped when models that Chutes and
+        Distilleries refer to are saved.
+        """
+        for obj in (Pipe.objects.get(pk=2), Company.objects.first()):
+            version = snapshot.get_version()
+            with patch('cyphon.versions.transaction.on_commit',
+                       side_effect=lambda func: func()):
+                obj.save()
+            self.assertGreater(snapshot.get_version(), version)
+
+    @patch('cyphon.snapshot._MAX_AGE', 0)
+    def test_max_age(self):
+        """
+        Tests that a snapshot is rebuilt after it expires.
+        """
+        result_1 = snapshot.get_snapshot()
+        result_2 = snapshot.get_snapshot()
+        self.assertIsNot(result_1, result_2)
+
+    def test_document_distillery(self):
+        """
+        Tests that a DocumentObj gets its Distillery from an active
+        snapshot.
+        """
+        distillery = Distillery.objects.get(pk=1)
+        collection = str(distillery.collection)
+        snapshot.activate()
+        snapshot.get_snapshot()
+        doc_obj = DocumentObj(collection=collection)
+        with self.assertNumQueries(0):
+            self.assertEqual(doc_obj.distillery, distillery)
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2018 Dunbar Security Solutions, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+"""
+Tests the versions module.
+"""
+
+# standard library
+try:
+    from unittest.mock import patch
+except ImportError:
+    from mock import patch
+
+# third party
+from django.core.cache import cache
+from django.test import TestCase
+
+# local
+from cyphon import versions
+
+
+class BumpVersionTestCase(TestCase):
+    """
+    Tests the bump_version function.
+    """
+
+    key = 'cyphon.tests.version'
+
+    def tearDown(self):
+        cache.delete(self.key)
+
+    def test_after_commit(self):
+        """
+        Tests that the counter isn't incremented until the transaction
+        commits.
+        """
+        with patch('cyphon.versions.transaction.on_commit') as mock_commit:
+            versions.bump_version(self.key)
+        self.assertEqual(versions.get_version(self.key), 0)
+        (callback, ), dummy_kwargs = mock_commit.call_args
+        callback()
+        self.assertEqual(versions.get_version(self.key), 1)
+        callback()
+        self.assertEqual(versions.get_version(self.key), 2)
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2018 Dunbar Security Solutions, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+"""
+Shares version counters between processes.
+
+Some processes keep in-memory copies of objects from the relational
+database, such as the configuration snapshot used by queue consumers.
+A version counter stored in Django's cache tells them when to reload
+those copies. Counters are bumped only after the transaction that
+changed the objects commits, so a process can't reload uncommitted data
+and stamp it with the new version.
+
+Counters are only shared between processes if Django's cache is (see
+the `CACHE` setting).
+
+============================  ==========================================
+Function                      Description
+============================  ==========================================
+:func:`~get_version`          Get the current value of a counter.
+:func:`~bump_version`         Increment a counter after commit.
+============================  ==========================================
+
+"""
+
+# third party
+from django.core.cache import cache
+from django.db import transaction
+
+
+def get_version(key):
+    """Get the current value of a version counter.
+
+    Parameters
+    ----------
+    key : |str|
+        The cache key of the counter.
+
+    Returns
+    -------
+    int
+
+    """
+    return cache.get(key, 0)
+
+
+def _increment(key):
+    """
+    Takes the cache key of a version counter and increments the counter,
+    creating it if it doesn't exist.
+    """
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, timeout=None)
+
+
+def bump_version(key):
+    """Increment a version counter once the current transaction commits.
+
+    If no transaction is active, the counter is incremented immediately.
+
+    Parameters
+    ----------
+    key : |str|
+        The cache key of the counter.
+
+    Returns
+    -------
+    None
+
+    """
+    transaction.on_commit(lambda: _increment(key))
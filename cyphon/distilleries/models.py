@@ -43,6 +43,7 @@ from cyphon.documents import DocumentObj
 from cyphon.models import GetByNameMixin, SelectRelatedManager
 from bottler.containers.models import Container
 from distilleries import signals
+from engines.sorter import SortParam, Sorter
 from utils.dateutils.dateutils import parse_date
 from warehouses.models import Collection
 
@@ -246,12 +247,23 @@ class Distillery(models.Model):
         """
         return self.container.add_label(doc)
 
+    def _add_labels(self, docs):
+        """Enhance a list of docs with metadata.
+
+        Takes a list of dictionaries of data and returns the 'labeled'
+        data, as in :meth:`~Distillery._add_label`. The docs are
+        analyzed together.
+        """
+        return self.container.add_labels(docs)
+
     def _create_doc_obj(self, doc, doc_id):
         """
         Takes a data dictionary and a document id for a document in the
         Distillery, and returns a DocumentObj for the document.
         """
-        return DocumentObj(data=doc, doc_id=doc_id, collection=str(self))
+        doc_obj = DocumentObj(data=doc, doc_id=doc_id, collection=str(self))
+        doc_obj.distillery = self
+        return doc_obj
 
     def _save_and_send_signal(self, doc):
         """Save a doc and send a |document_saved| signal.
@@ -409,6 +421,76 @@ class Distillery(models.Model):
         """
         return self.collection.find(query, sorter, page, page_size)
 
+    @staticmethod
+    def find_many(searches):
+        """Find documents matching queries in several Distilleries.
+
+        Parameters
+        ----------
+        searches : |list| of |tuple|
+            A list of (Distillery, |EngineQuery|, page, page_size)
+            tuples. All the Distilleries' |Collections| must use the
+            same backend.
+
+        Returns
+        -------
+        |list| of |dict| or |None|
+            The result of each search, in the same order as `searches`,
+            in the format returned by :meth:`~Distillery.find`. A search
+            that fails returns |None|.
+
+        """
+        return Collection.find_many([
+            (distillery.collection, query, None, page, page_size)
+            for (distillery, query, page, page_size) in searches
+        ])
+
+    @staticmethod
+    def find_across(searches, page=1, page_size=_PAGE_SIZE):
+        """Find documents in several Distilleries with a single query.
+
+        Documents are identified by the Distillery key that is added to
+        each saved document, and are sorted by the date they were saved,
+        most recent first.
+
+        Parameters
+        ----------
+        searches : |list| of |tuple|
+            A list of (Distillery, |EngineQuery|) tuples. All the
+            Distilleries' |Collections| must use the same backend, and
+            support cross-collection searches.
+
+        page : int
+            The page of results to return.
+
+        page_size : int
+            The number of documents per page of results.
+
+        Returns
+        -------
+        |dict| or |None|
+            A dictionary with keys 'count', 'results', and 'counts'. The
+            'count' value is the total number of documents matching any
+            search. The 'results' value is a page of documents from all
+            the Distilleries. The 'counts' value maps the pk of each
+            Distillery to its number of matching documents. Returns
+            |None| if the search fails.
+
+        """
+        sorter = Sorter([
+            SortParam(field_name=Distillery._DATE_KEY,
+                      field_type='DateTimeField',
+                      order='DESC')
+        ])
+        return Collection.find_across(
+            [(distillery.collection, query, distillery.pk)
+             for (distillery, query) in searches],
+            key=_DISTILLERY_SETTINGS['DISTILLERY_KEY'],
+            sorter=sorter,
+            page=page,
+            page_size=page_size,
+        )
+
     def find_by_id(self, doc_ids):
         """Find one or more documents by id.
 
@@ -602,6 +684,29 @@ class Distillery(models.Model):
         else:
             return self.container.get_sample(doc)
 
+    def _add_doc_info(self, doc_obj):
+        """
+        Takes a DocumentObj and returns its data updated with the date,
+        the Distillery's pk, a reference to the location of the original
+        data, and platform info.
+        """
+        doc = self._add_date(doc_obj.data)
+        doc = self._add_distillery_info(doc)
+        if doc_obj.doc_id and doc_obj.collection:
+            doc = self._add_raw_data_info(doc, doc_obj)
+        if doc_obj.platform:
+            doc = self._add_platform_info(doc, doc_obj.platform)
+        return doc
+
+    def _prepare_doc(self, doc_obj):
+        """Prepare a document for saving.
+
+        Takes a DocumentObj and returns its data updated with the date,
+        the Distillery's pk, a reference to the location of the original
+        data, platform info, and a label.
+        """
+        return self._add_label(self._add_doc_info(doc_obj))
+
     def save_data(self, doc_obj):
         """Save a document to the Distillery's |Collection|.
 
@@ -620,12 +725,38 @@ class Distillery(models.Model):
             The id of the saved document.
 
         """
-        doc = self._add_date(doc_obj.data)
-        doc = self._add_distillery_info(doc)
-        if doc_obj.doc_id and doc_obj.collection:
-            doc = self._add_raw_data_info(doc, doc_obj)
-        if doc_obj.platform:
-            doc = self._add_platform_info(doc, doc_obj.platform)
-        doc = self._add_label(doc)
+        doc = self._prepare_doc(doc_obj)
         doc_id = self._save_and_send_signal(doc)
         return doc_id
+
+    def save_many(self, doc_objs):
+        """Save multiple documents to the Distillery's |Collection|.
+
+        Prepares each document as in :meth:`~Distillery.save_data`,
+        labeling the documents together, saves them to the Distillery's
+        |Collection| in bulk, and sends a |document_saved| signal for
+        each saved document.
+
+        Parameters
+        ----------
+        doc_objs : |list| of |DocumentObj|
+            Documents to be saved.
+
+        Returns
+        -------
+        dict
+            A dictionary with keys 'ids' and 'errors', as returned by
+            :meth:`~warehouses.models.Collection.insert_many`.
+
+        """
+        docs = self._add_labels(
+            [self._add_doc_info(doc_obj) for doc_obj in doc_objs])
+        result = self.collection.insert_many(docs)
+
+        for doc, doc_id in zip(docs, result['ids']):
+            if doc_id is not None:
+                doc_obj = self._create_doc_obj(doc, doc_id)
+                signals.document_saved.send(sender=type(self),
+                                            doc_obj=doc_obj)
+
+        return result
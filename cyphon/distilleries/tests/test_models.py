@@ -390,4 +390,34 @@ class SaveDataTestCase(TransactionTestCase, DistilleryTestCaseMixin):
         self.distillery.collection.insert.assert_called_once_with(bottled_with_meta)
         self.assertEqual(doc_id, mock_doc_id)
 
+    def test_save_many(self):
+        """
+        Tests the save_many method.
+        """
+        mock_result = {
+            'ids': [1, None],
+            'errors': [{'index': 1, 'error': 'failed'}]
+        }
+        self.distillery.collection.insert_many = Mock(return_value=mock_result)
+
+        doc_objs = [
+            DocumentObj(data=copy.deepcopy(self.bottled_data),
+                        collection='mongodb.test_database.twitter'),
+            DocumentObj(data=copy.deepcopy(self.bottled_data),
+                        collection='mongodb.test_database.twitter')
+        ]
+
+        with patch('distilleries.models.timezone.now',
+                   return_value=self.time):
+            with patch('distilleries.models.signals.document_saved.send') \
+                    as mock_send:
+                result = self.distillery.save_many(doc_objs)
+
+        bottled_with_meta = copy.deepcopy(self.bottled_data)
+        bottled_with_meta.update(self.meta)
+        self.distillery.collection.insert_many.assert_called_once_with(
+            [bottled_with_meta, bottled_with_meta])
+        self.assertEqual(result, mock_result)
+        self.assertEqual(mock_send.call_count, 1)
+
 # TODO(LH): test labeled doc
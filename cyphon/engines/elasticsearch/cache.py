@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2018 Dunbar Security Solutions, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+"""
+Caches cluster health and index metadata for Elasticsearch Engines.
+
+Checking the cluster's health and whether an index exists before every
+operation doubles or triples the number of requests sent to
+Elasticsearch. This module remembers the results of those checks for a
+short time, so a healthy cluster in a steady state costs one request
+per operation.
+
+An index that is deleted while it is cached is created again by
+Elasticsearch when the next document is written to it. Engines keep an
+index template with their mapping, so the new index still gets the
+right mapping.
+
+==============================  ===========================================
+Function                        Description
+==============================  ===========================================
+:func:`~check_status`           Wait for a cluster status, if not cached.
+:func:`~index_exists`           Whether an index exists, if not cached.
+:func:`~add_index`              Record that an index exists.
+:func:`~discard_index`          Forget that an index exists.
+:func:`~clear`                  Clear all cached health and index info.
+==============================  ===========================================
+
+==============================  ===========================================
+Constant                        Description
+==============================  ===========================================
+:const:`~HEALTH_CACHE_TIMEOUT`  Seconds to cache a cluster status.
+:const:`~INDEX_CACHE_TIMEOUT`   Seconds to cache the existence of an index.
+==============================  ===========================================
+
+"""
+
+# standard library
+import threading
+import time
+
+# third party
+from django.conf import settings
+
+# local
+from .client import ELASTICSEARCH
+
+_ES_SETTINGS = settings.ELASTICSEARCH
+
+HEALTH_CACHE_TIMEOUT = _ES_SETTINGS.get('HEALTH_CACHE_TIMEOUT', 5)
+"""|int|
+
+Number of seconds for which a successful cluster health check is
+reused.
+"""
+
+INDEX_CACHE_TIMEOUT = _ES_SETTINGS.get('INDEX_CACHE_TIMEOUT', 60)
+"""|int|
+
+Number of seconds for which the existence of an index is remembered.
+"""
+
+_STATUS_LEVELS = {'red': 0, 'yellow': 1, 'green': 2}
+
+_LOCK = threading.Lock()
+
+# cluster status -> time when it was last confirmed
+_HEALTH = {}
+
+# index name -> time when its existence was last confirmed
+_INDEXES = {}
+
+
+def _is_fresh(timestamp, timeout):
+    """Whether a cached value is still valid.
+
+    Takes the time at which a value was cached and the number of
+    seconds for which it is valid, and returns a |bool|.
+    """
+    return timestamp is not None and time.time() - timestamp < timeout
+
+
+def _get_status_time(status):
+    """Get the time when a status was last confirmed.
+
+    Returns the most recent time at which the cluster was confirmed to
+    have the given status or a better one, or |None| if it hasn't been
+    confirmed.
+    """
+    level = _STATUS_LEVELS.get(status, 0)
+    times = [timestamp for (cached_status, timestamp) in _HEALTH.items()
+             if _STATUS_LEVELS.get(cached_status, 0) >= level]
+    return max(times) if times else None
+
+
+def check_status(status, timeout):
+    """Wait for the cluster to attain a status, unless recently seen.
+
+    Parameters
+    ----------
+    status : str
+        The desired cluster state. Options are: 'green', 'yellow', 'red'.
+
+    timeout : |int| or |float|
+        The number of seconds to wait for the desired state.
+
+    Returns
+    -------
+    None
+
+    """
+    with _LOCK:
+        if _is_fresh(_get_status_time(status), HEALTH_CACHE_TIMEOUT):
+            return
+
+    health = ELASTICSEARCH.cluster.health(wait_for_status=status,
+                                          request_timeout=timeout)
+
+    if health and not health.get('timed_out'):
+        with _LOCK:
+            _HEALTH[health.get('status', status)] = time.time()
+
+
+def index_exists(index):
+    """Find out if an index exists, using the cache if possible.
+
+    Parameters
+    ----------
+    index : str
+        The name of an Elasticsearch index.
+
+    Returns
+    -------
+    bool
+        Whether the index exists.
+
+    """
+    with _LOCK:
+        if _is_fresh(_INDEXES.get(index), INDEX_CACHE_TIMEOUT):
+            return True
+
+    exists = ELASTICSEARCH.indices.exists(index)
+
+    if exists:
+        add_index(index)
+
+    return exists
+
+
+def add_index(index):
+    """Record that an index exists.
+
+    Parameters
+    ----------
+    index : str
+        The name of an Elasticsearch index.
+
+    Returns
+    -------
+    None
+
+    """
+    now = time.time()
+    with _LOCK:
+        # drop stale entries, such as yesterday's time-series index
+        for name, timestamp in list(_INDEXES.items()):
+            if not _is_fresh(timestamp, INDEX_CACHE_TIMEOUT):
+                del _INDEXES[name]
+        _INDEXES[index] = now
+
+
+def discard_index(index):
+    """Forget that an index exists.
+
+    Should be called when Elasticsearch reports that an index cannot be
+    found, so that it will be created again before the next write.
+
+    Parameters
+    ----------
+    index : str
+        The name of an Elasticsearch index.
+
+    Returns
+    -------
+    None
+
+    """
+    with _LOCK:
+        _INDEXES.pop(index, None)
+
+
+def clear():
+    """Clear all cached cluster health and index information.
+
+    Returns
+    -------
+    None
+
+    """
+    with _LOCK:
+        _HEALTH.clear()
+        _INDEXES.clear()
@@ -38,6 +38,7 @@ ES_KWARGS = _ES_SETTINGS.get('KWARGS', {'timeout': 30})
 ES_INDEX_SETTINGS = _ES_SETTINGS.get('INDEX', {
     'index.mapping.ignore_malformed': True,
     'number_of_shards': 1,
+    'refresh_interval': '1s',
 })
 
 ELASTICSEARCH = elasticsearch.Elasticsearch(ES_HOSTS, **ES_KWARGS)
@@ -29,6 +29,8 @@ Constant                                Description
 :const:`~ENGINE_CLASS`                  Name of module's Engine subclass.
 :const:`~MULTIPLE_FIELD_NAME_MAPPINGS`  Whether a field can have >1 data type.
 :const:`~TIME_SERIES_ENABLED`           Whether time-series are supported.
+:const:`~MULTI_SEARCH_ENABLED`          Whether searches can be batched.
+:const:`~CROSS_COLLECTION_ENABLED`      Whether searches can be merged.
 ======================================  ======================================
 
 ======================================  ======================================
@@ -41,6 +43,7 @@ Decorator                               Description
 """
 
 # standard library
+from collections import OrderedDict
 import datetime
 from functools import wraps
 import logging
@@ -48,12 +51,22 @@ import logging
 # third party
 from django.utils import timezone
 import elasticsearch
+from elasticsearch import helpers
 
 # local
+from engines.elasticsearch import cache as es_cache
 from engines.elasticsearch import queries as es_queries
 from engines.elasticsearch import results as es_results
 from engines.elasticsearch import sorter as es_sorter
-from engines.engine import Engine, MAX_RESULTS, PAGE_SIZE
+from engines.engine import (
+    Engine,
+    EngineUnavailable,
+    MAX_RESULTS,
+    PAGE_SIZE,
+    REFRESH_IMMEDIATE,
+    REFRESH_NONE,
+    REFRESH_WAIT_FOR,
+)
 from .client import ELASTICSEARCH, ES_KWARGS
 from .mapper import create_mapping
 
@@ -61,6 +74,12 @@ _LOGGER = logging.getLogger(__name__)
 
 TIMEOUT = ES_KWARGS.get('timeout', 30)
 
+_REFRESH_PARAMS = {
+    REFRESH_IMMEDIATE: 'true',
+    REFRESH_WAIT_FOR: 'wait_for',
+    REFRESH_NONE: 'false',
+}
+
 ENGINE_CLASS = 'ElasticsearchEngine'
 """|str|
 
@@ -85,6 +104,33 @@ for easily archiving or deleting old data.
 """
 
 
+MULTI_SEARCH_ENABLED = True
+"""|bool|
+
+Whether the Engine can run searches of several indexes in a single
+request to the data store, using :meth:`~Engine.find_many`.
+"""
+
+
+CROSS_COLLECTION_ENABLED = True
+"""|bool|
+
+Whether the Engine can search several indexes with a single query that
+returns one sorted and paginated set of results, using
+:meth:`~ElasticsearchEngine.find_across`.
+"""
+
+
+def _is_index_not_found(error):
+    """Whether an error from a bulk request is for a missing index.
+
+    Takes the error reported for an item in a bulk request and returns
+    a |bool|.
+    """
+    return (isinstance(error, dict)
+            and error.get('type') == 'index_not_found_exception')
+
+
 def catch_connection_error(func):
     """Catch and log :exc:`~elasticsearch.exceptions.ConnectionError`.
 
@@ -117,7 +163,8 @@ def wait_for_status(status, timeout=TIMEOUT):
 
     Decorator for functions that require a particular cluster state.
     Waits for the cluster to attain the given status before executing
-    the function.
+    the function. Once the status has been confirmed, it is reused for
+    :const:`~engines.elasticsearch.cache.HEALTH_CACHE_TIMEOUT` seconds.
 
     Parameters
     ----------
@@ -136,8 +183,7 @@ def wait_for_status(status, timeout=TIMEOUT):
     def _decorator(func):
         @wraps(func)  # preserve name and docstring of wrapped function
         def _call(*args, **kwargs):
-            ELASTICSEARCH.cluster.health(wait_for_status=status,
-                                         request_timeout=timeout)
+            es_cache.check_status(status, timeout)
             return func(*args, **kwargs)
         return _call
     return _decorator
@@ -178,18 +224,22 @@ class ElasticsearchEngine(Engine):
     def __init__(self, collection):
         """Initialize an ElasticsearchEngine instance.
 
-        Creates an Elasticsearch index with the Engine's index name
-        and a mapping defined by the Engine's schema, if one does not
-        already exist.
+        Creates an index template and an Elasticsearch index with the
+        Engine's index name and a mapping defined by the Engine's
+        schema, if they do not already exist.
         """
         super(ElasticsearchEngine, self).__init__(collection)
         self._index_name = self.warehouse_collection.get_warehouse_name()
         self._doc_type = self.warehouse_collection.name
         self._in_time_series = self.warehouse_collection.in_time_series()
 
+        self._ensure_template()
+
         if not self._in_time_series and not self._index_exists():
             self._create_index()
 
+        self._ready = True
+
     def __str__(self):
         """Get a string representation of the Engine instance.
 
@@ -197,6 +247,14 @@ class ElasticsearchEngine(Engine):
         """
         return '%s.%s' % (self._index_name, self._doc_type)
 
+    def is_ready(self):
+        """Whether the Engine finished setting up its index.
+
+        Returns |False| if the Engine could not connect to
+        Elasticsearch when it was initialized.
+        """
+        return getattr(self, '_ready', False)
+
     @staticmethod
     def _current_date():
         """Get the current date.
@@ -231,6 +289,15 @@ class ElasticsearchEngine(Engine):
         """
         return {'index': self._index_for_insert, 'doc_type': self._doc_type}
 
+    @property
+    def _refresh(self):
+        """Get the refresh parameter for writing docs.
+
+        Returns the value of the Elasticsearch `refresh` parameter that
+        corresponds to the Engine's refresh policy.
+        """
+        return _REFRESH_PARAMS.get(self.refresh_policy, 'true')
+
     @property
     def _index_for_search(self):
         """Get the index name or pattern for searching docs.
@@ -269,7 +336,7 @@ class ElasticsearchEngine(Engine):
         Returns a Boolean indicating whether the index containing the
         Engine's doc_type already exists.
         """
-        return ELASTICSEARCH.indices.exists(self._index_for_insert)
+        return es_cache.index_exists(self._index_for_insert)
 
     def _create_mapping(self):
         """Create a mapping for the index.
@@ -289,19 +356,31 @@ class ElasticsearchEngine(Engine):
         mappings = self._create_mapping()
         params = {'index': index, 'ignore': 400, 'body': mappings}
         ELASTICSEARCH.indices.create(**params)
+        es_cache.add_index(index)
 
     def create_template(self):
         """Create a template for the index.
 
-        Returns a dict of properties for an Elasticsearch index template.
+        Creates or replaces an Elasticsearch index template with the
+        mapping defined by the Engine's schema.
         """
         name = str(self)
         body = self._create_mapping()
         body.update({'template': self._index_for_template})
-        if ELASTICSEARCH.indices.exists_template(name):
-            ELASTICSEARCH.indices.delete_template(name)
         ELASTICSEARCH.indices.put_template(name=name, body=body)
 
+    def _ensure_template(self):
+        """Create a template for the index if none exists.
+
+        Existing indexes are cached (see
+        :mod:`~engines.elasticsearch.cache`), so an index that is
+        deleted may be created again by Elasticsearch itself when the
+        next document is written. The template makes sure such an index
+        still gets the Engine's mapping.
+        """
+        if not ELASTICSEARCH.indices.exists_template(str(self)):
+            self.create_template()
+
     def _filter_by_id(self, doc_ids):
         """Get docs matching one or more ids from multiple indexes.
 
@@ -442,6 +521,22 @@ class ElasticsearchEngine(Engine):
 
         """
         offset = self.get_offset(page, page_size)
+        results = self._get_search_results(
+            self._get_find_params(query, sorter),
+            source=self.field_names,
+            size=page_size,
+            offset=offset
+        )
+        return es_results.get_results_and_count(results)
+
+    @staticmethod
+    def _get_find_params(query, sorter=None):
+        """Get the query body for :meth:`~ElasticsearchEngine.find`.
+
+        Takes an |EngineQuery| and an optional |Sorter|, and returns a
+        dictionary with the corresponding Elasticsearch query and sort
+        parameters.
+        """
         es_query = es_queries.ElasticsearchQuery(query.subqueries,
                                                  query.joiner)
         params = es_query.params
@@ -450,13 +545,173 @@ class ElasticsearchEngine(Engine):
             elastic_sorter = es_sorter.ElasticsearchSorter(sorter.sort_list)
             params.update(elastic_sorter.params)
 
-        results = self._get_search_results(
-            params,
-            source=self.field_names,
+        return params
+
+    def _get_multi_search_lines(self, query, sorter, page, page_size):
+        """Get the header and body of a search in a multi-search request.
+
+        Returns a list containing a header that specifies the index and
+        doc_type to search, followed by the body of a search equivalent
+        to :meth:`~ElasticsearchEngine.find`.
+        """
+        header = {
+            'index': self._index_for_search,
+            'type': self._doc_type,
+            'ignore_unavailable': True,
+        }
+        body = self._get_find_params(query, sorter)
+        body.update({
+            '_source': self.field_names,
+            'size': page_size,
+            'from': self.get_offset(page, page_size),
+        })
+        return [header, body]
+
+    @classmethod
+    @catch_connection_error
+    @wait_for_status('yellow')
+    def find_many(cls, searches):
+        """Run several searches in a single multi-search request.
+
+        Parameters
+        ----------
+        searches : |list| of |tuple|
+            A list of (ElasticsearchEngine, |EngineQuery|, |Sorter| or
+            |None|, page, page_size) tuples.
+
+        Returns
+        -------
+        |list| of |dict| or |None|
+            The result of each search, in the same order as `searches`,
+            in the format returned by :meth:`~ElasticsearchEngine.find`.
+            A search that fails returns |None|.
+
+        """
+        lines = []
+
+        for (engine, query, sorter, page, page_size) in searches:
+            lines += engine._get_multi_search_lines(query, sorter,
+                                                    page, page_size)
+
+        response = ELASTICSEARCH.msearch(body=lines)
+        results = []
+
+        for (engine, result) in zip([search[0] for search in searches],
+                                    response['responses']):
+            if 'error' in result:
+                _LOGGER.error('An error occurred while searching %s: %s',
+                              engine, result['error'])
+                results.append(None)
+            else:
+                results.append(es_results.get_results_and_count(result))
+
+        return results
+
+    @classmethod
+    @catch_connection_error
+    @wait_for_status('yellow')
+    def find_across(cls, searches, key, sorter=None, page=1,
+                    page_size=MAX_RESULTS):
+        """Search several indexes with a single query.
+
+        Documents from each Engine must be stamped with a `key` field
+        whose value identifies the source of the document. Each search
+        only matches documents with its own key value, so searches of
+        different Engines can share an index.
+
+        Parameters
+        ----------
+        searches : |list| of |tuple|
+            A list of (ElasticsearchEngine, |EngineQuery|, value)
+            tuples, where `value` is the value of the `key` field in
+            documents from that search.
+
+        key : str
+            The name of the field that identifies the source of a
+            document.
+
+        sorter : |Sorter| or |None|
+            The order in which all results are sorted.
+
+        page : int
+            The page of results to return.
+
+        page_size : int
+            The number of results on each page.
+
+        Returns
+        -------
+        dict
+            A dictionary with keys 'count', 'results', and 'counts'.
+            The 'count' value is the total number of documents matching
+            any search. The 'results' value is a page of documents from
+            all searches, in the order given by the `sorter`. The
+            'counts' value is a dictionary mapping each search's key
+            value to its number of matching documents.
+
+        """
+        if not searches:
+            return {'count': 0, 'results': [], 'counts': {}}
+
+        engines = [search[0] for search in searches]
+        values = [value for (_, _, value) in searches]
+        body = {
+            'query': {
+                'bool': {
+                    'should': [
+                        {
+                            'bool': {
+                                'filter': [{'term': {key: value}}],
+                                'must': [cls._get_find_params(query)['query']],
+                            }
+                        }
+                        for (_, query, value) in searches
+                    ],
+                    'minimum_should_match': 1,
+                }
+            },
+            # only docs matching a search are aggregated, so there is a
+            # bucket for each search with any results
+            'aggs': {
+                key: {
+                    'terms': {
+                        'field': key,
+                        'size': len(values),
+                    }
+                }
+            },
+        }
+
+        if sorter:
+            elastic_sorter = es_sorter.ElasticsearchSorter(sorter.sort_list)
+            body.update(elastic_sorter.params)
+
+        source = set([key])
+        for engine in engines:
+            source.update(engine.field_names)
+
+        indexes = OrderedDict.fromkeys(engine._index_for_search
+                                       for engine in engines)
+        doc_types = OrderedDict.fromkeys(engine._doc_type
+                                         for engine in engines)
+
+        results = ELASTICSEARCH.search(
+            index=','.join(indexes),
+            doc_type=','.join(doc_types),
+            body=body,
+            _source=sorted(source),
             size=page_size,
-            offset=offset
+            from_=cls.get_offset(page, page_size),
+            ignore_unavailable=True,
         )
-        return es_results.get_results_and_count(results)
+
+        counts = dict((value, 0) for value in values)
+        for bucket in results['aggregations'][key]['buckets']:
+            counts[bucket['key']] = bucket['doc_count']
+
+        data = es_results.get_results_and_count(results)
+        data['counts'] = counts
+        return data
 
     @catch_connection_error
     @wait_for_status('yellow')
@@ -500,12 +755,106 @@ class ElasticsearchEngine(Engine):
 
         """
         params = self._params_for_insert
-        params.update({'body': doc, 'refresh': True})
+        params.update({'body': doc, 'refresh': self._refresh})
         if not self._index_exists():
             self._create_index()
-        doc = ELASTICSEARCH.index(**params)
+        try:
+            doc = ELASTICSEARCH.index(**params)
+        except elasticsearch.exceptions.NotFoundError:
+            # the index was deleted after it was cached
+            es_cache.discard_index(params['index'])
+            self._create_index()
+            doc = ELASTICSEARCH.index(**params)
         return doc['_id']
 
+    def _get_bulk_actions(self, docs):
+        """Create actions for a bulk insert.
+
+        Takes a list of documents and returns a generator of index
+        actions for use with the Elasticsearch bulk helpers.
+        """
+        params = self._params_for_insert
+        for doc in docs:
+            action = {
+                '_op_type': 'index',
+                '_index': params['index'],
+                '_type': params['doc_type'],
+                '_source': doc,
+            }
+            yield action
+
+    def insert_many(self, docs):
+        """Insert multiple documents into the index.
+
+        Documents are sent to Elasticsearch using the bulk API. A
+        document that is rejected by Elasticsearch (e.g., because of a
+        mapping conflict) is reported in the returned errors and does
+        not prevent the other documents from being indexed.
+
+        Parameters
+        ----------
+        docs : |list| of |dict|
+            Documents to insert into the Elasticsearch index.
+
+        Returns
+        -------
+        dict
+            A dictionary with keys 'ids' and 'errors'. The 'ids' value
+            is a list of the ids of the inserted documents, in the same
+            order as `docs`, with |None| for any document that could
+            not be inserted. The 'errors' value is a list of
+            dictionaries with keys 'index' and 'error', giving the
+            position in `docs` and the reason for each failed document.
+
+        Raises
+        ------
+        EngineUnavailable
+            If a connection to Elasticsearch could not be made before
+            any documents were written.
+
+        """
+        result = {'ids': [], 'errors': []}
+
+        if not docs:
+            return result
+
+        try:
+            if not self._index_exists():
+                self._create_index()
+
+            responses = helpers.streaming_bulk(
+                ELASTICSEARCH,
+                self._get_bulk_actions(docs),
+                raise_on_error=False,
+                refresh=self._refresh
+            )
+
+            for position, (success, item) in enumerate(responses):
+                info = item.get('index', {})
+                if success:
+                    result['ids'].append(info['_id'])
+                else:
+                    error = info.get('error', item)
+                    if _is_index_not_found(error):
+                        es_cache.discard_index(info.get('_index'))
+                    result['ids'].append(None)
+                    result['errors'].append({
+                        'index': position,
+                        'error': error
+                    })
+
+        # a request that timed out may still have been carried out, and
+        # documents already reported were written
+        except elasticsearch.exceptions.ConnectionTimeout:
+            raise
+
+        except elasticsearch.exceptions.ConnectionError as error:
+            if result['ids']:
+                raise
+            raise EngineUnavailable(str(error)) from error
+
+        return result
+
     def _remove_by_id_wildcard(self, doc_ids):
         """Remove one or more docs from multiple indexes.
 
@@ -524,7 +873,7 @@ class ElasticsearchEngine(Engine):
 
         for hit in es_results.get_hits(results):
             params = es_results.get_doc_info(hit)
-            params.update({'refresh': True})
+            params.update({'refresh': self._refresh})
             ELASTICSEARCH.delete(**params)
 
     def _remove_by_id_simple(self, doc_ids):
@@ -538,6 +887,7 @@ class ElasticsearchEngine(Engine):
             params = self._params_for_search
             query = es_queries.id_query(doc_id)
             params.update(query)
+            params.update({'refresh': self._refresh})
             ELASTICSEARCH.delete(**params)
 
     @catch_connection_error
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2018 Dunbar Security Solutions, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+"""
+Benchmarks Elasticsearch indexing throughput for each refresh policy.
+
+Requires a running Elasticsearch instance, such as a local
+single-node cluster. Run with::
+
+    python manage.py test engines.elasticsearch.tests -p "benchmark_*.py"
+
+"""
+
+# standard library
+try:
+    from unittest.mock import patch
+except ImportError:
+    from mock import patch
+
+# local
+from engines.engine import REFRESH_POLICY_CHOICES
+from utils.performance.benchmark import get_rate, report
+from engines.elasticsearch.tests.test_engine import ElasticsearchBaseTestCase
+
+
+class RefreshPolicyBenchmark(ElasticsearchBaseTestCase):
+    """
+    Compares single and bulk indexing rates for each refresh policy.
+    """
+
+    DOCS = 500
+    CHUNK_SIZE = 100
+
+    def _get_docs(self):
+        """
+        Returns a list of documents to index.
+        """
+        return [
+            {'user': {'screen_name': 'user_%s' % i},
+             'content': {'rating': i % 10},
+             'status': 'benchmark'}
+            for i in range(self.DOCS)
+        ]
+
+    def test_docs_per_second(self):
+        """
+        Reports docs/sec for each refresh policy, for single inserts
+        and bulk inserts.
+        """
+        docs = self._get_docs()
+        chunks = [docs[i:i + self.CHUNK_SIZE]
+                  for i in range(0, len(docs), self.CHUNK_SIZE)]
+        results = []
+
+        for policy, label in REFRESH_POLICY_CHOICES:
+            with patch('warehouses.models.Collection.get_refresh_policy',
+                       return_value=policy):
+                single_rate = get_rate(self.engine.insert, docs, repeat=1)
+                bulk_rate = get_rate(self.engine.insert_many, chunks,
+                                     repeat=1) * self.CHUNK_SIZE
+            results.append(('%s (single)' % label, single_rate))
+            results.append(('%s (bulk)' % label, bulk_rate))
+
+        report('Elasticsearch refresh policy', results, unit='docs/sec')
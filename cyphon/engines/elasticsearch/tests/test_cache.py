@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2018 Dunbar Security Solutions, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+"""Tests the :mod:`engines.elasticsearch.cache` module.
+
+"""
+
+# standard library
+import logging
+from unittest import skipIf, TestCase
+try:
+    from unittest.mock import patch
+except ImportError:
+    from mock import patch
+
+# third party
+from elasticsearch.exceptions import ConnectionError
+
+LOGGER = logging.getLogger(__name__)
+
+try:
+    # local
+    from engines.elasticsearch import cache
+    NOT_CONNECTED = False
+
+except ConnectionError:
+    NOT_CONNECTED = True
+    LOGGER.warning('Cannot connect to Elasticsearch. '
+                   'Elasticsearch tests will be skipped.')
+
+
+@skipIf(NOT_CONNECTED, 'Cannot connect to Elasticsearch')
+class CheckStatusTestCase(TestCase):
+    """
+    Tests the check_status function.
+    """
+
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    @patch('engines.elasticsearch.cache.ELASTICSEARCH')
+    def test_cached(self, mock_es):
+        """
+        Tests that a confirmed status is reused.
+        """
+        mock_es.cluster.health.return_value = {'status': 'yellow',
+                                               'timed_out': False}
+        cache.check_status('yellow', 30)
+        cache.check_status('yellow', 30)
+        mock_es.cluster.health.assert_called_once_with(
+            wait_for_status='yellow', request_timeout=30)
+
+    @patch('engines.elasticsearch.cache.ELASTICSEARCH')
+    def test_better_status(self, mock_es):
+        """
+        Tests that a better status satisfies a request for a worse one,
+        but not vice versa.
+        """
+        mock_es.cluster.health.return_value = {'status': 'green',
+                                               'timed_out': False}
+        cache.check_status('green', 30)
+        cache.check_status('yellow', 30)
+        self.assertEqual(mock_es.cluster.health.call_count, 1)
+
+        cache.clear()
+        mock_es.cluster.health.return_value = {'status': 'yellow',
+                                               'timed_out': False}
+        cache.check_status('yellow', 30)
+        cache.check_status('green', 30)
+        self.assertEqual(mock_es.cluster.health.call_count, 3)
+
+    @patch('engines.elasticsearch.cache.ELASTICSEARCH')
+    def test_timed_out(self, mock_es):
+        """
+        Tests that a health check that timed out is not cached.
+        """
+        mock_es.cluster.health.return_value = {'status': 'red',
+                                               'timed_out': True}
+        cache.check_status('yellow', 30)
+        cache.check_status('yellow', 30)
+        self.assertEqual(mock_es.cluster.health.call_count, 2)
+
+    @patch('engines.elasticsearch.cache.HEALTH_CACHE_TIMEOUT', 0)
+    @patch('engines.elasticsearch.cache.ELASTICSEARCH')
+    def test_expired(self, mock_es):
+        """
+        Tests that a status is checked again once the cache expires.
+        """
+        mock_es.cluster.health.return_value = {'status': 'yellow',
+                                               'timed_out': False}
+        cache.check_status('yellow', 30)
+        cache.check_status('yellow', 30)
+        self.assertEqual(mock_es.cluster.health.call_count, 2)
+
+
+@skipIf(NOT_CONNECTED, 'Cannot connect to Elasticsearch')
+class IndexExistsTestCase(TestCase):
+    """
+    Tests the index_exists function.
+    """
+
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    @patch('engines.elasticsearch.cache.ELASTICSEARCH')
+    def test_exists(self, mock_es):
+        """
+        Tests that an existing index is cached.
+        """
+        mock_es.indices.exists.return_value = True
+        self.assertTrue(cache.index_exists('foo'))
+        self.assertTrue(cache.index_exists('foo'))
+        mock_es.indices.exists.assert_called_once_with('foo')
+
+    @patch('engines.elasticsearch.cache.ELASTICSEARCH')
+    def test_not_exists(self, mock_es):
+        """
+        Tests that a missing index is not cached.
+        """
+        mock_es.indices.exists.return_value = False
+        self.assertFalse(cache.index_exists('foo'))
+        self.assertFalse(cache.index_exists('foo'))
+        self.assertEqual(mock_es.indices.exists.call_count, 2)
+
+    @patch('engines.elasticsearch.cache.ELASTICSEARCH')
+    def test_add_index(self, mock_es):
+        """
+        Tests that an index recorded with add_index is not checked.
+        """
+        cache.add_index('foo')
+        self.assertTrue(cache.index_exists('foo'))
+        self.assertFalse(mock_es.indices.exists.called)
+
+    @patch('engines.elasticsearch.cache.ELASTICSEARCH')
+    def test_discard_index(self, mock_es):
+        """
+        Tests that a discarded index is checked again.
+        """
+        mock_es.indices.exists.return_value = False
+        cache.add_index('foo')
+        cache.discard_index('foo')
+        self.assertFalse(cache.index_exists('foo'))
+        mock_es.indices.exists.assert_called_once_with('foo')
+
+    @patch('engines.elasticsearch.cache.INDEX_CACHE_TIMEOUT', 0)
+    def test_add_index_prunes(self):
+        """
+        Tests that add_index removes expired entries.
+        """
+        cache.add_index('logs-2018-01-01')
+        cache.add_index('logs-2018-01-02')
+        self.assertEqual(list(cache._INDEXES), ['logs-2018-01-02'])
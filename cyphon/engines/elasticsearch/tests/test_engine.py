@@ -32,6 +32,9 @@ from elasticsearch.exceptions import ConnectionError
 from testfixtures import LogCapture
 
 # local
+from cyphon.fieldsets import QueryFieldset
+from engines.queries import EngineQuery
+from engines.sorter import SortParam, Sorter
 from engines.tests.test_engine import EngineBaseTestCase
 from engines.tests.mixins import CRUDTestCaseMixin, FilterTestCaseMixin
 from warehouses.models import Collection
@@ -40,6 +43,7 @@ LOGGER = logging.getLogger(__name__)
 
 try:
     # local
+    from engines.elasticsearch import cache as es_cache
     from engines.elasticsearch.client import ELASTICSEARCH, VERSION
     from engines.elasticsearch.engine import (
         catch_connection_error,
@@ -76,6 +80,9 @@ class ElasticsearchBaseTestCase(EngineBaseTestCase):
 
     def tearDown(self):
         self.elasticsearch.indices.delete(index=self.index)
+        self.elasticsearch.indices.delete_template(name=str(self.engine),
+                                                   ignore=404)
+        es_cache.clear()
         logging.disable(logging.NOTSET)
 
     @staticmethod
@@ -117,6 +124,146 @@ class ElasticsearchTestCase(ElasticsearchBaseTestCase):
         self.assertTrue(name.endswith('.test_docs'))
 
 
+    def test_refresh(self):
+        """
+        Tests that the _refresh property reflects the Collection's
+        refresh policy.
+        """
+        expected = [
+            ('immediate', 'true'),
+            ('wait_for', 'wait_for'),
+            ('none', 'false'),
+        ]
+        for policy, param in expected:
+            with patch('warehouses.models.Collection.get_refresh_policy',
+                       return_value=policy):
+                self.assertEqual(self.engine._refresh, param)
+
+    @patch('engines.elasticsearch.engine.ELASTICSEARCH.index',
+           return_value={'_id': 'abc'})
+    def test_insert_refresh(self, mock_index):
+        """
+        Tests that the insert method uses the Collection's refresh
+        policy.
+        """
+        with patch('warehouses.models.Collection.get_refresh_policy',
+                   return_value='none'):
+            self.engine.insert({'text': 'foo'})
+        self.assertEqual(mock_index.call_args[1]['refresh'], 'false')
+
+    def test_insert_many_errors(self):
+        """
+        Tests that the insert_many method returns errors for documents
+        that were rejected by Elasticsearch.
+        """
+        error = {'type': 'mapper_parsing_exception'}
+        responses = [
+            (True, {'index': {'_id': 'abc', 'status': 201}}),
+            (False, {'index': {'_id': None, 'status': 400, 'error': error}})
+        ]
+        with patch('engines.elasticsearch.engine.helpers.streaming_bulk',
+                   return_value=responses):
+            result = self.engine.insert_many([{'text': 'foo'},
+                                              {'text': 'bar'}])
+        self.assertEqual(result['ids'], ['abc', None])
+        self.assertEqual(result['errors'], [{'index': 1, 'error': error}])
+
+    def test_find_many(self):
+        """
+        Tests that the find_many method runs all searches in a single
+        multi-search request and returns results in order.
+        """
+        query = EngineQuery([
+            QueryFieldset(
+                field_name='text',
+                field_type='CharField',
+                operator='eq',
+                value='foo'
+            )
+        ], 'AND')
+        responses = {
+            'responses': [
+                {'hits': {'total': 1, 'hits': [
+                    {'_id': 'abc', '_source': {'text': 'foo'}}
+                ]}},
+                {'error': {'type': 'search_phase_execution_exception'}},
+            ]
+        }
+        searches = [
+            (self.engine, query, None, 1, 10),
+            (self.engine, query, None, 2, 10),
+        ]
+        with patch('engines.elasticsearch.engine.ELASTICSEARCH.msearch',
+                   return_value=responses) as mock_msearch:
+            results = ElasticsearchEngine.find_many(searches)
+
+        self.assertEqual(mock_msearch.call_count, 1)
+        lines = mock_msearch.call_args[1]['body']
+        self.assertEqual(len(lines), 4)
+        self.assertEqual(lines[0]['index'], self.engine._index_for_search)
+        self.assertEqual(lines[0]['type'], 'test_docs')
+        self.assertEqual(lines[1]['size'], 10)
+        self.assertEqual(lines[1]['from'], 0)
+        self.assertEqual(lines[3]['from'], 10)
+        self.assertEqual(results, [
+            {'count': 1, 'results': [{'_id': 'abc', 'text': 'foo'}]},
+            None,
+        ])
+
+    def test_find_across(self):
+        """
+        Tests that the find_across method searches all indexes with a
+        single query and returns a count for each search.
+        """
+        query = EngineQuery([
+            QueryFieldset(
+                field_name='text',
+                field_type='CharField',
+                operator='eq',
+                value='foo'
+            )
+        ], 'AND')
+        response = {
+            'hits': {'total': 3, 'hits': [
+                {'_id': 'abc', '_source': {'text': 'foo', '_distillery': 2}},
+            ]},
+            'aggregations': {
+                '_distillery': {
+                    'buckets': [{'key': 2, 'doc_count': 3}],
+                },
+            },
+        }
+        sorter = Sorter([SortParam('_saved_date', 'DateTimeField', 'DESC')])
+        searches = [
+            (self.engine, query, 1),
+            (self.engine, query, 2),
+        ]
+        with patch('engines.elasticsearch.engine.ELASTICSEARCH.search',
+                   return_value=response) as mock_search:
+            results = ElasticsearchEngine.find_across(
+                searches, '_distillery', sorter, page=2, page_size=10)
+
+        self.assertEqual(mock_search.call_count, 1)
+        kwargs = mock_search.call_args[1]
+        self.assertEqual(kwargs['index'], self.engine._index_for_search)
+        self.assertEqual(kwargs['doc_type'], 'test_docs')
+        self.assertEqual(kwargs['size'], 10)
+        self.assertEqual(kwargs['from_'], 10)
+        self.assertIn('_distillery', kwargs['_source'])
+
+        should = kwargs['body']['query']['bool']['should']
+        self.assertEqual(len(should), 2)
+        self.assertEqual(should[1]['bool']['filter'],
+                         [{'term': {'_distillery': 2}}])
+        self.assertEqual(kwargs['body']['sort'],
+                         [{'_saved_date': {'order': 'desc'}}])
+        self.assertEqual(results, {
+            'count': 3,
+            'results': [{'_id': 'abc', 'text': 'foo', '_distillery': 2}],
+            'counts': {1: 0, 2: 3},
+        })
+
+
 class CatchConnectionError(ElasticsearchBaseTestCase):
     """
     Tests methods for the catch_connection_error decorator.
@@ -374,6 +521,22 @@ class ElasticsearchHelperTestCase(ElasticsearchBaseTestCase):
             })
         self.assertEqual(actual, expected)
 
+    def test_deleted_index(self):
+        """
+        Tests that an index that is deleted while it is cached gets the
+        Engine's mapping when Elasticsearch creates it again.
+        """
+        self.assertTrue(self.engine._index_exists())
+        self.elasticsearch.indices.delete(index=self.index)
+        self.engine.insert({'content': {'text': 'foo'}})
+        mapping = self.elasticsearch.indices.get_mapping(index=self.index)
+        properties = mapping[self.index]['mappings']['test_docs']['properties']
+        if VERSION < '5.0':
+            expected = self.expected_properties_v2['ip_address']
+        else:
+            expected = self.expected_properties_v5['ip_address']
+        self.assertEqual(properties['ip_address'], expected)
+
     @patch('engines.elasticsearch.engine.ELASTICSEARCH.indices.put_template')
     def test_create_template(self, mock_template):
         """
@@ -431,6 +594,9 @@ class ElasticsearchWildcardTestCase(ElasticsearchBaseTestCase):
 
     def tearDown(self):
         self.elasticsearch.indices.delete(index=self.engine._index_for_insert)
+        self.elasticsearch.indices.delete_template(name=str(self.engine),
+                                                   ignore=404)
+        es_cache.clear()
         logging.disable(logging.NOTSET)
 
     def test_find_by_id(self):
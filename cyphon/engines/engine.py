@@ -21,17 +21,19 @@ An |Engine| performs CRUD operations on a set of documents in a data
 store, represented by a |Collection|. Essentially, an |Engine| shuttles
 documents to and from that |Collection|.
 
-=====================  =================================================
-Class                  Description
-=====================  =================================================
-:class:`~Engine`       Interface for a data store.
-=====================  =================================================
-
-=====================  =================================================
-Constant               Description
-=====================  =================================================
-:const:`~MAX_RESULTS`  Maximum number of results to return for a search.
-=====================  =================================================
+===========================  ===========================================
+Class                        Description
+===========================  ===========================================
+:class:`~Engine`             Interface for a data store.
+:class:`~EngineUnavailable`  A data store could not be reached.
+===========================  ===========================================
+
+================================  ======================================
+Constant                          Description
+================================  ======================================
+:const:`~MAX_RESULTS`             Maximum number of results to return.
+:const:`~REFRESH_POLICY_CHOICES`  Choices for when writes become visible.
+================================  ======================================
 
 """
 
@@ -49,6 +51,37 @@ MAX_RESULTS = 1000
 Maximum number of results to return from a query.
 """
 
+REFRESH_IMMEDIATE = 'immediate'
+REFRESH_WAIT_FOR = 'wait_for'
+REFRESH_NONE = 'none'
+
+REFRESH_POLICY_CHOICES = (
+    (REFRESH_IMMEDIATE, 'Immediate'),
+    (REFRESH_WAIT_FOR, 'Wait for refresh'),
+    (REFRESH_NONE, 'None (periodic refresh)'),
+)
+"""|tuple| of |tuple|
+
+Choices for when documents written to a data store become visible to
+searches. With 'immediate', the data store is refreshed after every
+write. With 'wait_for', a write returns once the data store's next
+scheduled refresh has made it visible. With 'none', writes return
+without waiting and become visible at the next scheduled refresh.
+Backends whose writes are always immediately visible ignore this
+policy.
+"""
+
+
+class EngineUnavailable(Exception):
+    """Raised when a data store can't be reached.
+
+    Raised by :meth:`~Engine.insert_many` only if no documents were
+    written, so the insert can be retried without saving any document
+    twice.
+    """
+
+    pass
+
 
 class Engine(BaseClass):
     """An interface for a data store.
@@ -91,6 +124,34 @@ class Engine(BaseClass):
         self.warehouse_collection = collection
         self.schema = collection.get_schema()
 
+    def is_ready(self):
+        """Whether the Engine finished setting up its data store.
+
+        Derived classes whose setup can fail without raising an
+        exception (e.g., if the data store is unavailable) should
+        override this method.
+
+        Returns
+        -------
+        bool
+            Whether the Engine can be reused.
+
+        """
+        return True
+
+    @property
+    def refresh_policy(self):
+        """The refresh policy for documents written by the Engine.
+
+        Returns
+        -------
+        |str|
+            A value from |REFRESH_POLICY_CHOICES|, as determined by the
+            Engine's |Collection|.
+
+        """
+        return self.warehouse_collection.get_refresh_policy()
+
     @property
     def field_names(self):
         """List the fields in the Engine's schema.
@@ -179,6 +240,33 @@ class Engine(BaseClass):
         """
         return self.raise_method_not_implemented()
 
+    @classmethod
+    def find_many(cls, searches):
+        """Run several searches, each on its own Engine.
+
+        Parameters
+        ----------
+        searches : |list| of |tuple|
+            A list of (Engine, |EngineQuery|, |Sorter| or |None|, page,
+            page_size) tuples. Each Engine must be an instance of this
+            class.
+
+        Returns
+        -------
+        |list| of |dict|
+            The result of each search, in the same order as `searches`,
+            in the format returned by :meth:`~Engine.find`.
+
+        Notes
+        -----
+        This runs each search in turn. Derived classes whose data store
+        can run several searches in a single request should override
+        this method.
+
+        """
+        return [engine.find(query, sorter, page, page_size)
+                for (engine, query, sorter, page, page_size) in searches]
+
     def filter_ids(self, doc_ids, fields, value):
         """Find the ids of documents that match a value.
 
@@ -226,6 +314,40 @@ class Engine(BaseClass):
         """
         return self.raise_method_not_implemented()
 
+    def insert_many(self, docs):
+        """Insert multiple documents into the data store.
+
+        Derived classes should override this method if the data store
+        supports bulk inserts. By default, documents are inserted one
+        at a time using :meth:`~Engine.insert`.
+
+        Parameters
+        ----------
+        docs : |list| of |dict|
+            The documents to insert in the data store.
+
+        Returns
+        -------
+        dict
+            A dictionary with keys 'ids' and 'errors'. The 'ids' value
+            is a list of the ids of the inserted documents, in the same
+            order as `docs`, with |None| for any document that could
+            not be inserted. The 'errors' value is a list of
+            dictionaries with keys 'index' and 'error', giving the
+            position in `docs` and the reason for each failed document.
+
+        Raises
+        ------
+        EngineUnavailable
+            If the data store could not be reached before any documents
+            were written.
+
+        """
+        return {
+            'ids': [self.insert(doc) for doc in docs],
+            'errors': [],
+        }
+
     def remove_by_id(self, doc_ids):
         """Remove the documents with the given ids.
 
@@ -29,6 +29,8 @@ Constant                                Description
 :const:`~ENGINE_CLASS`                  Name of module's Engine subclass.
 :const:`~MULTIPLE_FIELD_NAME_MAPPINGS`  Whether a field can have >1 data type.
 :const:`~TIME_SERIES_ENABLED`           Whether time-series are supported.
+:const:`~MULTI_SEARCH_ENABLED`          Whether searches can be batched.
+:const:`~CROSS_COLLECTION_ENABLED`      Whether searches can be merged.
 ======================================  ======================================
 
 ======================================  ======================================
@@ -49,7 +51,7 @@ from django.conf import settings
 import pymongo
 
 # local
-from engines.engine import Engine, MAX_RESULTS, PAGE_SIZE
+from engines.engine import Engine, EngineUnavailable, MAX_RESULTS, PAGE_SIZE
 from engines.mongodb import queries as mongodb_queries
 from engines.mongodb import sorter as mongodb_sorter
 from engines.mongodb import results as mongodb_results
@@ -60,6 +62,8 @@ _DISTILLERY_SETTINGS = settings.DISTILLERIES
 
 _LOGGER = logging.getLogger(__name__)
 
+_DUPLICATE_KEY_ERROR = 11000
+
 
 ENGINE_CLASS = 'MongoDbEngine'
 """|str|
@@ -84,6 +88,22 @@ creating timestamped collections (e.g. 'logstash-%Y-%m-%d').
 """
 
 
+MULTI_SEARCH_ENABLED = False
+"""|bool|
+
+Whether the Engine can run searches of several collections in a single
+request to the data store, using :meth:`~Engine.find_many`.
+"""
+
+
+CROSS_COLLECTION_ENABLED = False
+"""|bool|
+
+Whether the Engine can search several collections with a single query
+that returns one sorted and paginated set of results.
+"""
+
+
 def catch_timeout_error(func):
     """Catch and log :exc:`~pymongo.errors.ServerSelectionTimeoutError`.
 
@@ -161,6 +181,8 @@ class MongoDbEngine(Engine):
         if self.schema:
             self._create_text_index(self.schema)
 
+        self._ready = True
+
     def __str__(self):
         """Get a string representation of the Engine instance.
 
@@ -168,6 +190,14 @@ class MongoDbEngine(Engine):
         """
         return '%s.%s' % (self._db_name, self._collection_name)
 
+    def is_ready(self):
+        """Whether the Engine finished setting up its collection.
+
+        Returns |False| if the Engine could not connect to MongoDB when
+        it was initialized.
+        """
+        return getattr(self, '_ready', False)
+
     def _create_text_index(self, fields=None):
         """Create a text index for the database collection.
 
@@ -418,6 +448,89 @@ class MongoDbEngine(Engine):
 
         return str(obj_id)
 
+    def _get_duplicate_id(self, errmsg):
+        """Get the id of an existing doc from a duplicate key error.
+
+        Takes the error message of a duplicate key error and returns
+        the id of the document that already has that key.
+        """
+        key_val = parserutils.get_dup_key_val(errmsg)
+        dup = self._collection.find_one(key_val)
+        if dup is not None:
+            return str(dup['_id'])
+
+    def insert_many(self, docs):
+        """Insert multiple documents into the collection.
+
+        Documents are inserted in a single unordered bulk write, so a
+        document that cannot be inserted does not prevent the remaining
+        documents from being inserted.
+
+        Parameters
+        ----------
+        docs : |list| of |dict|
+            Documents to insert into the MongoDB collection.
+
+        Returns
+        -------
+        dict
+            A dictionary with keys 'ids' and 'errors'. The 'ids' value
+            is a list of the hexadecimal ids of the inserted documents,
+            in the same order as `docs`, with |None| for any document
+            that could not be inserted. The 'errors' value is a list of
+            dictionaries with keys 'index' and 'error', giving the
+            position in `docs` and the reason for each failed document.
+
+        Raises
+        ------
+        EngineUnavailable
+            If no MongoDB server could be selected, in which case no
+            documents were written.
+
+        Notes
+        ------
+        As with :meth:`~MongoDbEngine.insert`, if a document with the
+        same key already exists, the id of the original document is
+        returned in place of the new document's id.
+
+        """
+        result = {'ids': [], 'errors': []}
+
+        if not docs:
+            return result
+
+        write_errors = {}
+
+        try:
+            self._collection.insert_many(docs, ordered=False)
+
+        except pymongo.errors.BulkWriteError as error:
+            for write_error in error.details.get('writeErrors', []):
+                write_errors[write_error['index']] = write_error
+
+        # raised before any documents are sent
+        except pymongo.errors.ServerSelectionTimeoutError as error:
+            raise EngineUnavailable(str(error)) from error
+
+        for position, doc in enumerate(docs):
+            write_error = write_errors.get(position)
+
+            if write_error is None:
+                result['ids'].append(str(doc['_id']))
+
+            elif write_error.get('code') == _DUPLICATE_KEY_ERROR:
+                result['ids'].append(
+                    self._get_duplicate_id(write_error['errmsg']))
+
+            else:
+                result['ids'].append(None)
+                result['errors'].append({
+                    'index': position,
+                    'error': write_error.get('errmsg')
+                })
+
+        return result
+
     def remove_by_id(self, doc_ids):
         """Remove the documents with the given ids.
 
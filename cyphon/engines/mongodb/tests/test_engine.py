@@ -28,6 +28,7 @@ except ImportError:
     from mock import patch
 
 # third party
+from bson import ObjectId
 import pymongo
 
 # local
@@ -130,6 +131,38 @@ class MongoDbTestCase(MongoDbBaseTestCase):
         self.assertTrue(name.endswith('.test_docs'))
 
 
+    def test_insert_many_errors(self):
+        """
+        Tests that the insert_many method returns errors for documents
+        that could not be inserted.
+        """
+        docs = [{'_id': ObjectId(), 'text': 'foo'}, {'text': 'bar'}]
+        details = {'writeErrors': [{'index': 1, 'code': 2, 'errmsg': 'bad'}]}
+        error = pymongo.errors.BulkWriteError(details)
+        with patch.object(self.engine._collection, 'insert_many',
+                          side_effect=error):
+            result = self.engine.insert_many(docs)
+        self.assertEqual(result['ids'], [str(docs[0]['_id']), None])
+        self.assertEqual(result['errors'], [{'index': 1, 'error': 'bad'}])
+
+    def test_insert_many_duplicate(self):
+        """
+        Tests that the insert_many method returns the id of the
+        original document when a document has a duplicate key.
+        """
+        docs = [{'text': 'foo'}]
+        details = {'writeErrors': [{'index': 0, 'code': 11000,
+                                    'errmsg': 'duplicate'}]}
+        error = pymongo.errors.BulkWriteError(details)
+        with patch.object(self.engine._collection, 'insert_many',
+                          side_effect=error):
+            with patch.object(self.engine, '_get_duplicate_id',
+                              return_value='abc') as mock_get_id:
+                result = self.engine.insert_many(docs)
+        mock_get_id.assert_called_once_with('duplicate')
+        self.assertEqual(result, {'ids': ['abc'], 'errors': []})
+
+
 class MongoDbCRUDTestCase(MongoDbBaseTestCase, CRUDTestCaseMixin):
     """
     Class for testing simple CRUD operations for the MongoDbEngine class. Inherits its
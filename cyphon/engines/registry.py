@@ -15,7 +15,21 @@
 # You should have received a copy of the GNU General Public License
 # along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
 """
-Provides constants for locating |Engine| subclasses.
+Provides constants for locating |Engine| subclasses, and a registry
+of |Engine| instances shared by the process.
+
+Setting up an |Engine| can require several requests to its data store
+(e.g., to check the cluster's health or create indexes). The registry
+hands out long-lived |Engine| instances, so that this setup is done
+once per process rather than every time a |Collection| is fetched.
+
+The process that changes an |Engine|'s configuration discards its
+shared |Engines| right away. A version counter, stored in Django's
+cache, is bumped when the change commits (see :mod:`cyphon.versions`),
+so other processes notice it within `WAREHOUSES['ENGINE_CHECK_INTERVAL']`
+seconds. As a safeguard against changes that don't send signals,
+|Engines| are also set up again after `WAREHOUSES['ENGINE_MAX_AGE']`
+seconds.
 
 [`source`_]
 
@@ -28,16 +42,38 @@ Constant                   Description
 :const:`~BACKEND_CHOICES`  Choices for data stores (e.g., Elasticsearch).
 =========================  ================================================
 
+=========================  ================================================
+Function                   Description
+=========================  ================================================
+:func:`~get_engine`        Get a shared |Engine| for a key.
+:func:`~invalidate`        Discard one or all shared |Engines|.
+:func:`~bump_version`      Discard shared |Engines| in all processes.
+=========================  ================================================
+
 .. _source: ../_modules/engines/registry.html
 
 """
 
 # standard library
 import os
+import threading
+import time
+
+# third party
+from django.conf import settings
 
 # local
+from cyphon import versions
 from utils.choices import choices
 
+_WAREHOUSE_SETTINGS = getattr(settings, 'WAREHOUSES', {})
+
+_CHECK_INTERVAL = _WAREHOUSE_SETTINGS.get('ENGINE_CHECK_INTERVAL', 1)
+
+_MAX_AGE = _WAREHOUSE_SETTINGS.get('ENGINE_MAX_AGE', 300)
+
+_VERSION_KEY = 'engines.registry.version'
+
 
 def _get_this_package():
     """Get the name of this package.
@@ -81,3 +117,108 @@ argument for a CharField in a Django Model, e.g.::
     )
 
 """
+
+_LOCK = threading.Lock()
+
+# maps keys to (engine, version, created) tuples
+_ENGINES = {}
+
+_STATE = {
+    'version': None,
+    'last_check': 0,
+}
+
+
+def _get_version(now):
+    """
+    Takes the current time and returns the version of the Engines'
+    configuration, which is read from the cache at most once per check
+    interval.
+    """
+    if now - _STATE['last_check'] >= _CHECK_INTERVAL:
+        _STATE['version'] = versions.get_version(_VERSION_KEY)
+        _STATE['last_check'] = now
+    return _STATE['version']
+
+
+def get_engine(key, factory):
+    """Get a shared |Engine| instance.
+
+    Parameters
+    ----------
+    key : |int| or |str|
+        A value that identifies a |Collection|, such as its primary key.
+
+    factory : function
+        A function that takes no arguments and returns a new |Engine|
+        for the |Collection|. This is only called if the registry does
+        not already have a current |Engine| for the `key`.
+
+    Returns
+    -------
+    |Engine| or |None|
+        The |Engine| for the `key`. An |Engine| that could not finish
+        setting up (e.g., because its data store was unavailable) is
+        returned but not shared, so setup will be tried again.
+
+    """
+    now = time.time()
+    version = _get_version(now)
+
+    with _LOCK:
+        entry = _ENGINES.get(key)
+
+    if entry is not None:
+        (engine, engine_version, created) = entry
+        if engine_version == version and now - created < _MAX_AGE:
+            return engine
+
+    engine = factory()
+
+    if engine is not None and engine.is_ready():
+        with _LOCK:
+            current = _ENGINES.get(key)
+            if current is None or current is entry:
+                _ENGINES[key] = (engine, version, now)
+            else:
+                engine = current[0]
+
+    return engine
+
+
+def invalidate(key=None):
+    """Discard shared |Engine| instances.
+
+    Should be called when the configuration that an |Engine| depends
+    on changes, such as its |Collection|, |Warehouse|, or |Container|.
+
+    Parameters
+    ----------
+    key : |int| or |str|, optional
+        A value that identifies a |Collection|. If |None|, all shared
+        |Engines| are discarded.
+
+    Returns
+    -------
+    None
+
+    """
+    with _LOCK:
+        if key is None:
+            _ENGINES.clear()
+        else:
+            _ENGINES.pop(key, None)
+
+
+def bump_version():
+    """Discard shared |Engine| instances in all processes.
+
+    The version is bumped once the current transaction commits. Other
+    processes set up their |Engines| again the next time they check it.
+
+    Returns
+    -------
+    None
+
+    """
+    versions.bump_version(_VERSION_KEY)
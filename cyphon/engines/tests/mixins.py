@@ -49,6 +49,29 @@ class CRUDTestCaseMixin(object):
         self.assertEqual(self._get_id([result], 0), doc_id)
         self.assertEqual(self._get_doc([result], 0)['text'], test_text)
 
+    def test_insert_many(self):
+        """
+        Tests the insert_many method.
+        """
+        test_texts = ['this is an insert_many test post',
+                      'this is another insert_many test post']
+        result = self.engine.insert_many([{'text': text} for text in test_texts])
+
+        self.assertEqual(result['errors'], [])
+        self.assertEqual(len(result['ids']), 2)
+
+        for doc_id, test_text in zip(result['ids'], test_texts):
+            doc = self.engine.find_by_id(doc_id)
+            self.assertEqual(self._get_id([doc], 0), doc_id)
+            self.assertEqual(self._get_doc([doc], 0)['text'], test_text)
+
+    def test_insert_many_empty(self):
+        """
+        Tests the insert_many method for an empty list of documents.
+        """
+        result = self.engine.insert_many([])
+        self.assertEqual(result, {'ids': [], 'errors': []})
+
     def test_find_by_id_single(self):
         """
         Tests the find_by_id method for a single document.
@@ -151,6 +151,13 @@ class EngineTestCase(EngineBaseTestCase):
         with self.assertRaises(NotImplementedError):
             self.engine.insert({'_id': 'xyz'})
 
+    def test_insert_many(self):
+        """
+        Tests the insert_many method.
+        """
+        with self.assertRaises(NotImplementedError):
+            self.engine.insert_many([{'_id': 'xyz'}])
+
     def test_remove_by_id(self):
         """
         Tests the remove_by_id method.
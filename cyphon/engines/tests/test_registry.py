@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2018 Dunbar Security Solutions, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+"""
+Tests the registry of shared Engines.
+"""
+
+# standard library
+from unittest import TestCase
+try:
+    from unittest.mock import Mock, patch
+except ImportError:
+    from mock import Mock, patch
+
+# local
+from engines import registry
+
+
+class GetEngineTestCase(TestCase):
+    """
+    Tests the get_engine function.
+    """
+
+    def setUp(self):
+        registry.invalidate()
+
+    def tearDown(self):
+        registry.invalidate()
+
+    def test_shared(self):
+        """
+        Tests that an Engine is only created once for a key.
+        """
+        engine = Mock()
+        engine.is_ready.return_value = True
+        factory = Mock(return_value=engine)
+
+        self.assertIs(registry.get_engine(1, factory), engine)
+        self.assertIs(registry.get_engine(1, factory), engine)
+        self.assertEqual(factory.call_count, 1)
+
+    def test_different_keys(self):
+        """
+        Tests that different keys get different Engines.
+        """
+        factory = Mock(side_effect=lambda: Mock())
+        engine_1 = registry.get_engine(1, factory)
+        engine_2 = registry.get_engine(2, factory)
+        self.assertIsNot(engine_1, engine_2)
+
+    def test_not_ready(self):
+        """
+        Tests that an Engine that did not finish setting up is not
+        shared.
+        """
+        engine = Mock()
+        engine.is_ready.return_value = False
+        factory = Mock(return_value=engine)
+
+        self.assertIs(registry.get_engine(1, factory), engine)
+        registry.get_engine(1, factory)
+        self.assertEqual(factory.call_count, 2)
+
+    def test_none(self):
+        """
+        Tests that a factory that returns None is called again.
+        """
+        factory = Mock(return_value=None)
+        self.assertIsNone(registry.get_engine(1, factory))
+        registry.get_engine(1, factory)
+        self.assertEqual(factory.call_count, 2)
+
+    @patch('engines.registry._CHECK_INTERVAL', 0)
+    def test_version_changed(self):
+        """
+        Tests that an Engine is set up again when another process
+        changes its configuration.
+        """
+        factory = Mock(side_effect=lambda: Mock())
+        engine = registry.get_engine(1, factory)
+
+        with patch('engines.registry.versions.get_version', return_value=-1):
+            new_engine = registry.get_engine(1, factory)
+            self.assertIsNot(new_engine, engine)
+            self.assertIs(registry.get_engine(1, factory), new_engine)
+
+        self.assertEqual(factory.call_count, 2)
+
+    def test_max_age(self):
+        """
+        Tests that an Engine is set up again when it gets too old.
+        """
+        factory = Mock(side_effect=lambda: Mock())
+        engine = registry.get_engine(1, factory)
+        with patch('engines.registry._MAX_AGE', 0):
+            self.assertIsNot(registry.get_engine(1, factory), engine)
+
+    def test_bump_version(self):
+        """
+        Tests that the version is bumped when a transaction commits.
+        """
+        version = registry.versions.get_version(registry._VERSION_KEY)
+        with patch('cyphon.versions.transaction.on_commit',
+                   side_effect=lambda func: func()):
+            registry.bump_version()
+        self.assertGreater(
+            registry.versions.get_version(registry._VERSION_KEY), version)
+
+
+class InvalidateTestCase(TestCase):
+    """
+    Tests the invalidate function.
+    """
+
+    def setUp(self):
+        registry.invalidate()
+        self.factory = Mock(side_effect=lambda: Mock())
+        registry.get_engine(1, self.factory)
+        registry.get_engine(2, self.factory)
+
+    def tearDown(self):
+        registry.invalidate()
+
+    def test_invalidate_key(self):
+        """
+        Tests that only the Engine for the given key is discarded.
+        """
+        registry.invalidate(1)
+        registry.get_engine(1, self.factory)
+        registry.get_engine(2, self.factory)
+        self.assertEqual(self.factory.call_count, 3)
+
+    def test_invalidate_all(self):
+        """
+        Tests that all Engines are discarded.
+        """
+        registry.invalidate()
+        registry.get_engine(1, self.factory)
+        registry.get_engine(2, self.factory)
+        self.assertEqual(self.factory.call_count, 4)
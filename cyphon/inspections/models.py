@@ -56,6 +56,26 @@ class Inspection(models.Model):
                 return step.result_value
         return None
 
+    def get_results(self, data_list):
+        """
+
+        Notes
+        -----
+        This method should have the same name as the corresponding
+        method in a LabProcedure.
+
+        """
+        steps = list(self.steps.all())
+        results = []
+        for data in data_list:
+            result = None
+            for step in steps:
+                if step.is_match(data):
+                    result = step.result_value
+                    break
+            results.append(result)
+        return results
+
 
 class InspectionStep(models.Model):
     """
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2018 Dunbar Security Solutions, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+"""
+Provides helpers for Lab modules that analyze lists of values.
+
+=========================  ==========================================
+Class                      Description
+=========================  ==========================================
+:class:`~MemoCache`        Remembers the results for recent values.
+=========================  ==========================================
+
+=========================  ==========================================
+Function                   Description
+=========================  ==========================================
+:func:`~analyze_many`      Analyzes each distinct value in a list.
+=========================  ==========================================
+
+"""
+
+# standard library
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import threading
+
+_MISSING = object()
+
+
+def _is_hashable(value):
+    """
+    Takes a value and returns a Boolean indicating whether it can be
+    used as a dictionary key.
+    """
+    try:
+        hash(value)
+        return True
+    except TypeError:
+        return False
+
+
+class MemoCache(object):
+    """Remembers the results of an analysis for recent values.
+
+    Parameters
+    ----------
+    maxsize : int
+        The number of values to remember. When the cache is full, the
+        least recently used value is forgotten.
+
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._results)
+
+    def get(self, value, default=None):
+        """Get the result for a value.
+
+        Parameters
+        ----------
+        value : str
+            The analyzed value.
+
+        default : any
+            The result to return if the value isn't cached.
+
+        Returns
+        -------
+        any
+            The cached result, or the default.
+
+        """
+        with self._lock:
+            result = self._results.get(value, _MISSING)
+            if result is _MISSING:
+                return default
+            self._results.move_to_end(value)
+            return result
+
+    def set(self, value, result):
+        """Remember the result for a value.
+
+        Parameters
+        ----------
+        value : str
+            The analyzed value.
+
+        result : any
+            The result of the analysis.
+
+        Returns
+        -------
+        None
+
+        """
+        with self._lock:
+            self._results[value] = result
+            self._results.move_to_end(value)
+            if len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+
+    def clear(self):
+        """Forget all results.
+
+        Returns
+        -------
+        None
+
+        """
+        with self._lock:
+            self._results.clear()
+
+
+def analyze_many(func, values, cache=None, processes=None, chunksize=100):
+    """Analyze each distinct value in a list.
+
+    Parameters
+    ----------
+    func : callable
+        A function that takes a single value. To be used with more than
+        one process, it must be defined at the top level of a module.
+
+    values : list
+        The values to analyze. Values that aren't hashable (e.g., lists)
+        are analyzed each time they appear, and aren't cached.
+
+    cache : |MemoCache| or |None|
+        A cache of results for values that have already been analyzed.
+        New results are added to it.
+
+    processes : int or |None|
+        If greater than 1, the number of processes used to analyze the
+        values. Values are only sent to other processes if there are
+        more than `chunksize` of them to analyze.
+
+    chunksize : int
+        The number of values sent to another process at a time.
+
+    Returns
+    -------
+    list
+        The result for each value, in the same order.
+
+    """
+    hashable = [_is_hashable(value) for value in values]
+    results = {}
+    pending = []
+
+    for value, is_hashable in zip(values, hashable):
+        if is_hashable and value not in results:
+            result = _MISSING if cache is None else cache.get(value, _MISSING)
+            if result is _MISSING:
+                pending.append(value)
+            results[value] = result
+
+    if processes and processes > 1 and len(pending) > chunksize:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            computed = list(executor.map(func, pending, chunksize=chunksize))
+    else:
+        computed = [func(value) for value in pending]
+
+    for value, result in zip(pending, computed):
+        results[value] = result
+        if cache is not None:
+            cache.set(value, result)
+
+    return [results[value] if is_hashable else func(value)
+            for value, is_hashable in zip(values, hashable)]
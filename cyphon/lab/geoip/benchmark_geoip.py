@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2018 Dunbar Security Solutions, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+"""
+Benchmarks looking up IP addresses in the GeoLite2 city database.
+
+Compares opening the database for each lookup, as get_lng_lat used to,
+with a shared memory-mapped Reader, with and without the lookup cache.
+Requires the GeoLite2 city database at `GEOIP['GEOIP_PATH']`.
+
+Run with::
+
+    python manage.py test lab.geoip -p "benchmark_*.py"
+
+"""
+
+# standard library
+import logging
+import os.path
+import random
+from unittest import TestCase, skipIf
+
+# third party
+from geoip2.database import Reader
+from geoip2.errors import AddressNotFoundError
+
+# local
+from lab.geoip import geoip
+from utils.performance.benchmark import get_rate, report
+
+NOT_INSTALLED = not os.path.isfile(geoip.get_city_db_path())
+
+
+def _get_addresses(num, distinct):
+    """
+    Returns a list of public IPv4 addresses with the given number of
+    distinct values.
+    """
+    rand = random.Random(0)
+    pool = ['%s.%s.%s.%s' % (rand.randint(1, 9), rand.randint(0, 255),
+                             rand.randint(0, 255), rand.randint(1, 254))
+            for _ in range(distinct)]
+    return [pool[rand.randrange(distinct)] for _ in range(num)]
+
+
+@skipIf(NOT_INSTALLED, 'GeoLite2 database is not installed')
+class GeoIPBenchmark(TestCase):
+    """
+    Looks up 1M addresses drawn from 10,000 distinct values.
+    """
+
+    LOOKUPS = 1000000
+    DISTINCT = 10000
+    SAMPLE = 1000
+
+    def setUp(self):
+        geoip.clear_cache()
+        logging.disable(logging.WARNING)
+
+    def tearDown(self):
+        geoip.clear_cache()
+        logging.disable(logging.NOTSET)
+
+    def test_lookups_per_second(self):
+        """
+        Reports lookups/sec for each approach.
+        """
+        addresses = _get_addresses(self.LOOKUPS, self.DISTINCT)
+        city_db_path = geoip.get_city_db_path()
+
+        def open_per_lookup(ip_address):
+            """Opens the database for each lookup."""
+            db_reader = Reader(city_db_path)
+            try:
+                result = db_reader.city(ip_address)
+                return (result.location.longitude, result.location.latitude)
+            except AddressNotFoundError:
+                return None
+            finally:
+                db_reader.close()
+
+        def shared_reader(ip_address):
+            """Looks up each address with the shared Reader."""
+            try:
+                result = geoip.get_reader().city(ip_address)
+                return (result.location.longitude, result.location.latitude)
+            except AddressNotFoundError:
+                return None
+
+        for ip_address in addresses[:10]:
+            self.assertEqual(geoip.get_lng_lat(ip_address),
+                             open_per_lookup(ip_address))
+
+        results = [
+            ('open per lookup',
+             get_rate(open_per_lookup, addresses[:self.SAMPLE], repeat=1)),
+            ('shared reader',
+             get_rate(shared_reader, addresses[:self.LOOKUPS // 10],
+                      repeat=1)),
+            ('shared reader + cache',
+             get_rate(geoip.get_lng_lat, addresses, repeat=1)),
+            ('get_lng_lats',
+             get_rate(geoip.get_lng_lats, [addresses], repeat=1)
+             * self.LOOKUPS),
+        ]
+        report('GeoIP', results, unit='lookups/sec')
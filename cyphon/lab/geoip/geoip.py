@@ -15,13 +15,26 @@
 # You should have received a copy of the GNU General Public License
 # along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
 """
+Looks up the location of IP addresses in the GeoLite2 city database.
+
+The database is opened the first time it is needed and shared by all
+lookups in the process. The file is memory-mapped, so its pages are
+shared with other processes using the same database. Every
+`GEOIP['RELOAD_CHECK_INTERVAL']` seconds, the file is checked for
+changes, and the database is reopened if it has been replaced.
+
+The coordinates of the last `GEOIP['CACHE_SIZE']` addresses looked up
+are cached, since the same addresses tend to appear in many documents.
 
 """
 
 # standard library
+from functools import lru_cache
 import ipaddress
 import logging
 import os
+import threading
+import time
 
 # third party
 from django.conf import settings
@@ -30,8 +43,20 @@ from geoip2.errors import AddressNotFoundError
 
 _GEOIP_SETTINGS = settings.GEOIP
 
+_CACHE_SIZE = _GEOIP_SETTINGS.get('CACHE_SIZE', 10000)
+
+_RELOAD_CHECK_INTERVAL = _GEOIP_SETTINGS.get('RELOAD_CHECK_INTERVAL', 60)
+
 _LOGGER = logging.getLogger(__name__)
 
+_LOCK = threading.Lock()
+
+_STATE = {
+    'reader': None,
+    'file_id': None,
+    'last_check': 0,
+}
+
 
 def get_city_db_path():
     """
@@ -41,6 +66,95 @@ def get_city_db_path():
                         _GEOIP_SETTINGS['CITY_DB'])
 
 
+def _get_file_id(path):
+    """
+    Takes the path to a file and returns a tuple that changes when
+    the file is modified or replaced.
+    """
+    stat = os.stat(path)
+    return (stat.st_ino, stat.st_size, stat.st_mtime)
+
+
+def _open_reader():
+    """
+    Opens the GeoLite2 city database, clears the lookup cache, and
+    returns the new Reader.
+    """
+    city_db_path = get_city_db_path()
+    file_id = _get_file_id(city_db_path)
+
+    # the default mode memory-maps the file
+    reader = Reader(city_db_path)
+
+    # the old Reader isn't closed, since other threads may still be
+    # using it; its memory map is released once they're done with it
+    _STATE['reader'] = reader
+    _STATE['file_id'] = file_id
+    _STATE['last_check'] = time.time()
+    _lookup.cache_clear()
+
+    _LOGGER.info('Opened GeoLite2 database %s', city_db_path)
+
+    return reader
+
+
+def _is_current(now):
+    """
+    Takes the current time and returns a Boolean indicating whether
+    the open database can still be used.
+    """
+    if now - _STATE['last_check'] < _RELOAD_CHECK_INTERVAL:
+        return True
+
+    _STATE['last_check'] = now
+
+    try:
+        return _get_file_id(get_city_db_path()) == _STATE['file_id']
+    except OSError:
+        # keep using the open database while the file is being replaced
+        return True
+
+
+def get_reader():
+    """Get the shared Reader for the GeoLite2 city database.
+
+    Opens the database if it isn't open yet, or if the file has changed
+    since it was opened.
+
+    Returns
+    -------
+    |Reader|
+
+    """
+    reader = _STATE['reader']
+
+    if reader is not None and _is_current(time.time()):
+        return reader
+
+    with _LOCK:
+        if _STATE['reader'] is not reader:
+            return _STATE['reader']
+        return _open_reader()
+
+
+def clear_cache():
+    """Close the shared Reader and clear the lookup cache.
+
+    Returns
+    -------
+    None
+
+    """
+    with _LOCK:
+        reader = _STATE['reader']
+        _STATE['reader'] = None
+        _STATE['file_id'] = None
+        _lookup.cache_clear()
+
+    if reader is not None:
+        reader.close()
+
+
 def is_public_ip_addr(ip_address):
     """
     Takes an IPv4 or IPv6 address and returns a Boolean indicating
@@ -54,6 +168,21 @@ def is_public_ip_addr(ip_address):
                         ip_address)
 
 
+@lru_cache(maxsize=_CACHE_SIZE)
+def _lookup(ip_address):
+    """
+    Takes a public IPv4 or IPv6 address and returns a 2-tuple of
+    (longitude, latitude), or None if the address isn't in the database.
+    """
+    try:
+        result = get_reader().city(ip_address)
+        return (result.location.longitude, result.location.latitude)
+
+    except AddressNotFoundError:
+        _LOGGER.warning('The address %s is not in the GeoLite2 database.',
+                        ip_address)
+
+
 def get_lng_lat(ip_address):
     """
     Takes an IPv4 or IPv6 address and returns a 2-tuple of (longitude, latitude).
@@ -61,19 +190,44 @@ def get_lng_lat(ip_address):
     coord = None
 
     if ip_address and is_public_ip_addr(ip_address):
+        coord = _lookup(ip_address)
 
-        city_db_path = get_city_db_path()
-        db_reader = Reader(city_db_path)
+    return coord
 
-        try:
-            result = db_reader.city(ip_address)
-            coord = (result.location.longitude, result.location.latitude)
 
-        except AddressNotFoundError:
-            _LOGGER.warning('The address %s is not in the GeoLite2 database.',
-                            ip_address)
+def get_lng_lats(ip_addresses):
+    """Get the coordinates of several IP addresses.
 
-        finally:
-            db_reader.close()
+    Parameters
+    ----------
+    ip_addresses : |list| of |str|
+        IPv4 or IPv6 addresses.
 
-    return coord
+    Returns
+    -------
+    |list| of |tuple| or |None|
+        A 2-tuple of (longitude, latitude) for each address, in the
+        same order, or |None| for addresses without a location.
+
+    """
+    coords = {}
+    results = []
+
+    for ip_address in ip_addresses:
+        # values that aren't strings may not be hashable (e.g., lists)
+        if not isinstance(ip_address, str):
+            results.append(get_lng_lat(ip_address))
+            continue
+
+        if ip_address not in coords:
+            coords[ip_address] = get_lng_lat(ip_address)
+
+        results.append(coords[ip_address])
+
+    return results
+
+
+#: Versions of this module's functions that take a list of values.
+BATCH_FUNCTIONS = {
+    'get_lng_lat': get_lng_lats,
+}
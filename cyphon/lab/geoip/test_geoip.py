@@ -23,9 +23,9 @@ import logging
 import os.path
 from unittest import TestCase, skipIf
 try:
-    from unittest.mock import patch
+    from unittest.mock import Mock, patch
 except ImportError:
-    from mock import patch
+    from mock import Mock, patch
 
 # third party
 from geoip2.errors import AddressNotFoundError
@@ -52,6 +52,12 @@ class GeoIPTestCase(TestCase):
     Tests the get_lng_lat function.
     """
 
+    def setUp(self):
+        geoip.clear_cache()
+
+    def tearDown(self):
+        geoip.clear_cache()
+
     def test_known_ip(self):
         """
         Test case for a known IP address.
@@ -94,3 +100,94 @@ class GeoIPTestCase(TestCase):
                 ('lab.geoip.geoip', 'WARNING',
                  'The address 99.99.99.99 is not in the GeoLite2 database.')
             )
+
+
+@patch('lab.geoip.geoip._get_file_id', return_value=(1, 1, 1))
+@patch('lab.geoip.geoip.Reader')
+class SharedReaderTestCase(TestCase):
+    """
+    Tests that the GeoLite2 database is shared between lookups.
+    """
+
+    def setUp(self):
+        geoip.clear_cache()
+
+    def tearDown(self):
+        geoip.clear_cache()
+
+    @staticmethod
+    def _mock_city(ip_address):
+        """
+        Returns a mock result with a location based on an IP address.
+        """
+        octet = int(ip_address.split('.')[0])
+        return Mock(location=Mock(longitude=float(octet), latitude=0.0))
+
+    def test_shared_reader(self, mock_reader, mock_file_id):
+        """
+        Tests that the database is only opened once.
+        """
+        mock_reader.return_value.city.side_effect = self._mock_city
+        self.assertEqual(geoip.get_lng_lat('8.8.8.8'), (8.0, 0.0))
+        self.assertEqual(geoip.get_lng_lat('9.9.9.9'), (9.0, 0.0))
+        self.assertEqual(mock_reader.call_count, 1)
+
+    def test_cached_lookup(self, mock_reader, mock_file_id):
+        """
+        Tests that repeated addresses are looked up once.
+        """
+        mock_city = mock_reader.return_value.city
+        mock_city.side_effect = self._mock_city
+        geoip.get_lng_lat('8.8.8.8')
+        geoip.get_lng_lat('8.8.8.8')
+        self.assertEqual(mock_city.call_count, 1)
+
+    def test_reopen_changed_file(self, mock_reader, mock_file_id):
+        """
+        Tests that the database is reopened when the file changes.
+        """
+        mock_city = mock_reader.return_value.city
+        mock_city.side_effect = self._mock_city
+        geoip.get_lng_lat('8.8.8.8')
+
+        mock_file_id.return_value = (2, 1, 1)
+        geoip._STATE['last_check'] = 0
+        geoip.get_lng_lat('8.8.8.8')
+
+        self.assertEqual(mock_reader.call_count, 2)
+        self.assertEqual(mock_city.call_count, 2)
+
+    def test_unchanged_file(self, mock_reader, mock_file_id):
+        """
+        Tests that the database isn't reopened if the file hasn't
+        changed.
+        """
+        mock_reader.return_value.city.side_effect = self._mock_city
+        geoip.get_lng_lat('8.8.8.8')
+        geoip._STATE['last_check'] = 0
+        geoip.get_lng_lat('9.9.9.9')
+        self.assertEqual(mock_reader.call_count, 1)
+
+    def test_get_lng_lats(self, mock_reader, mock_file_id):
+        """
+        Tests the get_lng_lats function.
+        """
+        mock_city = mock_reader.return_value.city
+        mock_city.side_effect = self._mock_city
+        actual = geoip.get_lng_lats(['8.8.8.8', None, '10.0.0.1',
+                                     '9.9.9.9', '8.8.8.8'])
+        expected = [(8.0, 0.0), None, None, (9.0, 0.0), (8.0, 0.0)]
+        self.assertEqual(actual, expected)
+        self.assertEqual(mock_city.call_count, 2)
+
+    def test_get_lng_lats_unhashable(self, mock_reader, mock_file_id):
+        """
+        Tests that the get_lng_lats function handles values that can't
+        be hashed.
+        """
+        mock_city = mock_reader.return_value.city
+        mock_city.side_effect = self._mock_city
+        with patch('lab.geoip.geoip._LOGGER'):
+            actual = geoip.get_lng_lats([['8.8.8.8'], '8.8.8.8', {}])
+        self.assertEqual(actual, [None, (8.0, 0.0), None])
+        self.assertEqual(mock_city.call_count, 1)
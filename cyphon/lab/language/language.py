@@ -22,19 +22,28 @@ Constant                Description
 ======================  ================================================
 :const:`~PROBABILTY`    Level of certainty needed to assign a language.
 :const:`~LANGUAGES`     A list of supported languages.
+:const:`~CACHE_SIZE`    The number of texts whose language is cached.
 ======================  ================================================
 
 ======================  ================================================
 Function                Description
 ======================  ================================================
 :func:`~get_language`   Classifies the language of text.
+:func:`~get_languages`  Classifies the language of several texts.
+:func:`~clear_cache`    Forgets the results for cached texts.
 ======================  ================================================
 
+Results are cached for the last :const:`~CACHE_SIZE` texts, since the
+same text often appears many times (e.g., templated emails).
+
 """
 
 # third party
 from langdetect import detect_langs
 
+# local
+from lab.batch import MemoCache, analyze_many
+
 
 PROBABILTY = 0.95
 """|float|
@@ -50,6 +59,26 @@ ISO 639-1 codes for supported languages. These are languages supported
 by MongoDB's text index.
 """
 
+CACHE_SIZE = 10000
+"""|int|
+
+The number of texts whose language is remembered.
+"""
+
+_CACHE = MemoCache(CACHE_SIZE)
+
+
+def _detect(text):
+    """
+    Takes text and returns its most likely supported language, or
+    'none'.
+    """
+    results = detect_langs(text)
+    for result in results:
+        if result.lang in LANGUAGES and result.prob >= PROBABILTY:
+            return result.lang
+    return 'none'
+
 
 def get_language(text):
     """Classify the language of text.
@@ -78,8 +107,53 @@ def get_language(text):
     for more info.
 
     """
-    results = detect_langs(text)
-    for result in results:
-        if result.lang in LANGUAGES and result.prob >= PROBABILTY:
-            return result.lang
-    return 'none'
+    # values that aren't strings may not be hashable (e.g., lists)
+    if not isinstance(text, str):
+        return _detect(text)
+
+    language = _CACHE.get(text)
+    if language is None:
+        language = _detect(text)
+        _CACHE.set(text, language)
+    return language
+
+
+def get_languages(texts, processes=None):
+    """Classify the language of several texts.
+
+    Each distinct text is only classified once.
+
+    Parameters
+    ----------
+    texts : |list| of |str|
+        The texts to classify.
+
+    processes : int or |None|
+        If greater than 1, the number of processes used to classify
+        the texts.
+
+    Returns
+    -------
+    |list| of |str|
+        The language of each text, in the same order, as returned by
+        :func:`~get_language`.
+
+    """
+    return analyze_many(_detect, texts, cache=_CACHE, processes=processes)
+
+
+def clear_cache():
+    """Forget the language of all cached texts.
+
+    Returns
+    -------
+    None
+
+    """
+    _CACHE.clear()
+
+
+#: Versions of this module's functions that take a list of values.
+BATCH_FUNCTIONS = {
+    'get_language': get_languages,
+}
@@ -26,7 +26,7 @@ except ImportError:
     from mock import Mock, patch
 
 # local
-from .language import get_language, PROBABILTY
+from .language import clear_cache, get_language, get_languages, PROBABILTY
 
 
 class LanguageTestCase(TestCase):
@@ -35,8 +35,12 @@ class LanguageTestCase(TestCase):
     """
 
     def setUp(self):
+        clear_cache()
         self.mock_lang = Mock()
 
+    def tearDown(self):
+        clear_cache()
+
     def test_unsupported(self):
         """
         Tests the get_language() function for an unsupported language.
@@ -85,3 +89,41 @@ class LanguageTestCase(TestCase):
         Tests the get_language() function for English text.
         """
         self.assertEqual(get_language('this is english'), 'en')
+
+    def test_cached_language(self):
+        """
+        Tests that the get_language() function only classifies text once.
+        """
+        self.mock_lang.prob = 1.0
+        self.mock_lang.lang = 'en'
+        with patch('lab.language.language.detect_langs',
+                   return_value=[self.mock_lang]) as mock_detect:
+            get_language('this is english')
+            self.assertEqual(get_language('this is english'), 'en')
+            self.assertEqual(mock_detect.call_count, 1)
+
+    def test_get_languages(self):
+        """
+        Tests the get_languages() function.
+        """
+        self.mock_lang.prob = 1.0
+        self.mock_lang.lang = 'en'
+        with patch('lab.language.language.detect_langs',
+                   return_value=[self.mock_lang]) as mock_detect:
+            actual = get_languages(['hello', 'hi', 'hello'])
+            self.assertEqual(actual, ['en', 'en', 'en'])
+            self.assertEqual(mock_detect.call_count, 2)
+
+    def test_unhashable_text(self):
+        """
+        Tests that values that can't be hashed are classified without
+        being cached.
+        """
+        self.mock_lang.prob = 1.0
+        self.mock_lang.lang = 'en'
+        with patch('lab.language.language.detect_langs',
+                   return_value=[self.mock_lang]) as mock_detect:
+            self.assertEqual(get_language(['hello']), 'en')
+            actual = get_languages([['hello'], 'hello', ['hello']])
+            self.assertEqual(actual, ['en', 'en', 'en'])
+            self.assertEqual(mock_detect.call_count, 4)
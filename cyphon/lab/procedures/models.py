@@ -27,6 +27,7 @@ Class                Description
 """
 
 # standard library
+from functools import lru_cache
 import importlib
 
 # third party
@@ -38,6 +39,32 @@ from lab.registry import LAB_CHOICES
 from utils.parserutils import parserutils
 from utils.validators.validators import IDENTIFIER_VALIDATOR
 
+#: The name of an optional dictionary in a Lab module that maps the
+#: names of its functions to versions that analyze a list of values.
+BATCH_FUNCTIONS = 'BATCH_FUNCTIONS'
+
+
+@lru_cache(maxsize=None)
+def _load_functions(package, module, function):
+    """
+    Takes the names of a Lab subpackage, a module within it, and a
+    function within the module. Returns a tuple of the function and its
+    batch version, if the module defines one. Since the results are
+    cached by name, each function is only imported once per process,
+    and edits to a Protocol take effect right away.
+    """
+    module_full_name = 'lab.%s.%s' % (package, module)
+
+    # load the module (will raise ImportError if module cannot be loaded)
+    lab_module = importlib.import_module(module_full_name)
+
+    # get the classifier function (will raise AttributeError if function cannot be found)
+    func = getattr(lab_module, function)
+
+    batch_funcs = getattr(lab_module, BATCH_FUNCTIONS, {})
+
+    return (func, batch_funcs.get(function))
+
 
 class Protocol(models.Model):
     """Analyzes data using a function in a Lab subpackage.
@@ -85,14 +112,12 @@ class Protocol(models.Model):
         """Represent a Protocol as a string."""
         return self.name
 
-    def _get_module(self):
-        """Return the module for analyzing the data."""
-        module_full_name = 'lab.%s.%s' % (self.package, self.module)
-
-        # load the module (will raise ImportError if module cannot be loaded)
-        module = importlib.import_module(module_full_name)
-
-        return module
+    def _get_functions(self):
+        """
+        Return a tuple of the function for analyzing the data and its
+        batch version (or None).
+        """
+        return _load_functions(self.package, self.module, self.function)
 
     def process(self, data):
         """Analyze a dictionary of data.
@@ -111,12 +136,34 @@ class Protocol(models.Model):
             The result of the analysis.
 
         """
-        module = self._get_module()
+        (func, _) = self._get_functions()
+        return func(data)
 
-        # get the classifier function (will raise AttributeError if function cannot be found)
-        func = getattr(module, self.function)
+    def process_many(self, data_list):
+        """Analyze a list of data.
 
-        return func(data)
+        If the Protocol's module lists a batch version of the Protocol's
+        :attr:`~Protocol.function` in its `BATCH_FUNCTIONS` dictionary,
+        passes the whole list to it. Otherwise, passes each item to the
+        :attr:`~Protocol.function` in turn.
+
+        Parameters
+        ----------
+        data_list : list
+            The data to analyze.
+
+        Returns
+        -------
+        list
+            The result of the analysis for each item, in the same order.
+
+        """
+        (func, batch_func) = self._get_functions()
+
+        if batch_func is not None:
+            return list(batch_func(data_list))
+
+        return [func(data) for data in data_list]
 
 
 class Procedure(models.Model):
@@ -149,6 +196,9 @@ class Procedure(models.Model):
     def _analyze(self, data):
         return self.protocol.process(data)
 
+    def _analyze_many(self, data_list):
+        return self.protocol.process_many(data_list)
+
     def get_result(self, data):
         """Analayze data according to a Protocol.
 
@@ -179,3 +229,34 @@ class Procedure(models.Model):
             return self._analyze(value)
         else:
             return self._analyze(data)
+
+    def get_results(self, data_list):
+        """Analyze a list of data according to a Protocol.
+
+        Like :meth:`~Procedure.get_result`, but analyzes a list of data
+        dictionaries with a single call to the Procedure's
+        :attr:`~Procedure.protocol`.
+
+        Parameters
+        ----------
+        data_list : |list| of |dict|
+            The data to analyze.
+
+        Returns
+        -------
+        list
+            The results of the analysis for each data dictionary, in the
+            same order.
+
+        Notes
+        -----
+        This method should have the same name as the corresponding
+        method in an Inspection.
+
+        """
+        if self.field_name:
+            values = [parserutils.get_dict_value(self.field_name, data)
+                      for data in data_list]
+            return self._analyze_many(values)
+        else:
+            return self._analyze_many(data_list)
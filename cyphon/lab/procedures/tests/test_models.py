@@ -25,6 +25,7 @@ except ImportError:
 from django.test import TestCase
 
 # local
+from lab.procedures import models as procedures
 from lab.procedures.models import Procedure, Protocol
 from tests.fixture_manager import get_fixtures
 
@@ -44,6 +45,57 @@ class ProtocolTestCase(TestCase):
         """
         self.assertEqual(str(self.protocol), 'geoip')
 
+    def test_process(self):
+        """
+        Tests the process method for a Protocol.
+        """
+        mock_func = Mock(return_value='foo')
+        with patch('lab.procedures.models._load_functions',
+                   return_value=(mock_func, None)):
+            self.assertEqual(self.protocol.process('bar'), 'foo')
+            mock_func.assert_called_once_with('bar')
+
+    def test_process_many_w_batch(self):
+        """
+        Tests the process_many method for a Protocol whose function has
+        a batch version.
+        """
+        mock_func = Mock()
+        mock_batch = Mock(return_value=['foo', 'bar'])
+        with patch('lab.procedures.models._load_functions',
+                   return_value=(mock_func, mock_batch)):
+            actual = self.protocol.process_many(['a', 'b'])
+            self.assertEqual(actual, ['foo', 'bar'])
+            mock_batch.assert_called_once_with(['a', 'b'])
+            self.assertFalse(mock_func.called)
+
+    def test_process_many_wo_batch(self):
+        """
+        Tests the process_many method for a Protocol whose function has
+        no batch version.
+        """
+        mock_func = Mock(side_effect=lambda data: data.upper())
+        with patch('lab.procedures.models._load_functions',
+                   return_value=(mock_func, None)):
+            actual = self.protocol.process_many(['a', 'b'])
+            self.assertEqual(actual, ['A', 'B'])
+
+    def test_load_functions(self):
+        """
+        Tests that a Protocol's function is only imported once.
+        """
+        procedures._load_functions.cache_clear()
+        mock_module = Mock()
+        mock_module.BATCH_FUNCTIONS = {'get_lng_lat': mock_module.get_lng_lats}
+        with patch('lab.procedures.models.importlib.import_module',
+                   return_value=mock_module) as mock_import:
+            for _ in range(2):
+                actual = self.protocol._get_functions()
+            mock_import.assert_called_once_with('lab.geoip.geoip')
+            self.assertEqual(actual, (mock_module.get_lng_lat,
+                                      mock_module.get_lng_lats))
+        procedures._load_functions.cache_clear()
+
 
 class ProcedureTestCase(TestCase):
     """
@@ -84,3 +136,14 @@ class ProcedureTestCase(TestCase):
             value = self.data[self.procedure.field_name]
             mock_process.assert_called_once_with(value)
             self.assertEqual(actual, self.mock_result)
+
+    def test_get_results(self):
+        """
+        Tests the get_results method for a Procedure with a field_name.
+        """
+        data_list = [self.data, {'source_ip': 'baz'}]
+        with patch('lab.procedures.models.Protocol.process_many',
+                   return_value=[1, 2]) as mock_process_many:
+            actual = self.procedure.get_results(data_list)
+            mock_process_many.assert_called_once_with(['foobar', 'baz'])
+            self.assertEqual(actual, [1, 2])
@@ -17,13 +17,19 @@
 """
 Provides functions for analyzing the sentiment of text.
 
-======================  ================================================
-Function                Description
-======================  ================================================
-:func:`~clean_text`     Removes links and special characters from text.
-:func:`~get_polarity`   Gets the degree of polarity of text.
-:func:`~get_sentiment`  Classifies the sentiment of text.
-======================  ================================================
+Results are cached for the last :const:`~CACHE_SIZE` cleaned texts,
+since the same text often appears many times (e.g., retweets).
+
+=========================  ================================================
+Function                   Description
+=========================  ================================================
+:func:`~clean_text`        Removes links and special characters from text.
+:func:`~get_polarity`      Gets the degree of polarity of text.
+:func:`~get_polarities`    Gets the degree of polarity of several texts.
+:func:`~get_sentiment`     Classifies the sentiment of text.
+:func:`~get_sentiments`    Classifies the sentiment of several texts.
+:func:`~clear_cache`       Forgets the results for cached texts.
+=========================  ================================================
 
 """
 
@@ -32,6 +38,22 @@ import re
 
 # third party
 from textblob import TextBlob
+from textblob.sentiments import PatternAnalyzer
+
+# local
+from lab.batch import MemoCache, analyze_many
+
+CACHE_SIZE = 10000
+"""|int|
+
+The number of cleaned texts whose polarity is remembered.
+"""
+
+_CLEAN_REGEX = re.compile(r'(@[A-Za-z0-9]+)|([^0-9A-Za-z \t])|(\w+:\/\/\S+)')
+
+_ANALYZER = PatternAnalyzer()
+
+_CACHE = MemoCache(CACHE_SIZE)
 
 
 def clean_text(text):
@@ -48,11 +70,30 @@ def clean_text(text):
         The cleaned text.
 
     """
-    regex = r'(@[A-Za-z0-9]+)|([^0-9A-Za-z \t])|(\w+:\/\/\S+)'
-    cleaned_text = re.sub(regex, ' ', text)
+    cleaned_text = _CLEAN_REGEX.sub(' ', text)
     return ' '.join(cleaned_text.split())
 
 
+def _analyze(cleaned_text):
+    """
+    Takes cleaned text and returns its polarity.
+    """
+    analysis = TextBlob(cleaned_text, analyzer=_ANALYZER)
+    return analysis.sentiment.polarity
+
+
+def _classify(polarity):
+    """
+    Takes a polarity and returns the corresponding sentiment.
+    """
+    if polarity > 0:
+        return 'positive'
+    elif polarity == 0:
+        return 'neutral'
+    else:
+        return 'negative'
+
+
 def get_polarity(text):
     """Get the degree of polarity of text.
 
@@ -68,8 +109,36 @@ def get_polarity(text):
 
     """
     cleaned_text = clean_text(text)
-    analysis = TextBlob(cleaned_text)
-    return analysis.sentiment.polarity
+    polarity = _CACHE.get(cleaned_text)
+    if polarity is None:
+        polarity = _analyze(cleaned_text)
+        _CACHE.set(cleaned_text, polarity)
+    return polarity
+
+
+def get_polarities(texts, processes=None):
+    """Get the degree of polarity of several texts.
+
+    Each distinct text is only analyzed once.
+
+    Parameters
+    ----------
+    texts : |list| of |str|
+        The texts to analyze.
+
+    processes : int or |None|
+        If greater than 1, the number of processes used to analyze
+        the texts.
+
+    Returns
+    -------
+    |list| of |float|
+        The polarity of each text, in the same order.
+
+    """
+    cleaned_texts = [clean_text(text) for text in texts]
+    return analyze_many(_analyze, cleaned_texts, cache=_CACHE,
+                        processes=processes)
 
 
 def get_sentiment(text):
@@ -88,9 +157,44 @@ def get_sentiment(text):
 
     """
     polarity = get_polarity(text)
-    if polarity > 0:
-        return 'positive'
-    elif polarity == 0:
-        return 'neutral'
-    else:
-        return 'negative'
+    return _classify(polarity)
+
+
+def get_sentiments(texts, processes=None):
+    """Classify the sentiment of several texts.
+
+    Parameters
+    ----------
+    texts : |list| of |str|
+        The texts to analyze.
+
+    processes : int or |None|
+        If greater than 1, the number of processes used to analyze
+        the texts.
+
+    Returns
+    -------
+    |list| of |str|
+        The sentiment of each text, in the same order.
+
+    """
+    polarities = get_polarities(texts, processes=processes)
+    return [_classify(polarity) for polarity in polarities]
+
+
+def clear_cache():
+    """Forget the polarity of all cached texts.
+
+    Returns
+    -------
+    None
+
+    """
+    _CACHE.clear()
+
+
+#: Versions of this module's functions that take a list of values.
+BATCH_FUNCTIONS = {
+    'get_polarity': get_polarities,
+    'get_sentiment': get_sentiments,
+}
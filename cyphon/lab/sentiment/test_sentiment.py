@@ -26,7 +26,14 @@ except ImportError:
     from mock import Mock, patch
 
 # local
-from .sentiment import clean_text, get_polarity, get_sentiment
+from .sentiment import (
+    clean_text,
+    clear_cache,
+    get_polarities,
+    get_polarity,
+    get_sentiment,
+    get_sentiments,
+)
 
 
 class CleanTextTestCase(TestCase):
@@ -65,9 +72,13 @@ class GetPolarityTestCase(TestCase):
     """
 
     def setUp(self):
+        clear_cache()
         self.mock_analysis = Mock()
         self.mock_analysis.sentiment = Mock()
 
+    def tearDown(self):
+        clear_cache()
+
     def test_positive_polarity(self):
         """
         Tests the get_polarity() function for a postive sentiment.
@@ -101,12 +112,44 @@ class GetPolarityTestCase(TestCase):
                    return_value=self.mock_analysis):
             self.assertEqual(get_polarity('foobar'), polarity)
 
+    def test_cached_polarity(self):
+        """
+        Tests that the get_polarity() function only analyzes text once.
+        """
+        self.mock_analysis.sentiment.polarity = 0.1
+
+        with patch('lab.sentiment.sentiment.TextBlob',
+                   return_value=self.mock_analysis) as mock_textblob:
+            get_polarity('@foo hey there')
+            self.assertEqual(get_polarity('@bar hey there'), 0.1)
+            self.assertEqual(mock_textblob.call_count, 1)
+
+    def test_get_polarities(self):
+        """
+        Tests the get_polarities() function.
+        """
+        def analyze(text, analyzer):
+            """Returns a mock analysis based on the length of the text."""
+            return Mock(sentiment=Mock(polarity=len(text)))
+
+        with patch('lab.sentiment.sentiment.TextBlob',
+                   side_effect=analyze) as mock_textblob:
+            actual = get_polarities(['hey', '@foo hey', 'hi', 'hey'])
+            self.assertEqual(actual, [3, 3, 2, 3])
+            self.assertEqual(mock_textblob.call_count, 2)
+
 
 class GetSentimentTestCase(TestCase):
     """
     Tests the get_sentiment() function.
     """
 
+    def setUp(self):
+        clear_cache()
+
+    def tearDown(self):
+        clear_cache()
+
     def test_sentiment(self):
         """
         Tests the get_sentiment() function for various sentiments.
@@ -138,3 +181,12 @@ class GetSentimentTestCase(TestCase):
         """
         with patch('lab.sentiment.sentiment.get_polarity', return_value=-0.1):
             self.assertEqual(get_sentiment('foobar'), 'negative')
+
+    def test_get_sentiments(self):
+        """
+        Tests the get_sentiments() function.
+        """
+        with patch('lab.sentiment.sentiment.get_polarities',
+                   return_value=[0.1, 0, -0.1]):
+            actual = get_sentiments(['foo', 'bar', 'baz'])
+            self.assertEqual(actual, ['positive', 'neutral', 'negative'])
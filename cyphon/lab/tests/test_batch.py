@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2018 Dunbar Security Solutions, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+"""
+Tests the batch module.
+"""
+
+# standard library
+from unittest import TestCase
+try:
+    from unittest.mock import MagicMock, Mock, patch
+except ImportError:
+    from mock import MagicMock, Mock, patch
+
+# local
+from lab.batch import MemoCache, analyze_many
+
+
+class MemoCacheTestCase(TestCase):
+    """
+    Tests the MemoCache class.
+    """
+
+    def test_get(self):
+        """
+        Tests the get method.
+        """
+        cache = MemoCache(2)
+        cache.set('foo', 0)
+        self.assertEqual(cache.get('foo'), 0)
+        self.assertIsNone(cache.get('bar'))
+        self.assertEqual(cache.get('bar', 'baz'), 'baz')
+
+    def test_evict(self):
+        """
+        Tests that the least recently used value is forgotten when the
+        cache is full.
+        """
+        cache = MemoCache(2)
+        cache.set('foo', 1)
+        cache.set('bar', 2)
+        cache.get('foo')
+        cache.set('baz', 3)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get('foo'), 1)
+        self.assertIsNone(cache.get('bar'))
+        self.assertEqual(cache.get('baz'), 3)
+
+    def test_clear(self):
+        """
+        Tests the clear method.
+        """
+        cache = MemoCache(2)
+        cache.set('foo', 1)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+
+class AnalyzeManyTestCase(TestCase):
+    """
+    Tests the analyze_many function.
+    """
+
+    def test_distinct_values(self):
+        """
+        Tests that each distinct value is analyzed once.
+        """
+        mock_func = Mock(side_effect=len)
+        actual = analyze_many(mock_func, ['a', 'bb', 'a', 'ccc'])
+        self.assertEqual(actual, [1, 2, 1, 3])
+        self.assertEqual(mock_func.call_count, 3)
+
+    def test_cache(self):
+        """
+        Tests that cached values aren't analyzed again.
+        """
+        cache = MemoCache(10)
+        cache.set('a', 5)
+        mock_func = Mock(side_effect=len)
+        actual = analyze_many(mock_func, ['a', 'bb'], cache=cache)
+        self.assertEqual(actual, [5, 2])
+        mock_func.assert_called_once_with('bb')
+        self.assertEqual(cache.get('bb'), 2)
+
+    def test_unhashable_values(self):
+        """
+        Tests that values that can't be hashed are analyzed each time
+        and aren't cached.
+        """
+        cache = MemoCache(10)
+        mock_func = Mock(side_effect=len)
+        actual = analyze_many(mock_func, [['a'], 'bb', ['a'], 'bb'],
+                              cache=cache)
+        self.assertEqual(actual, [1, 2, 1, 2])
+        self.assertEqual(mock_func.call_count, 3)
+        self.assertEqual(len(cache), 1)
+
+    def test_processes(self):
+        """
+        Tests that values are analyzed in other processes when there
+        are enough of them.
+        """
+        values = [str(num) for num in range(5)]
+        mock_executor = MagicMock()
+        mock_executor.__enter__.return_value.map.return_value = range(5)
+
+        with patch('lab.batch.ProcessPoolExecutor',
+                   return_value=mock_executor) as mock_pool:
+            actual = analyze_many(int, values, processes=2, chunksize=2)
+            mock_pool.assert_called_once_with(max_workers=2)
+            self.assertEqual(actual, list(range(5)))
+
+    def test_few_values(self):
+        """
+        Tests that values are analyzed in this process when there
+        aren't enough to send elsewhere.
+        """
+        with patch('lab.batch.ProcessPoolExecutor') as mock_pool:
+            actual = analyze_many(int, ['1', '2'], processes=2, chunksize=2)
+            self.assertFalse(mock_pool.called)
+            self.assertEqual(actual, [1, 2])
@@ -28,3 +28,7 @@ class MonitorsConfig(AppConfig):
     """
     name = 'monitors'
     verbose_name = 'Monitors'
+
+    def ready(self):
+        """Perform initialization tasks."""
+        import monitors.signals
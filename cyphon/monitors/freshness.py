@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2018 Dunbar Security Solutions, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+"""
+Tracks when documents were last saved to each Distillery, so that
+|Monitors| can check their health without searching the Distilleries'
+|Collections|.
+
+Each process that saves documents keeps the date and id of the latest
+document it has seen for each Distillery. These are merged into a
+single entry in Django's cache when a Distillery is first seen, and
+at most every `MONITORS['TRACKER_FLUSH_INTERVAL']` seconds after that.
+
+Processes merge their activity into the entry without locking it, so
+one process's activity can be overwritten by another's, and the entry
+can be evicted from the cache. The tracker is therefore only trusted
+when it shows that a document was saved during a monitoring interval.
+If it doesn't, the Distillery must be searched instead, so an unhealthy
+Monitor is never reported on the tracker's word alone. Distilleries
+whose documents are saved by other means (e.g., Logstash) are never
+tracked.
+
+============================  ==========================================
+Constant                      Description
+============================  ==========================================
+:const:`~UNKNOWN`             No tracked activity can be relied on.
+============================  ==========================================
+
+============================  ==========================================
+Function                      Description
+============================  ==========================================
+:func:`~is_enabled`           Whether documents are being tracked.
+:func:`~record`               Record that a document was saved.
+:func:`~flush`                Merge tracked activity into the cache.
+:func:`~get_last_seen`        Get the latest tracked document.
+:func:`~reset`                Clear all tracked activity.
+============================  ==========================================
+
+"""
+
+# standard library
+import threading
+import time
+
+# third party
+from django.conf import settings
+from django.core.cache import cache
+
+_MONITOR_SETTINGS = getattr(settings, 'MONITORS', {})
+
+_FLUSH_INTERVAL = _MONITOR_SETTINGS.get('TRACKER_FLUSH_INTERVAL', 5)
+
+_TIMEOUT = _MONITOR_SETTINGS.get('TRACKER_TIMEOUT', 86400)
+
+_CACHE_KEY = 'monitors.freshness'
+
+#: Returned by :func:`~get_last_seen` when a Distillery must be searched.
+UNKNOWN = object()
+
+_LOCK = threading.Lock()
+
+_STATE = {
+    'last_seen': {},
+    'last_flush': 0,
+}
+
+
+def is_enabled():
+    """Whether saved documents are being tracked.
+
+    Returns
+    -------
+    bool
+
+    """
+    return _MONITOR_SETTINGS.get('TRACK_DOCUMENTS', False) \
+        and not settings.TEST
+
+
+def _merge(last_seen, distillery_id, date, doc_id):
+    """
+    Takes a dictionary of tracked activity, a Distillery id, and the
+    date and id of a document, and updates the dictionary if the
+    document is the latest one seen for the Distillery. Returns a
+    Boolean indicating whether the Distillery was already tracked.
+    """
+    current = last_seen.get(distillery_id)
+    if current is None or date > current[0]:
+        last_seen[distillery_id] = (date, doc_id)
+    return current is not None
+
+
+def record(distillery, doc_id, date):
+    """Record that a document was saved to a Distillery.
+
+    The activity is flushed to the cache if the Distillery hasn't been
+    seen before, or if the flush interval has passed.
+
+    Parameters
+    ----------
+    distillery : |Distillery|
+        The |Distillery| the document was saved to.
+
+    doc_id : str
+        The id of the saved document.
+
+    date : |datetime| or |None|
+        The date of the document, as returned by
+        :meth:`~distilleries.models.Distillery.get_date`. Documents
+        without a date are ignored.
+
+    Returns
+    -------
+    None
+
+    """
+    if date is None or not is_enabled():
+        return
+
+    with _LOCK:
+        tracked = _merge(_STATE['last_seen'], distillery.pk, date, doc_id)
+        due = time.time() - _STATE['last_flush'] >= _FLUSH_INTERVAL
+
+    if due or not tracked:
+        flush()
+
+
+def flush():
+    """Merge the activity tracked by this process into the cache.
+
+    Returns
+    -------
+    None
+
+    """
+    with _LOCK:
+        last_seen = dict(_STATE['last_seen'])
+        _STATE['last_flush'] = time.time()
+
+    if not last_seen:
+        return
+
+    # not atomic, so a concurrent flush from another process may be
+    # lost; get_last_seen only trusts activity that is present
+    shared = cache.get(_CACHE_KEY) or {}
+
+    for distillery_id, (date, doc_id) in last_seen.items():
+        _merge(shared, distillery_id, date, doc_id)
+
+    cache.set(_CACHE_KEY, shared, timeout=_TIMEOUT)
+
+
+def get_last_seen(distillery, since):
+    """Get the latest tracked document saved to a Distillery.
+
+    Parameters
+    ----------
+    distillery : |Distillery|
+        The |Distillery| to check.
+
+    since : |datetime|
+        The start of the period to check.
+
+    Returns
+    -------
+    |tuple|
+        The date and id of the latest tracked document, if its date is
+        later than `since`. Otherwise, :const:`~UNKNOWN`, in which case
+        the Distillery must be searched instead.
+
+    """
+    if not is_enabled() or distillery.is_shell:
+        return UNKNOWN
+
+    shared = cache.get(_CACHE_KEY) or {}
+    last_seen = {}
+
+    for source in (shared, _STATE['last_seen']):
+        activity = source.get(distillery.pk)
+        if activity is not None:
+            _merge(last_seen, distillery.pk, *activity)
+
+    activity = last_seen.get(distillery.pk)
+
+    if activity is not None and activity[0] > since:
+        return activity
+
+    return UNKNOWN
+
+
+def reset():
+    """Clear the activity tracked by this process and the cache.
+
+    Returns
+    -------
+    None
+
+    """
+    with _LOCK:
+        _STATE['last_seen'] = {}
+        _STATE['last_flush'] = 0
+
+    cache.delete(_CACHE_KEY)
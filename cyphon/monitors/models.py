@@ -21,11 +21,13 @@ at the expected rate.
 """
 
 # standard library
+from collections import OrderedDict
 from datetime import timedelta
 import json
 
 # third party
 from django.db import models
+from django.db.models import Case, Value, When
 from django.utils import timezone
 from django.utils.translation import ugettext_lazy as _
 
@@ -42,6 +44,8 @@ from distilleries.models import Distillery
 from engines.queries import EngineQuery
 from engines.sorter import SortParam, Sorter
 import utils.dateutils.dateutils as dt
+from warehouses.models import Collection
+from . import freshness
 
 
 class MonitorManager(AlarmManager):
@@ -49,6 +53,13 @@ class MonitorManager(AlarmManager):
 
     """
 
+    _STATUS_FIELDS = (
+        ('status', models.CharField()),
+        ('last_healthy', models.DateTimeField()),
+        ('last_active_distillery_id', models.IntegerField()),
+        ('last_saved_doc', models.CharField()),
+    )
+
     def find_relevant(self, distillery):
         """
 
@@ -56,6 +67,117 @@ class MonitorManager(AlarmManager):
         active_monitors = self.find_enabled()
         return active_monitors.filter(distilleries=distillery)
 
+    @staticmethod
+    def _find_latest_docs(monitors):
+        """
+        Takes a list of Monitors and returns a dictionary that maps the
+        pk of each of their untracked Distilleries to the most recent
+        document in the Distillery, or None if there isn't one.
+        Distilleries in the same Warehouse are searched together.
+        """
+        distilleries = OrderedDict()
+        start_times = {}
+
+        for monitor in monitors:
+            start_time = monitor._get_query_start_time()
+            for distillery in monitor.distilleries.all():
+                distilleries[distillery.pk] = distillery
+                if distillery.pk not in start_times or \
+                        start_time < start_times[distillery.pk]:
+                    start_times[distillery.pk] = start_time
+
+        latest_docs = {}
+        searches = OrderedDict()
+
+        for distillery in distilleries.values():
+            last_seen = freshness.get_last_seen(
+                distillery, start_times[distillery.pk])
+            if last_seen is not freshness.UNKNOWN:
+                continue
+            date_field = distillery.get_searchable_date_field()
+            if date_field:
+                collection = distillery.collection
+                query = Monitor._get_date_query(
+                    date_field, start_times[distillery.pk])
+                sorter = Monitor._get_sorter(date_field)
+                searches.setdefault(collection.warehouse_id, []).append(
+                    (distillery, (collection, query, sorter, 1, 1)))
+
+        for group in searches.values():
+            results = Collection.find_many(
+                [search for (dummy_distillery, search) in group])
+            for (distillery, dummy_search), result in zip(group, results):
+                if result and result['results']:
+                    latest_docs[distillery.pk] = result['results'][0]
+                else:
+                    latest_docs[distillery.pk] = None
+
+        return latest_docs
+
+    def _bulk_update_status(self, monitors, now):
+        """
+        Takes a list of Monitors and saves their status fields with a
+        single query.
+        """
+        updates = {'last_updated': now}
+
+        for (attname, output_field) in self._STATUS_FIELDS:
+            updates[attname] = Case(
+                *[When(pk=monitor.pk, then=Value(
+                    output_field.to_python(getattr(monitor, attname)),
+                    output_field=output_field))
+                  for monitor in monitors],
+                output_field=output_field
+            )
+
+        self.filter(pk__in=[monitor.pk for monitor in monitors])\
+            .update(**updates)
+
+    def update_statuses(self, monitors=None):
+        """Update the status of several Monitors at once.
+
+        Finds the most recent document in each monitored Distillery
+        with one search per |Warehouse|, updates the Monitors' statuses
+        with a single query, and then creates any Alerts that are due.
+
+        Parameters
+        ----------
+        monitors : |list| of |Monitor| or |None|
+            The Monitors to update. If |None|, all enabled Monitors are
+            updated.
+
+        Returns
+        -------
+        dict
+            The current status of each Monitor, keyed by its pk.
+
+        """
+        if monitors is None:
+            monitors = self.find_enabled().prefetch_related('distilleries')
+
+        monitors = list(monitors)
+
+        if not monitors:
+            return {}
+
+        latest_docs = self._find_latest_docs(monitors)
+        now = timezone.now()
+        old_statuses = {}
+
+        for monitor in monitors:
+            old_statuses[monitor.pk] = monitor.status
+            monitor._latest_docs = latest_docs
+            monitor._update_fields()
+            monitor.last_updated = now
+
+        self._bulk_update_status(monitors, now)
+
+        for monitor in monitors:
+            if monitor.status == monitor._UNHEALTHY:
+                monitor._alert(old_statuses[monitor.pk])
+
+        return dict((monitor.pk, monitor.status) for monitor in monitors)
+
 
 class Monitor(Alarm):
     """
@@ -242,13 +364,12 @@ class Monitor(Alarm):
         else:
             return interval_start
 
-    def _get_query(self, date_field):
+    @staticmethod
+    def _get_date_query(date_field, start_time):
         """
-        Takes the name of a date field and returns an |EngineQuery| for
-        documents with dates later than the last_healthy date (if there
-        is one) or the start of the monitoring interval (if there isn't).
+        Takes the name of a date field and a datetime, and returns an
+        |EngineQuery| for documents with dates later than the datetime.
         """
-        start_time = self._get_query_start_time()
         query = QueryFieldset(
             field_name=date_field,
             field_type='DateTimeField',
@@ -257,6 +378,15 @@ class Monitor(Alarm):
         )
         return EngineQuery([query])
 
+    def _get_query(self, date_field):
+        """
+        Takes the name of a date field and returns an |EngineQuery| for
+        documents with dates later than the last_healthy date (if there
+        is one) or the start of the monitoring interval (if there isn't).
+        """
+        start_time = self._get_query_start_time()
+        return self._get_date_query(date_field, start_time)
+
     @staticmethod
     def _get_sorter(date_field):
         """
@@ -274,7 +404,13 @@ class Monitor(Alarm):
         """
         Takes a Distillery and the most recent document from the
         monitoring interval, if one exists. Otherwise, returns None.
+        If the Monitor is being updated along with others, uses the
+        documents already found for its Distilleries.
         """
+        latest_docs = getattr(self, '_latest_docs', None)
+        if latest_docs is not None and distillery.pk in latest_docs:
+            return latest_docs[distillery.pk]
+
         date_field = distillery.get_searchable_date_field()
         if date_field:
             query = self._get_query(date_field)
@@ -283,19 +419,35 @@ class Monitor(Alarm):
             if results['results']:
                 return results['results'][0]
 
+    def _get_last_seen(self, distillery):
+        """
+        Takes a Distillery and returns a tuple of the date and id of the
+        most recent document from the monitoring interval, if one
+        exists. Otherwise, returns None. Uses the documents tracked as
+        they are saved if possible, and searches the Distillery if not.
+        """
+        start_time = self._get_query_start_time()
+        last_seen = freshness.get_last_seen(distillery, start_time)
+        if last_seen is not freshness.UNKNOWN:
+            return last_seen
+
+        doc = self._get_most_recent_doc(distillery)
+        if doc:
+            return (distillery.get_date(doc), doc.get('_id'))
+
     def _update_doc_info(self):
         """
         Looks for the most recently saved doc among the Distilleries
         being monitored, and updates the relevant field in the Monitor.
         """
         for distillery in self.distilleries.all():
-            doc = self._get_most_recent_doc(distillery)
-            if doc:
-                date = distillery.get_date(doc)
+            last_seen = self._get_last_seen(distillery)
+            if last_seen:
+                (date, doc_id) = last_seen
                 if self.last_healthy is None or date > self.last_healthy:
                     self.last_healthy = date
                     self.last_active_distillery = distillery
-                    self.last_saved_doc = doc.get('_id')
+                    self.last_saved_doc = doc_id
 
     def _set_current_status(self):
         """
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2018 Dunbar Security Solutions, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+"""
+Defines a receiver for the Distillery app's document_saved signal.
+"""
+
+# third party
+from django.dispatch import receiver
+
+# local
+from distilleries.signals import document_saved
+from . import freshness
+
+
+@receiver(document_saved)
+def track_document(sender, doc_obj, **args):
+    """
+    Receiver for the Distillery app's document_saved signal. Records
+    the newly saved document so Monitors can see the Distillery is
+    active without searching it.
+    """
+    if not freshness.is_enabled():
+        return
+
+    distillery = doc_obj.distillery
+    if distillery is not None:
+        date = distillery.get_date(doc_obj.data)
+        freshness.record(distillery, doc_obj.doc_id, date)
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2018 Dunbar Security Solutions, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+"""
+Tests the freshness module.
+"""
+
+# standard library
+from datetime import datetime
+try:
+    from unittest.mock import patch
+except ImportError:
+    from mock import patch
+
+# third party
+from django.core.cache import cache
+from django.test import TestCase
+
+# local
+from cyphon.documents import DocumentObj
+from distilleries.models import Distillery
+from monitors import freshness
+from monitors.models import Monitor
+from monitors.signals import track_document
+from tests.fixture_manager import get_fixtures
+
+START = datetime.strptime('2016-01-01 09:00:00 +0000', '%Y-%m-%d %H:%M:%S %z')
+EARLY = datetime.strptime('2016-01-01 09:04:00 +0000', '%Y-%m-%d %H:%M:%S %z')
+LATE = datetime.strptime('2016-01-01 09:06:00 +0000', '%Y-%m-%d %H:%M:%S %z')
+
+
+@patch('monitors.freshness.is_enabled', return_value=True)
+class FreshnessTestCase(TestCase):
+    """
+    Tests tracking of saved documents.
+    """
+    fixtures = get_fixtures(['monitors'])
+
+    def setUp(self):
+        freshness.reset()
+        self.distillery = Distillery.objects.get(pk=1)
+
+    def tearDown(self):
+        freshness.reset()
+
+    def test_record(self, mock_enabled):
+        """
+        Tests that a new Distillery is flushed to the cache right away
+        and that only its latest document is kept.
+        """
+        freshness.record(self.distillery, '1', LATE)
+        freshness.record(self.distillery, '2', EARLY)
+
+        shared = cache.get(freshness._CACHE_KEY)
+        self.assertEqual(shared, {1: (LATE, '1')})
+        self.assertEqual(
+            freshness.get_last_seen(self.distillery, START), (LATE, '1'))
+
+    def test_record_no_date(self, mock_enabled):
+        """
+        Tests that documents without dates are ignored.
+        """
+        freshness.record(self.distillery, '1', None)
+        self.assertIsNone(cache.get(freshness._CACHE_KEY))
+
+    def test_flush_interval(self, mock_enabled):
+        """
+        Tests that activity for a known Distillery is only flushed once
+        the flush interval has passed.
+        """
+        freshness.record(self.distillery, '1', EARLY)
+
+        with patch('monitors.freshness.flush') as mock_flush:
+            freshness.record(self.distillery, '2', LATE)
+            self.assertFalse(mock_flush.called)
+
+            freshness._STATE['last_flush'] = 0
+            freshness.record(self.distillery, '3', LATE)
+            self.assertTrue(mock_flush.called)
+
+    def test_flush_lost_entry(self, mock_enabled):
+        """
+        Tests that activity is flushed again if the cache entry is lost.
+        """
+        freshness.record(self.distillery, '1', EARLY)
+        cache.delete(freshness._CACHE_KEY)
+        freshness.flush()
+
+        shared = cache.get(freshness._CACHE_KEY)
+        self.assertEqual(shared, {1: (EARLY, '1')})
+
+    def test_flush_lost_update(self, mock_enabled):
+        """
+        Tests that activity overwritten by another process's flush is
+        treated as unknown rather than as inactivity.
+        """
+        freshness.record(self.distillery, '1', EARLY)
+        freshness.reset()
+        cache.set(freshness._CACHE_KEY, {2: (LATE, '2')})
+
+        result = freshness.get_last_seen(self.distillery, START)
+        self.assertIs(result, freshness.UNKNOWN)
+
+    def test_get_last_seen_untracked(self, mock_enabled):
+        """
+        Tests that the tracker can't be relied on before anything has
+        been tracked.
+        """
+        result = freshness.get_last_seen(self.distillery, START)
+        self.assertIs(result, freshness.UNKNOWN)
+
+    def test_get_last_seen_no_activity(self, mock_enabled):
+        """
+        Tests that the tracker can't be relied on when it shows no
+        activity for a Distillery during a period.
+        """
+        other_distillery = Distillery.objects.get(pk=2)
+        freshness.record(other_distillery, '1', EARLY)
+        result = freshness.get_last_seen(self.distillery, START)
+        self.assertIs(result, freshness.UNKNOWN)
+        result = freshness.get_last_seen(other_distillery, LATE)
+        self.assertIs(result, freshness.UNKNOWN)
+
+    def test_get_last_seen_shell(self, mock_enabled):
+        """
+        Tests that Distilleries that don't save their own documents
+        are never tracked.
+        """
+        freshness.record(self.distillery, '1', EARLY)
+        self.distillery.is_shell = True
+        result = freshness.get_last_seen(self.distillery, START)
+        self.assertIs(result, freshness.UNKNOWN)
+
+    def test_get_last_seen_disabled(self, mock_enabled):
+        """
+        Tests that the tracker isn't used when tracking is disabled.
+        """
+        freshness.record(self.distillery, '1', EARLY)
+
+        mock_enabled.return_value = False
+        result = freshness.get_last_seen(self.distillery, START)
+        self.assertIs(result, freshness.UNKNOWN)
+
+    def test_track_document(self, mock_enabled):
+        """
+        Tests that the document_saved receiver records saved documents.
+        """
+        doc_obj = DocumentObj(data={}, doc_id='1')
+        doc_obj.distillery = self.distillery
+
+        with patch.object(Distillery, 'get_date', return_value=EARLY):
+            track_document(sender=Distillery, doc_obj=doc_obj)
+
+        self.assertEqual(
+            freshness.get_last_seen(self.distillery, START), (EARLY, '1'))
+
+    def test_update_status(self, mock_enabled):
+        """
+        Tests that a Monitor can update its status from tracked
+        documents without searching its Distilleries.
+        """
+        freshness.record(self.distillery, '11', EARLY)
+        monitor = Monitor.objects.get(pk=3)
+        assert monitor.status == 'RED'
+
+        with patch('monitors.models.Distillery.find') as mock_find:
+            with patch('monitors.models.timezone.now', return_value=LATE):
+                result = monitor.update_status()
+            self.assertFalse(mock_find.called)
+
+        updated_monitor = Monitor.objects.get(pk=3)
+        self.assertEqual(updated_monitor.last_healthy, EARLY)
+        self.assertEqual(updated_monitor.last_active_distillery.pk, 1)
+        self.assertEqual(updated_monitor.last_saved_doc, '11')
+        self.assertEqual(result, 'GREEN')
@@ -71,6 +71,59 @@ class MonitorManagerTestCase(TestCase):
         relevant_monitors = Monitor.objects.find_relevant(distillery)
         self.assertEqual(relevant_monitors.count(), 3)
 
+    @patch_find_by_id()
+    @patch('alerts.models.Alert.teaser')
+    @patch('monitors.models.timezone.now', return_value=LATE)
+    def test_update_statuses(self, mock_now, mock_teaser):
+        """
+        Tests the update_statuses method of the MonitorManager class.
+        """
+        assert Alert.objects.count() == 0
+
+        results = [
+            {'count': 1, 'results': [{'_id': 2, 'created_date': LATE}]},
+            {'count': 0, 'results': []},
+        ]
+        mock_teaser.get = Mock(return_value=None)
+        with patch('monitors.models.Collection.find_many',
+                   return_value=results) as mock_find_many:
+            statuses = Monitor.objects.update_statuses()
+
+            # distilleries 1 and 2 share a warehouse
+            self.assertEqual(mock_find_many.call_count, 1)
+            searches = mock_find_many.call_args[0][0]
+            self.assertEqual(len(searches), 2)
+
+        self.assertEqual(statuses, {1: 'GREEN', 2: 'GREEN',
+                                    3: 'GREEN', 5: 'RED'})
+
+        # get fresh instances from the database
+        monitor_grn = Monitor.objects.get(pk=3)
+        self.assertEqual(monitor_grn.status, 'GREEN')
+        self.assertEqual(monitor_grn.last_healthy, LATE)
+        self.assertEqual(monitor_grn.last_updated, LATE)
+        self.assertEqual(monitor_grn.last_active_distillery.pk, 1)
+        self.assertEqual(monitor_grn.last_saved_doc, '2')
+
+        monitor_red = Monitor.objects.get(pk=5)
+        self.assertEqual(monitor_red.status, 'RED')
+        self.assertEqual(monitor_red.last_updated, LATE)
+        self.assertIsNone(monitor_red.last_healthy)
+
+        self.assertEqual(Monitor.objects.get(pk=4).status, 'RED')
+        self.assertEqual(Alert.objects.count(), 1)
+        self.assertEqual(Alert.objects.get().alarm, monitor_red)
+
+    def test_update_statuses_none(self):
+        """
+        Tests the update_statuses method of the MonitorManager class
+        when there are no Monitors to update.
+        """
+        with patch('monitors.models.Collection.find_many') \
+                as mock_find_many:
+            self.assertEqual(Monitor.objects.update_statuses([]), {})
+            self.assertFalse(mock_find_many.called)
+
 
 class MonitorTestCase(TestCase):
     """
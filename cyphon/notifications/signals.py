@@ -15,7 +15,7 @@
 # You should have received a copy of the GNU General Public License
 # along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
 """
-Methods that handle signals necessary for push notifications.
+Sends push notifications for new |Alerts|.
 """
 
 # standard library
@@ -26,10 +26,9 @@ import requests
 from constance import config
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.db.models.signals import post_save
-from django.dispatch import receiver
 
 # local
+from alerts.handlers import alert_handler
 from alerts.models import Alert
 
 _NOTIFICATION_SETTINGS = settings.NOTIFICATIONS
@@ -89,17 +88,17 @@ def send_push_notifications(alert):
                           'SSL certificate verification failed. ')
 
 
-@receiver(post_save, sender=Alert)
-def handle_alert_post_save_signal(sender, instance, created, **kwargs):
+@alert_handler
+def notify_new_alert(alert):
     """
-    Handles the Alert models post_save signal.
+    Sends push notifications for a new Alert.
     """
-    if created and config.PUSH_NOTIFICATIONS_ENABLED:
+    if config.PUSH_NOTIFICATIONS_ENABLED:
 
         if not _NOTIFICATION_SETTINGS['PUSH_NOTIFICATION_KEY']:
             _LOGGER.error('Could not send push notifications. '
                           'No PUSH_NOTIFICATION_KEY was provided')
         else:
             ignored_levels = _NOTIFICATION_SETTINGS['IGNORED_ALERT_LEVELS']
-            if instance.level not in ignored_levels:
-                send_push_notifications(instance)
+            if alert.level not in ignored_levels:
+                send_push_notifications(alert)
@@ -18,12 +18,17 @@
 
 """
 
+# standard library
+import functools
+import operator
+
 # third party
+from django.contrib.postgres.search import SearchQuery, SearchRank
 from django.core.paginator import Paginator, EmptyPage
-from django.db.models import Q
+from django.db.models import F, Q
 
 # local
-from alerts.models import Alert
+from alerts.models import Alert, Comment
 from alerts.serializers import AlertDetailSerializer
 from distilleries.models import Distillery
 from utils.dbutils.dbutils import join_query
@@ -86,32 +91,64 @@ class AlertSearchResults(SearchResults):
         return AlertDetailSerializer(alert, context={'request': request}).data
 
     @staticmethod
-    def _get_keyword_search_query(keyword, text_fields):
-        """ Create a search query for searching by keyword.
+    def _get_unindexed_search_query(keyword, text_fields):
+        """Create a search query for Alerts that haven't been indexed.
+
+        Alerts created before the search index was added have no
+        search vector until the `rebuild_alert_search` command is run.
+        Their fields are searched directly instead.
 
         Parameters
         ----------
         keyword : string
-        text_fields : list of DataField
+        text_fields : list of str
 
         Returns
         -------
         Q
         """
+        comments = Comment.objects.filter(content__icontains=keyword)
         queries = [
             Q(title__icontains=keyword),
             Q(analysis__notes__icontains=keyword),
-            Q(comments__content__icontains=keyword)]
+            Q(pk__in=comments.values('alert_id'))]
 
         for field in text_fields:
             underscored_field = field.replace('.', '__')
             query_field = 'data__{}__icontains'.format(underscored_field)
             queries.append(Q(**{query_field: keyword}))
 
-        return join_query(queries, 'OR')
+        return Q(search_vector__isnull=True) & join_query(queries, 'OR')
 
     @staticmethod
-    def _get_keyword_list_search_query(keywords, distilleries):
+    def _get_keyword_search_query(keyword, text_fields=None):
+        """ Create a search query for searching by keyword.
+
+        Matches Alerts whose search vector matches the keyword, or
+        whose indexed text contains it.
+
+        Parameters
+        ----------
+        keyword : string
+        text_fields : list of str or None
+            Names of text fields to search in Alerts that haven't been
+            indexed. If |None|, unindexed Alerts aren't searched.
+
+        Returns
+        -------
+        Q
+        """
+        query = (Q(search_vector=SearchQuery(keyword)) |
+                 Q(search_text__contains=keyword.lower()))
+
+        if text_fields is not None:
+            query |= AlertSearchResults._get_unindexed_search_query(
+                keyword, text_fields)
+
+        return query
+
+    @staticmethod
+    def _get_keyword_list_search_query(keywords, distilleries=None):
         """Create a search query that searches alerts for keywords.
 
         Parameters
@@ -119,7 +156,10 @@ class AlertSearchResults(SearchResults):
         keywords : list of str
             Keywords to search for.
 
-        distilleries: list of distilleries.models.Distillery
+        distilleries: list of distilleries.models.Distillery or None
+            Distilleries whose text fields should be searched in Alerts
+            that haven't been indexed. If |None|, all Distilleries are
+            used.
 
         Returns
         -------
@@ -129,7 +169,14 @@ class AlertSearchResults(SearchResults):
         if not keywords:
             return Q()
 
-        text_fields = AlertSearchResults._get_shared_text_fields(distilleries)
+        text_fields = None
+
+        if Alert.objects.filter(search_vector__isnull=True).exists():
+            if distilleries is None:
+                distilleries = Distillery.objects.all()
+            text_fields = AlertSearchResults._get_shared_text_fields(
+                distilleries)
+
         queries = [
             AlertSearchResults._get_keyword_search_query(keyword, text_fields)
             for keyword in keywords]
@@ -139,6 +186,24 @@ class AlertSearchResults(SearchResults):
 
         return join_query(queries, 'AND')
 
+    @staticmethod
+    def _get_search_rank(keywords):
+        """Create an expression for ranking alerts by keyword relevance.
+
+        Parameters
+        ----------
+        keywords : list of str
+            Keywords to search for.
+
+        Returns
+        -------
+        SearchRank
+
+        """
+        search_query = functools.reduce(
+            operator.and_, [SearchQuery(keyword) for keyword in keywords])
+        return SearchRank(F('search_vector'), search_query)
+
     @staticmethod
     def _convert_fieldset_operator(fieldset_operator):
         """Converts a Fieldset operator to the django filter equivalent.
@@ -217,7 +282,7 @@ class AlertSearchResults(SearchResults):
 
         Returns
         -------
-        list of DataFields
+        list of str
         """
         grouped_text_fields = [
             distillery.get_text_fields() for distillery in distilleries]
@@ -258,8 +323,6 @@ class AlertSearchResults(SearchResults):
 
         if distillery_qs:
             alert_qs = alert_qs.filter(distillery__in=distillery_qs)
-        else:
-            distillery_qs = Distillery.objects.all()
 
         if after:
             alert_qs = alert_qs.filter(created_date__gte=after)
@@ -273,6 +336,12 @@ class AlertSearchResults(SearchResults):
         alert_qs = alert_qs.filter(
             join_query([keyword_query, field_query], 'AND'))
 
+        if query.keywords:
+            rank = AlertSearchResults._get_search_rank(query.keywords)
+            # unindexed Alerts have no rank, so they come last
+            alert_qs = alert_qs.annotate(rank=rank).order_by(
+                F('rank').desc(nulls_last=True), '-id')
+
         return alert_qs
 
     @staticmethod
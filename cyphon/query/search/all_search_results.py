@@ -37,16 +37,21 @@ class AllSearchResults(object):
 
     """
     def __init__(self, query, page=1, page_size=DEFAULT_PAGE_SIZE,
-                 before=None, after=None):
+                 before=None, after=None, merge=False):
         """Initialize an AllSearchResults object.
 
         Parameters
         ----------
         query : query.search.search_query.SearchQuery
 
+        merge : bool
+            Whether to merge the results of Distilleries that support
+            cross-collection searches.
+
         """
         self.distillery_results = DistillerySearchResultsList(
-            query, page=page, page_size=page_size, before=before, after=after)
+            query, page=page, page_size=page_size, before=before, after=after,
+            merge=merge)
         self.alert_results = AlertSearchResults(
             query, page=page, page_size=page_size, before=before, after=after)
         self.count = self.distillery_results.count + self.alert_results.count
@@ -15,19 +15,69 @@
 # You should have received a copy of the GNU General Public License
 # along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
 
+"""
+Defines classes for searching the documents of |Distilleries|.
+
+Distilleries are searched in parallel by a pool of threads shared by
+the process, and Distilleries whose backend supports it are searched in
+batches of one request each. Distilleries that aren't searched before
+the deadline in the `SEARCH` settings are reported as timed out. Since
+the pool is shared and bounded, searches that are stuck after their
+deadline can't tie up more than `SEARCH['MAX_WORKERS']` threads.
+
+When results are merged, Distilleries whose backend supports
+cross-collection searches are searched with a single query, which
+returns one page of results sorted by save date, along with a count for
+each Distillery.
+
+"""
+
 # standard library
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
 from functools import reduce
+import logging
+import threading
 
 # third party
+from django.conf import settings
 from django.urls import reverse
 
 # local
 from cyphon.fieldsets import QueryFieldset
+from cyphon.transaction import close_connection
 from distilleries.models import Distillery
 from distilleries.serializers import DistilleryListSerializer
 from engines.queries import EngineQuery
 from .search_results import SearchResults, DEFAULT_PAGE_SIZE
 
+_LOGGER = logging.getLogger(__name__)
+
+_SEARCH_SETTINGS = getattr(settings, 'SEARCH', {})
+
+_LOCK = threading.Lock()
+
+_STATE = {
+    'executor': None,
+}
+
+
+def _get_executor():
+    """
+    Returns the ThreadPoolExecutor shared by searches in the current
+    process, creating it if needed.
+    """
+    with _LOCK:
+        if _STATE['executor'] is None:
+            _STATE['executor'] = ThreadPoolExecutor(
+                max_workers=_SEARCH_SETTINGS.get('MAX_WORKERS', 8))
+        return _STATE['executor']
+
+
+def _get_distillery_names(search_results):
+    """Return the names of the Distilleries in a list of search results."""
+    return ', '.join(str(result.distillery) for result in search_results)
+
 
 class DistillerySearchResults(SearchResults):
     """
@@ -37,7 +87,7 @@ class DistillerySearchResults(SearchResults):
     VIEW_NAME = 'search_distillery'
 
     def __init__(self, query, distillery, page=1, page_size=DEFAULT_PAGE_SIZE,
-                 before=None, after=None):
+                 before=None, after=None, run_search=True):
         """Create a DistillerySearchResults instance.
 
         Parameters
@@ -46,28 +96,27 @@ class DistillerySearchResults(SearchResults):
 
         distillery : Distillery
 
+        run_search : bool
+            Whether to search the Distillery now. If |False|, the
+            search can be run later and its results passed to
+            :meth:`~DistillerySearchResults.set_results`.
+
         """
         super(DistillerySearchResults, self).__init__(
             self.VIEW_NAME, query, page, page_size,
+            before=before, after=after,
         )
         self.results = []
         self.count = 0
+        self.timed_out = False
+        self.merged_results = None
         self.distillery = distillery
         self.engine_query = self._get_engine_query(
             distillery, query, before=before, after=after)
 
-        if not self.engine_query:
-            return
-
-        if (before or after) and not distillery.get_searchable_date_field():
-            results = None
-        else:
-            results = self.distillery.find(
-                self.engine_query, page=page, page_size=page_size)
-
-        if results and results['count']:
-            self.count = results['count']
-            self.results = results['results']
+        if run_search and self.can_search():
+            self.set_results(self.distillery.find(
+                self.engine_query, page=page, page_size=page_size))
 
     @staticmethod
     def _serialize_distillery_object(distillery, request):
@@ -241,6 +290,43 @@ class DistillerySearchResults(SearchResults):
     def _get_path(self):
         return reverse(self.view_name, args=[self.distillery.pk])
 
+    def can_search(self):
+        """Whether the Distillery can be searched for the query.
+
+        Returns
+        -------
+        bool
+            |False| if the query has nothing to search in the
+            Distillery, or if it is limited to a date range and the
+            Distillery has no searchable date field.
+
+        """
+        if not self.engine_query:
+            return False
+
+        if self.before or self.after:
+            return bool(self.distillery.get_searchable_date_field())
+
+        return True
+
+    def set_results(self, results):
+        """Set the results of the Distillery's search.
+
+        Parameters
+        ----------
+        results : dict or None
+            The results of the search, in the format returned by
+            :meth:`Distillery.find <distilleries.models.Distillery.find>`.
+
+        Returns
+        -------
+        None
+
+        """
+        if results and results['count']:
+            self.count = results['count']
+            self.results = results['results']
+
     def as_dict(self, request):
         """Return a JSON serializable representation of this instance.
 
@@ -256,6 +342,7 @@ class DistillerySearchResults(SearchResults):
         parent_dict = super(DistillerySearchResults, self).as_dict(request)
 
         parent_dict['results'] = self.results
+        parent_dict['timed_out'] = self.timed_out
         parent_dict['distillery'] = self._serialize_distillery_object(
             self.distillery, request,
         )
@@ -263,6 +350,133 @@ class DistillerySearchResults(SearchResults):
         return parent_dict
 
 
+class MergedDistillerySearchResults(SearchResults):
+    """Search results from several Distilleries, sorted and paginated as one.
+
+    Attributes
+    ----------
+    search_results : list of DistillerySearchResults
+        The results of each Distillery included in the search. Their
+        counts are set from the merged search.
+
+    results : list of dict
+        A page of documents from all the Distilleries, most recently
+        saved first.
+
+    timed_out : bool
+        Whether the search was abandoned at the deadline.
+
+    """
+
+    VIEW_NAME = 'search_distilleries'
+
+    def __init__(self, query, search_results, page=1,
+                 page_size=DEFAULT_PAGE_SIZE, before=None, after=None):
+        """Create a MergedDistillerySearchResults instance.
+
+        Parameters
+        ----------
+        query : query.search.search_query.SearchQuery
+
+        search_results : list of DistillerySearchResults
+            Results for Distilleries whose |Collections| share a backend
+            that supports cross-collection searches.
+
+        """
+        super(MergedDistillerySearchResults, self).__init__(
+            self.VIEW_NAME, query, page, page_size,
+            before=before, after=after,
+        )
+        self.results = []
+        self.count = 0
+        self.timed_out = False
+        self.search_results = search_results
+
+        for result in search_results:
+            result.merged_results = self
+
+    def search(self):
+        """Search all the Distilleries with a single query.
+
+        Returns
+        -------
+        dict or None
+            The results of the search, in the format returned by
+            :meth:`Distillery.find_across
+            <distilleries.models.Distillery.find_across>`.
+
+        """
+        return Distillery.find_across(
+            [(result.distillery, result.engine_query)
+             for result in self.search_results],
+            page=self.page, page_size=self.page_size)
+
+    def set_results(self, results):
+        """Set the results of the merged search.
+
+        Parameters
+        ----------
+        results : dict or None
+            The results of the search, in the format returned by
+            :meth:`Distillery.find_across
+            <distilleries.models.Distillery.find_across>`.
+
+        Returns
+        -------
+        None
+
+        """
+        if not results:
+            return
+
+        self.count = results['count']
+        self.results = results['results']
+
+        for result in self.search_results:
+            result.count = results['counts'].get(result.distillery.pk, 0)
+
+    def set_timed_out(self):
+        """Mark the search, and each Distillery in it, as timed out.
+
+        Returns
+        -------
+        None
+
+        """
+        self.timed_out = True
+
+        for result in self.search_results:
+            result.timed_out = True
+
+    def as_dict(self, request):
+        """Return a JSON serializable representation of this instance.
+
+        Parameters
+        ----------
+        request : django.http.HttpRequest
+
+        Returns
+        -------
+        dict
+
+        """
+        parent_dict = super(MergedDistillerySearchResults, self).as_dict(
+            request)
+
+        parent_dict['results'] = self.results
+        parent_dict['timed_out'] = self.timed_out
+        parent_dict['distilleries'] = [
+            {
+                'count': result.count,
+                'distillery': result._serialize_distillery_object(
+                    result.distillery, request),
+            }
+            for result in self.search_results
+        ]
+
+        return parent_dict
+
+
 class DistillerySearchResultsList(object):
     """
 
@@ -270,22 +484,33 @@ class DistillerySearchResultsList(object):
 
     def __init__(
             self, query, page=1, page_size=DEFAULT_PAGE_SIZE,
-            before=None, after=None):
+            before=None, after=None, merge=False):
         """Create a DistillerySearchResultsList instance.
 
         Parameters
         ----------
         query: query.search.search_query.SearchQuery
 
+        merge : bool
+            Whether to search Distilleries that support cross-collection
+            searches with a single query, and return their results as
+            one sorted list.
+
         """
         self.count = 0
+        self.merge = merge
         self.distilleries = (
             query.distilleries or Distillery.objects.all()
         )
         self.results = self._get_distillery_search_results(
             self.distilleries, query,
-            page=page, page_size=page_size, before=before, after=after
+            page=page, page_size=page_size, before=before, after=after,
+            merge=merge
         )
+        self.merged_results = list(OrderedDict.fromkeys(
+            result.merged_results for result in self.results
+            if result.merged_results
+        ))
         self.count = self._get_result_count(self.results)
 
     @staticmethod
@@ -306,7 +531,7 @@ class DistillerySearchResultsList(object):
     @staticmethod
     def _get_distillery_search_results(
             distilleries, query, page, page_size,
-            before=None, after=None):
+            before=None, after=None, merge=False):
         """Return a list of DistillerySearchResults for a query.
 
         Parameters
@@ -315,20 +540,246 @@ class DistillerySearchResultsList(object):
 
         query : query.search.search_query.SearchQuery
 
+        merge : bool
+            Whether to merge the searches of Distilleries that support
+            cross-collection searches.
+
         Returns
         -------
         list of DistillerySearchResults or None
 
         """
-        if query.keywords or query.field_parameters:
-            return [
-                DistillerySearchResults(
-                    query, distillery,
-                    page=page, page_size=page_size, before=before, after=after)
-                for distillery in distilleries
+        if not (query.keywords or query.field_parameters):
+            return []
+
+        search_results = [
+            DistillerySearchResults(
+                query, distillery,
+                page=page, page_size=page_size, before=before, after=after,
+                run_search=False)
+            for distillery in distilleries
+        ]
+
+        searchable = [
+            result for result in search_results if result.can_search()
+        ]
+        merged_results = []
+
+        if merge:
+            merged_results = DistillerySearchResultsList._get_merged_results(
+                searchable, query, page=page, page_size=page_size,
+                before=before, after=after)
+            searchable = [
+                result for result in searchable if not result.merged_results
+            ]
+
+        DistillerySearchResultsList._run_searches(
+            searchable, page=page, page_size=page_size,
+            merged_results=merged_results)
+
+        return search_results
+
+    @staticmethod
+    def _get_merged_results(search_results, query, page, page_size,
+                            before=None, after=None):
+        """Group DistillerySearchResults into merged searches.
+
+        Distilleries whose backend supports cross-collection searches
+        are grouped by backend, and each group is searched with a
+        single query.
+
+        Parameters
+        ----------
+        search_results : list of DistillerySearchResults
+
+        query : query.search.search_query.SearchQuery
+
+        Returns
+        -------
+        list of MergedDistillerySearchResults
+
+        """
+        groups = OrderedDict()
+
+        for result in search_results:
+            collection = result.distillery.collection
+            if collection.supports_cross_collection_search():
+                backend = collection.get_backend()
+                groups.setdefault(backend, []).append(result)
+
+        return [
+            MergedDistillerySearchResults(
+                query, group, page=page, page_size=page_size,
+                before=before, after=after)
+            for group in groups.values()
+        ]
+
+    @staticmethod
+    def _get_search_batches(search_results):
+        """Group DistillerySearchResults into batches searched together.
+
+        Distilleries whose backend supports multi-search are grouped by
+        backend, in batches of up to `SEARCH['BATCH_SIZE']`. Every other
+        Distillery is searched on its own.
+
+        Parameters
+        ----------
+        search_results : list of DistillerySearchResults
+
+        Returns
+        -------
+        list of list of DistillerySearchResults
+
+        """
+        batch_size = max(_SEARCH_SETTINGS.get('BATCH_SIZE', 20), 1)
+        batches = []
+        multi_searches = OrderedDict()
+
+        for result in search_results:
+            collection = result.distillery.collection
+            if collection.supports_multi_search():
+                backend = collection.get_backend()
+                multi_searches.setdefault(backend, []).append(result)
+            else:
+                batches.append([result])
+
+        for group in multi_searches.values():
+            batches += [
+                group[index:index + batch_size]
+                for index in range(0, len(group), batch_size)
             ]
 
-        return []
+        return batches
+
+    @staticmethod
+    @close_connection
+    def _search_batch(batch, page, page_size):
+        """Search the Distilleries of a batch of DistillerySearchResults.
+
+        Parameters
+        ----------
+        batch : list of DistillerySearchResults
+
+        page : int
+
+        page_size : int
+
+        Returns
+        -------
+        list of dict or None
+            The results for each DistillerySearchResults in the batch.
+
+        """
+        if len(batch) == 1:
+            result = batch[0]
+            return [result.distillery.find(
+                result.engine_query, page=page, page_size=page_size)]
+
+        return Distillery.find_many([
+            (result.distillery, result.engine_query, page, page_size)
+            for result in batch
+        ])
+
+    @staticmethod
+    @close_connection
+    def _search_merged(merged_results):
+        """Run a merged search of several Distilleries.
+
+        Parameters
+        ----------
+        merged_results : MergedDistillerySearchResults
+
+        Returns
+        -------
+        dict or None
+
+        """
+        return merged_results.search()
+
+    @staticmethod
+    def _run_searches(search_results, page, page_size, merged_results=()):
+        """Search Distilleries in parallel and set their results.
+
+        Batches that aren't finished within `SEARCH['TIMEOUT']` seconds
+        are abandoned, and their DistillerySearchResults are marked as
+        timed out. Abandoned batches that haven't started are cancelled;
+        the others keep their threads in the shared pool until their
+        backend responds. Errors are logged and leave the results empty.
+
+        Parameters
+        ----------
+        search_results : list of DistillerySearchResults
+
+        page : int
+
+        page_size : int
+
+        merged_results : list of MergedDistillerySearchResults
+            Merged searches to run in the same pool.
+
+        Returns
+        -------
+        None
+
+        """
+        batches = DistillerySearchResultsList._get_search_batches(
+            search_results)
+        tasks = len(batches) + len(merged_results)
+
+        if not tasks:
+            return
+
+        executor = _get_executor()
+
+        merged_futures = OrderedDict(
+            (executor.submit(DistillerySearchResultsList._search_merged,
+                             merged), merged)
+            for merged in merged_results
+        )
+        futures = OrderedDict(
+            (executor.submit(DistillerySearchResultsList._search_batch,
+                             batch, page, page_size), batch)
+            for batch in batches
+        )
+        done, dummy_not_done = wait(
+            list(merged_futures) + list(futures),
+            timeout=_SEARCH_SETTINGS.get('TIMEOUT'))
+
+        for future, merged in merged_futures.items():
+            if future not in done:
+                future.cancel()
+                merged.set_timed_out()
+                _LOGGER.warning(
+                    'Merged search of %s timed out',
+                    _get_distillery_names(merged.search_results))
+                continue
+
+            try:
+                merged.set_results(future.result())
+            except Exception as error:
+                _LOGGER.error(
+                    'An error occurred while searching %s: %s',
+                    _get_distillery_names(merged.search_results), error)
+
+        for future, batch in futures.items():
+            if future not in done:
+                future.cancel()
+                for result in batch:
+                    result.timed_out = True
+                    _LOGGER.warning('Search of Distillery %s timed out',
+                                    result.distillery)
+                continue
+
+            try:
+                batch_results = future.result()
+            except Exception as error:
+                _LOGGER.error(
+                    'An error occurred while searching %s: %s',
+                    _get_distillery_names(batch), error)
+                continue
+
+            for result, results in zip(batch, batch_results):
+                result.set_results(results)
 
     def _get_results_as_dict(self, request):
         """Return a JSON serializable representation of earch results.
@@ -344,7 +795,8 @@ class DistillerySearchResultsList(object):
         """
         return [
             result.as_dict(request) for result in self.results
-            if result.count
+            if (result.count or result.timed_out)
+            and not result.merged_results
         ]
 
     def as_dict(self, request):
@@ -360,7 +812,14 @@ class DistillerySearchResultsList(object):
         dict
 
         """
-        return {
+        data = {
             'count': self.count,
             'results': self._get_results_as_dict(request)
         }
+
+        if self.merge:
+            data['merged'] = [
+                merged.as_dict(request) for merged in self.merged_results
+            ]
+
+        return data
@@ -244,3 +244,59 @@ class AlertSearchResultsTestCase(TestCase):
         alert_results = self._get_search_results(search_query)
 
         self.assertEqual(alert_results.count, 0)
+
+    def test_keyword_ranking(self):
+        """
+        Tests that alerts are ordered by how well they match keywords.
+        """
+        search_query = SearchQuery('example', self.user)
+        alert_results = self._get_search_results(search_query)
+        alert_ids = [alert.pk for alert in alert_results.results]
+
+        # notes outrank a partial match in the data
+        self.assertEqual(alert_ids, [3, 1, 2])
+
+    def test_partial_keyword(self):
+        """
+        Tests that keywords match part of a word.
+        """
+        search_query = SearchQuery('suppl', self.user)
+        alert_results = self._get_search_results(search_query)
+
+        self.assertEqual(alert_results.count, 3)
+
+    def test_stemmed_keyword(self):
+        """
+        Tests that keywords match other forms of a word.
+        """
+        search_query = SearchQuery('noted', self.user)
+        alert_results = self._get_search_results(search_query)
+
+        self.assertEqual(alert_results.count, 2)
+
+    def test_unindexed_alert(self):
+        """
+        Tests that alerts that haven't been indexed are still found,
+        after the alerts that have been.
+        """
+        Alert.objects.filter(pk=4).update(search_text=None,
+                                          search_vector=None)
+        search_query = SearchQuery('"Acme Supply co"', self.user)
+        alert_results = self._get_search_results(search_query)
+        alert_ids = [alert.pk for alert in alert_results.results]
+
+        self.assertEqual(alert_ids, [3, 1, 4])
+
+    def test_unindexed_comment(self):
+        """
+        Tests that comments of alerts that haven't been indexed are
+        searched.
+        """
+        Alert.objects.filter(pk=2).update(search_text=None,
+                                          search_vector=None)
+        search_query = SearchQuery(
+            '"This alert isn\'t this important"', self.user)
+        alert_results = self._get_search_results(search_query)
+
+        self.assertEqual(alert_results.count, 1)
+        self.assertEqual(alert_results.results[0].pk, 2)
@@ -19,6 +19,7 @@ Tests for the DistillerySearchResults Class.
 """
 
 # standard library
+import time
 from unittest.mock import patch
 from dateutil import parser
 
@@ -26,6 +27,7 @@ from dateutil import parser
 from django.contrib.auth import get_user_model
 from django.test import TestCase
 from django.test.client import RequestFactory
+from testfixtures import LogCapture
 
 # local
 from cyphon.fieldsets import QueryFieldset
@@ -34,6 +36,7 @@ from engines.queries import EngineQuery
 from query.search.distillery_search_results import (
     DistillerySearchResults,
     DistillerySearchResultsList,
+    _get_executor,
 )
 from tests.test_fixture_manager import get_fixtures
 from query.search.search_query import SearchQuery
@@ -50,6 +53,13 @@ MOCK_FIND = patch(
     return_value=MOCK_RESULTS,
 )
 
+MOCK_FIND_MANY = patch(
+    'distilleries.models.Distillery.find_many',
+    side_effect=lambda searches: [MOCK_RESULTS] * len(searches),
+)
+
+MOCK_SETTINGS = 'query.search.distillery_search_results._SEARCH_SETTINGS'
+
 
 def get_fieldsets(subqueries):
     fieldsets = []
@@ -220,6 +230,7 @@ class DistillerySearchResultsTestCase(TestCase):
             'results': MOCK_RESULTS_LIST,
             'next': None,
             'previous': None,
+            'timed_out': False,
             'distillery': {
                 'id': 1,
                 'name': 'mongodb.test_database.test_posts',
@@ -244,7 +255,7 @@ class DistillerySearchResultsListTestCase(TestCase):
         -------
         DistillerySearchResultsList
         """
-        with MOCK_FIND:
+        with MOCK_FIND, MOCK_FIND_MANY:
             return DistillerySearchResultsList(query)
 
     def setUp(self):
@@ -299,6 +310,7 @@ class DistillerySearchResultsListTestCase(TestCase):
                 'next': None,
                 'previous': None,
                 'results': MOCK_RESULTS_LIST,
+                'timed_out': False,
                 'distillery': {
                     'id': 1,
                     'name': 'mongodb.test_database.test_posts',
@@ -306,3 +318,185 @@ class DistillerySearchResultsListTestCase(TestCase):
                 }
             }]
         })
+
+    def test_multi_search(self):
+        """
+        Tests that Distilleries whose backend supports multi-search are
+        searched in a single batch.
+        """
+        search_query = SearchQuery('test', self.user)
+
+        with MOCK_FIND as mock_find, MOCK_FIND_MANY as mock_find_many:
+            distillery_results_list = DistillerySearchResultsList(
+                search_query)
+
+        self.assertEqual(mock_find.call_count, 2)
+        self.assertEqual(mock_find_many.call_count, 1)
+        searches = mock_find_many.call_args[0][0]
+        self.assertEqual([search[0].pk for search in searches],
+                         [3, 4, 5, 6])
+        self.assertEqual(distillery_results_list.count, 6)
+
+    def test_multi_search_batch_size(self):
+        """
+        Tests that multi-searches are split into batches of
+        SEARCH['BATCH_SIZE'] Distilleries.
+        """
+        search_query = SearchQuery('test', self.user)
+
+        with patch.dict(MOCK_SETTINGS, {'BATCH_SIZE': 3}):
+            with MOCK_FIND as mock_find, MOCK_FIND_MANY as mock_find_many:
+                distillery_results_list = DistillerySearchResultsList(
+                    search_query)
+
+        # the last batch holds a single Distillery, searched on its own
+        self.assertEqual(mock_find.call_count, 3)
+        self.assertEqual(mock_find_many.call_count, 1)
+        self.assertEqual(distillery_results_list.count, 6)
+
+    def test_timeout(self):
+        """
+        Tests that Distilleries that aren't searched before the deadline
+        are reported as timed out while the others return results.
+        """
+        def find(query, page, page_size):
+            time.sleep(0.5)
+            return MOCK_RESULTS
+
+        search_query = SearchQuery('test', self.user)
+        factory = RequestFactory()
+        request = factory.get('/api/v1/search/')
+
+        with patch.dict(MOCK_SETTINGS, {'TIMEOUT': 0.1}):
+            with patch('distilleries.models.Distillery.find',
+                       side_effect=find), MOCK_FIND_MANY:
+                with LogCapture() as log_capture:
+                    start = time.time()
+                    distillery_results_list = DistillerySearchResultsList(
+                        search_query)
+                    elapsed = time.time() - start
+
+        self.assertLess(elapsed, 0.4)
+        self.assertEqual(distillery_results_list.count, 4)
+        timed_out = [
+            result.distillery.pk
+            for result in distillery_results_list.results
+            if result.timed_out
+        ]
+        self.assertEqual(timed_out, [1, 2])
+        log_capture.check(
+            ('query.search.distillery_search_results', 'WARNING',
+             'Search of Distillery mongodb.test_database.test_posts '
+             'timed out'),
+            ('query.search.distillery_search_results', 'WARNING',
+             'Search of Distillery mongodb.test_database.test_docs '
+             'timed out'),
+        )
+
+        results = distillery_results_list.as_dict(request)['results']
+        self.assertEqual(len(results), 6)
+        self.assertTrue(results[0]['timed_out'])
+        self.assertEqual(results[0]['count'], 0)
+
+    def test_shared_executor(self):
+        """
+        Tests that searches share one bounded pool of threads, so
+        searches that time out can't pile up threads.
+        """
+        executor = _get_executor()
+        self.assertIs(_get_executor(), executor)
+        self.assertEqual(executor._max_workers, 8)
+
+    def test_error(self):
+        """
+        Tests that an error in one search is logged and doesn't affect
+        the results of the others.
+        """
+        search_query = SearchQuery('test', self.user)
+
+        with patch('distilleries.models.Distillery.find',
+                   side_effect=ValueError('foo')), MOCK_FIND_MANY:
+            with LogCapture() as log_capture:
+                distillery_results_list = DistillerySearchResultsList(
+                    search_query)
+
+        self.assertEqual(distillery_results_list.count, 4)
+        self.assertFalse(any(result.timed_out
+                             for result in distillery_results_list.results))
+        log_capture.check(
+            ('query.search.distillery_search_results', 'ERROR',
+             'An error occurred while searching '
+             'mongodb.test_database.test_posts: foo'),
+            ('query.search.distillery_search_results', 'ERROR',
+             'An error occurred while searching '
+             'mongodb.test_database.test_docs: foo'),
+        )
+
+    def test_merge(self):
+        """
+        Tests that Distilleries that support cross-collection searches
+        are searched with a single query when results are merged.
+        """
+        search_query = SearchQuery('test', self.user)
+        factory = RequestFactory()
+        request = factory.get('/api/v1/search/')
+        mock_find_across = patch(
+            'distilleries.models.Distillery.find_across',
+            return_value={
+                'count': 5,
+                'results': MOCK_RESULTS_LIST * 5,
+                'counts': {3: 2, 5: 3},
+            }
+        )
+
+        with MOCK_FIND as mock_find, MOCK_FIND_MANY as mock_find_many:
+            with mock_find_across as mock_find_across:
+                distillery_results_list = DistillerySearchResultsList(
+                    search_query, merge=True)
+
+        self.assertEqual(mock_find.call_count, 2)
+        self.assertEqual(mock_find_many.call_count, 0)
+        self.assertEqual(mock_find_across.call_count, 1)
+        searches = mock_find_across.call_args[0][0]
+        self.assertEqual([search[0].pk for search in searches],
+                         [3, 4, 5, 6])
+        self.assertEqual(distillery_results_list.count, 7)
+        self.assertEqual(len(distillery_results_list.merged_results), 1)
+
+        data = distillery_results_list.as_dict(request)
+        self.assertEqual(data['count'], 7)
+        self.assertEqual([result['distillery']['id']
+                          for result in data['results']], [1, 2])
+        self.assertEqual(len(data['merged']), 1)
+        merged = data['merged'][0]
+        self.assertEqual(merged['count'], 5)
+        self.assertEqual(merged['results'], MOCK_RESULTS_LIST * 5)
+        self.assertEqual([(result['distillery']['id'], result['count'])
+                          for result in merged['distilleries']],
+                         [(3, 2), (4, 0), (5, 3), (6, 0)])
+
+    def test_merge_timeout(self):
+        """
+        Tests that a merged search that doesn't finish before the
+        deadline marks each of its Distilleries as timed out.
+        """
+        def find_across(searches, page, page_size):
+            time.sleep(0.5)
+
+        search_query = SearchQuery('test', self.user)
+
+        with patch.dict(MOCK_SETTINGS, {'TIMEOUT': 0.1}):
+            with MOCK_FIND, patch('distilleries.models.Distillery.find_across',
+                                  side_effect=find_across):
+                with LogCapture():
+                    distillery_results_list = DistillerySearchResultsList(
+                        search_query, merge=True)
+
+        merged = distillery_results_list.merged_results[0]
+        self.assertTrue(merged.timed_out)
+        self.assertEqual([
+            result.distillery.pk
+            for result in distillery_results_list.results
+            if result.timed_out
+        ], [3, 4, 5, 6])
+        self.assertEqual(distillery_results_list.count, 2)
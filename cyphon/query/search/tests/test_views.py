@@ -96,6 +96,15 @@ class QueryParamsTestCase(TestCase):
 
         self.assertEqual(params.page_size, DEFAULT_PAGE_SIZE)
 
+    def test_merge_parsing(self):
+        """
+        Tests that the merge parameter is parsed as a boolean.
+        """
+        self.assertFalse(QueryParams().merge)
+        self.assertFalse(QueryParams({'merge': 'meep'}).merge)
+        self.assertTrue(QueryParams({'merge': 'true'}).merge)
+        self.assertTrue(QueryParams({'merge': '1'}).merge)
+
     def test_date_parsing(self):
         """
         Tests that a date is correctly parsed.
@@ -140,6 +149,16 @@ class SearchViewBaseTestCase(CyphonAPITestCase):
         'distilleries.models.Distillery.find',
         return_value={'count': 0, 'results': []},
     )
+    MOCK_FIND_MANY = patch(
+        'distilleries.models.Distillery.find_many',
+        side_effect=lambda searches: [MOCK_RESULTS] * len(searches),
+    )
+    EMPTY_MOCK_FIND_MANY = patch(
+        'distilleries.models.Distillery.find_many',
+        side_effect=lambda searches: [
+            {'count': 0, 'results': []} for _ in searches
+        ],
+    )
 
     def setUp(self):
         self.user = AppUser.objects.get(id=2)
@@ -156,7 +175,7 @@ class SearchViewBaseTestCase(CyphonAPITestCase):
         -------
         rest_framework.response.Response
         """
-        with self.MOCK_FIND:
+        with self.MOCK_FIND, self.MOCK_FIND_MANY:
             return self.get_api_response(url)
 
     def _get_empty_mock_response(self, url):
@@ -171,7 +190,7 @@ class SearchViewBaseTestCase(CyphonAPITestCase):
         -------
         rest_framework.response.Response
         """
-        with self.EMPTY_MOCK_FIND:
+        with self.EMPTY_MOCK_FIND, self.EMPTY_MOCK_FIND_MANY:
             return self.get_api_response(url)
 
     def _is_valid_response(self, response):
@@ -319,6 +338,7 @@ class SearchDistilleriesViewTestCase(SearchViewBaseTestCase):
             'count': 1,
             'next': None,
             'previous': None,
+            'timed_out': False,
             'distillery': {
                 'id': 6,
                 'name': 'elasticsearch.test_index.test_mail',
@@ -338,6 +358,39 @@ class SearchDistilleriesViewTestCase(SearchViewBaseTestCase):
             'Search query is empty.',
         )
 
+    def test_merged_results(self):
+        """
+        Tests that Elasticsearch Distilleries are returned as one merged
+        list of results when the merge parameter is set.
+        """
+        mock_find_across = patch(
+            'distilleries.models.Distillery.find_across',
+            return_value={
+                'count': 2,
+                'results': self.MOCK_RESULTS_LIST * 2,
+                'counts': {6: 2},
+            }
+        )
+        with mock_find_across:
+            response = self._get_mock_response(
+                '?query=%40source%3D%22test_mail%22+something&merge=true'
+            )
+        self._is_valid_response(response)
+        self.assertEqual(response.data['results']['count'], 2)
+        self.assertEqual(response.data['results']['results'], [])
+        merged = response.data['results']['merged']
+        self.assertEqual(len(merged), 1)
+        self.assertEqual(merged[0]['count'], 2)
+        self.assertEqual(merged[0]['results'], self.MOCK_RESULTS_LIST * 2)
+        self.assertEqual(merged[0]['distilleries'], [{
+            'count': 2,
+            'distillery': {
+                'id': 6,
+                'name': 'elasticsearch.test_index.test_mail',
+                'url': 'http://testserver/api/v1/distilleries/6/',
+            },
+        }])
+
 
 class SearchDistilleryViewTestCase(SearchViewBaseTestCase):
     """
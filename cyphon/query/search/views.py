@@ -53,6 +53,7 @@ class QueryParams(object):
         self.page = self._parse_int(params.get('page'), 1)
         self.page_size = self._parse_int(
             params.get('page_size'), DEFAULT_PAGE_SIZE)
+        self.merge = self._parse_bool(params.get('merge'))
 
     @staticmethod
     def _parse_date(date):
@@ -61,6 +62,10 @@ class QueryParams(object):
         except (ValueError, TypeError):
             return None
 
+    @staticmethod
+    def _parse_bool(value):
+        return str(value).lower() in ('true', '1')
+
     @staticmethod
     def _parse_int(integer, default):
         try:
@@ -88,7 +93,7 @@ def search(request):
     if search_query.is_valid():
         search_results = AllSearchResults(
             search_query, page=params.page, page_size=params.page_size,
-            after=params.after, before=params.before)
+            after=params.after, before=params.before, merge=params.merge)
         response['results'] = search_results.as_dict(request)
 
         return Response(response)
@@ -145,7 +150,7 @@ def search_distilleries(request):
     if search_query.is_valid():
         search_results = DistillerySearchResultsList(
             search_query, page=params.page, page_size=params.page_size,
-            after=params.after, before=params.before)
+            after=params.after, before=params.before, merge=params.merge)
         response['results'] = search_results.as_dict(request)
 
         return Response(response)
@@ -24,6 +24,7 @@ import json
 import logging
 import os
 import sys
+import time
 from multiprocessing import Process
 
 # add path to the Cyphon project folder so Cyphon packages can be found
@@ -48,7 +49,9 @@ import six
 
 # local
 from cyphon.documents import DocumentObj
-from cyphon.transaction import close_connection, close_old_connections
+from cyphon import snapshot
+from cyphon.transaction import close_old_connections
+from engines.engine import EngineUnavailable
 from sifter.datasifter.datachutes.models import DataChute
 from sifter.logsifter.logchutes.models import LogChute
 from watchdogs.models import Watchdog
@@ -57,6 +60,14 @@ LOGGER = logging.getLogger('receiver')
 
 BROKER = settings.RABBITMQ
 
+_RECEIVER_SETTINGS = getattr(settings, 'RECEIVER', {})
+
+BATCH_SIZE = _RECEIVER_SETTINGS.get('BATCH_SIZE', 1)
+
+BATCH_TIMEOUT = _RECEIVER_SETTINGS.get('BATCH_TIMEOUT', 1000)
+
+RETRY_DELAY = _RECEIVER_SETTINGS.get('RETRY_DELAY', 5)
+
 
 def create_doc_obj(body):
     """Turn a message str into a |DocumentObj|.
@@ -82,7 +93,7 @@ def create_doc_obj(body):
     return DocumentObj(data=data, doc_id=doc_id, collection=collection)
 
 
-@close_connection
+@close_old_connections
 def process_msg(channel, method, properties, body):
     """Process a message.
 
@@ -123,7 +134,120 @@ def process_msg(channel, method, properties, body):
                          '\'%s\':\n  %s', body, error)
 
 
-def consume_queue(routing_key='watchdogs'):
+@close_old_connections
+def process_batch(channel, messages, routing_key):
+    """Process a batch of messages.
+
+    Parses the messages and processes them together, so that documents
+    can be saved with bulk inserts. Acknowledges the messages once they
+    have been processed.
+
+    If a data store could not be reached before any documents were
+    saved, the messages are requeued after `RECEIVER['RETRY_DELAY']`
+    seconds. Messages that can't be parsed, and batches that fail after
+    some of their documents may have been saved, are rejected without
+    being requeued, so no document is saved twice. Like messages that
+    fail in :func:`~process_msg`, they are logged and dropped, unless a
+    dead-letter exchange has been set for the queue with a RabbitMQ
+    policy.
+
+    Parameters
+    ----------
+    channel : pika.Channel
+
+    messages : |list| of |tuple|
+        A list of (method, properties, body) tuples for the messages
+        received.
+
+    routing_key : str
+        Indicates the type of consumer to use. Options are 'datachutes',
+        'logchutes', 'watchdogs'.
+
+    """
+    consumers = {
+        'datachutes': DataChute.objects.process_many,
+        'logchutes': LogChute.objects.process_many,
+        'watchdogs': Watchdog.objects.process_many,
+    }
+    last_tag = None
+    doc_objs = []
+    bodies = []
+
+    for method, dummy_properties, body in messages:
+        try:
+            doc_objs.append(create_doc_obj(body))
+        except Exception as error:
+            LOGGER.exception('An error occurred while processing the message '
+                             '\'%s\':\n  %s', body, error)
+            channel.basic_nack(delivery_tag=method.delivery_tag,
+                               requeue=False)
+        else:
+            bodies.append(body)
+            last_tag = method.delivery_tag
+
+    if not doc_objs:
+        return
+
+    try:
+        consumers[routing_key](doc_objs)
+    except EngineUnavailable as error:
+        LOGGER.error('A batch of %s messages could not be saved and will be '
+                     'retried in %s sec:\n  %s', len(doc_objs), RETRY_DELAY,
+                     error)
+        time.sleep(RETRY_DELAY)
+        channel.basic_nack(delivery_tag=last_tag, multiple=True,
+                           requeue=True)
+    except Exception as error:
+        LOGGER.exception('An error occurred while processing a batch of %s '
+                         'messages:\n  %s', len(doc_objs), error)
+        for body in bodies:
+            LOGGER.error('The message \'%s\' was rejected', body)
+        channel.basic_nack(delivery_tag=last_tag, multiple=True,
+                           requeue=False)
+    else:
+        channel.basic_ack(delivery_tag=last_tag, multiple=True)
+
+
+def consume_batches(channel, queue_name, routing_key, batch_size,
+                    batch_timeout):
+    """Consume messages from a queue in batches.
+
+    Parameters
+    ----------
+    channel : pika.Channel
+
+    queue_name : str
+        The name of the queue.
+
+    routing_key : str
+        Indicates the type of consumer to use.
+
+    batch_size : int
+        The maximum number of messages in a batch.
+
+    batch_timeout : int
+        The maximum number of milliseconds to wait for a batch to fill
+        after its first message is received.
+
+    """
+    timeout = batch_timeout / 1000.0
+    messages = []
+    started = None
+
+    for message in channel.consume(queue_name, inactivity_timeout=timeout):
+        if message[0] is not None:
+            if not messages:
+                started = time.time()
+            messages.append(message)
+
+        if messages and (len(messages) >= batch_size
+                         or time.time() - started >= timeout):
+            process_batch(channel, messages, routing_key)
+            messages = []
+
+
+def consume_queue(routing_key='watchdogs', batch_size=BATCH_SIZE,
+                  batch_timeout=BATCH_TIMEOUT):
     """Create a queue consumer for RabbitMQ.
 
     Parameters
@@ -131,7 +255,18 @@ def consume_queue(routing_key='watchdogs'):
     routing_key : str
         Options are 'datachutes', 'logchutes', 'watchdogs'.
 
+    batch_size : int
+        The maximum number of messages to process together. If greater
+        than 1, messages are processed in batches and acknowledged after
+        each batch has been saved. Otherwise, each message is
+        acknowledged and then processed on its own.
+
+    batch_timeout : int
+        The maximum number of milliseconds to wait for a batch to fill.
+
     """
+    snapshot.activate()
+
     try:
         credentials = pika.PlainCredentials(username=BROKER['USERNAME'],
                                             password=BROKER['PASSWORD'])
@@ -160,10 +295,14 @@ def consume_queue(routing_key='watchdogs'):
 
         LOGGER.info('Waiting for messages')
         # print(' [*] Waiting for messages. To exit press CTRL+C')
-        channel.basic_qos(prefetch_count=1)
-        channel.basic_consume(process_msg, queue=queue_name)
-
-        channel.start_consuming()
+        if batch_size > 1:
+            channel.basic_qos(prefetch_count=batch_size)
+            consume_batches(channel, queue_name, routing_key, batch_size,
+                            batch_timeout)
+        else:
+            channel.basic_qos(prefetch_count=1)
+            channel.basic_consume(process_msg, queue=queue_name)
+            channel.start_consuming()
 
     except Exception as error:
         LOGGER.exception('An error occurred while consuming messages:\n  %s',
@@ -171,7 +310,8 @@ def consume_queue(routing_key='watchdogs'):
 
 
 @close_old_connections
-def create_consumers(routing_key, num):
+def create_consumers(routing_key, num, batch_size=BATCH_SIZE,
+                     batch_timeout=BATCH_TIMEOUT):
     """Create one or more queue consumers.
 
     Parameters
@@ -184,8 +324,18 @@ def create_consumers(routing_key, num):
         A string representation of an integer representing the number of
         consumers to spawn.
 
+    batch_size : int
+        The maximum number of messages each consumer processes together.
+
+    batch_timeout : int
+        The maximum number of milliseconds to wait for a batch to fill.
+
     """
-    kwargs = {'routing_key': routing_key}
+    kwargs = {
+        'routing_key': routing_key,
+        'batch_size': batch_size,
+        'batch_timeout': batch_timeout,
+    }
     for dummy_num in range(num):
         process = Process(target=consume_queue, kwargs=kwargs)
         process.start()
@@ -200,5 +350,13 @@ if __name__ == '__main__':
         _NUM = int(sys.argv[2])
     except (IndexError, ValueError):
         _NUM = 1
+    try:
+        _BATCH_SIZE = int(sys.argv[3])
+    except (IndexError, ValueError):
+        _BATCH_SIZE = BATCH_SIZE
+    try:
+        _BATCH_TIMEOUT = int(sys.argv[4])
+    except (IndexError, ValueError):
+        _BATCH_TIMEOUT = BATCH_TIMEOUT
 
-    create_consumers(_ROUTING_KEY, _NUM)
+    create_consumers(_ROUTING_KEY, _NUM, _BATCH_SIZE, _BATCH_TIMEOUT)
@@ -34,7 +34,14 @@ from testfixtures import LogCapture
 
 # local
 from cyphon.documents import DocumentObj
-from receiver.receiver import create_doc_obj, process_msg, LOGGER
+from engines.engine import EngineUnavailable
+from receiver.receiver import (
+    consume_batches,
+    create_doc_obj,
+    process_batch,
+    process_msg,
+    LOGGER,
+)
 from tests.fixture_manager import get_fixtures
 
 LOGGER.removeHandler('console')
@@ -140,3 +147,119 @@ class ProcessMsgTestCase(TransactionTestCase):
                          '"foobar"}\':\n'
                          '  foo'),
                     )
+
+
+class ProcessBatchTestCase(TransactionTestCase):
+    """
+    Tests the process_batch and consume_batches functions.
+    """
+
+    fixtures = get_fixtures(['logchutes'])
+
+    doc = {
+        'message': 'foobar',
+        '@uuid': '12345',
+        'collection': 'elasticsearch.test_index.test_logs'
+    }
+    msg = bytes(json.dumps(doc), 'utf-8')
+
+    def setUp(self):
+        logging.disable(logging.ERROR)
+        self.channel = Mock()
+        self.messages = [
+            (Mock(delivery_tag=1), None, self.msg),
+            (Mock(delivery_tag=2), None, self.msg),
+        ]
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    @patch('receiver.receiver.LogChute.objects.process_many')
+    def test_process_batch(self, mock_process):
+        """
+        Tests that a batch is processed together and acknowledged.
+        """
+        process_batch(self.channel, self.messages, 'logchutes')
+        doc_objs = mock_process.call_args[0][0]
+        self.assertEqual(len(doc_objs), 2)
+        self.assertEqual(doc_objs[0].doc_id, '12345')
+        self.channel.basic_ack.assert_called_once_with(delivery_tag=2,
+                                                       multiple=True)
+        self.assertFalse(self.channel.basic_nack.called)
+
+    @patch('receiver.receiver.LogChute.objects.process_many')
+    def test_process_batch_bad_msg(self, mock_process):
+        """
+        Tests that a malformed message is rejected and the rest of the
+        batch is processed.
+        """
+        self.messages[0] = (Mock(delivery_tag=1), None, b'foo')
+        process_batch(self.channel, self.messages, 'logchutes')
+        doc_objs = mock_process.call_args[0][0]
+        self.assertEqual(len(doc_objs), 1)
+        self.channel.basic_nack.assert_called_once_with(delivery_tag=1,
+                                                        requeue=False)
+        self.channel.basic_ack.assert_called_once_with(delivery_tag=2,
+                                                       multiple=True)
+
+    @patch('receiver.receiver.LogChute.objects.process_many')
+    def test_process_batch_all_bad(self, mock_process):
+        """
+        Tests that nothing is acknowledged if no message can be parsed.
+        """
+        messages = [(Mock(delivery_tag=1), None, b'foo')]
+        process_batch(self.channel, messages, 'logchutes')
+        self.assertFalse(mock_process.called)
+        self.assertFalse(self.channel.basic_ack.called)
+        self.channel.basic_nack.assert_called_once_with(delivery_tag=1,
+                                                        requeue=False)
+
+    @patch('receiver.receiver.LogChute.objects.process_many',
+           side_effect=Exception('foo'))
+    def test_process_batch_error(self, mock_process):
+        """
+        Tests that a batch is rejected without being requeued if it
+        can't be processed, so saved documents aren't saved again.
+        """
+        process_batch(self.channel, self.messages, 'logchutes')
+        self.channel.basic_nack.assert_called_once_with(
+            delivery_tag=2, multiple=True, requeue=False)
+        self.assertFalse(self.channel.basic_ack.called)
+
+    @patch('receiver.receiver.time.sleep')
+    @patch('receiver.receiver.LogChute.objects.process_many',
+           side_effect=EngineUnavailable('foo'))
+    def test_process_batch_unavailable(self, mock_process, mock_sleep):
+        """
+        Tests that a batch is requeued if a data store could not be
+        reached before any documents were saved.
+        """
+        process_batch(self.channel, self.messages, 'logchutes')
+        self.assertTrue(mock_sleep.called)
+        self.channel.basic_nack.assert_called_once_with(
+            delivery_tag=2, multiple=True, requeue=True)
+        self.assertFalse(self.channel.basic_ack.called)
+
+    @patch('receiver.receiver.process_batch')
+    def test_consume_batches_size(self, mock_process):
+        """
+        Tests that a batch is processed when it is full.
+        """
+        self.channel.consume.return_value = iter(self.messages * 2)
+        consume_batches(self.channel, 'logchutes', 'logchutes',
+                        batch_size=2, batch_timeout=60000)
+        self.assertEqual(mock_process.call_count, 2)
+        mock_process.assert_called_with(self.channel, self.messages,
+                                        'logchutes')
+
+    @patch('receiver.receiver.process_batch')
+    def test_consume_batches_timeout(self, mock_process):
+        """
+        Tests that a partial batch is processed after a timeout.
+        """
+        self.channel.consume.return_value = iter(
+            self.messages[:1] + [(None, None, None)])
+        consume_batches(self.channel, 'logchutes', 'logchutes',
+                        batch_size=10, batch_timeout=0)
+        mock_process.assert_called_once_with(self.channel, self.messages[:1],
+                                             'logchutes')
@@ -19,6 +19,7 @@
 """
 
 # standard library
+from collections import OrderedDict
 import logging
 
 # third party
@@ -28,6 +29,9 @@ from django.utils.functional import cached_property
 
 # local
 from cyphon.models import SelectRelatedManager, FindEnabledMixin
+from engines.engine import EngineUnavailable
+from cyphon.snapshot import get_active_snapshot
+from sifter.sieves.compiled import get_multi_sieve
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -81,6 +85,31 @@ class ChuteManager(SelectRelatedManager, FindEnabledMixin):
         """
         return self.settings['DEFAULT_MUNGER_ENABLED'] and self._default_munger
 
+    def _get_enabled_chutes(self):
+        """
+        Returns the enabled Chutes, from the active configuration
+        snapshot if there is one.
+        """
+        snapshot = get_active_snapshot()
+        if snapshot is not None:
+            chutes = snapshot.get_enabled_chutes(self.model)
+            if chutes is not None:
+                return chutes
+        return self.find_enabled()
+
+    @staticmethod
+    def _get_matching_chutes(chutes, doc_obj):
+        """
+        Takes a list of enabled Chutes and a DocumentObj and returns the
+        Chutes whose Sieves match the document. All Sieves are matched
+        in a single pass, so fields and Rules shared by several Chutes
+        are only examined once.
+        """
+        if not chutes:
+            return []
+        matcher = get_multi_sieve(chutes)
+        return [chutes[index] for index in matcher.get_matches(doc_obj.data)]
+
     def _process_with_default(self, doc_obj):
         """
 
@@ -91,17 +120,58 @@ class ChuteManager(SelectRelatedManager, FindEnabledMixin):
         """
 
         """
-        enabled_chutes = self.find_enabled()
+        enabled_chutes = list(self._get_enabled_chutes())
         saved = False
 
-        for chute in enabled_chutes:
-            result = chute.process(doc_obj)
+        for chute in self._get_matching_chutes(enabled_chutes, doc_obj):
+            result = chute._munge(chute._prepare(doc_obj))
             if result:
                 saved = True
 
         if not saved and self._default_munger_enabled:
             self._process_with_default(doc_obj)
 
+    def process_many(self, doc_objs):
+        """
+        Takes a list of DocumentObjs and processes them with the enabled
+        Chutes. Documents matched by Chutes that share a Munger are
+        condensed and saved together with a bulk insert. Documents that
+        match no Chute are processed with the default Munger, if it is
+        enabled.
+
+        Raises EngineUnavailable if a data store could not be reached
+        before any documents were saved, so the caller can retry them.
+        Raises other exceptions if some documents may have been saved.
+        """
+        enabled_chutes = list(self._get_enabled_chutes())
+        batches = OrderedDict()
+
+        for doc_obj in doc_objs:
+            matched = False
+
+            for chute in self._get_matching_chutes(enabled_chutes, doc_obj):
+                # Chutes may add info to the document they prepare, so
+                # each Chute gets its own DocumentObj
+                batch = batches.setdefault(chute.munger, [])
+                batch.append(chute._prepare(doc_obj.derive(doc_obj.data)))
+                matched = True
+
+            if not matched and self._default_munger_enabled:
+                batches.setdefault(self._default_munger, []).append(doc_obj)
+
+        saved = False
+
+        for munger, batch in batches.items():
+            try:
+                munger.process_many(batch)
+            except EngineUnavailable as error:
+                if not saved:
+                    raise
+                # retrying would save the earlier batches again
+                raise RuntimeError('Documents were saved before the error: '
+                                   '%s' % error) from error
+            saved = True
+
 
 class Chute(models.Model):
     """
@@ -130,10 +200,26 @@ class Chute(models.Model):
         returns False.
         """
         if self.sieve:
-            return self.sieve.is_match(data)
+            return self.sieve.get_compiled().is_match(data)
         else:
             return True
 
+    def _prepare(self, doc_obj):
+        """
+        Takes a DocumentObj that matches the Chute's sieve and returns
+        the DocumentObj to be processed by the Chute's munger. Derived
+        classes can override this method to add info to the document.
+        """
+        return doc_obj
+
+    def matches(self, doc_obj):
+        """
+        Takes a DocumentObj and returns True if the Chute is enabled and
+        the document matches the rules defined by the Chute's sieve.
+        Otherwise, returns False.
+        """
+        return self.enabled and self._is_match(doc_obj.data)
+
     def _munge(self, doc_obj):
         """
         Takes a DocumentObj, processes the data with the Chute's munger,
@@ -148,8 +234,8 @@ class Chute(models.Model):
         munger and returns the document id of the distilled document.
         Otherwise, returns None.
         """
-        if self.enabled and self._is_match(doc_obj.data):
-            return self._munge(doc_obj)
+        if self.matches(doc_obj):
+            return self._munge(self._prepare(doc_obj))
 
     def thread_process(self, queue, **kwargs):
         """
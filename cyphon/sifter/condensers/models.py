@@ -27,6 +27,7 @@ import logging
 
 # third party
 from django.db import models
+from django.db.models import prefetch_related_objects
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.core.exceptions import ValidationError
 from django.utils.translation import ugettext_lazy as _
@@ -34,6 +35,8 @@ from django.utils.translation import ugettext_lazy as _
 # local
 from bottler.bottles.models import Bottle, BottleField
 from parsers.models import Parser
+from sifter.condensers.plans import CondenserPlan, clear_cache, get_plan
+from utils.caches.caches import clear_on_change
 
 LOGGER = logging.getLogger(__name__)
 
@@ -90,6 +93,10 @@ class Condenser(models.Model):
         Takes a dictionary of data (e.g., of a social media post) and a
         Condenser. Returns a dictionary that distills the data
         using the crosswalk defined by the Condenser.
+
+        This walks the Condenser's Fittings through the ORM. The
+        :meth:`~Condenser.process` method uses a precompiled
+        |CondenserPlan| instead.
         """
         custom_doc = {}
 
@@ -107,13 +114,52 @@ class Condenser(models.Model):
 
         return custom_doc
 
+    def _get_plan_steps(self, path=()):
+        """
+        Takes a tuple of field names leading to the Condenser's place in
+        the condensed document, and returns a list of (path, parser)
+        steps for a |CondenserPlan|. Embedded Condensers are flattened
+        into the list.
+        """
+        prefetch_related_objects([self], 'fittings__content_type',
+                                 'fittings__target_field',
+                                 'fittings__field_parser')
+        steps = []
+
+        for fitting in self.fittings.all():
+            target_path = path + (fitting.target_field_name,)
+
+            if fitting.is_parser():
+                steps.append((target_path, fitting.field_parser))
+
+            # if the field represents another Bottle, flatten its steps
+            else:
+                steps.append((target_path, None))
+                steps.extend(
+                    fitting.field_parser._get_plan_steps(target_path))
+
+        return steps
+
+    def compile(self):
+        """
+        Returns a |CondenserPlan| that condenses data in the same way
+        as the Condenser, without querying the database.
+        """
+        return CondenserPlan(name=self.name, steps=self._get_plan_steps())
+
+    def get_plan(self):
+        """
+        Returns a cached |CondenserPlan| for the Condenser.
+        """
+        return get_plan(self)
+
     def process(self, data, **kwargs):
         """
         Takes a dictionary of data (e.g., of a social media post) and a
         Condenser. Returns a dictionary that distills the data
         using the crosswalk defined by the Condenser.
         """
-        return self._condense(data=data, condenser=self, **kwargs)
+        return self.get_plan().process(data, **kwargs)
 
 
 class Fitting(models.Model):
@@ -261,3 +307,8 @@ class Fitting(models.Model):
         # method to handle data, since the field_parser can be either a
         # Condenser or a Parser
         return self.field_parser.process(data, *args, **kwargs)
+
+
+# discard cached CondenserPlans when their models change
+clear_on_change(clear_cache, (Condenser, Fitting, Parser, BottleField),
+                dispatch_uid='condensers.clear_plans')
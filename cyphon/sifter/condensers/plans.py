@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2018 Dunbar Security Solutions, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+"""
+Provides precompiled plans for running Condensers without the ORM.
+
+A |Condenser| is made of Fittings, each of which refers to a Parser or
+to another Condenser for an embedded document. Walking those Fittings
+for every document requires several queries. A |CondenserPlan| flattens
+the Condenser into a list of steps once, so that documents can be
+condensed in memory.
+
+==========================  ============================================
+Class                       Description
+==========================  ============================================
+:class:`~CondenserPlan`     A flat, in-memory version of a Condenser.
+==========================  ============================================
+
+==========================  ============================================
+Function                    Description
+==========================  ============================================
+:func:`~get_plan`           Get a cached |CondenserPlan| for a Condenser.
+:func:`~clear_cache`        Discard all cached |CondenserPlans|.
+==========================  ============================================
+
+"""
+
+# third party
+from django.conf import settings
+
+# local
+from utils.caches.caches import TimedCache
+
+_CONDENSER_SETTINGS = getattr(settings, 'CONDENSERS', {})
+
+_CACHE_TIMEOUT = _CONDENSER_SETTINGS.get('CACHE_TIMEOUT', 60)
+
+_CACHE = TimedCache(_CACHE_TIMEOUT)
+
+
+class CondenserPlan(object):
+    """A flat, in-memory version of a |Condenser|.
+
+    Parameters
+    ----------
+    name : str
+        The name of the Condenser.
+
+    steps : |list| of |tuple|
+        A list of (path, parser) tuples, in the order in which the
+        Condenser's Fittings are applied. The path is a |tuple| of
+        field names leading to the field in the condensed document.
+        The parser is a Parser whose `process` method returns the value
+        for that field, or |None| if the field is an embedded document.
+
+    """
+
+    __slots__ = ('name', 'steps')
+
+    def __init__(self, name, steps):
+        self.name = name
+        self.steps = steps
+
+    def __repr__(self):
+        return '<%s: %s>' % (self.__class__.__name__, self.name)
+
+    def process(self, data, **kwargs):
+        """
+        Takes a dictionary of data (e.g., of a social media post) and
+        returns a dictionary that distills the data using the crosswalk
+        defined by the Condenser.
+        """
+        custom_doc = {}
+
+        for path, parser in self.steps:
+            target = custom_doc
+            for field_name in path[:-1]:
+                target = target[field_name]
+
+            if parser is None:
+                target[path[-1]] = {}
+            else:
+                target[path[-1]] = parser.process(data, **kwargs)
+
+        return custom_doc
+
+
+def _get_cache_key(condenser):
+    """
+    Takes a Condenser and returns a key for caching its plan.
+    """
+    return (condenser._meta.label_lower, condenser.pk)
+
+
+def get_plan(condenser):
+    """Get a |CondenserPlan| for a Condenser.
+
+    Plans are cached for the life of the process, and are rebuilt when
+    a Condenser, Fitting, Parser, or BottleField is saved or deleted in
+    the same process, or after `CONDENSERS['CACHE_TIMEOUT']` seconds to
+    pick up changes made by other processes.
+
+    Parameters
+    ----------
+    condenser : |Condenser|
+        The Condenser to compile.
+
+    Returns
+    -------
+    |CondenserPlan|
+        An in-memory version of the Condenser.
+
+    """
+    if condenser.pk is None:
+        return condenser.compile()
+
+    return _CACHE.get(_get_cache_key(condenser), condenser.compile)
+
+
+def clear_cache():
+    """Discard all cached |CondenserPlans|."""
+    _CACHE.clear()
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2018 Dunbar Security Solutions, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+"""
+Tests the CondenserPlan class.
+"""
+
+# standard library
+from unittest import TestCase
+try:
+    from unittest.mock import Mock, patch
+except ImportError:
+    from mock import Mock, patch
+
+# local
+from sifter.condensers import plans
+from sifter.condensers.plans import CondenserPlan
+
+
+class CondenserPlanTestCase(TestCase):
+    """
+    Tests the CondenserPlan class.
+    """
+
+    def test_process(self):
+        """
+        Tests the process method for a plan with an embedded document.
+        """
+        parser_1 = Mock()
+        parser_1.process.return_value = 'foo'
+        parser_2 = Mock()
+        parser_2.process.return_value = 'bar'
+        plan = CondenserPlan('test', steps=[
+            (('message',), parser_1),
+            (('content',), None),
+            (('content', 'host'), parser_2),
+        ])
+        actual = plan.process('data', company=1)
+        expected = {'message': 'foo', 'content': {'host': 'bar'}}
+        self.assertEqual(actual, expected)
+        parser_1.process.assert_called_once_with('data', company=1)
+
+    def test_process_empty_embedded_doc(self):
+        """
+        Tests the process method for an embedded document with no
+        fields.
+        """
+        plan = CondenserPlan('test', steps=[(('content',), None)])
+        self.assertEqual(plan.process('data'), {'content': {}})
+
+
+class GetPlanTestCase(TestCase):
+    """
+    Tests the get_plan function.
+    """
+
+    def setUp(self):
+        plans.clear_cache()
+        self.condenser = Mock(pk=1)
+        self.condenser._meta.label_lower = 'logcondensers.logcondenser'
+
+    def tearDown(self):
+        plans.clear_cache()
+
+    def test_cached(self):
+        """
+        Tests that a plan is only compiled once.
+        """
+        plan = plans.get_plan(self.condenser)
+        self.assertIs(plans.get_plan(self.condenser), plan)
+        self.assertEqual(self.condenser.compile.call_count, 1)
+
+    def test_unsaved(self):
+        """
+        Tests that a plan for an unsaved Condenser is not cached.
+        """
+        self.condenser.pk = None
+        plans.get_plan(self.condenser)
+        plans.get_plan(self.condenser)
+        self.assertEqual(self.condenser.compile.call_count, 2)
+
+    @patch.object(plans._CACHE, 'timeout', 0)
+    def test_expired(self):
+        """
+        Tests that a plan is rebuilt once the cache expires.
+        """
+        plans.get_plan(self.condenser)
+        plans.get_plan(self.condenser)
+        self.assertEqual(self.condenser.compile.call_count, 2)
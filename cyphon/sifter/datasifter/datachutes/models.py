@@ -73,15 +73,19 @@ class DataChute(Chute):
 
     def bulk_process(self, data):
         """
-
+        Takes a list of data dictionaries and processes the ones that
+        match the Chute's sieve with the Chute's munger. Matching
+        documents are condensed and saved together with a bulk insert.
         """
-        for doc in data:
-            doc_obj = DocumentObj(data=doc)
-            self.process(doc_obj)
+        doc_objs = [DocumentObj(data=doc) for doc in data]
+        matches = [self._prepare(doc_obj) for doc_obj in doc_objs
+                   if self.matches(doc_obj)]
+        if matches:
+            return self.munger.process_many(matches)
 
-    def process(self, doc_obj):
+    def _prepare(self, doc_obj):
         """
         Overrides the parent method to add platform info to the data.
         """
         doc_obj.platform = self._platform_name
-        return super(DataChute, self).process(doc_obj)
+        return doc_obj
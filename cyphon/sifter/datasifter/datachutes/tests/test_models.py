@@ -21,15 +21,16 @@ Tests the DataChute class.
 # standard library
 import logging
 try:
-    from unittest.mock import Mock, call, patch
+    from unittest.mock import Mock, patch
 except ImportError:
-    from mock import Mock, call, patch
+    from mock import Mock, patch
 
 # third party
 from django.test import TestCase
 
 # local
 from cyphon.documents import DocumentObj
+from engines.engine import EngineUnavailable
 from sifter.datasifter.datachutes.models import DataChute
 from tests.fixture_manager import get_fixtures
 
@@ -52,21 +53,72 @@ class DataChuteTestCase(TestCase):
     def tearDown(self):
         logging.disable(logging.NOTSET)
 
-    @patch('sifter.datasifter.datachutes.models.DataChute.process')
-    def test_bulk_process(self, mock_process):
+    def test_bulk_process(self):
         """
         Tests the bulk_process method for a chute.
         """
-        data_1 = {}
-        data_2 = {}
-        mock_doc_1 = Mock()
-        mock_doc_2 = Mock()
-        with patch('sifter.datasifter.datachutes.models.DocumentObj',
-                   side_effect=[[mock_doc_1], [mock_doc_2]]) as mock_doc:
-            datachute = DataChute.objects.get(pk=1)
-            datachute.bulk_process([data_1, data_2])
-            mock_doc.has_calls([call(data_1), call(data_2)])
-            mock_process.has_calls([call(mock_doc_1), call(mock_doc_2)])
+        data_1 = {'id': 1, 'subject': 'This is a Critical Alert'}
+        data_2 = {'id': 2, 'Subject': 'This is an Urgent Alert'}
+        data_3 = {'id': 3, 'subject': 'This is another Critical Alert'}
+
+        datachute = DataChute.objects.get(pk=3)
+        datachute.munger.process_many = Mock()
+        datachute.bulk_process([data_1, data_2, data_3])
+
+        args = datachute.munger.process_many.call_args[0]
+        self.assertEqual([doc_obj.data for doc_obj in args[0]],
+                         [data_1, data_3])
+        self.assertEqual(args[0][0].platform, datachute._platform_name)
+
+    def test_bulk_process_no_matches(self):
+        """
+        Tests the bulk_process method when no documents match the
+        chute's sieve.
+        """
+        data = {'id': 1, 'Subject': 'This is an Urgent Alert'}
+
+        datachute = DataChute.objects.get(pk=3)
+        datachute.munger.process_many = Mock()
+        datachute.bulk_process([data])
+
+        self.assertFalse(datachute.munger.process_many.called)
+
+    def test_process_many_platforms(self):
+        """
+        Tests that a document matched by DataChutes for different
+        platforms is saved with each DataChute's platform.
+        """
+        data = {'id': 1, 'subject': 'This is a Critical Alert'}
+        chutes = [DataChute.objects.get(pk=3), DataChute.objects.get(pk=4)]
+        platform_name = property(lambda chute: 'platform_%s' % chute.pk)
+
+        with patch.object(DataChute.objects, '_get_enabled_chutes',
+                          return_value=chutes):
+            with patch.object(DataChute, '_platform_name', platform_name):
+                with patch('sifter.datasifter.datachutes.models.'
+                           'DataMunger.process_many') as mock_process_many:
+                    DataChute.objects.process_many([DocumentObj(data=data)])
+
+        batch = mock_process_many.call_args[0][0]
+        self.assertEqual([doc_obj.platform for doc_obj in batch],
+                         ['platform_3', 'platform_4'])
+        self.assertEqual([doc_obj.data for doc_obj in batch], [data, data])
+
+    def test_process_many_unavailable(self):
+        """
+        Tests that an error from a data store that couldn't be reached
+        is passed on if no documents were saved, so they can be retried.
+        """
+        data = {'id': 1, 'subject': 'This is a Critical Alert'}
+        chutes = [DataChute.objects.get(pk=3)]
+
+        with patch.object(DataChute.objects, '_get_enabled_chutes',
+                          return_value=chutes):
+            with patch('sifter.datasifter.datachutes.models.'
+                       'DataMunger.process_many',
+                       side_effect=EngineUnavailable('foo')):
+                with self.assertRaises(EngineUnavailable):
+                    DataChute.objects.process_many([DocumentObj(data=data)])
 
     def test_process_match(self):
         """
@@ -88,6 +88,58 @@ class DataSieveTestCase(TestCase):
         data = {'subject': 'this is a critical alert'}
         self.assertFalse(self.datasieve.is_match(data))
 
+    def test_compile(self):
+        """
+        Tests that the compile method returns a CompiledSieve that
+        agrees with the is_match method.
+        """
+        docs = [
+            {'subject': 'this is a critical alert'},
+            {'subject': 'this is an urgent alert'},
+            {'subject': 'this is an urgent notice'},
+        ]
+        for logic in ['AND', 'OR']:
+            self.datasieve.logic = logic
+            compiled = self.datasieve.compile()
+            for data in docs:
+                self.assertEqual(compiled.is_match(data),
+                                 self.datasieve.is_match(data))
+
+    def test_compile_no_queries(self):
+        """
+        Tests that a CompiledSieve does not query the database.
+        """
+        compiled = self.datasieve.compile()
+        with self.assertNumQueries(0):
+            compiled.is_match({'subject': 'this is a critical alert'})
+
+    def test_compile_shared_fields(self):
+        """
+        Tests that compiled Rules are identified by their fields and
+        keys so they can be shared by a MultiSieve.
+        """
+        for rule in DataRule.objects.all():
+            compiled = rule.compile()
+            self.assertEqual(compiled.key, ('datasieves.datarule', rule.pk))
+            self.assertEqual(compiled.field[1], rule.field_name)
+            if rule.operator == 'CharField:x' and not rule.is_regex:
+                self.assertEqual(compiled.literal,
+                                 (rule.value, rule.case_sensitive))
+            else:
+                self.assertIsNone(compiled.literal)
+
+    def test_get_compiled(self):
+        """
+        Tests that the get_compiled method caches the CompiledSieve
+        until a related Rule is saved.
+        """
+        compiled = self.datasieve.get_compiled()
+        self.assertIs(self.datasieve.get_compiled(), compiled)
+
+        rule = DataRule.objects.get(pk=2)
+        rule.save()
+        self.assertIsNot(self.datasieve.get_compiled(), compiled)
+
 
 class DataSieveNodeTestCase(TestCase):
     """
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2018 Dunbar Security Solutions, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+"""
+Benchmarks matching log messages against many LogChutes, one Chute at
+a time and with a combined matcher.
+
+Run with::
+
+    python manage.py test sifter.logsifter.logchutes.tests -p "benchmark_*.py"
+
+"""
+
+# third party
+from django.test import TestCase
+
+# local
+from cyphon.documents import DocumentObj
+from sifter.logsifter.logchutes.models import LogChute
+from sifter.logsifter.logmungers.models import LogMunger
+from sifter.logsifter.logsieves.models import LogRule, LogSieve, LogSieveNode
+from tests.fixture_manager import get_fixtures
+from utils.performance.benchmark import get_rate, report
+
+
+class MultiSieveBenchmark(TestCase):
+    """
+    Compares matching log messages against 120 LogChutes one Chute at
+    a time with matching them in a single pass.
+    """
+    fixtures = get_fixtures(['logchutes'])
+
+    CHUTES = 120
+    MESSAGES = 2000
+
+    @classmethod
+    def setUpTestData(cls):
+        munger = LogMunger.objects.get(name='default_log')
+        shared_rule = LogRule.objects.create(
+            name='benchmark_error',
+            operator='CharField:x',
+            value='error'
+        )
+        LogChute.objects.all().delete()
+
+        for i in range(cls.CHUTES):
+            sieve = LogSieve.objects.create(name='benchmark_%s' % i)
+            rule = LogRule.objects.create(
+                name='benchmark_host_%s' % i,
+                operator='CharField:x',
+                value='host-%03d ' % i
+            )
+            LogSieveNode.objects.create(sieve=sieve, node_object=shared_rule)
+            LogSieveNode.objects.create(sieve=sieve, node_object=rule)
+            LogChute.objects.create(sieve=sieve, munger=munger)
+
+    def test_messages_per_second(self):
+        """
+        Reports messages/sec for matching each LogChute separately and
+        for matching all LogChutes in a single pass.
+        """
+        doc_objs = [
+            DocumentObj(data='%s host-%03d sshd[%s]: %s for user %s' % (
+                'Jan 1 00:00:00', i % (self.CHUTES * 2), i,
+                'error' if i % 4 == 0 else 'accepted', i))
+            for i in range(self.MESSAGES)
+        ]
+        chutes = list(LogChute.objects.find_enabled())
+        get_matching_chutes = LogChute.objects._get_matching_chutes
+
+        def match_each(doc_obj):
+            """Matches a document against each LogChute."""
+            return [chute for chute in chutes if chute.matches(doc_obj)]
+
+        def match_all(doc_obj):
+            """Matches a document against all LogChutes at once."""
+            return get_matching_chutes(chutes, doc_obj)
+
+        for doc_obj in doc_objs:
+            self.assertEqual(match_all(doc_obj), match_each(doc_obj))
+
+        results = [
+            ('per Chute', get_rate(match_each, doc_objs)),
+            ('combined', get_rate(match_all, doc_objs)),
+        ]
+        report('%s LogChutes' % self.CHUTES, results, unit='messages/sec')
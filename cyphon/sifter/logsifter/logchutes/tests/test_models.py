@@ -29,6 +29,7 @@ from django.test import TestCase
 from testfixtures import LogCapture
 
 # local
+from cyphon.documents import DocumentObj
 from sifter.logsifter.logchutes.models import LogChute
 from sifter.logsifter.logmungers.models import LogMunger
 from tests.fixture_manager import get_fixtures
@@ -100,3 +101,61 @@ class LogChuteTestCase(TestCase):
                      'ERROR',
                      'Default LogMunger "dummy_munger" is not configured.'),
                 )
+
+    def test_process(self):
+        """
+        Tests the process method for a document that matches a
+        LogChute.
+        """
+        mock_config = {
+            'DEFAULT_MUNGER': 'default_log',
+            'DEFAULT_MUNGER_ENABLED': True
+        }
+        critical = DocumentObj(data='this is a critical alert')
+
+        with patch.dict('sifter.logsifter.logchutes.models.conf.LOGSIFTER',
+                        mock_config):
+            with patch('sifter.logsifter.logmungers.models.LogMunger.'
+                       'process', return_value='id_123') as mock_process:
+                LogChute.objects.process(critical)
+                mock_process.assert_called_once_with(critical)
+
+    def test_process_default(self):
+        """
+        Tests the process method for a document that doesn't match a
+        LogChute.
+        """
+        mock_config = {
+            'DEFAULT_MUNGER': 'default_log',
+            'DEFAULT_MUNGER_ENABLED': True
+        }
+        other = DocumentObj(data='this is something else')
+
+        with patch.dict('sifter.logsifter.logchutes.models.conf.LOGSIFTER',
+                        mock_config):
+            with patch('sifter.logsifter.logchutes.models.LogChuteManager.'
+                       '_process_with_default') as mock_default:
+                LogChute.objects.process(other)
+                mock_default.assert_called_once_with(other)
+
+    def test_process_many(self):
+        """
+        Tests the process_many method.
+        """
+        mock_config = {
+            'DEFAULT_MUNGER': 'default_log',
+            'DEFAULT_MUNGER_ENABLED': True
+        }
+        critical = DocumentObj(data='this is a critical alert')
+        test = DocumentObj(data='this is a test')
+        other = DocumentObj(data='this is something else')
+
+        with patch.dict('sifter.logsifter.logchutes.models.conf.LOGSIFTER',
+                        mock_config):
+            with patch('sifter.logsifter.logmungers.models.LogMunger.'
+                       'process_many') as mock_process:
+                LogChute.objects.process_many([critical, test, other])
+                self.assertEqual(mock_process.call_count, 2)
+                mock_process.assert_any_call([critical, test])
+                mock_process.assert_any_call([other])
+
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2018 Dunbar Security Solutions, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+"""
+Benchmarks condensing log lines with and without a precompiled plan.
+
+Run with::
+
+    python manage.py test sifter.logsifter.logcondensers.tests -p "benchmark_*.py"
+
+"""
+
+# third party
+from django.contrib.contenttypes.models import ContentType
+from django.test import TestCase
+
+# local
+from bottler.bottles.models import Bottle, BottleField
+from sifter.logsifter.logcondensers.models import (
+    LogCondenser,
+    LogFitting,
+    LogParser,
+)
+from utils.performance.benchmark import get_rate, report
+
+
+class CondenserPlanBenchmark(TestCase):
+    """
+    Compares a 30-fitting LogCondenser run through the ORM with its
+    precompiled plan.
+    """
+
+    FITTINGS = 30
+    LINES = 100000
+    ORM_LINES = 1000
+
+    METHODS = [
+        ('COPY', None),
+        ('SUBSTRING', r'host=(\S+)'),
+        ('P/A', r'error'),
+        ('COUNT', r'\d+'),
+        ('SUBSTRING', r'user=(\w+)'),
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        bottle = Bottle.objects.create(name='benchmark_log')
+        cls.condenser = LogCondenser.objects.create(name='benchmark_log',
+                                                    bottle=bottle)
+        parser_type = ContentType.objects.get_for_model(LogParser)
+
+        for i in range(cls.FITTINGS):
+            field = BottleField.objects.create(
+                field_name='benchmark_field_%s' % i,
+                field_type='CharField'
+            )
+            bottle.fields.add(field)
+            method, regex = cls.METHODS[i % len(cls.METHODS)]
+            parser = LogParser.objects.create(
+                name='benchmark_parser_%s' % i,
+                method=method,
+                regex=regex
+            )
+            LogFitting.objects.create(
+                condenser=cls.condenser,
+                target_field=field,
+                content_type=parser_type,
+                object_id=parser.pk
+            )
+
+    def test_lines_per_second(self):
+        """
+        Reports lines/sec for ORM and precompiled condensing.
+        """
+        lines = [
+            '<134>Mar 29 13:02:%02d host=web-%s user=user%s status=%s %s'
+            % (i % 60, i % 7, i % 13, 200 + i % 5,
+               'error' if i % 10 == 0 else 'ok')
+            for i in range(self.LINES)
+        ]
+        # compile from a separate instance, so the ORM path doesn't
+        # benefit from the Fittings prefetched for the plan
+        plan = LogCondenser.objects.get(pk=self.condenser.pk).compile()
+
+        def condense_with_orm(line):
+            """Condenses a line by walking the Fittings."""
+            return self.condenser._condense(line, self.condenser)
+
+        for line in lines[:10]:
+            self.assertEqual(plan.process(line), condense_with_orm(line))
+
+        results = [
+            ('ORM', get_rate(condense_with_orm, lines[:self.ORM_LINES],
+                             repeat=1)),
+            ('plan', get_rate(plan.process, lines, repeat=1)),
+        ]
+        report('30-fitting LogCondenser', results, unit='lines/sec')
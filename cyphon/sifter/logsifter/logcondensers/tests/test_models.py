@@ -32,6 +32,7 @@ import six
 
 # local
 from bottler.bottles.models import BottleField
+from sifter.condensers import plans
 from sifter.condensers.tests.mixins import CondenserTestCaseMixin, \
     FittingTestCaseMixin
 from sifter.logsifter.logcondensers.models import LogCondenser, LogFitting
@@ -80,6 +81,40 @@ class LogCondenserTestCase(LogCondenserBaseTestCase, CondenserTestCaseMixin):
             for item in actual:
                 self.assertEqual(actual[item], expected[item])
 
+    def test_compile(self):
+        """
+        Tests that the compile method returns a plan that condenses
+        data in the same way as the Condenser's Fittings.
+        """
+        plan = self.condenser.compile()
+        actual = plan.process(self.test_doc)
+        expected = self.condenser._condense(self.test_doc, self.condenser)
+        self.assertEqual(actual, expected)
+        self.assertEqual(
+            sorted(path for (path, _) in plan.steps),
+            [('content',), ('content', 'date_str'), ('content', 'host'),
+             ('message',)]
+        )
+
+    def test_process_no_queries(self):
+        """
+        Tests that the process method doesn't query the database once
+        the Condenser's plan has been compiled.
+        """
+        plans.clear_cache()
+        condenser = LogCondenser.objects.get(name='nested_log')
+        condenser.get_plan()
+        with self.assertNumQueries(0):
+            condenser.process(self.test_doc)
+
+    def test_plan_cleared_on_save(self):
+        """
+        Tests that cached plans are discarded when a Fitting is saved.
+        """
+        plan = self.condenser.get_plan()
+        LogFitting.objects.get(pk=1).save()
+        self.assertIsNot(self.condenser.get_plan(), plan)
+
 
 class LogFittingTestCase(LogCondenserBaseTestCase, FittingTestCaseMixin):
     """
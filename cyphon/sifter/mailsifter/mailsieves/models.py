@@ -52,6 +52,13 @@ class MailRule(Rule):
         value = accessors.get_email_value(self.field_name, data)
         return str(value)
 
+    def _get_field_key(self):
+        """
+        Returns a tuple identifying the Message component the MailRule
+        examines, so MailRules can share it.
+        """
+        return ('string', self.field_name)
+
 
 class MailSieve(Sieve):
     """
@@ -18,9 +18,6 @@
 
 """
 
-# standard library
-import copy
-
 # third party
 from django.db import models
 
@@ -68,6 +65,14 @@ class Munger(models.Model):
         """
         return self.condenser.process(data)
 
+    def _condense(self, doc_obj):
+        """
+        Takes a DocumentObj and returns a new DocumentObj containing the
+        data condensed into the Distillery's Bottle.
+        """
+        parsed_data = self._process_data(doc_obj.data)
+        return doc_obj.derive(parsed_data)
+
     def process(self, doc_obj):
         """
         Condenses data into the Distillery's Bottle, adds the doc_id and
@@ -81,8 +86,27 @@ class Munger(models.Model):
             The document to be processed.
 
         """
-        parsed_data = self._process_data(doc_obj.data)
-        new_doc_obj = copy.deepcopy(doc_obj)
-        new_doc_obj.data = parsed_data
+        new_doc_obj = self._condense(doc_obj)
         doc_id = self._save_data(new_doc_obj)
         return doc_id
+
+    def process_many(self, doc_objs):
+        """
+        Condenses multiple documents into the Distillery's Bottle and
+        saves them in the Distillery's Collection with a bulk insert.
+        Sends a signal for each document saved.
+
+        Parameters
+        ----------
+        doc_objs : |list| of |DocumentObj|
+            The documents to be processed.
+
+        Returns
+        -------
+        dict
+            A dictionary with keys 'ids' and 'errors', as returned by
+            :meth:`~distilleries.models.Distillery.save_many`.
+
+        """
+        new_doc_objs = [self._condense(doc_obj) for doc_obj in doc_objs]
+        return self.distillery.save_many(new_doc_objs)
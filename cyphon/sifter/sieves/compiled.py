@@ -0,0 +1,570 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2018 Dunbar Security Solutions, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+"""
+Defines in-memory representations of Rules and Sieves.
+
+A compiled Sieve is a tree of plain Python predicates built once from
+the database. Regular expressions are compiled and numeric operators
+are parsed when the tree is built, so evaluating a document requires
+no database queries and no regex compilation.
+
+A :class:`~MultiSieve` combines the compiled Sieves of many Chutes so
+that a document can be matched against all of them in one pass. Each
+field is extracted from the document only once, each Rule shared by
+several Sieves is evaluated only once, and plain "contains" Rules on
+the same field are screened together with a single combined regex, so
+a document that contains none of their values is rejected at once.
+
+============================  ==========================================
+Class                         Description
+============================  ==========================================
+:class:`~CompiledRule`        A predicate compiled from a Rule.
+:class:`~CompiledSieve`       A predicate compiled from a Sieve.
+:class:`~LiteralScreen`       Finds which of many plain values a
+                              string contains.
+:class:`~MatchContext`        Values and results shared while matching
+                              a document.
+:class:`~MultiSieve`          A combined matcher for many Sieves.
+============================  ==========================================
+
+=============================  =========================================
+Function                       Description
+=============================  =========================================
+:func:`~get_compiled_sieve`    Get a cached CompiledSieve for a Sieve.
+:func:`~get_multi_sieve`       Get a cached MultiSieve for Chutes.
+:func:`~clear_cache`           Discard all cached CompiledSieves.
+=============================  =========================================
+
+"""
+
+# standard library
+import re
+
+# third party
+from django.conf import settings
+
+# local
+from utils.caches.caches import TimedCache
+
+_SIEVE_SETTINGS = getattr(settings, 'SIEVES', {})
+
+_CACHE_TIMEOUT = _SIEVE_SETTINGS.get('CACHE_TIMEOUT', 60)
+
+_CACHE = TimedCache(_CACHE_TIMEOUT)
+
+_MULTI_CACHE = TimedCache(_CACHE_TIMEOUT)
+
+
+class CompiledRule(object):
+    """A predicate compiled from a Rule.
+
+    Parameters
+    ----------
+    name : str
+        The name of the Rule.
+
+    check : callable
+        A function that takes a value and returns a |bool| indicating
+        whether the value meets the Rule's condition.
+
+    preprocess : callable or |None|
+        An optional function applied to the data before it is checked
+        (e.g., a |Protocol|).
+
+    negate : bool
+        Whether the result of the check should be inverted.
+
+    extract : callable or |None|
+        An optional function that takes the data and returns the value
+        to be checked (e.g., the string value of a field). If |None|,
+        the data itself is checked.
+
+    field : tuple or |None|
+        A hashable key identifying the value returned by `extract`.
+        Rules with the same `field` share the extracted value when they
+        are evaluated in the same :class:`~MatchContext`. If |None|, the
+        value is not shared.
+
+    key : tuple or |None|
+        A hashable key identifying the Rule, so its result can be
+        shared by all Sieves that contain it.
+
+    literal : tuple or |None|
+        For Rules that test whether a string contains a plain value,
+        a tuple of the value and a |bool| indicating whether the match
+        is case-sensitive. Used to screen such Rules together.
+
+    """
+
+    __slots__ = ('name', '_check', '_preprocess', '_negate', '_extract',
+                 'field', 'key', 'literal')
+
+    def __init__(self, name, check, preprocess=None, negate=False,
+                 extract=None, field=None, key=None, literal=None):
+        self.name = name
+        self._check = check
+        self._preprocess = preprocess
+        self._negate = negate
+        self._extract = extract
+        self.field = field if preprocess is None else None
+        self.key = key
+        self.literal = literal if self.field is not None else None
+
+    def __repr__(self):
+        return '<%s: %s>' % (self.__class__.__name__, self.name)
+
+    def extract(self, data):
+        """
+        Takes a dictionary or a string of data and returns the value
+        the Rule checks.
+        """
+        if self._preprocess is not None:
+            data = self._preprocess(data)
+
+        if self._extract is not None:
+            return self._extract(data)
+
+        return data
+
+    def _get_result(self, match):
+        """
+        Takes the result of the Rule's check and applies the Rule's
+        negation.
+        """
+        match = bool(match)
+
+        if self._negate:
+            return not match
+
+        return match
+
+    def check(self, value):
+        """
+        Takes a value returned by the extract method and returns True
+        if it meets the Rule's criterion, before any negation.
+        """
+        return bool(self._check(value))
+
+    def is_match(self, data):
+        """
+        Takes a dictionary or a string of data and returns True if the
+        data meets the Rule's criterion. Otherwise, returns False.
+        """
+        return self._get_result(self._check(self.extract(data)))
+
+    def evaluate(self, context):
+        """
+        Takes a |MatchContext| and returns True if its data meets the
+        Rule's criterion, reusing values and results already found for
+        the same data.
+        """
+        if self.key is None:
+            return self._get_result(context.check(self))
+
+        results = context.results
+        try:
+            return results[self.key]
+        except KeyError:
+            result = self._get_result(context.check(self))
+            results[self.key] = result
+            return result
+
+
+class CompiledSieve(object):
+    """A predicate compiled from a Sieve.
+
+    Parameters
+    ----------
+    name : str
+        The name of the Sieve.
+
+    nodes : list of |CompiledRule| and |CompiledSieve|
+        The compiled nodes of the Sieve.
+
+    logic : str
+        The logic used to combine the nodes, which can be 'AND' or
+        'OR'.
+
+    negate : bool
+        Whether the result of the Sieve should be inverted.
+
+    """
+
+    __slots__ = ('name', '_nodes', '_logic', '_negate')
+
+    def __init__(self, name, nodes, logic='AND', negate=False):
+        self.name = name
+        self._nodes = tuple(nodes)
+        self._logic = logic
+        self._negate = negate
+
+    def __repr__(self):
+        return '<%s: %s>' % (self.__class__.__name__, self.name)
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def _matches_all(self, data):
+        """
+        Returns True if the data matches all nodes of the Sieve.
+        """
+        for node in self._nodes:
+            if not node.is_match(data):
+                return False
+        return True
+
+    def _matches_any(self, data):
+        """
+        Returns True if the data matches any node of the Sieve.
+        """
+        for node in self._nodes:
+            if node.is_match(data):
+                return True
+        return False
+
+    def _evaluates_all(self, context):
+        """
+        Returns True if the data of a |MatchContext| match all nodes of
+        the Sieve.
+        """
+        for node in self._nodes:
+            if not node.evaluate(context):
+                return False
+        return True
+
+    def _evaluates_any(self, context):
+        """
+        Returns True if the data of a |MatchContext| match any node of
+        the Sieve.
+        """
+        for node in self._nodes:
+            if node.evaluate(context):
+                return True
+        return False
+
+    def is_match(self, data):
+        """
+        Takes a dictionary of data and returns True if the data meet
+        the criteria of the Sieve. Otherwise, returns False.
+        """
+        if self._logic == 'OR':
+            match = self._matches_any(data)
+        else:
+            match = self._matches_all(data)
+
+        if self._negate:
+            return not match
+
+        return match
+
+    def evaluate(self, context):
+        """
+        Takes a |MatchContext| and returns True if its data meet the
+        criteria of the Sieve, reusing values and results already found
+        for the same data.
+        """
+        if self._logic == 'OR':
+            match = self._evaluates_any(context)
+        else:
+            match = self._evaluates_all(context)
+
+        if self._negate:
+            return not match
+
+        return match
+
+    def get_rules(self):
+        """
+        Returns a generator of the |CompiledRules| in the Sieve and its
+        nested Sieves.
+        """
+        for node in self._nodes:
+            if isinstance(node, CompiledSieve):
+                for rule in node.get_rules():
+                    yield rule
+            else:
+                yield node
+
+
+class LiteralScreen(object):
+    """Finds which of many plain values a string contains.
+
+    A single regex combining all the values is used to quickly reject
+    strings that contain none of them. Only strings that contain at
+    least one value are searched for each value individually.
+
+    Parameters
+    ----------
+    values : iterable of str
+        The values to find.
+
+    case_sensitive : bool
+        Whether the values should be matched with case-sensitivity.
+
+    """
+
+    __slots__ = ('_search', '_searches')
+
+    def __init__(self, values, case_sensitive=False):
+        flags = 0 if case_sensitive else re.IGNORECASE
+        values = sorted(set(values), key=len, reverse=True)
+        pattern = '|'.join(re.escape(value) for value in values)
+        self._search = re.compile(pattern, flags).search
+        self._searches = tuple(
+            (value, re.compile(re.escape(value), flags).search)
+            for value in values
+        )
+
+    def find(self, string):
+        """
+        Takes a string and returns a frozenset of the values it
+        contains.
+        """
+        if self._search(string) is None:
+            return frozenset()
+
+        return frozenset([value for (value, search) in self._searches
+                          if search(string) is not None])
+
+
+class MatchContext(object):
+    """Values and results shared while matching a document.
+
+    A MatchContext is created for each document matched by a
+    :class:`~MultiSieve`, and caches the values extracted from the
+    document and the results of the Rules evaluated against it.
+
+    Parameters
+    ----------
+    data : dict or str
+        The data being matched.
+
+    screens : dict
+        A dictionary that maps the `field` of a |CompiledRule| and a
+        |bool| for case-sensitivity to a :class:`~LiteralScreen` for
+        the literal values of the Rules with that `field`.
+
+    Attributes
+    ----------
+    data : dict or str
+        The data being matched.
+
+    results : dict
+        A dictionary that maps the `key` of a |CompiledRule| to its
+        result.
+
+    """
+
+    __slots__ = ('data', 'results', '_screens', '_values', '_found')
+
+    def __init__(self, data, screens=None):
+        self.data = data
+        self.results = {}
+        self._screens = screens or {}
+        self._values = {}
+        self._found = {}
+
+    def get_value(self, rule):
+        """
+        Takes a |CompiledRule| and returns the value it checks,
+        extracting it from the data only once per `field`.
+        """
+        field = rule.field
+
+        if field is None:
+            return rule.extract(self.data)
+
+        values = self._values
+        try:
+            return values[field]
+        except KeyError:
+            value = rule.extract(self.data)
+            values[field] = value
+            return value
+
+    def _get_found(self, rule):
+        """
+        Takes a |CompiledRule| with a `literal` and returns a frozenset
+        of the literal values found in its field, or None if there is
+        no :class:`~LiteralScreen` for the field.
+        """
+        screen_key = (rule.field, rule.literal[1])
+        found = self._found
+
+        try:
+            return found[screen_key]
+        except KeyError:
+            screen = self._screens.get(screen_key)
+            if screen is not None:
+                found[screen_key] = screen.find(self.get_value(rule))
+            else:
+                found[screen_key] = None
+            return found[screen_key]
+
+    def check(self, rule):
+        """
+        Takes a |CompiledRule| and returns the result of its check,
+        before any negation, for the data.
+        """
+        if rule.literal is not None:
+            found = self._get_found(rule)
+            if found is not None:
+                return rule.literal[0] in found
+
+        return rule.check(self.get_value(rule))
+
+
+class MultiSieve(object):
+    """A combined matcher for the Sieves of many Chutes.
+
+    Parameters
+    ----------
+    sieves : list of |CompiledSieve| or |None|
+        The compiled Sieves to match. |None| represents a Chute without
+        a Sieve, which matches any data.
+
+    """
+
+    __slots__ = ('_sieves', '_screens')
+
+    def __init__(self, sieves):
+        self._sieves = tuple(sieves)
+        self._screens = self._get_screens()
+
+    def __len__(self):
+        return len(self._sieves)
+
+    def _get_screens(self):
+        """
+        Returns a dictionary that maps a field and a |bool| for
+        case-sensitivity to a :class:`~LiteralScreen` for the literal
+        values of the Rules with that field.
+        """
+        literals = {}
+
+        for sieve in self._sieves:
+            if sieve is None:
+                continue
+            for rule in sieve.get_rules():
+                if rule.literal is not None:
+                    value, case_sensitive = rule.literal
+                    screen_key = (rule.field, case_sensitive)
+                    literals.setdefault(screen_key, set()).add(value)
+
+        return dict(
+            (screen_key, LiteralScreen(values, case_sensitive=screen_key[1]))
+            for (screen_key, values) in literals.items()
+        )
+
+    def get_matches(self, data):
+        """Get the indexes of the Sieves that match the data.
+
+        Parameters
+        ----------
+        data : dict or str
+            The data to match.
+
+        Returns
+        -------
+        |list| of |int|
+            The indexes of the matching Sieves, in the order the Sieves
+            were given.
+
+        """
+        context = MatchContext(data, self._screens)
+        return [index for (index, sieve) in enumerate(self._sieves)
+                if sieve is None or sieve.evaluate(context)]
+
+
+def _get_cache_key(sieve):
+    """
+    Returns a key identifying a saved Sieve in the cache.
+    """
+    return (sieve._meta.label_lower, sieve.pk)
+
+
+def get_compiled_sieve(sieve):
+    """Get a |CompiledSieve| for a Sieve.
+
+    Compiled Sieves are cached for the life of the process, and are
+    rebuilt when a Rule, Sieve, or SieveNode is saved or deleted in
+    the same process, or after `SIEVES['CACHE_TIMEOUT']` seconds to
+    pick up changes made by other processes.
+
+    Parameters
+    ----------
+    sieve : |Sieve|
+        The Sieve to compile.
+
+    Returns
+    -------
+    |CompiledSieve|
+        An in-memory predicate equivalent to the Sieve.
+
+    """
+    if sieve.pk is None:
+        return sieve.compile()
+
+    return _CACHE.get(_get_cache_key(sieve), sieve.compile)
+
+
+def _get_multi_cache_key(chutes):
+    """
+    Returns a key identifying a list of saved Chutes and their Sieves
+    in the cache.
+    """
+    return tuple((chute._meta.label_lower, chute.pk, chute.sieve_id)
+                 for chute in chutes)
+
+
+def _create_multi_sieve(chutes):
+    """
+    Returns a new |MultiSieve| for the Sieves of a list of Chutes.
+    """
+    sieves = [chute.sieve.get_compiled() if chute.sieve else None
+              for chute in chutes]
+    return MultiSieve(sieves)
+
+
+def get_multi_sieve(chutes):
+    """Get a |MultiSieve| for the Sieves of a list of Chutes.
+
+    MultiSieves are cached like |CompiledSieves|, and are discarded
+    along with them.
+
+    Parameters
+    ----------
+    chutes : list of |Chute|
+        The Chutes whose Sieves should be matched.
+
+    Returns
+    -------
+    |MultiSieve|
+        A matcher whose results are indexes into `chutes`.
+
+    """
+    if any(chute.pk is None for chute in chutes):
+        return _create_multi_sieve(chutes)
+
+    return _MULTI_CACHE.get(_get_multi_cache_key(chutes),
+                            lambda: _create_multi_sieve(chutes))
+
+
+def clear_cache():
+    """Discard all cached |CompiledSieves| and |MultiSieves|."""
+    _CACHE.clear()
+    _MULTI_CACHE.clear()
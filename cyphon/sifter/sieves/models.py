@@ -46,11 +46,21 @@ from django.utils.translation import ugettext_lazy as _
 from cyphon.models import GetByNameManager
 from cyphon.choices import LOGIC_CHOICES, RANGE_CHOICES, REGEX_CHOICES
 from lab.procedures.models import Protocol
-from utils.parserutils.parserutils import get_dict_value
+from utils.caches.caches import clear_on_change
+from utils.parserutils.parserutils import get_dict_value, get_field_path
 from utils.validators.validators import regex_validator
+from .compiled import CompiledRule, CompiledSieve, clear_cache, \
+                      get_compiled_sieve
 
 LOGGER = logging.getLogger(__name__)
 
+_NUMERIC_OPERATORS = {
+    '>': operator.gt,
+    '>=': operator.ge,
+    '<': operator.lt,
+    '<=': operator.le
+}
+
 
 class Rule(models.Model):
     """An abstract base class for models that define rules.
@@ -151,7 +161,7 @@ class Rule(models.Model):
             regex_validator(self.value)
 
     def _preprocess(self, data):
-        self.protocol.process(data)
+        return self.protocol.process(data)
 
     def _get_comparison_value(self, data):
         """
@@ -216,6 +226,64 @@ class Rule(models.Model):
 
         return False
 
+    def _compile_regex(self):
+        """
+        Returns a compiled regular expression for the Rule, or None if
+        the regex cannot be parsed.
+        """
+        regex = self._create_regex()
+        flags = 0 if self.case_sensitive else re.IGNORECASE
+
+        try:
+            return re.compile(regex, flags)
+        except sre_constants.error:
+            LOGGER.error('Cannot parse the regex "%s" for %s %s',
+                         regex, self.__class__.__name__, self.id)
+
+    def _compile_regex_check(self):
+        """
+        Returns a function that takes a string and returns True if it
+        matches the Rule's precompiled regex.
+        """
+        pattern = self._compile_regex()
+
+        if pattern is None:
+            return lambda string: False
+
+        search = pattern.search
+        return lambda string: search(string) is not None
+
+    def _compile_check(self):
+        """
+        Returns a function equivalent to the Rule's _check_value method,
+        with the Rule's regex and operator parsed in advance. The
+        function takes the value returned by the Rule's extractor.
+        """
+        return self._compile_regex_check()
+
+    def _get_field_key(self):
+        """
+        Returns a tuple identifying the value the Rule examines, so
+        Rules that examine the same value can share it.
+        """
+        return ('string', )
+
+    def _get_extractor(self):
+        """
+        Returns a function that takes a data object and returns the
+        value to be examined by the Rule's compiled check.
+        """
+        return self._get_string
+
+    def _get_literal(self):
+        """
+        Returns a tuple of the Rule's value and case-sensitivity if the
+        Rule tests whether a string contains a plain value. Otherwise,
+        returns None.
+        """
+        if self.operator == 'CharField:x' and not self.is_regex:
+            return (self.value, self.case_sensitive)
+
     def _check_value(self, value):
         """
         Takes a value and checks it against the Rule's logic. Returns
@@ -223,6 +291,33 @@ class Rule(models.Model):
         """
         return self._matches_regex(value)
 
+    def compile(self):
+        """
+        Returns a |CompiledRule| that evaluates data like the Rule's
+        is_match method, without rebuilding the Rule's regex on each
+        call.
+        """
+        if self.protocol_id is not None:
+            preprocess = self._get_comparison_value
+        else:
+            preprocess = None
+
+        if self.pk is not None:
+            key = (self._meta.label_lower, self.pk)
+        else:
+            key = None
+
+        return CompiledRule(
+            name=self.name,
+            check=self._compile_check(),
+            preprocess=preprocess,
+            negate=self.negate,
+            extract=self._get_extractor(),
+            field=self._get_field_key(),
+            key=key,
+            literal=self._get_literal()
+        )
+
     def is_match(self, data):
         """
         Takes a dictionary or a string of data and returns True if the data meets
@@ -368,19 +463,88 @@ class FieldRule(Rule):
         """
 
         """
-        operators = {
-            '>': operator.gt,
-            '>=': operator.ge,
-            '<': operator.lt,
-            '<=': operator.le
-        }
         try:
             comparison = self._get_operator_value()
             value = self._get_value(data)
-            return operators[comparison](float(value), float(self.value))
+            return _NUMERIC_OPERATORS[comparison](float(value),
+                                                  float(self.value))
         except (ValueError, TypeError):  # catch TypeError if value is None
             return False
 
+    def _compile_null_check(self):
+        """
+        Returns a function equivalent to the _is_null method that takes
+        the field value.
+        """
+        return lambda value: value is None
+
+    def _compile_numeric_check(self):
+        """
+        Returns a function equivalent to the _numeric_match method,
+        with the comparison operator and the Rule's value parsed in
+        advance.
+        """
+        comparison = _NUMERIC_OPERATORS[self._get_operator_value()]
+
+        try:
+            threshold = float(self.value)
+        except (ValueError, TypeError):
+            return lambda value: False
+
+        def check(value):
+            """
+            Compares a numeric field value to the Rule's value.
+            """
+            try:
+                return comparison(float(value), threshold)
+            except (ValueError, TypeError):  # catch TypeError if value is None
+                return False
+
+        return check
+
+    def _compile_check(self):
+        """
+        Returns a function equivalent to the Rule's _check_value method,
+        with the Rule's regex and operator parsed in advance.
+        """
+        operator_type = self._get_operator_type()
+        methods = {
+            'CharField': self._compile_regex_check,
+            'EmptyField': self._compile_null_check,
+            'FloatField': self._compile_numeric_check,
+        }
+
+        func = methods[operator_type]
+        return func()
+
+    def _is_string_rule(self):
+        """
+        Returns True if the Rule examines the string form of the field
+        value.
+        """
+        return self._get_operator_type() == 'CharField'
+
+    def _get_field_key(self):
+        """
+        Returns a tuple identifying the field value the Rule examines,
+        so Rules that examine the same value can share it.
+        """
+        if self._is_string_rule():
+            return ('string', self.field_name)
+        return ('value', self.field_name)
+
+    def _get_extractor(self):
+        """
+        Returns a function that takes a dictionary and returns the field
+        value to be examined by the Rule's compiled check, using a
+        precompiled path to the field.
+        """
+        get_value = get_field_path(self.field_name).get
+
+        if self._is_string_rule():
+            return lambda data: str(get_value(data))
+        return get_value
+
     def _check_value(self, value):
         """
         Takes a value and checks it against the Rule's logic. Returns the result
@@ -513,6 +677,27 @@ class Sieve(models.Model):
         else:
             return match
 
+    def compile(self):
+        """
+        Returns a |CompiledSieve| built from the Sieve's nodes. The
+        nodes and the objects they refer to are fetched from the
+        database once, so the result can be used to examine many
+        documents without further queries.
+        """
+        nodes = self.nodes.prefetch_related('node_object')
+        return CompiledSieve(
+            name=self.name,
+            nodes=[node.compile() for node in nodes],
+            logic=self.logic,
+            negate=self.negate
+        )
+
+    def get_compiled(self):
+        """
+        Returns a cached |CompiledSieve| for the Sieve.
+        """
+        return get_compiled_sieve(self)
+
 
 class SieveNode(models.Model):
     """A reference to a Rule or a Sieve.
@@ -595,3 +780,15 @@ class SieveNode(models.Model):
         criterion. Otherwise, returns False.
         """
         return self.node_object.is_match(data)
+
+    def compile(self):
+        """
+        Returns a compiled version of the Rule or Sieve referenced by
+        the node.
+        """
+        return self.node_object.compile()
+
+
+# discard cached CompiledSieves when their models change
+clear_on_change(clear_cache, (Rule, Sieve, SieveNode, Protocol),
+                dispatch_uid='sieves.clear_compiled_sieves')
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2018 Dunbar Security Solutions, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+"""
+Benchmarks Sieve evaluation with and without compilation.
+
+Run with::
+
+    python manage.py test sifter.sieves.tests -p "benchmark_*.py"
+
+"""
+
+# third party
+from django.test import TestCase
+
+# local
+from sifter.datasifter.datasieves.models import (
+    DataRule,
+    DataSieve,
+    DataSieveNode,
+)
+from utils.performance.benchmark import get_rate, report
+
+
+class CompiledSieveBenchmark(TestCase):
+    """
+    Compares a nested 50-rule DataSieve evaluated through the ORM with
+    its compiled equivalent.
+    """
+
+    MESSAGES = 500
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.sieve = DataSieve.objects.create(name='root', logic='AND')
+        for i in range(5):
+            child = DataSieve.objects.create(name='child_%s' % i,
+                                             logic='OR')
+            DataSieveNode.objects.create(sieve=cls.sieve, node_object=child)
+            for j in range(9):
+                rule = DataRule.objects.create(
+                    name='rule_%s_%s' % (i, j),
+                    field_name='message',
+                    operator='CharField:x',
+                    value='keyword_%s_%s' % (i, j)
+                )
+                DataSieveNode.objects.create(sieve=child, node_object=rule)
+            rule = DataRule.objects.create(
+                name='rule_%s_severity' % i,
+                field_name='severity',
+                operator='FloatField:>=',
+                value='5'
+            )
+            DataSieveNode.objects.create(sieve=child, node_object=rule)
+
+    def test_messages_per_second(self):
+        """
+        Reports messages/sec for ORM and compiled Sieve evaluation.
+        """
+        messages = [
+            {'message': 'log line %s keyword_%s_8' % (i, i % 5),
+             'severity': i % 10}
+            for i in range(self.MESSAGES)
+        ]
+        compiled = self.sieve.compile()
+
+        for data in messages:
+            self.assertEqual(compiled.is_match(data),
+                             self.sieve.is_match(data))
+
+        results = [
+            ('ORM', get_rate(self.sieve.is_match, messages, repeat=1)),
+            ('compiled', get_rate(compiled.is_match, messages)),
+        ]
+        report('Nested 50-rule DataSieve', results, unit='messages/sec')
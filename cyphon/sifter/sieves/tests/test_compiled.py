@@ -0,0 +1,363 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2018 Dunbar Security Solutions, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+"""
+Tests the CompiledRule, CompiledSieve, and MultiSieve classes.
+"""
+
+# standard library
+import re
+from unittest import TestCase
+try:
+    from unittest.mock import Mock, patch
+except ImportError:
+    from mock import Mock, patch
+
+# local
+from sifter.sieves import compiled
+from sifter.sieves.compiled import (
+    CompiledRule,
+    CompiledSieve,
+    LiteralScreen,
+    MatchContext,
+    MultiSieve,
+)
+
+
+def _create_literal_rule(value, pk, negate=False, case_sensitive=False,
+                         extract=None):
+    """
+    Returns a CompiledRule that checks whether a message contains a
+    value.
+    """
+    flags = 0 if case_sensitive else re.IGNORECASE
+    search = re.compile(re.escape(value), flags).search
+    extract = extract or (lambda data: str(data.get('message')))
+    return CompiledRule(
+        name=value,
+        check=lambda string: search(string) is not None,
+        negate=negate,
+        extract=extract,
+        field=('string', 'message'),
+        key=('datasieves.datarule', pk),
+        literal=(value, case_sensitive)
+    )
+
+
+class CompiledRuleTestCase(TestCase):
+    """
+    Tests the CompiledRule class.
+    """
+
+    def test_is_match(self):
+        """
+        Tests the is_match method.
+        """
+        rule = CompiledRule('test', check=lambda data: 'foo' in data)
+        self.assertTrue(rule.is_match('foobar'))
+        self.assertFalse(rule.is_match('bar'))
+
+    def test_is_match_negated(self):
+        """
+        Tests the is_match method for a negated CompiledRule.
+        """
+        rule = CompiledRule('test', check=lambda data: 'foo' in data,
+                            negate=True)
+        self.assertFalse(rule.is_match('foobar'))
+        self.assertTrue(rule.is_match('bar'))
+
+    def test_is_match_preprocess(self):
+        """
+        Tests the is_match method for a CompiledRule with a
+        preprocessing function.
+        """
+        rule = CompiledRule('test', check=lambda data: data == 'FOO',
+                            preprocess=str.upper)
+        self.assertTrue(rule.is_match('foo'))
+
+    def test_is_match_extract(self):
+        """
+        Tests the is_match method for a CompiledRule with an extraction
+        function.
+        """
+        rule = _create_literal_rule('foo', pk=1)
+        self.assertTrue(rule.is_match({'message': 'FOOBAR'}))
+        self.assertFalse(rule.is_match({'message': 'bar'}))
+
+    def test_preprocess_not_shared(self):
+        """
+        Tests that a CompiledRule with a preprocessing function does not
+        share its extracted value.
+        """
+        rule = CompiledRule('test', check=bool, preprocess=str.upper,
+                            field=('string', ), literal=('foo', False))
+        self.assertIsNone(rule.field)
+        self.assertIsNone(rule.literal)
+
+    def test_evaluate_shared_result(self):
+        """
+        Tests that the evaluate method reuses the result of a Rule with
+        the same key.
+        """
+        check = Mock(return_value=True)
+        rule_1 = CompiledRule('test', check=check, key=('rule', 1))
+        rule_2 = CompiledRule('test', check=check, key=('rule', 1))
+        context = MatchContext('foo')
+        self.assertTrue(rule_1.evaluate(context))
+        self.assertTrue(rule_2.evaluate(context))
+        check.assert_called_once_with('foo')
+
+    def test_evaluate_negated(self):
+        """
+        Tests the evaluate method for a negated CompiledRule.
+        """
+        rule = _create_literal_rule('foo', pk=1, negate=True)
+        context = MatchContext({'message': 'foobar'})
+        self.assertFalse(rule.evaluate(context))
+
+
+class CompiledSieveTestCase(TestCase):
+    """
+    Tests the CompiledSieve class.
+    """
+
+    def setUp(self):
+        self.foo = CompiledRule('foo', check=lambda data: 'foo' in data)
+        self.bar = CompiledRule('bar', check=lambda data: 'bar' in data)
+
+    def test_is_match_and(self):
+        """
+        Tests the is_match method for 'AND' logic.
+        """
+        sieve = CompiledSieve('test', [self.foo, self.bar], logic='AND')
+        self.assertTrue(sieve.is_match('foobar'))
+        self.assertFalse(sieve.is_match('foo'))
+
+    def test_is_match_or(self):
+        """
+        Tests the is_match method for 'OR' logic.
+        """
+        sieve = CompiledSieve('test', [self.foo, self.bar], logic='OR')
+        self.assertTrue(sieve.is_match('foo'))
+        self.assertFalse(sieve.is_match('baz'))
+
+    def test_is_match_nested(self):
+        """
+        Tests the is_match method for a nested CompiledSieve.
+        """
+        child = CompiledSieve('child', [self.foo, self.bar], logic='OR')
+        sieve = CompiledSieve('test', [child], negate=True)
+        self.assertFalse(sieve.is_match('bar'))
+        self.assertTrue(sieve.is_match('baz'))
+
+    def test_evaluate(self):
+        """
+        Tests the evaluate method for nested CompiledSieves.
+        """
+        child = CompiledSieve('child', [self.foo, self.bar], logic='OR')
+        sieve = CompiledSieve('test', [child, self.foo], logic='AND')
+        for data in ['foo', 'bar', 'foobar', 'baz']:
+            self.assertEqual(sieve.evaluate(MatchContext(data)),
+                             sieve.is_match(data))
+
+    def test_get_rules(self):
+        """
+        Tests the get_rules method for nested CompiledSieves.
+        """
+        child = CompiledSieve('child', [self.bar])
+        sieve = CompiledSieve('test', [self.foo, child])
+        self.assertEqual(list(sieve.get_rules()), [self.foo, self.bar])
+
+
+class LiteralScreenTestCase(TestCase):
+    """
+    Tests the LiteralScreen class.
+    """
+
+    def test_find(self):
+        """
+        Tests the find method, including values that overlap.
+        """
+        screen = LiteralScreen(['foo', 'foobar', 'bar', 'baz'])
+        self.assertEqual(screen.find('a FOOBAR'),
+                         frozenset(['foo', 'foobar', 'bar']))
+
+    def test_find_none(self):
+        """
+        Tests the find method for a string without any of the values.
+        """
+        screen = LiteralScreen(['foo', 'bar'])
+        self.assertEqual(screen.find('qux'), frozenset())
+
+    def test_find_case_sensitive(self):
+        """
+        Tests the find method for case-sensitive values.
+        """
+        screen = LiteralScreen(['foo', 'Bar'], case_sensitive=True)
+        self.assertEqual(screen.find('FOO Bar'), frozenset(['Bar']))
+
+    def test_special_characters(self):
+        """
+        Tests that regex characters in values are matched literally.
+        """
+        screen = LiteralScreen(['a.b', '(c)'])
+        self.assertEqual(screen.find('axb (c)'), frozenset(['(c)']))
+
+
+class MultiSieveTestCase(TestCase):
+    """
+    Tests the MultiSieve class.
+    """
+
+    def setUp(self):
+        self.extract = Mock(side_effect=lambda data: data['message'])
+        self.foo = _create_literal_rule('foo', pk=1, extract=self.extract)
+        self.bar = _create_literal_rule('bar', pk=2, extract=self.extract)
+        self.not_baz = _create_literal_rule('baz', pk=3, negate=True,
+                                            extract=self.extract)
+        self.sieves = [
+            CompiledSieve('foo', [self.foo]),
+            CompiledSieve('foo_and_bar', [self.foo, self.bar]),
+            CompiledSieve('bar_or_not_baz', [self.bar, self.not_baz],
+                          logic='OR'),
+            None,
+        ]
+        self.multi_sieve = MultiSieve(self.sieves)
+
+    def test_get_matches(self):
+        """
+        Tests that the get_matches method returns the same results as
+        matching each CompiledSieve separately.
+        """
+        messages = ['foo', 'FOO bar', 'baz', 'bar baz', 'qux', 'foobaz']
+        for message in messages:
+            data = {'message': message}
+            expected = [index for (index, sieve) in enumerate(self.sieves)
+                        if sieve is None or sieve.is_match(data)]
+            self.assertEqual(self.multi_sieve.get_matches(data), expected)
+
+    def test_extracts_once(self):
+        """
+        Tests that a field is only extracted once per document.
+        """
+        self.multi_sieve.get_matches({'message': 'foo bar'})
+        self.extract.assert_called_once_with({'message': 'foo bar'})
+
+    def test_no_sieves(self):
+        """
+        Tests the get_matches method for an empty MultiSieve.
+        """
+        self.assertEqual(MultiSieve([]).get_matches({'message': 'foo'}), [])
+
+
+class GetMultiSieveTestCase(TestCase):
+    """
+    Tests the get_multi_sieve function.
+    """
+
+    def setUp(self):
+        compiled.clear_cache()
+        self.chute = Mock(pk=1, sieve_id=1)
+        self.chute._meta.label_lower = 'logchutes.logchute'
+        self.chute.sieve.get_compiled.return_value = \
+            CompiledSieve('foo', [_create_literal_rule('foo', pk=1)])
+
+    def tearDown(self):
+        compiled.clear_cache()
+
+    def test_cached(self):
+        """
+        Tests that a MultiSieve is only built once for the same Chutes.
+        """
+        result_1 = compiled.get_multi_sieve([self.chute])
+        result_2 = compiled.get_multi_sieve([self.chute])
+        self.assertIs(result_1, result_2)
+
+    def test_clear_cache(self):
+        """
+        Tests that a MultiSieve is rebuilt after the cache is cleared.
+        """
+        result_1 = compiled.get_multi_sieve([self.chute])
+        compiled.clear_cache()
+        result_2 = compiled.get_multi_sieve([self.chute])
+        self.assertIsNot(result_1, result_2)
+
+    def test_different_chutes(self):
+        """
+        Tests that a MultiSieve is rebuilt when the Chutes change.
+        """
+        result_1 = compiled.get_multi_sieve([self.chute])
+        self.chute.sieve_id = 2
+        result_2 = compiled.get_multi_sieve([self.chute])
+        self.assertIsNot(result_1, result_2)
+
+    def test_without_sieve(self):
+        """
+        Tests that a Chute without a Sieve matches any data.
+        """
+        self.chute.sieve = None
+        multi_sieve = compiled.get_multi_sieve([self.chute])
+        self.assertEqual(multi_sieve.get_matches({'message': 'bar'}), [0])
+
+
+class GetCompiledSieveTestCase(TestCase):
+    """
+    Tests the get_compiled_sieve function.
+    """
+
+    def setUp(self):
+        compiled.clear_cache()
+        self.sieve = Mock(pk=1)
+        self.sieve._meta.label_lower = 'datasieves.datasieve'
+
+    def tearDown(self):
+        compiled.clear_cache()
+
+    def test_cached(self):
+        """
+        Tests that a Sieve is only compiled once.
+        """
+        result_1 = compiled.get_compiled_sieve(self.sieve)
+        result_2 = compiled.get_compiled_sieve(self.sieve)
+        self.assertIs(result_1, result_2)
+        self.sieve.compile.assert_called_once_with()
+
+    def test_clear_cache(self):
+        """
+        Tests that a Sieve is recompiled after the cache is cleared.
+        """
+        compiled.get_compiled_sieve(self.sieve)
+        compiled.clear_cache()
+        compiled.get_compiled_sieve(self.sieve)
+        self.assertEqual(self.sieve.compile.call_count, 2)
+
+    @patch.object(compiled._CACHE, 'timeout', 0)
+    def test_timeout(self):
+        """
+        Tests that a Sieve is recompiled after the cache times out.
+        """
+        compiled.get_compiled_sieve(self.sieve)
+        compiled.get_compiled_sieve(self.sieve)
+        self.assertEqual(self.sieve.compile.call_count, 2)
+
+    def test_unsaved(self):
+        """
+        Tests that an unsaved Sieve is not cached.
+        """
+        self.sieve.pk = None
+        compiled.get_compiled_sieve(self.sieve)
+        compiled.get_compiled_sieve(self.sieve)
+        self.assertEqual(self.sieve.compile.call_count, 2)
@@ -21,12 +21,17 @@ Tests the Rules and RuleSet classes.
 # standard library
 import logging
 from unittest import TestCase
+try:
+    from unittest.mock import patch
+except ImportError:
+    from mock import patch
 
 # third party
 from django.core.exceptions import ValidationError
 
 # local
-from sifter.sieves.models import FieldRule
+from lab.procedures.models import Protocol
+from sifter.sieves.models import FieldRule, StringRule
 
 
 class FieldRuleTestCase(TestCase):
@@ -321,3 +326,58 @@ class FieldRuleTestCase(TestCase):
             self.fail('Rule raised ValidationError unexpectedly')
         with self.assertRaises(ValidationError):
             self.assertFalse(invalid_rule.clean())
+
+    def test_compile(self):
+        """
+        Tests that the compile method returns a CompiledRule that
+        agrees with the is_match method.
+        """
+        rules = [
+            FieldRule(field_name='subject', operator='CharField:x',
+                      value='CRITICAL'),
+            FieldRule(field_name='subject', operator='CharField:x',
+                      value='CRITICAL', case_sensitive=True),
+            FieldRule(field_name='subject', operator='CharField:^x',
+                      value='this', negate=True),
+            FieldRule(field_name='subject', operator='CharField:x$',
+                      value='al.rt', is_regex=True),
+            FieldRule(field_name='age', operator='FloatField:>=',
+                      value='21'),
+            FieldRule(field_name='age', operator='FloatField:<',
+                      value='21'),
+            FieldRule(field_name='age', operator='EmptyField'),
+        ]
+        docs = [
+            {'subject': 'this is a critical alert', 'age': '21'},
+            {'subject': 'a CRITICAL alert [CRIT', 'age': 20.5},
+            {'subject': None, 'age': None},
+            {'age': 'foobar'},
+        ]
+        for rule in rules:
+            compiled = rule.compile()
+            for data in docs:
+                self.assertEqual(compiled.is_match(data),
+                                 rule.is_match(data))
+
+
+class StringRuleTestCase(TestCase):
+    """
+    Tests the StringRule class.
+    """
+
+    def test_protocol(self):
+        """
+        Tests that the is_match method checks the result of the Rule's
+        Protocol.
+        """
+        protocol = Protocol(name='sentiment', package='sentiment',
+                            module='sentiment', function='get_sentiment')
+        rule = StringRule(
+            operator='CharField:x',
+            value='positive',
+            protocol=protocol
+        )
+        with patch('lab.procedures.models.Protocol.process',
+                   return_value='positive') as mock_process:
+            self.assertTrue(rule.is_match('I love this'))
+            mock_process.assert_called_once_with('I love this')
@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2018 Dunbar Security Solutions, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+"""
+Provides a per-process index of |Tags| for tagging text.
+
+Tags used to be matched by tokenizing the name of every Tag each time
+an object was tagged. A |TagIndex| tokenizes the names once. Tags with
+a single token are kept in a dictionary keyed by name, and are found
+by looking up the raw and lemmatized tokens of the text. Tags with
+several tokens are grouped by their first token, and are found by
+comparing the tokens that follow each occurrence of it in the text.
+Tagging a piece of text therefore costs one tokenization, however many
+Tags exist.
+
+The index is rebuilt after a |Tag| is saved or deleted. The process
+that made the change drops its index right away. A version counter,
+stored in Django's cache, is bumped when the change commits (see
+:mod:`cyphon.versions`), so other processes notice it within
+`TAGS['INDEX_CHECK_INTERVAL']` seconds. As a safeguard against changes
+that don't send signals, indexes are also rebuilt after
+`TAGS['INDEX_MAX_AGE']` seconds.
+
+=====================  ==============================================
+Class                  Description
+=====================  ==============================================
+:class:`~TagIndex`     Finds the Tags that occur in text.
+=====================  ==============================================
+
+=====================  ==============================================
+Function               Description
+=====================  ==============================================
+:func:`~get_index`     Gets a current TagIndex.
+:func:`~invalidate`    Rebuilds TagIndexes in all processes.
+:func:`~tokenize`      Gets the tokens and terms of a string.
+=====================  ==============================================
+
+"""
+
+# standard library
+from collections import defaultdict
+from functools import lru_cache
+import threading
+import time
+
+# third party
+from django.apps import apps
+from django.conf import settings
+import nltk
+
+# local
+from cyphon import versions
+
+_TAG_SETTINGS = getattr(settings, 'TAGS', {})
+
+_CHECK_INTERVAL = _TAG_SETTINGS.get('INDEX_CHECK_INTERVAL', 1)
+
+_MAX_AGE = _TAG_SETTINGS.get('INDEX_MAX_AGE', 300)
+
+_VERSION_KEY = 'tags.index.version'
+
+_LEMMATIZER = nltk.stem.WordNetLemmatizer()
+
+_LOCK = threading.Lock()
+
+_STATE = {
+    'index': None,
+    'last_check': 0,
+}
+
+
+@lru_cache(maxsize=10000)
+def _lemmatize(token):
+    """
+    Takes a token and returns its lemma. Results are cached, since the
+    same words recur across Alerts.
+    """
+    return _LEMMATIZER.lemmatize(token)
+
+
+def tokenize(value):
+    """Get the tokens and terms of a string.
+
+    Parameters
+    ----------
+    value : |str|
+        The string to tokenize.
+
+    Returns
+    -------
+    |tuple| of (|list| of |str|, |set| of |str|)
+        The tokens of the string, in order, and a set containing both
+        the tokens and their lemmas.
+
+    """
+    tokens = nltk.word_tokenize(value)
+    terms = set(tokens)
+    terms.update([_lemmatize(token) for token in terms])
+    return (tokens, terms)
+
+
+class TagIndex(object):
+    """Finds the |Tags| that occur in text.
+
+    Parameters
+    ----------
+    tags : |list| of (|int|, |str|) tuples
+        The primary key and name of each |Tag| to index.
+
+    Attributes
+    ----------
+    version : int
+        The version of the Tags when the TagIndex was built.
+
+    created : float
+        The time when the TagIndex was built.
+
+    """
+
+    def __init__(self, tags, version=None):
+        self.version = version
+        self.created = time.time()
+        self._words = defaultdict(set)
+        self._phrases = defaultdict(list)
+        for (tag_id, name) in tags:
+            self._add(tag_id, name)
+
+    def __len__(self):
+        """Return the number of Tags in the TagIndex."""
+        return (sum(len(tag_ids) for tag_ids in self._words.values())
+                + sum(len(phrases) for phrases in self._phrases.values()))
+
+    def _add(self, tag_id, name):
+        """
+        Takes the primary key and name of a Tag and adds the Tag to the
+        TagIndex.
+        """
+        tokens = nltk.word_tokenize(name)
+        if len(tokens) > 1:
+            self._phrases[tokens[0]].append((tuple(tokens), tag_id))
+        elif tokens:
+            self._words[name].add(tag_id)
+
+    def _match_words(self, terms):
+        """
+        Takes a set of terms and returns a set of primary keys for
+        single-token Tags whose names are among them.
+        """
+        tag_ids = set()
+        for term in terms:
+            tag_ids.update(self._words.get(term, ()))
+        return tag_ids
+
+    def _match_phrases(self, tokens):
+        """
+        Takes a list of tokens and returns a set of primary keys for
+        multi-token Tags whose tokens appear together in it.
+        """
+        tag_ids = set()
+        for (position, token) in enumerate(tokens):
+            for (phrase, tag_id) in self._phrases.get(token, ()):
+                end = position + len(phrase)
+                if tuple(tokens[position:end]) == phrase:
+                    tag_ids.add(tag_id)
+        return tag_ids
+
+    def match(self, value):
+        """Find the |Tags| that occur in a string.
+
+        A single-token |Tag| matches if its name is one of the string's
+        tokens or lemmas. A multi-token |Tag| matches if its tokens
+        appear consecutively in the string.
+
+        Parameters
+        ----------
+        value : |str|
+            The string to search.
+
+        Returns
+        -------
+        |set| of |int|
+            The primary keys of the |Tags| that occur in the string.
+
+        """
+        (tokens, terms) = tokenize(value)
+        return self._match_words(terms) | self._match_phrases(tokens)
+
+
+def get_version():
+    """
+    Returns the current version of the Tags.
+    """
+    return versions.get_version(_VERSION_KEY)
+
+
+def _is_current(index, now):
+    """
+    Takes a TagIndex and the current time, and returns a Boolean
+    indicating whether the index can still be used.
+    """
+    if now - index.created >= _MAX_AGE:
+        return False
+
+    if now - _STATE['last_check'] < _CHECK_INTERVAL:
+        return True
+
+    _STATE['last_check'] = now
+    return get_version() == index.version
+
+
+def _rebuild():
+    """
+    Builds a new TagIndex from the Tags in the database and returns it.
+    """
+    tag_model = apps.get_model('tags', 'Tag')
+    version = get_version()
+    tags = tag_model.objects.values_list('pk', 'name')
+    index = TagIndex(tags, version)
+    _STATE['index'] = index
+    _STATE['last_check'] = index.created
+    return index
+
+
+def get_index():
+    """Get a current |TagIndex|.
+
+    Builds a new index if none exists or if the existing index is out
+    of date.
+
+    Returns
+    -------
+    |TagIndex|
+
+    """
+    index = _STATE['index']
+
+    if index is not None and _is_current(index, time.time()):
+        return index
+
+    with _LOCK:
+        if _STATE['index'] is not index:
+            return _STATE['index']
+        return _rebuild()
+
+
+def invalidate():
+    """Rebuild |TagIndexes| in all processes.
+
+    The index in the current process is discarded immediately. The
+    version is bumped once the current transaction commits, and other
+    processes rebuild their indexes the next time they check it.
+
+    Returns
+    -------
+    None
+
+    """
+    _STATE['index'] = None
+    versions.bump_version(_VERSION_KEY)
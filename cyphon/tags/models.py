@@ -35,7 +35,7 @@ from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
-from django.db import models
+from django.db import IntegrityError, models, transaction
 from django.utils.translation import ugettext_lazy as _
 import nltk
 
@@ -46,8 +46,8 @@ from cyphon.models import FindEnabledMixin
 from taxonomies.models import Taxonomy, TaxonomyManager
 from utils.parserutils.parserutils import get_dict_value
 from utils.validators.validators import lowercase_validator
+from . import index
 
-_LEMMATIZER = nltk.stem.WordNetLemmatizer()
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -91,9 +91,8 @@ class TagManager(models.Manager):
     @staticmethod
     def _get_tokens(value):
         """Convert a string into a set of raw and lemmatized tokens."""
-        tokens = nltk.word_tokenize(value)
-        tokens += [_LEMMATIZER.lemmatize(token) for token in tokens]
-        return set(tokens)
+        (dummy_tokens, terms) = index.tokenize(value)
+        return terms
 
     def get_by_natural_key(self, topic_name, tag_name):
         """Get a |Tag| by its natural key.
@@ -124,6 +123,12 @@ class TagManager(models.Manager):
     def process(self, value, obj, queryset=None, user=None):
         """Tag an object.
 
+        Finds the |Tags| that occur in the `value` using a cached
+        |TagIndex|, so the `value` is only tokenized once. A
+        single-token |Tag| matches if its name is one of the `value`'s
+        tokens or lemmas. A multi-token |Tag| matches if its tokens
+        appear together in the `value`.
+
         Parameters
         ----------
 
@@ -142,22 +147,19 @@ class TagManager(models.Manager):
 
         Returns
         -------
-        |TagRelation|
+        |list| of |TagRelations|
+            The |TagRelations| created for the object.
 
         """
+        tag_ids = index.get_index().match(value)
+        if not tag_ids:
+            return []
+
         if queryset is None:
             queryset = self.get_queryset()
 
-        tokens = self._get_tokens(value)
-
-        for tag in queryset:
-            tag_tokens = nltk.word_tokenize(tag.name)
-            if (len(tag_tokens) > 1):
-                contains_tag = tag.name in value
-            else:
-                contains_tag = tag.name in tokens
-            if contains_tag:
-                tag.assign_tag(obj)
+        tags = queryset.filter(pk__in=tag_ids)
+        return TagRelation.objects.assign_tags(tags, obj, user)
 
 
 class Tag(models.Model):
@@ -234,6 +236,78 @@ class Tag(models.Model):
         return tag_relation
 
 
+class TagRelationManager(models.Manager):
+    """Manage |TagRelation| objects.
+
+    Adds methods to the default Django model manager.
+    """
+
+    def _assign_in_turn(self, tags, obj, user):
+        """
+        Takes an iterable of Tags, an object, and an AppUser, and
+        assigns each Tag to the object separately. Returns a list of
+        the new TagRelations.
+        """
+        tag_relations = []
+        model_type = ContentType.objects.get_for_model(obj)
+        for tag in tags:
+            (tag_relation, created) = self.get_or_create(
+                content_type=model_type,
+                object_id=obj.pk,
+                tag=tag,
+                defaults={'tagged_by': user}
+            )
+            if created:
+                tag_relations.append(tag_relation)
+        return tag_relations
+
+    def assign_tags(self, tags, obj, user=None):
+        """Associate several |Tags| with an object.
+
+        Creates |TagRelations| for all the |Tags| the object doesn't
+        already have in a single query.
+
+        Parameters
+        ----------
+        tags : |list| or |QuerySet| of |Tags|
+            The |Tags| to assign.
+
+        obj : |Alert|, |Analysis|, or |Comment|
+            The object to be tagged.
+
+        user : |AppUser|
+            The user tagging the object. Default is |None|.
+
+        Returns
+        -------
+        |list| of |TagRelations|
+            The |TagRelations| that were created.
+
+        """
+        model_type = ContentType.objects.get_for_model(obj)
+        existing = set(self.filter(
+            content_type=model_type,
+            object_id=obj.pk
+        ).values_list('tag_id', flat=True))
+
+        new_tags = {tag.pk: tag for tag in tags if tag.pk not in existing}
+        if not new_tags:
+            return []
+
+        tag_relations = [
+            self.model(content_type=model_type, object_id=obj.pk,
+                       tag=tag, tagged_by=user)
+            for tag in new_tags.values()
+        ]
+
+        try:
+            with transaction.atomic():
+                return self.bulk_create(tag_relations)
+        except IntegrityError:
+            # another process tagged the object in the meantime
+            return self._assign_in_turn(new_tags.values(), obj, user)
+
+
 class TagRelation(models.Model):
     """Association between a |Tag| and an object.
 
@@ -287,6 +361,8 @@ class TagRelation(models.Model):
         on_delete=models.PROTECT
     )
 
+    objects = TagRelationManager()
+
     class Meta(object):
         """Metadata options."""
 
@@ -317,7 +393,8 @@ class DataTaggerManager(models.Manager, FindEnabledMixin):
         None
 
         """
-        for datatagger in self.find_enabled():
+        datataggers = self.find_enabled().prefetch_related('topics')
+        for datatagger in datataggers:
             datatagger.process(alert)
 
 
@@ -437,9 +514,10 @@ class DataTagger(models.Model):
     def _tag_partial_match(self, alert, value):
         """Assign a Tag to an Alert based on a partial match.
 
-        If a Tag contains more than one token, matches the Tag against
-        the raw field value. Otherwise, matches the Tag against a list
-        of tokens created from the field value.
+        Matches Tags against the tokens created from the field value.
+        A Tag that contains more than one token only matches if its
+        tokens appear consecutively in the field value, so "cat food"
+        matches "cat food bowl" but not "bobcat food".
         """
         tags = self._get_relevant_tags()
         Tag.objects.process(value, alert, tags)
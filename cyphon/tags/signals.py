@@ -20,16 +20,35 @@
 
 # third party
 from django.conf import settings
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 # local
+from alerts.handlers import alert_handler
 from alerts.models import Alert, Analysis, Comment
+from . import index
 from .models import DataTagger, Tag
 
 
+@receiver(post_save, sender=Tag, dispatch_uid='tags.index.save')
+@receiver(post_delete, sender=Tag, dispatch_uid='tags.index.delete')
+def update_index(sender, **kwargs):
+    """Rebuild the |TagIndex| when a |Tag| changes."""
+    index.invalidate()
+
+
 def tag_alert(sender, instance, created, **kwargs):
+    """Tag an updated |Alert|.
+
+    New Alerts are tagged by :func:`~tag_new_alert`.
+    """
+    if not created:
+        DataTagger.objects.process(instance)
+
+
+def tag_new_alert(alert):
     """Tag a new |Alert|."""
-    DataTagger.objects.process(instance)
+    DataTagger.objects.process(alert)
 
 
 def tag_analysis(sender, instance, created, **kwargs):
@@ -44,5 +63,6 @@ def tag_comment(sender, instance, created, **kwargs):
 
 if not settings.TEST:
     post_save.connect(tag_alert, sender=Alert)
+    alert_handler(tag_new_alert)
     post_save.connect(tag_analysis, sender=Analysis)
     post_save.connect(tag_comment, sender=Comment)
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2018 Dunbar Security Solutions, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+"""
+Benchmarks finding the Tags that occur in alert text.
+
+Compares tokenizing every Tag name for each piece of text, as
+TagManager.process used to, with a TagIndex built once.
+
+Run with::
+
+    python manage.py test tags.tests -p "benchmark_*.py"
+
+"""
+
+# standard library
+import random
+
+# third party
+from django.test import SimpleTestCase
+import nltk
+
+# local
+from tags.index import TagIndex, tokenize
+from utils.performance.benchmark import get_rate, report
+
+
+def _get_tags(num):
+    """
+    Returns (id, name) tuples for Tags, a quarter of which have more
+    than one token.
+    """
+    tags = []
+    for index in range(num):
+        if index % 4:
+            tags.append((index, 'tag%04d' % index))
+        else:
+            tags.append((index, 'tag%04d group' % index))
+    return tags
+
+
+def _get_texts(num, tags):
+    """
+    Returns alert texts, each mentioning a few Tags.
+    """
+    rand = random.Random(0)
+    words = ['alert', 'login', 'failed', 'from', 'host', 'user', 'error',
+             'detected', 'on', 'server', 'traffic', 'unusual']
+    texts = []
+    for _ in range(num):
+        text = [rand.choice(words) for _ in range(30)]
+        text += [rand.choice(tags)[1] for _ in range(3)]
+        rand.shuffle(text)
+        texts.append(' '.join(text) + '.')
+    return texts
+
+
+class TagIndexBenchmark(SimpleTestCase):
+    """
+    Finds 2,000 Tags in 1,000 alert texts.
+    """
+
+    TAGS = 2000
+    TEXTS = 1000
+
+    def test_texts_per_second(self):
+        """
+        Reports texts/sec for each approach.
+        """
+        tags = _get_tags(self.TAGS)
+        texts = _get_texts(self.TEXTS, tags)
+
+        def match_each_tag(value):
+            """Tokenizes every Tag name, as TagManager.process used to."""
+            (dummy_tokens, terms) = tokenize(value)
+            tag_ids = set()
+            for (tag_id, name) in tags:
+                if len(nltk.word_tokenize(name)) > 1:
+                    contains_tag = name in value
+                else:
+                    contains_tag = name in terms
+                if contains_tag:
+                    tag_ids.add(tag_id)
+            return tag_ids
+
+        tag_index = TagIndex(tags)
+
+        for text in texts[:20]:
+            self.assertEqual(tag_index.match(text), match_each_tag(text))
+
+        results = [
+            ('each tag', get_rate(match_each_tag, texts, repeat=1)),
+            ('index', get_rate(tag_index.match, texts)),
+        ]
+        report('Tag matching', results, unit='texts/sec')
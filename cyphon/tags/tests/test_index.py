@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2018 Dunbar Security Solutions, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+"""
+Tests the tags.index module.
+"""
+
+# standard library
+try:
+    from unittest.mock import patch
+except ImportError:
+    from mock import patch
+
+# third party
+from django.test import SimpleTestCase, TestCase
+
+# local
+from tags import index
+from tags.index import TagIndex
+from tags.models import Tag, Topic
+from tests.fixture_manager import get_fixtures
+
+
+class TagIndexTestCase(SimpleTestCase):
+    """
+    Tests the TagIndex class.
+    """
+
+    tags = [
+        (1, 'cat'),
+        (2, 'dog'),
+        (3, 'pied piper'),
+        (4, 'wild cats'),
+        (5, 'cat'),
+    ]
+
+    def setUp(self):
+        self.index = TagIndex(self.tags)
+
+    def test_len(self):
+        """
+        Tests the __len__ method.
+        """
+        self.assertEqual(len(self.index), 5)
+
+    def test_match_words(self):
+        """
+        Tests that single-token Tags match raw and lemmatized tokens.
+        """
+        self.assertEqual(self.index.match('some cats and a dog'), {1, 2, 5})
+
+    def test_match_phrases(self):
+        """
+        Tests that multi-token Tags match consecutive tokens.
+        """
+        self.assertEqual(self.index.match('about wild cats.'), {1, 4, 5})
+        self.assertEqual(self.index.match('the pied piper'), {3})
+        self.assertEqual(self.index.match('a pied shirt and a piper'), set())
+
+    def test_no_match(self):
+        """
+        Tests that an empty set is returned when no Tags match.
+        """
+        self.assertEqual(self.index.match('nothing to see here'), set())
+        self.assertEqual(self.index.match(''), set())
+
+
+class GetIndexTestCase(TestCase):
+    """
+    Tests the get_index function.
+    """
+    fixtures = get_fixtures(['tags'])
+
+    def setUp(self):
+        index.invalidate()
+
+    def test_reuse(self):
+        """
+        Tests that the same TagIndex is returned until Tags change.
+        """
+        tag_index = index.get_index()
+        self.assertIs(index.get_index(), tag_index)
+        self.assertEqual(len(tag_index), Tag.objects.count())
+
+    def test_new_tag(self):
+        """
+        Tests that the TagIndex is rebuilt when a Tag is created.
+        """
+        tag_index = index.get_index()
+        self.assertEqual(tag_index.match('a fresh kumquat'), set())
+        topic = Topic.objects.get_by_natural_key('Animals')
+        tag = Tag.objects.create(name='kumquat', topic=topic)
+        new_index = index.get_index()
+        self.assertIsNot(new_index, tag_index)
+        self.assertEqual(new_index.match('a fresh kumquat'), {tag.pk})
+
+    def test_version_bumped_on_commit(self):
+        """
+        Tests that the version is only bumped when a transaction that
+        saves a Tag commits.
+        """
+        version = index.get_version()
+        tag = Tag.objects.get(name='cat')
+        tag.save()
+        self.assertEqual(index.get_version(), version)
+
+        with patch('cyphon.versions.transaction.on_commit',
+                   side_effect=lambda func: func()) as mock_commit:
+            tag.save()
+        self.assertTrue(mock_commit.called)
+        self.assertGreater(index.get_version(), version)
+
+    def test_other_process(self):
+        """
+        Tests that the TagIndex is rebuilt when the version changes.
+        """
+        tag_index = index.get_index()
+        with patch('tags.index.get_version', return_value=-1):
+            with patch('tags.index._CHECK_INTERVAL', 0):
+                self.assertIsNot(index.get_index(), tag_index)
+
+    def test_max_age(self):
+        """
+        Tests that the TagIndex is rebuilt when it gets too old.
+        """
+        tag_index = index.get_index()
+        with patch('tags.index._MAX_AGE', 0):
+            self.assertIsNot(index.get_index(), tag_index)
@@ -89,6 +89,53 @@ class TagManagerTestCase(TransactionTestCase):
         Tag.objects.process(value=self.text, obj=self.alert, queryset=queryset)
         self.assertEquals(len(self.alert.associated_tags), 0)
 
+    def test_process_twice(self):
+        """
+        Tests that processing the same text twice doesn't create
+        duplicate TagRelations.
+        """
+        relations = Tag.objects.process(value=self.text, obj=self.alert)
+        self.assertEqual(len(relations), 2)
+        relations = Tag.objects.process(value=self.text, obj=self.alert)
+        self.assertEqual(relations, [])
+        self.assertEquals(len(self.alert.associated_tags), 2)
+
+
+class TagRelationManagerTestCase(TestCase):
+    """
+    Test cases for the TagRelationManager class.
+    """
+    fixtures = get_fixtures(['tags'])
+
+    def setUp(self):
+        self.alert = Alert.objects.get(pk=2)
+
+    def test_assign_tags(self):
+        """
+        Tests that only missing TagRelations are created.
+        """
+        cat = Tag.objects.get(name='cat')
+        dog = Tag.objects.get(name='dog')
+        cat.assign_tag(self.alert)
+        relations = TagRelation.objects.assign_tags([cat, dog], self.alert)
+        self.assertEqual([relation.tag for relation in relations], [dog])
+        self.assertEqual(set(self.alert.associated_tags), {cat, dog})
+
+    def test_race(self):
+        """
+        Tests that Tags are assigned in turn if another process creates
+        one of the TagRelations first.
+        """
+        cat = Tag.objects.get(name='cat')
+        dog = Tag.objects.get(name='dog')
+        cat.assign_tag(self.alert)
+        with patch.object(TagRelation.objects, 'filter') as mock_filter:
+            mock_filter.return_value.values_list.return_value = []
+            relations = TagRelation.objects.assign_tags([cat, dog],
+                                                        self.alert)
+        self.assertEqual([relation.tag for relation in relations], [dog])
+        self.assertEqual(set(self.alert.associated_tags), {cat, dog})
+
 
 class TagTestCase(TestCase):
     """
@@ -26,7 +26,7 @@ from django.test import TestCase
 # local
 from alerts.models import Alert, Analysis, Comment
 from tags.models import TagRelation
-from tags.signals import tag_alert, tag_analysis, tag_comment
+from tags.signals import tag_alert, tag_analysis, tag_comment, tag_new_alert
 from tests.fixture_manager import get_fixtures
 
 
@@ -54,11 +54,13 @@ class TagAlertTestCase(TestCase):
 
     def test_new_alert(self):
         """
-        Tests that a new Alert is tagged.
+        Tests that a new Alert is left for the tag_new_alert handler.
         """
         alert = self.alert
         alert.pk = None
         alert.save()
+        self.assertEquals(len(alert.associated_tags), 0)
+        tag_new_alert(alert)
         self.assertEquals(len(alert.associated_tags), 2)
 
 
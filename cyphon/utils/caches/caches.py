@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2018 Dunbar Security Solutions, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+"""
+Provides in-process caches for objects compiled from the database.
+
+Compiled objects, such as |CompiledSieves| and |CondenserPlans|, are
+kept for a limited time so that changes made in other processes are
+picked up, and are discarded at once when a model they depend on is
+saved or deleted in the same process.
+
+============================  ==========================================
+Class                         Description
+============================  ==========================================
+:class:`~TimedCache`          Thread-safe cache with expiring entries.
+============================  ==========================================
+
+============================  ==========================================
+Function                      Description
+============================  ==========================================
+:func:`~clear_on_change`      Clear a cache when models change.
+============================  ==========================================
+
+"""
+
+# standard library
+import threading
+import time
+
+# third party
+from django.db.models.signals import post_delete, post_save
+
+
+class TimedCache(object):
+    """A thread-safe cache whose entries expire.
+
+    Parameters
+    ----------
+    timeout : |int| or |float|
+        Number of seconds for which an entry is kept.
+
+    """
+
+    def __init__(self, timeout):
+        self.timeout = timeout
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """Return the number of entries in the cache."""
+        return len(self._entries)
+
+    def get(self, key, create):
+        """Get a cached value, creating it if needed.
+
+        Parameters
+        ----------
+        key : hashable
+            The key of the value.
+
+        create : callable
+            A function that takes no arguments and returns the value,
+            called if the value isn't cached or has expired.
+
+        Returns
+        -------
+        object
+            The cached or newly created value.
+
+        """
+        now = time.time()
+        cached = self._entries.get(key)
+
+        if cached is not None and now - cached[1] < self.timeout:
+            return cached[0]
+
+        value = create()
+
+        with self._lock:
+            stale = [old_key for (old_key, (dummy_value, created))
+                     in self._entries.items()
+                     if now - created >= self.timeout]
+            for old_key in stale:
+                del self._entries[old_key]
+            self._entries[key] = (value, now)
+
+        return value
+
+    def clear(self):
+        """Discard all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+def clear_on_change(clear, models, dispatch_uid):
+    """Call a function when instances of some models change.
+
+    Parameters
+    ----------
+    clear : callable
+        A function that takes no arguments, such as a cache's `clear`
+        method.
+
+    models : |tuple| of |Model| classes
+        The models whose instances should trigger the function when
+        they are saved or deleted.
+
+    dispatch_uid : str
+        A unique prefix for the identifiers of the signal receivers.
+
+    Returns
+    -------
+    function
+        The receiver connected to the signals.
+
+    """
+    def _receiver(sender, **kwargs):
+        """Call the function if the sender is one of the models."""
+        if issubclass(sender, models):
+            clear()
+
+    post_save.connect(_receiver, weak=False,
+                      dispatch_uid=dispatch_uid + '.save')
+    post_delete.connect(_receiver, weak=False,
+                        dispatch_uid=dispatch_uid + '.delete')
+    return _receiver
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2018 Dunbar Security Solutions, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+"""
+Tests functions in the caches package.
+"""
+
+# standard library
+from unittest import TestCase
+try:
+    from unittest.mock import Mock, patch
+except ImportError:
+    from mock import Mock, patch
+
+# local
+from utils.caches.caches import TimedCache, clear_on_change
+
+
+class TimedCacheTestCase(TestCase):
+    """
+    Tests the TimedCache class.
+    """
+
+    def setUp(self):
+        self.cache = TimedCache(timeout=60)
+        self.create = Mock(side_effect=lambda: object())
+
+    def test_cached(self):
+        """
+        Tests that a value is only created once while it is fresh.
+        """
+        value = self.cache.get('foo', self.create)
+        self.assertIs(self.cache.get('foo', self.create), value)
+        self.assertEqual(self.create.call_count, 1)
+
+    def test_expired(self):
+        """
+        Tests that expired values are created again and pruned.
+        """
+        self.cache.get('foo', self.create)
+        self.cache.timeout = 0
+        self.cache.get('bar', self.create)
+        self.cache.get('foo', self.create)
+        self.assertEqual(self.create.call_count, 3)
+        self.assertEqual(len(self.cache), 1)
+
+    def test_clear(self):
+        """
+        Tests the clear method.
+        """
+        self.cache.get('foo', self.create)
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+        self.cache.get('foo', self.create)
+        self.assertEqual(self.create.call_count, 2)
+
+
+class ClearOnChangeTestCase(TestCase):
+    """
+    Tests the clear_on_change function.
+    """
+
+    def test_clear_on_change(self):
+        """
+        Tests that the function is only called for the given models.
+        """
+        class Foo(object):
+            pass
+
+        class Bar(object):
+            pass
+
+        clear = Mock()
+        with patch('utils.caches.caches.post_save'), \
+                patch('utils.caches.caches.post_delete'):
+            receiver = clear_on_change(clear, (Foo, ), 'tests.foo')
+        receiver(sender=Bar)
+        self.assertFalse(clear.called)
+        receiver(sender=Foo)
+        clear.assert_called_once_with()
@@ -65,107 +65,182 @@ def html_to_text(html):
     return os.linesep.join(lines)
 
 
-def get_dict_value(field_name, doc):
-    """Return the value of a dictionary item.
+#: The maximum number of compiled FieldPaths kept by get_field_path.
+_FIELD_PATH_CACHE_SIZE = 4096
+
+_FIELD_PATHS = {}
+
+
+def _parse_index(index):
+    """
+    Takes a string representing an array index, e.g. "0]", and returns
+    it as an integer. If the string is not a valid index, returns the
+    string, so the error is raised when the index is used, as if the
+    path had been parsed at that time.
+    """
+    # remove trailing bracket from index value
+    index = index.replace(']', '')
+    try:
+        return int(index)
+    except ValueError:
+        return index
+
+
+class FieldPath(object):
+    """A precompiled path to a value in a nested dictionary.
+
+    The `field_name` is parsed into a tuple of keys and array indexes
+    when the FieldPath is created, so values can be looked up without
+    parsing the `field_name` or copying the document again.
 
     Parameters
     ----------
     field_name : |str|
+        The path to the value, using dot notation for nested
+        dictionaries (e.g., 'parentkey.childkey') and brackets for
+        array indexes (e.g., 'tags[0]').
 
-    doc : |dict|
-        A data dictionary.
+    Attributes
+    ----------
+    field_name : |str|
+        The path to the value.
 
-    Returns
+    Example
     -------
-    any type
-        The value associated with the given `field_name` from the `doc`.
+    >>> path = FieldPath('a.b[0].c[1][1]')
+    >>> path.get({'a': {'b': [{'c': [100, [15, 20]]}, {'d': 40}], 'e': 10}})
+    20
 
-    Note
-    ----
-    For a nested dictionary, use dot notation in the `field_name`
-    (e.g., 'parentkey.childkey'). You may also reference an array value
-    by its index (e.g., 'tags[0]').
+    """
 
-    Examples
-    --------
-    >>> get_value('a.b.c', {'a': {'b': {'c': 100}}})
-    100
+    __slots__ = ('field_name', '_steps')
 
-    >>> doc = {'a': {'b': [{'c': [100, [15, 20]]}, {'d': 40}], 'e': 10}}
-    >>> field = 'a.b[0].c[1][1]'
-    >>> get_dict_value(field, doc)
-    20
+    def __init__(self, field_name):
+        self.field_name = field_name
+        self._steps = tuple(self._parse_key(key)
+                            for key in field_name.split('.'))
 
-    """
+    def __repr__(self):
+        return '<%s: %s>' % (self.__class__.__name__, self.field_name)
 
-    def get_array_value(doc, key):
+    @staticmethod
+    def _parse_key(key):
         """
-        Takes a dictionary (doc) and a string (key) representing a dictionary
-        key and one or more array indexes, e.g. "location[0][1]". Returns the
-        corresponding value from the dictionary.
+        Takes a string representing a dictionary key and any array
+        indexes, e.g. "location[0][1]", and returns a tuple of the key
+        and a tuple of the indexes, e.g. ('location', (0, 1)).
         """
         # split key at the start of array values, e.g. 'loc[0]' -> ['loc', '0]']
         key_parts = key.split('[')
+        indexes = tuple(_parse_index(index) for index in key_parts[1:])
+        return (key_parts[0], indexes)
+
+    def get(self, doc):
+        """Return the value at the path in a dictionary.
+
+        Parameters
+        ----------
+        doc : |dict|
+            A data dictionary.
+
+        Returns
+        -------
+        any type
+            The value at the path, or |None| if a key in the path
+            cannot be found. If a value along the path is not a
+            dictionary, that value is returned.
 
-        # get the name of the parent field, e.g. "loc"
-        key = key_parts.pop(0)
+        Warning
+        -------
+        The value is not copied, so it should not be modified.
 
-        # get the dictionary value, which is the first array
-        array = doc[key]
+        """
+        value = ''
 
-        while len(key_parts) > 0:
+        try:
+            for (key, indexes) in self._steps:
 
-            index = key_parts.pop(0)
+                if not isinstance(doc, dict):
+                    return doc
 
-            # remove trailing bracket from index value
-            index = index.replace(']', '')
+                value = doc[key]
 
-            # need to convert the string to an integer to use it as an index
-            index = int(index)
+                for index in indexes:
+                    if not isinstance(index, int):
+                        index = int(index)
+                    value = value[index]
 
-            value = array[index]
+                doc = value
 
-            # step into the next array
-            array = value
+        except KeyError:
+            return None
 
         return value
 
-    if isinstance(field_name, str):
 
-        doc_copy = deepcopy(doc)
+def get_field_path(field_name):
+    """Get a compiled |FieldPath| for a field name.
 
-        # parse the string into a list of keys
-        keys = field_name.split('.')
-        value = ''
+    FieldPaths are cached, so each field name is only parsed once.
 
-        try:
-            while len(keys) > 0:
+    Parameters
+    ----------
+    field_name : |str|
+        The path to a value in a dictionary.
 
-                if isinstance(doc_copy, dict):
+    Returns
+    -------
+    |FieldPath|
+        A compiled path for the `field_name`.
 
-                    key = keys.pop(0)
+    """
+    try:
+        return _FIELD_PATHS[field_name]
+    except KeyError:
+        if len(_FIELD_PATHS) >= _FIELD_PATH_CACHE_SIZE:
+            _FIELD_PATHS.clear()
+        path = FieldPath(field_name)
+        _FIELD_PATHS[field_name] = path
+        return path
 
-                    # remove any leading or trailing whitespaces
-                    key.strip()
 
-                    # check if the key includes an array index (e.g., 'location[0]')
-                    if '[' in key:
-                        value = get_array_value(doc_copy, key)
-                    else:
-                        value = doc_copy[key]
+def get_dict_value(field_name, doc):
+    """Return the value of a dictionary item.
 
-                    doc_copy = value
+    Parameters
+    ----------
+    field_name : |str|
 
-                else:
-                    return doc_copy
+    doc : |dict|
+        A data dictionary.
 
-        except KeyError:
-            # log this error so user knows to correct field_name
-            # LOGGER.warning('The field_name "%s" cannot be found in the document %s.',
-            #                field_name, str(doc)[:160])
-            return None
+    Returns
+    -------
+    any type
+        The value associated with the given `field_name` from the `doc`.
 
-        return value
+    Note
+    ----
+    For a nested dictionary, use dot notation in the `field_name`
+    (e.g., 'parentkey.childkey'). You may also reference an array value
+    by its index (e.g., 'tags[0]').
+
+    The value is looked up with a cached |FieldPath| and is not copied,
+    so it should not be modified.
+
+    Examples
+    --------
+    >>> get_value('a.b.c', {'a': {'b': {'c': 100}}})
+    100
+
+    >>> doc = {'a': {'b': [{'c': [100, [15, 20]]}, {'d': 40}], 'e': 10}}
+    >>> field = 'a.b[0].c[1][1]'
+    >>> get_dict_value(field, doc)
+    20
+
+    """
+    if isinstance(field_name, str):
+        return get_field_path(field_name).get(doc)
 
 
 def merge_dict(target, addition):
@@ -208,6 +283,8 @@ def abridge_dict(schema, data):
     for field in schema:
         value = get_dict_value(field.field_name, data)
         if value:
+            # copy the value so the abridged dict can't modify the data
+            value = deepcopy(value)
             keys = field.field_name.split('.')
             val = {keys.pop(-1): value}
             while len(keys):
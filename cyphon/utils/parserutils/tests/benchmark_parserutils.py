@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2018 Dunbar Security Solutions, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+"""
+Benchmarks looking up fields in nested documents with a compiled
+FieldPath.
+
+Run with::
+
+    python manage.py test utils.parserutils.tests -p "benchmark_*.py"
+
+"""
+
+# standard library
+from copy import deepcopy
+import json
+from unittest import TestCase
+
+# local
+from utils.parserutils import parserutils
+from utils.performance.benchmark import get_peak_memory, get_rate, report
+
+
+def _create_doc(num):
+    """
+    Returns a nested document of about 10 KB.
+    """
+    return {
+        'message': 'log line %s' % num,
+        'host': {'name': 'host-%s' % num, 'ip': '10.0.0.%s' % (num % 255)},
+        'events': [
+            {
+                'id': i,
+                'user': {'name': 'user_%s' % i, 'groups': ['a', 'b', 'c']},
+                'tags': ['tag_%s' % j for j in range(10)],
+            }
+            for i in range(60)
+        ],
+    }
+
+
+class FieldPathBenchmark(TestCase):
+    """
+    Compares looking up a field by copying the document, as
+    get_dict_value used to, with a compiled FieldPath.
+    """
+
+    DOCS = 2000
+    FIELD_NAME = 'events[20].user.groups[1]'
+
+    def test_lookups_per_second(self):
+        """
+        Reports lookups/sec and peak memory for each approach.
+        """
+        docs = [_create_doc(num) for num in range(self.DOCS)]
+        self.assertGreater(len(json.dumps(docs[0])), 10000)
+
+        path = parserutils.FieldPath(self.FIELD_NAME)
+        field_name = self.FIELD_NAME
+
+        def get_with_copy(doc):
+            """Copies the document before walking the path."""
+            return parserutils.FieldPath(field_name).get(deepcopy(doc))
+
+        def get_dict_value(doc):
+            """Looks up the field with get_dict_value."""
+            return parserutils.get_dict_value(field_name, doc)
+
+        for doc in docs[:10]:
+            self.assertEqual(get_with_copy(doc), 'b')
+            self.assertEqual(get_dict_value(doc), 'b')
+
+        results = [
+            ('deepcopy', get_rate(get_with_copy, docs, repeat=1)),
+            ('get_dict_value', get_rate(get_dict_value, docs)),
+            ('FieldPath', get_rate(path.get, docs)),
+        ]
+        report('Nested 10 KB documents', results, unit='lookups/sec')
+
+        memory = [
+            ('deepcopy', get_peak_memory(get_with_copy, docs[:100])),
+            ('FieldPath', get_peak_memory(path.get, docs[:100])),
+        ]
+        for label, peak in memory:
+            print('%s: %s bytes peak' % (label, peak))
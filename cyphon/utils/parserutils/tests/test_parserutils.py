@@ -111,6 +111,65 @@ class GetDictValueTestCase(TestCase):
         field = 'a.b[0].c[1][1]'
         self.assertEqual(parserutils.get_dict_value(field, doc), 20)
 
+    def test_not_a_string(self):
+        """
+        Tests method for a field name that isn't a string.
+        """
+        self.assertEqual(parserutils.get_dict_value(None, {'a': 1}), None)
+
+    def test_value_not_copied(self):
+        """
+        Tests that the value is returned without copying the document.
+        """
+        doc = {'a': {'b': [1, 2]}}
+        self.assertIs(parserutils.get_dict_value('a.b', doc), doc['a']['b'])
+
+
+class FieldPathTestCase(TestCase):
+    """
+    Tests the FieldPath class.
+    """
+
+    def test_get(self):
+        """
+        Tests the get method for a nested path with array indexes.
+        """
+        path = parserutils.FieldPath('a.b[0].c[1][1]')
+        doc = {'a': {'b': [{'c': [100, [15, 20]]}, {'d': 40}], 'e': 10}}
+        self.assertEqual(path.get(doc), 20)
+
+    def test_get_missing_key(self):
+        """
+        Tests the get method for a path that isn't in the document.
+        """
+        path = parserutils.FieldPath('a.c')
+        self.assertEqual(path.get({'a': {'b': 1}}), None)
+
+    def test_get_through_non_dict(self):
+        """
+        Tests the get method for a path through a value that isn't a
+        dictionary.
+        """
+        path = parserutils.FieldPath('a.b.c')
+        self.assertEqual(path.get({'a': 5}), 5)
+
+    def test_get_invalid_index(self):
+        """
+        Tests the get method for a path with an invalid array index.
+        """
+        path = parserutils.FieldPath('a[x]')
+        with self.assertRaises(ValueError):
+            path.get({'a': [1, 2]})
+
+    def test_get_field_path_cached(self):
+        """
+        Tests that get_field_path returns the same FieldPath for a
+        field name.
+        """
+        path = parserutils.get_field_path('a.b')
+        self.assertIs(parserutils.get_field_path('a.b'), path)
+        self.assertEqual(path.field_name, 'a.b')
+
 
 class AbridgeDictTestCase(TestCase):
     """
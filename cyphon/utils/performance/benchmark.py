@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2018 Dunbar Security Solutions, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+"""
+Provides helper functions for benchmarking.
+
+Benchmarks live alongside an app's tests in modules named
+``benchmark_*.py``, so they are not run with the regular test suite.
+Run them with the Django test runner, e.g.::
+
+    python manage.py test -p "benchmark_*.py"
+
+"""
+
+# standard library
+import time
+import tracemalloc
+
+
+def get_rate(func, items, repeat=3):
+    """Measure how many items per second a function can process.
+
+    Parameters
+    ----------
+    func : callable
+        A function that takes a single item.
+
+    items : list
+        The items to process.
+
+    repeat : int
+        The number of times to process the items. The fastest run is
+        used.
+
+    Returns
+    -------
+    float
+        The number of items processed per second in the fastest run.
+
+    """
+    best = None
+
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        for item in items:
+            func(item)
+        deltatime = time.perf_counter() - start_time
+
+        if best is None or deltatime < best:
+            best = deltatime
+
+    return len(items) / best if best else float('inf')
+
+
+def get_peak_memory(func, items):
+    """Measure the peak memory allocated while processing items.
+
+    Parameters
+    ----------
+    func : callable
+        A function that takes a single item.
+
+    items : list
+        The items to process.
+
+    Returns
+    -------
+    int
+        The peak number of bytes allocated while processing the items,
+        not counting memory that was already allocated.
+
+    """
+    tracemalloc.start()
+    try:
+        for item in items:
+            func(item)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def report(title, results, unit='items/sec'):
+    """Print benchmark results.
+
+    Parameters
+    ----------
+    title : str
+        The name of the benchmark.
+
+    results : list of tuple
+        A list of (label, rate) tuples.
+
+    unit : str
+        The unit of the rates.
+
+    """
+    print('\n====%s Benchmark====' % title)
+    baseline = results[0][1] if results else None
+    for label, rate in results:
+        speedup = rate / baseline if baseline else 0
+        print('%s: %.1f %s (%.1fx)' % (label, rate, unit, speedup))
+    print('==== end ====\n')
@@ -41,6 +41,7 @@ class WarehouseAdmin(admin.ModelAdmin):
         'name',
         'backend',
         'time_series',
+        'refresh_policy',
     )
 
     ordering = ['backend', 'name']
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2018 Dunbar Security Solutions, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+#
+# Generated by Django 1.11.7 on 2026-10-18 12:00
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('warehouses', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='collection',
+            name='refresh_policy',
+            field=models.CharField(blank=True, choices=[('immediate', 'Immediate'), ('wait_for', 'Wait for refresh'), ('none', 'None (periodic refresh)')], help_text='Overrides the refresh policy of the Warehouse.', max_length=20),
+        ),
+        migrations.AddField(
+            model_name='warehouse',
+            name='refresh_policy',
+            field=models.CharField(choices=[('immediate', 'Immediate'), ('wait_for', 'Wait for refresh'), ('none', 'None (periodic refresh)')], default='immediate', help_text='When used with Elasticsearch, determines when new documents become searchable. "Immediate" refreshes the index after every write, which slows down bulk indexing.', max_length=20),
+        ),
+    ]
@@ -43,6 +43,8 @@ from django.utils.functional import cached_property
 from django.utils.translation import ugettext_lazy as _
 
 # local
+from engines.engine import REFRESH_IMMEDIATE, REFRESH_POLICY_CHOICES
+from engines import registry
 from engines.registry import ENGINES_PACKAGE, ENGINE_MODULE, BACKEND_CHOICES
 from utils.validators.validators import db_name_validator, lowercase_validator
 
@@ -103,6 +105,11 @@ class Warehouse(models.Model):
         Whether data should be stored as a time series (e.g.,
         timestamped indexes).
 
+    refresh_policy : str
+        When documents written to the Warehouse should become visible
+        to searches. Choices are constrained to
+        |REFRESH_POLICY_CHOICES|.
+
     """
     _DEFAULT_STORAGE_ENGINE = _WAREHOUSE_SETTINGS['DEFAULT_STORAGE_ENGINE']
 
@@ -117,6 +124,14 @@ class Warehouse(models.Model):
         help_text=_('When used with Elasticsearch, stores each day\'s '
                     'data in a separate index. Allows easy deletion '
                     'of old data in Elasticsearch.'))
+    refresh_policy = models.CharField(
+        max_length=20,
+        choices=REFRESH_POLICY_CHOICES,
+        default=REFRESH_IMMEDIATE,
+        help_text=_('When used with Elasticsearch, determines when new '
+                    'documents become searchable. "Immediate" refreshes '
+                    'the index after every write, which slows down bulk '
+                    'indexing.'))
 
     objects = WarehouseManager()
 
@@ -259,12 +274,21 @@ class Collection(models.Model):
         The name of a document collection, doc type, or database table,
         depending on the |Warehouse| backend.
 
+    refresh_policy : str
+        When documents written to the Collection should become visible
+        to searches. If blank, the |Warehouse|'s refresh policy is used.
+
     """
 
     warehouse = models.ForeignKey(Warehouse, related_name='collections',
                                   related_query_name='collection')
     name = models.CharField(max_length=40, verbose_name='collection name',
                             validators=[db_name_validator])
+    refresh_policy = models.CharField(
+        max_length=20,
+        choices=REFRESH_POLICY_CHOICES,
+        blank=True,
+        help_text=_('Overrides the refresh policy of the Warehouse.'))
 
     objects = CollectionManager()
 
@@ -364,6 +388,18 @@ class Collection(models.Model):
 
     in_time_series.short_description = 'time series'
 
+    def get_refresh_policy(self):
+        """Get the refresh policy for the Collection.
+
+        Returns
+        -------
+        str
+            The Collection's refresh policy, or the refresh policy of
+            its |Warehouse| if the Collection does not define one.
+
+        """
+        return self.refresh_policy or self.warehouse.refresh_policy
+
     def get_warehouse_name(self):
         """Get the name of the Collection's |Warehouse|.
 
@@ -434,6 +470,10 @@ class Collection(models.Model):
     def engine(self):
         """An |Engine| for handling documents.
 
+        The |Engine| is shared by all instances of the Collection in
+        the current process, so that its data store is only set up
+        once.
+
         Returns
         -------
         |Engine|
@@ -441,7 +481,9 @@ class Collection(models.Model):
             handle documents associated with the Collection.
 
         """
-        return self._get_engine()
+        if self.pk is None:
+            return self._get_engine()
+        return registry.get_engine(self.pk, self._get_engine)
 
     def find_by_id(self, doc_ids):
         """Find one or more documents by id.
@@ -490,6 +532,108 @@ class Collection(models.Model):
         """
         return self.engine.find(query, sorter, page, page_size)
 
+    def supports_multi_search(self):
+        """Whether the Collection can be searched in a batch.
+
+        Returns
+        -------
+        bool
+            Whether the Collection's backend can run searches of several
+            Collections in a single request.
+
+        """
+        module = self._get_module()
+        return getattr(module, 'MULTI_SEARCH_ENABLED', False)
+
+    @staticmethod
+    def find_many(searches):
+        """Find documents matching queries in several Collections.
+
+        Parameters
+        ----------
+        searches : |list| of |tuple|
+            A list of (Collection, |EngineQuery|, |Sorter| or |None|,
+            page, page_size) tuples. All the Collections must use the
+            same backend.
+
+        Returns
+        -------
+        |list| of |dict| or |None|
+            The result of each search, in the same order as `searches`,
+            in the format returned by :meth:`~Collection.find`. A search
+            that fails returns |None|.
+
+        """
+        if not searches:
+            return []
+
+        engine_class = searches[0][0]._get_class()
+        engine_searches = [
+            (collection.engine, query, sorter, page, page_size)
+            for (collection, query, sorter, page, page_size) in searches
+        ]
+        return engine_class.find_many(engine_searches) or \
+            [None] * len(searches)
+
+    def supports_cross_collection_search(self):
+        """Whether the Collection can be searched with others in one query.
+
+        Returns
+        -------
+        bool
+            Whether the Collection's backend can search several
+            Collections with a single query that returns one sorted and
+            paginated set of results.
+
+        """
+        module = self._get_module()
+        return getattr(module, 'CROSS_COLLECTION_ENABLED', False)
+
+    @staticmethod
+    def find_across(searches, key, sorter=None, page=1,
+                    page_size=_PAGE_SIZE):
+        """Find documents in several Collections with a single query.
+
+        Parameters
+        ----------
+        searches : |list| of |tuple|
+            A list of (Collection, |EngineQuery|, value) tuples, where
+            `value` is the value of the `key` field in documents from
+            that Collection. All the Collections must use the same
+            backend.
+
+        key : str
+            The name of the field that identifies the source of a
+            document.
+
+        sorter : |Sorter| or |None|
+            The order in which all results are sorted.
+
+        page : int
+            The page of results to return.
+
+        page_size : int
+            The number of results on each page.
+
+        Returns
+        -------
+        |dict| or |None|
+            A dictionary with keys 'count', 'results', and 'counts'. The
+            'counts' value maps each search's key value to its number of
+            matching documents. Returns |None| if the search fails.
+
+        """
+        if not searches:
+            return {'count': 0, 'results': [], 'counts': {}}
+
+        engine_class = searches[0][0]._get_class()
+        engine_searches = [
+            (collection.engine, query, value)
+            for (collection, query, value) in searches
+        ]
+        return engine_class.find_across(engine_searches, key, sorter,
+                                        page, page_size)
+
     def filter_ids(self, doc_ids, fields, value):
         """Find the ids of documents that match a value.
 
@@ -535,6 +679,40 @@ class Collection(models.Model):
         except Exception as error:  # pylint: disable=W0703
             _LOGGER.exception('Insertion error: %s', error)
 
+    def insert_many(self, docs):
+        """Save multiple documents to the Collection.
+
+        Parameters
+        ----------
+        docs : |list| of |dict|
+            Documents to insert into the data store represented by the
+            Collection.
+
+        Returns
+        -------
+        dict
+            A dictionary with keys 'ids' and 'errors'. The 'ids' value
+            is a list of the ids of the inserted documents, in the same
+            order as `docs`, with |None| for any document that could
+            not be inserted. The 'errors' value is a list of
+            dictionaries with keys 'index' and 'error' describing each
+            failed document.
+
+        Raises
+        ------
+        Exception
+            Unlike :meth:`~Collection.insert`, errors that prevent the
+            whole batch from being saved (such as a lost connection) are
+            not caught, so that the caller can retry the batch.
+
+        """
+        result = self.engine.insert_many(docs)
+
+        for error in result['errors']:
+            _LOGGER.error('Insertion error: %s', error['error'])
+
+        return result
+
     def remove_by_id(self, doc_ids):
         """Remove the documents with the given ids.
 
@@ -15,24 +15,48 @@
 # You should have received a copy of the GNU General Public License
 # along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
 """
-Creates a signal to send when a |Distillery| saves a document.
+Defines receivers for signals that affect |Engines|.
 
-========================  ===================================
-Constant                  Description
-========================  ===================================
-:const:`~document_saved`  |Signal| that a document was saved.
-========================  ===================================
+===============================  ======================================
+Function                         Description
+===============================  ======================================
+:func:`~invalidate_engines`      Discard shared |Engines| on changes.
+:func:`~put_template`            Create an index template.
+===============================  ======================================
 
 """
 
 # third party
-from django.db.models.signals import post_save
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 
 # local
 from distilleries.models import Distillery
+from engines import registry
 from warehouses.models import Collection
 
+ENGINE_APPS = (
+    'bottles',
+    'containers',
+    'distilleries',
+    'labels',
+    'warehouses',
+)
+"""|tuple| of |str|
+
+Labels of apps whose models determine how an |Engine| is set up.
+"""
+
+
+@receiver(post_save, dispatch_uid='warehouses.invalidate_engines.save')
+@receiver(post_delete, dispatch_uid='warehouses.invalidate_engines.delete')
+@receiver(m2m_changed, dispatch_uid='warehouses.invalidate_engines.m2m')
+def invalidate_engines(sender, **kwargs):
+    """Discard shared |Engines| when their configuration changes."""
+    if sender._meta.app_label in ENGINE_APPS:
+        registry.invalidate()
+        registry.bump_version()
+
 
 @receiver(post_save, sender=Distillery)
 @receiver(post_save, sender=Collection)
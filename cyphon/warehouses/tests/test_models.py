@@ -279,6 +279,24 @@ class CollectionTestCase(TestCase):
         expected = True
         self.assertIs(actual, expected)
 
+    def test_get_refresh_policy_default(self):
+        """
+        Tests the get_refresh_policy method when the Collection does not
+        define a refresh policy.
+        """
+        collection = Collection.objects.get(pk=3)
+        collection.warehouse.refresh_policy = 'wait_for'
+        self.assertEqual(collection.get_refresh_policy(), 'wait_for')
+
+    def test_get_refresh_policy_override(self):
+        """
+        Tests the get_refresh_policy method when the Collection defines
+        its own refresh policy.
+        """
+        collection = Collection.objects.get(pk=3)
+        collection.refresh_policy = 'none'
+        self.assertEqual(collection.get_refresh_policy(), 'none')
+
     def test_get_warehouse_none(self):
         """
         Tests the get_warehouse_name method.
@@ -382,6 +400,35 @@ class CollectionTestCase(TestCase):
                 ('warehouses.models', 'ERROR', 'Insertion error: %s' % msg),
             )
 
+    @patch('warehouses.models.Collection.engine')
+    def test_insert_many(self, mock_engine):
+        """
+        Tests the insert_many method of the Collection class.
+        """
+        mock_result = {
+            'ids': [self.mock_doc_id, None],
+            'errors': [{'index': 1, 'error': 'msg'}]
+        }
+        self.collection.engine.insert_many = Mock(return_value=mock_result)
+        with LogCapture() as log_capture:
+            result = self.collection.insert_many([self.doc, self.doc])
+            log_capture.check(
+                ('warehouses.models', 'ERROR', 'Insertion error: msg'),
+            )
+        self.collection.engine.insert_many.assert_called_once_with(
+            [self.doc, self.doc])
+        self.assertEqual(result, mock_result)
+
+    @patch('warehouses.models.Collection.engine')
+    def test_insert_many_error(self, mock_engine):
+        """
+        Tests that the insert_many method of the Collection class
+        raises an Exception that prevents the batch from being saved.
+        """
+        self.collection.engine.insert_many = Mock(side_effect=Exception('msg'))
+        with self.assertRaises(Exception):
+            self.collection.insert_many([self.doc])
+
     @patch('warehouses.models.Collection.engine')
     def test_find(self, mock_engine):
         """
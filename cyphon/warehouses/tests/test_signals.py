@@ -15,7 +15,7 @@
 # You should have received a copy of the GNU General Public License
 # along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
 """
-Tests signals for Distilleries.
+Tests signals for Warehouses.
 """
 
 # standard library
@@ -29,6 +29,7 @@ from django.test import TransactionTestCase
 
 # local
 from distilleries.models import Distillery
+from engines import registry
 from tests.fixture_manager import get_fixtures
 from warehouses.models import Collection
 
@@ -70,3 +71,49 @@ class PutTemplateTestCase(TransactionTestCase):
             distillery.save()
         except AttributeError:
             self.fail('put_template() raised AttributeError unexpectedly')
+
+
+class InvalidateEnginesTestCase(TransactionTestCase):
+    """
+    Tests the invalidate_engines signal receiver.
+    """
+
+    fixtures = get_fixtures(['distilleries'])
+
+    def tearDown(self):
+        registry.invalidate()
+
+    @patch('engines.registry.invalidate')
+    def test_collection_saved(self, mock_invalidate):
+        """
+        Tests that shared Engines are discarded when a Collection is
+        saved.
+        """
+        collection = Collection.objects.get_by_natural_key(
+            'mongodb', 'test_database', 'test_docs')
+        collection.save()
+        mock_invalidate.assert_called_with()
+
+    @patch('engines.registry.invalidate')
+    def test_container_saved(self, mock_invalidate):
+        """
+        Tests that shared Engines are discarded when a Container is
+        saved.
+        """
+        distillery = Distillery.objects.get_by_natural_key(
+            'mongodb.test_database.test_docs')
+        distillery.container.save()
+        mock_invalidate.assert_called_with()
+
+    @patch('warehouses.models.Collection._get_engine')
+    def test_engine_shared(self, mock_get_engine):
+        """
+        Tests that separately fetched Collections share an Engine.
+        """
+        mock_get_engine.return_value.is_ready.return_value = True
+        registry.invalidate()
+        collection_1 = Collection.objects.get(pk=1)
+        collection_2 = Collection.objects.get(pk=1)
+        self.assertIs(collection_1.engine, collection_2.engine)
+        self.assertEqual(mock_get_engine.call_count, 1)
+
@@ -32,6 +32,7 @@ from alarms.models import Alarm, AlarmManager
 from alerts.models import Alert
 from categories.models import Category
 from cyphon.choices import ALERT_LEVEL_CHOICES, TIME_UNIT_CHOICES
+from cyphon.snapshot import get_active_snapshot
 from utils.dbutils.dbutils import json_encodeable
 from sifter.datasifter.datasieves.models import DataSieve
 
@@ -63,10 +64,16 @@ class WatchdogManager(AlarmManager):
 
         Returns
         -------
-        |Queryset|
-            A |Queryset| of |Watchdogs| for inspecting a document.
+        |Queryset| or |list|
+            A |Queryset| of |Watchdogs| for inspecting a document, or
+            a |list| of |Watchdogs| if a configuration snapshot is
+            active.
 
         """
+        snapshot = get_active_snapshot()
+        if snapshot is not None:
+            return snapshot.find_relevant_watchdogs(distillery)
+
         enabled_watchdogs = self.find_enabled()
         categories = self._get_categories(distillery)
         queryset = enabled_watchdogs.annotate(
@@ -339,7 +346,7 @@ class Trigger(models.Model):
         Takes a data dictionary and returns a Boolean indicating whether
         it matches the Trigger's DataSieve.
         """
-        return self.sieve.is_match(data)
+        return self.sieve.get_compiled().is_match(data)
 
 
 class Muzzle(models.Model):
@@ -338,10 +338,11 @@ class TriggerTestCase(TestCase):
         Tests the is_match method.
         """
         with patch('watchdogs.models.Trigger.sieve') as mock_sieve:
-            mock_sieve.is_match = Mock(return_value=True)
+            mock_compiled = mock_sieve.get_compiled.return_value
+            mock_compiled.is_match = Mock(return_value=True)
             data = {'title': 'test'}
             result = self.trigger.is_match(data)
-            mock_sieve.is_match.assert_called_once_with(data)
+            mock_compiled.is_match.assert_called_once_with(data)
             self.assertIs(result, True)
 
 
@@ -640,6 +640,8 @@ rst_epilog = """
 .. |Tag| replace:: :class:`~tags.models.Tag`
 .. |Tags| replace:: :class:`Tags<tags.models.Tag>`
 .. |TagRelation| replace:: :class:`~tags.models.TagRelation`
+.. |TagIndex| replace:: :class:`~tags.index.TagIndex`
+.. |TagIndexes| replace:: :class:`TagIndexes<tags.index.TagIndex>`
 .. |TagRelations| replace:: :class:`Tags<tags.models.TagRelation>`
 .. |Taste| replace:: :class:`~bottler.tastes.models.Taste`
 .. |Tastes| replace:: :class:`Tastes<bottler.tastes.models.Taste>`
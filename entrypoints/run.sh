@@ -24,6 +24,9 @@ cd /usr/src/app/cyphon
 # migrate db, so we have the latest db schema
 su-exec cyphon python manage.py migrate --verbosity 0
 
+# create the table used by Django's cache
+su-exec cyphon python manage.py createcachetable
+
 # collect static files
 su-exec cyphon python manage.py collectstatic --noinput --verbosity 0
 
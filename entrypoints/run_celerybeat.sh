@@ -27,5 +27,8 @@ rm -f celerybeat-schedule.pid
 # migrate db, so we have the latest db schema
 su-exec cyphon python manage.py migrate --verbosity 0
 
+# create the table used by Django's cache
+su-exec cyphon python manage.py createcachetable
+
 # run Celery beat for Cyphon with Celery configuration stored in celeryapp
 su-exec cyphon celery beat -A cyphon -l ERROR
@@ -24,5 +24,8 @@ cd /usr/src/app/cyphon
 # migrate db, so we have the latest db schema
 su-exec cyphon python manage.py migrate --verbosity 0
 
+# create the table used by Django's cache
+su-exec cyphon python manage.py createcachetable
+
 # run Celery worker for Cyphon with Celery configuration stored in celeryapp
 su-exec cyphon celery worker -A cyphon -l ERROR
@@ -24,4 +24,7 @@ cd /usr/src/app/cyphon
 # migrate db, so we have the latest db schema
 su-exec cyphon python manage.py migrate --verbosity 0
 
+# create the table used by Django's cache
+su-exec cyphon python manage.py createcachetable
+
 exec python receiver/receiver.py "$@"